@@ -0,0 +1,331 @@
+import os
+import sys
+import glob
+import time
+import logging
+import optparse
+import traceback
+import multiprocessing
+
+
+TARGETS = {
+    'canvas': 'Canvas',
+    'kl': 'KL'
+}
+
+
+def argOpts():
+
+    usage = "usage: %prog output_directory krg_file [krg_file ...] [options]"
+    parser = optparse.OptionParser(usage, version="%prog 1.0")
+
+    parser.add_option("-t", "--target", dest="target", default="kl", choices=sorted(TARGETS.keys()),
+                      help="The builder generating the rigs: 'kl' (default) or 'canvas'.")
+
+    parser.add_option("-j", "--jobs", dest="jobs", type="int", default=multiprocessing.cpu_count(),
+                      help="Number of worker processes, one per CPU by default.")
+
+    parser.add_option("-c", "--config", dest="config",
+                      help="Python file registering the config used to build the rigs.")
+
+    parser.add_option("-l", "--logdir", dest="logdir",
+                      help="Folder of the per rig build logs, the output directory by default.")
+
+    parser.add_option("-i", "--isolate", dest="isolate", action="store_true",
+                      help="Build each rig in a new worker process, instead of reusing the workers.")
+
+    description = optparse.OptionGroup(parser, "Description",
+                                       "Builds rigs from krg files in parallel. The krg files can be glob patterns. "
+                                       "Each worker process loads its own Fabric client and Kraken config.")
+
+    parser.add_option_group(description)
+
+    options, args = parser.parse_args()
+
+    if len(args) < 2:
+        print "\nPlease provide the target folder and the rig files to build as command line arguments."
+        exit(1)
+
+    if options.config and not os.path.isfile(options.config):
+        print "\nCannot read config file path [%s]" % options.config
+        exit(1)
+
+    if options.jobs < 1:
+        print "\nThe number of jobs must be at least 1."
+        exit(1)
+
+    return (options, args)
+
+
+def collectRigFiles(patterns):
+    """Expands the glob patterns into a sorted list of unique rig files."""
+
+    rigFiles = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern))
+        if len(matches) == 0 and os.path.isfile(pattern):
+            matches = [pattern]
+
+        for match in matches:
+            match = os.path.abspath(match)
+            if match not in rigFiles:
+                rigFiles.append(match)
+
+    return rigFiles
+
+
+def getRigTitle(rigFile):
+    return os.path.split(rigFile)[1].partition('.')[0]
+
+
+# ========
+# Workers
+# ========
+_workerConfigClass = None
+_workerError = None
+
+
+def loadConfigClass(target, configFile, configName=None):
+    """Imports Kraken for a target and the config file registering a config.
+
+    Workers forked from the main process already imported the config file, so
+    importing it again registers nothing. They are given the registered name
+    of the config found by the main process instead.
+
+    Args:
+        target (str): The builder generating the rigs.
+        configFile (str): The config file, None to use the default config.
+        configName (str): The registered name of the config, found from the
+            configs the config file registers if None.
+
+    Returns:
+        type: The config class used to build the rigs.
+
+    """
+
+    os.environ['KRAKEN_DCC'] = TARGETS[target]
+
+    from kraken.core.kraken_system import KrakenSystem
+    from kraken.core.configs.config import Config
+
+    ks = KrakenSystem.getInstance()
+
+    configClass = Config
+    if configFile:
+        numConfigs = len(ks.registeredConfigs)
+
+        directory, file = os.path.split(os.path.abspath(configFile))
+        filebase, ext = os.path.splitext(file)
+        if directory not in sys.path:
+            sys.path = [directory] + sys.path  # prepend
+        exec("import " + filebase)
+
+        if configName is not None:
+            configClass = ks.getConfigClass(configName)
+        elif len(ks.registeredConfigs) > numConfigs:
+            configClass = ks.getConfigClass(next(reversed(ks.registeredConfigs)))
+
+    return configClass
+
+
+def getConfigName(configClass):
+    return configClass.__module__ + "." + configClass.__name__
+
+
+def initWorker(target, configFile, configName):
+    """Sets up the Kraken singletons of a worker process.
+
+    Every process owns its KrakenSystem, and so its Fabric client, and its
+    Config. The config is made current again before each build so the meta
+    data set while building a rig doesn't leak into the next one.
+
+    An error raised by the initializer would make the pool respawn the
+    worker forever, so it is stored and reported by buildRig instead.
+
+    """
+
+    global _workerConfigClass
+    global _workerError
+
+    try:
+        _workerConfigClass = loadConfigClass(target, configFile, configName)
+    except Exception:
+        _workerError = traceback.format_exc()
+
+
+def buildRig(job):
+    """Builds a single rig in a worker process.
+
+    Args:
+        job (tuple): The rig file, the output folder and the log file.
+
+    Returns:
+        dict: The result of the build.
+
+    """
+
+    rigFile, outputFolder, logFile = job
+
+    result = {
+        'file': rigFile,
+        'title': getRigTitle(rigFile),
+        'log': logFile,
+        'pid': os.getpid(),
+        'error': None,
+        'times': {}
+    }
+
+    if _workerError is not None:
+        result['error'] = "Worker initialization failed:\n%s" % _workerError
+        result['times']['total'] = 0.0
+        with open(logFile, 'w') as log:
+            log.write(result['error'])
+
+        return result
+
+    from kraken import plugins
+    from kraken.log import getLogger
+    from kraken.core.objects.rig import Rig
+
+    logger = getLogger('kraken')
+    stdout = sys.stdout
+
+    with open(logFile, 'w') as log:
+        handler = logging.StreamHandler(log)
+        handler.setFormatter(logging.Formatter('[%(levelname)s] %(message)s'))
+        logger.addHandler(handler)
+
+        # Builders also print their progress.
+        sys.stdout = log
+
+        start = time.time()
+        try:
+            _workerConfigClass.makeCurrent()
+
+            guideRig = Rig()
+            guideRig.loadRigDefinitionFile(rigFile)
+
+            rig = Rig()
+            rig.loadRigDefinition(guideRig.getRigBuildData())
+            result['times']['load'] = time.time() - start
+
+            builder = plugins.getBuilder()
+            builder.setOutputFolder(outputFolder)
+
+            config = builder.getConfig()
+            config.setMetaData('RigTitle', result['title'])
+
+            buildStart = time.time()
+            builder.build(rig)
+            result['times']['build'] = time.time() - buildStart
+
+        except Exception:
+            result['error'] = traceback.format_exc()
+            log.write(result['error'])
+
+        finally:
+            result['times']['total'] = time.time() - start
+            sys.stdout = stdout
+            logger.removeHandler(handler)
+
+    return result
+
+
+# =====
+# Main
+# =====
+def printSummary(results, elapsed):
+
+    succeeded = [x for x in results if x['error'] is None]
+    failed = [x for x in results if x['error'] is not None]
+
+    print "======================================"
+    print "Built %d of %d rigs in %.2fs using %d processes" % (
+        len(succeeded), len(results), elapsed, len(set([x['pid'] for x in results])))
+
+    if len(succeeded) > 0:
+        buildTimes = sorted([x['times']['total'] for x in succeeded])
+        print "Rig build time: min %.2fs, median %.2fs, max %.2fs, total %.2fs" % (
+            buildTimes[0], buildTimes[len(buildTimes) / 2], buildTimes[-1], sum(buildTimes))
+
+        slowest = max(succeeded, key=lambda x: x['times']['total'])
+        print "Slowest rig: %s (%.2fs)" % (slowest['file'], slowest['times']['total'])
+
+    if len(failed) > 0:
+        print "======================================"
+        print "FAILED RIGS"
+
+        for result in failed:
+            print "%s: %s" % (result['file'], result['error'].strip().split('\n')[-1])
+            print "  log: %s" % result['log']
+
+
+def main():
+
+    options, args = argOpts()
+
+    outputFolder = os.path.abspath(args[0])
+    rigFiles = collectRigFiles(args[1:])
+    if len(rigFiles) == 0:
+        print "\nNo rig files found."
+        exit(1)
+
+    # Rigs are written to folders and extensions named after their file.
+    titles = {}
+    for rigFile in rigFiles:
+        title = getRigTitle(rigFile)
+        if title in titles:
+            print "\nRig files %s and %s would overwrite each other's output." % (titles[title], rigFile)
+            exit(1)
+
+        titles[title] = rigFile
+
+    logFolder = os.path.abspath(options.logdir or outputFolder)
+    for folder in (outputFolder, logFolder):
+        if not os.path.exists(folder):
+            os.makedirs(folder)
+
+    jobs = [(x, outputFolder, os.path.join(logFolder, getRigTitle(x) + '.log')) for x in rigFiles]
+
+    numProcesses = min(options.jobs, len(jobs))
+    maxTasksPerChild = 1 if options.isolate else None
+
+    # Fail early on a broken install or config, before starting the workers.
+    try:
+        configClass = loadConfigClass(options.target, options.config)
+    except Exception:
+        traceback.print_exc()
+        print "\nFailed to load Kraken with config [%s]" % options.config
+        exit(1)
+
+    print "Building %d rigs with %d processes..." % (len(jobs), numProcesses)
+
+    start = time.time()
+    pool = multiprocessing.Pool(numProcesses,
+                                initializer=initWorker,
+                                initargs=(options.target, options.config, getConfigName(configClass)),
+                                maxtasksperchild=maxTasksPerChild)
+
+    results = []
+    try:
+        for result in pool.imap_unordered(buildRig, jobs):
+            results.append(result)
+
+            status = 'Built' if result['error'] is None else 'FAILED'
+            print "[%d/%d] %s %s (%.2fs)" % (len(results), len(jobs), status, result['file'], result['times']['total'])
+
+        pool.close()
+    except KeyboardInterrupt:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+
+    printSummary(results, time.time() - start)
+
+    if len([x for x in results if x['error'] is not None]) > 0:
+        exit(1)
+
+
+if __name__ == "__main__":
+    main()
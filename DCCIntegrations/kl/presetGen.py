@@ -27,6 +27,15 @@ def argOpts():
     parser.add_option("-C", "--constants", dest="constants", action="store_true",
                       help="Enables the use of constants for the array indices - thus easier to read code")
 
+    parser.add_option("-d", "--dirtypropagation", dest="dirtypropagation", action="store_true",
+                      help="Only solves the outputs downstream of the controls and attributes set since the last evaluation")
+
+    parser.add_option("-O", "--optimize", dest="optimize", action="store_true",
+                      help="Leaves out the items feeding no joint, control or shape and solves the static items once on reset")
+
+    parser.add_option("-t", "--threads", dest="threads", type="int",
+                      help="Solves the independent items of the rig in parallel on up to the provided number of threads, 1 solves them serially level by level")
+
     parser.add_option("-n", "--extensionname", dest="extensionname",
                       help="Overrides the name of the extension. By default it is based on the name of the rig in the krg file.")
 
@@ -85,6 +94,12 @@ def main():
     config.setMetaData('RigTitle', os.path.split(args[0])[1].partition('.')[0])
     if options.constants:
         config.setMetaData('UseRigConstants', True)
+    if options.dirtypropagation:
+        config.setMetaData('DirtyPropagation', True)
+    if options.optimize:
+        config.setMetaData('OptimizeItems', True)
+    if options.threads:
+        config.setMetaData('SolveThreads', options.threads)
     if options.numframes:
         config.setMetaData('ProfilingFrames', options.numframes)
     if options.logfile:
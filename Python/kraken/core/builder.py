@@ -49,6 +49,8 @@ class Builder(object):
     def __init__(self, debugMode=False):
         super(Builder, self).__init__()
         self._buildElements = []
+        self._buildElementsById = {}
+        self._buildElementsByPath = {}
         self._sceneItemsById = {}
 
         self.config = Config.getInstance()
@@ -78,6 +80,26 @@ class Builder(object):
 
         self._buildElements.append(pairing)
 
+        # The first pairing registered for an item wins, as with the former
+        # linear search.
+        if isinstance(kSceneItem, SceneItem):
+            self._buildElementsById.setdefault(kSceneItem.getId(), pairing)
+            self._buildElementsByPath.setdefault(kSceneItem.getPath(), pairing)
+
+        return True
+
+    def _clearSceneItemPairs(self):
+        """Clears the registered kraken / dcc scene item pairs.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self._buildElements = []
+        self._buildElementsById = {}
+        self._buildElementsByPath = {}
+
         return True
 
     def deleteBuildElements(self):
@@ -97,9 +119,26 @@ class Builder(object):
         """
 
         if isinstance(kSceneItem, SceneItem):
-            for builtElement in self._buildElements:
-                if builtElement['src'] == kSceneItem:
-                    return builtElement['tgt']
+            pairing = self._buildElementsById.get(kSceneItem.getId())
+            if pairing is not None:
+                return pairing['tgt']
+
+        return None
+
+    def getDCCSceneItemFromPath(self, path):
+        """Given the path of a kraken scene item, returns the built dcc scene item.
+
+        Args:
+            path (str): Path of the scene item at the time it was built.
+
+        Returns:
+            object: The DCC Scene Item that corresponds to the given path.
+
+        """
+
+        pairing = self._buildElementsByPath.get(path)
+        if pairing is not None:
+            return pairing['tgt']
 
         return None
 
@@ -665,12 +704,13 @@ class Builder(object):
 
         rootItems = traverser.traverse(
             discoverCallback=traverser.discoverChildren,
-            discoveredItemsFirst=False)
+            discoveredItemsFirst=False,
+            useCache=True)
 
         traverser = Traverser('Build')
         for rootItem in rootItems:
             traverser.addRootItem(rootItem)
-        traverser.traverse()
+        traverser.traverse(useCache=True)
 
         try:
             self._preBuild(kSceneItem)
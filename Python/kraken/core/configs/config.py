@@ -27,6 +27,8 @@ class Config(object):
         self._colors = self.initColors()
         self._colorMap = self.initColorMap()
         self._nameTemplate = self.initNameTemplate()
+        self._nameFormatPlans = {}
+        self._nameFormatPlansTemplate = None
         self._controlShapes = self.initControlShapes()
         self._metaData = {}
 
@@ -343,6 +345,54 @@ class Config(object):
 
         return self._nameTemplate
 
+    def getNameFormatPlan(self, typeNameHierarchy):
+        """Returns the resolved name format and type for a type hierarchy.
+
+        Plans are computed once per type hierarchy and kept until the name
+        template of the config is replaced.
+
+        Args:
+            typeNameHierarchy (tuple): Class names of the object's type
+                hierarchy, most derived first.
+
+        Returns:
+            tuple: The name format token list and the name template type.
+
+        """
+
+        nameTemplate = self.getNameTemplate()
+        if self._nameFormatPlansTemplate is not nameTemplate:
+            self._nameFormatPlans = {}
+            self._nameFormatPlansTemplate = nameTemplate
+
+        plan = self._nameFormatPlans.get(typeNameHierarchy, None)
+        if plan is not None:
+            return plan
+
+        # Get the token list for this type of object
+        nameFormat = None
+        for typeName in nameTemplate['formats'].keys():
+            if typeName in typeNameHierarchy:
+                nameFormat = nameTemplate['formats'][typeName]
+                break
+
+        if nameFormat is None:
+            nameFormat = nameTemplate['formats']['default']
+
+        objectType = None
+        for eachType in typeNameHierarchy:
+            if eachType in nameTemplate['types'].keys():
+                objectType = eachType
+                break
+
+        if objectType is None:
+            objectType = 'default'
+
+        plan = (nameFormat, objectType)
+        self._nameFormatPlans[typeNameHierarchy] = plan
+
+        return plan
+
 
     # ======================
     # Control Shape Methods
@@ -0,0 +1,405 @@
+"""Kraken - evaluator module.
+
+Classes:
+Evaluator - Dependency ordered operator and constraint evaluation.
+
+"""
+
+from timeit import default_timer
+
+from kraken.core.maths.math_object import MathObject
+from kraken.core.objects.scene_item import SceneItem
+from kraken.core.objects.object_3d import Object3D
+from kraken.core.objects.attributes.attribute import Attribute
+from kraken.core.objects.constraints.constraint import Constraint
+from kraken.core.objects.operators.operator import Operator
+from kraken.core.profiler import Profiler
+from kraken.log import getLogger
+
+logger = getLogger('kraken')
+
+
+class Evaluator(object):
+    """Evaluates the operators and constraints found under its root items.
+
+    The operators and constraints (nodes) are ordered so that each node is
+    evaluated after the nodes driving its inputs, following the sources of
+    the scene items. Every node is evaluated at most once per pass, and nodes
+    whose inputs and outputs are unchanged since their last evaluation are
+    skipped. The evaluation order is rebuilt when the scene graph revision
+    changes.
+
+    """
+
+    def __init__(self):
+        super(Evaluator, self).__init__()
+        self._rootItems = []
+        self._rootItemIds = set()
+        self.reset()
+
+
+    # =================
+    # Root Item Methods
+    # =================
+    def addRootItem(self, item):
+        """Adds a root item whose operators and constraints are evaluated.
+
+        Args:
+            item (SceneItem): The item to add as a root item.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        if item.getId() in self._rootItemIds:
+            return False
+
+        self._rootItems.append(item)
+        self._rootItemIds.add(item.getId())
+        self._graphRevision = None
+
+        return True
+
+
+    def addRootItems(self, items):
+        """Adds a bunch of root items to this Evaluator.
+
+        Args:
+            items (SceneItem[]): The SceneItems to add as root items.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        for item in items:
+            self.addRootItem(item)
+
+        return True
+
+
+    # =============
+    # Graph Methods
+    # =============
+    def reset(self):
+        """Resets the evaluation order and the recorded input states."""
+
+        self._nodes = []
+        self._inputItems = {}
+        self._inputStates = {}
+        self._evaluationTimes = []
+        self._graphRevision = None
+
+
+    def getNodes(self):
+        """Returns the operators and constraints in evaluation order.
+
+        Returns:
+            list: The nodes in the order they are evaluated.
+
+        """
+
+        if self._graphRevision != SceneItem.getGraphRevision():
+            self.__buildGraph()
+
+        return list(self._nodes)
+
+
+    def __collectNodes(self):
+        """Collects the nodes found in the hierarchies of the root items.
+
+        The items of a component are usually parented under the layers of the
+        rig. When a component is a root item, its items are walked from the
+        component and the items of other components are skipped.
+
+        """
+
+        nodes = []
+        nodeIds = set()
+
+        def addNode(node):
+            if node.getId() not in nodeIds:
+                nodeIds.add(node.getId())
+                nodes.append(node)
+
+        def addSourceNodes(item):
+            for source in item.getSources():
+                if isinstance(source, (Operator, Constraint)):
+                    addNode(source)
+
+        visited = set()
+        stack = []
+        for rootItem in reversed(self._rootItems):
+            scope = None
+            if rootItem.isTypeOf('Component'):
+                scope = rootItem
+
+            stack.append((rootItem, scope))
+
+        while stack:
+            item, scope = stack.pop()
+            if item.getId() in visited:
+                continue
+
+            visited.add(item.getId())
+
+            if isinstance(item, (Operator, Constraint)):
+                addNode(item)
+                continue
+
+            addSourceNodes(item)
+
+            if not isinstance(item, Object3D):
+                continue
+
+            children = item.getChildren()
+            if item.isTypeOf('Component'):
+                for operator in item.getOperators():
+                    addNode(operator)
+
+                children = children + [x for x in item.getItems().values()
+                                       if isinstance(x, Object3D)]
+
+            for i in xrange(item.getNumConstraints()):
+                addNode(item.getConstraintByIndex(i))
+
+            for i in xrange(item.getNumAttributeGroups()):
+                attrGrp = item.getAttributeGroupByIndex(i)
+                for j in xrange(attrGrp.getNumAttributes()):
+                    addSourceNodes(attrGrp.getAttributeByIndex(j))
+
+            for child in reversed(children):
+                if scope is not None:
+                    component = child.getComponent()
+                    if component is not None and component is not scope and \
+                            component.isTypeOf('Component'):
+                        continue
+
+                stack.append((child, scope))
+
+        return nodes
+
+
+    def __buildGraph(self):
+        """Orders the nodes so that each is evaluated after its upstream nodes.
+
+        The items feeding each node are walked through their sources up to the
+        nodes driving them. Those items are recorded as the inputs of the node
+        to detect changes later.
+
+        """
+
+        nodes = self.__collectNodes()
+        nodeIds = set([x.getId() for x in nodes])
+
+        upstreamNodes = {}
+        self._inputItems = {}
+        for node in nodes:
+            upstream = []
+            inputItems = []
+            visited = set([node.getId()])
+            stack = list(reversed(node.getSources()))
+            while stack:
+                item = stack.pop()
+                if item.getId() in visited:
+                    continue
+
+                visited.add(item.getId())
+
+                if isinstance(item, (Operator, Constraint)):
+                    if item.getId() in nodeIds:
+                        upstream.append(item)
+                    continue
+
+                inputItems.append(item)
+                stack.extend(reversed(item.getSources()))
+
+            upstreamNodes[node.getId()] = upstream
+            self._inputItems[node.getId()] = inputItems
+
+        # Depth first post order, upstream nodes first and otherwise in the
+        # order the nodes were found.
+        order = []
+        states = {}
+        for node in nodes:
+            if node.getId() in states:
+                continue
+
+            states[node.getId()] = 1
+            stack = [(node, iter(upstreamNodes[node.getId()]))]
+            while stack:
+                current, upstreamIter = stack[-1]
+                for upstreamNode in upstreamIter:
+                    state = states.get(upstreamNode.getId(), 0)
+                    if state == 0:
+                        states[upstreamNode.getId()] = 1
+                        stack.append((upstreamNode, iter(upstreamNodes[upstreamNode.getId()])))
+                        break
+
+                    if state == 1:
+                        logger.warning("Evaluator: Cycle between '" +
+                                       current.getPath() + "' and '" +
+                                       upstreamNode.getPath() + "'.")
+                else:
+                    stack.pop()
+                    states[current.getId()] = 2
+                    order.append(current)
+
+        self._nodes = order
+        self._inputStates = {}
+        self._graphRevision = SceneItem.getGraphRevision()
+
+
+    # ==================
+    # Evaluation Methods
+    # ==================
+    def __getItemState(self, item):
+        """Returns a snapshot of the value of an xfo or attribute item."""
+
+        if isinstance(item, Object3D):
+            return item.xfo.clone()
+        elif isinstance(item, Attribute):
+            return item.getValue()
+
+        return None
+
+
+    def __getInputState(self, node):
+        """Returns a snapshot of the values feeding and written by a node.
+
+        The written values are part of the snapshot so that a node is
+        evaluated again when its outputs were set by something else since its
+        last evaluation, as when a component loads its data.
+
+        """
+
+        state = []
+        for item in self._inputItems[node.getId()]:
+            state.append(self.__getItemState(item))
+
+        if isinstance(node, Constraint):
+            state.append(node.getMaintainOffset())
+
+            constrainee = node.getConstrainee()
+            if constrainee is not None:
+                state.append(self.__getItemState(constrainee))
+
+        if isinstance(node, Operator):
+            for name in sorted(node.getInputNames()):
+                values = node.getInput(name)
+                if not isinstance(values, list):
+                    values = [values]
+
+                for value in values:
+                    if isinstance(value, SceneItem):
+                        continue
+                    if isinstance(value, MathObject):
+                        value = value.clone()
+
+                    state.append(value)
+
+            for name in sorted(node.getOutputNames()):
+                values = node.getOutput(name)
+                if not isinstance(values, list):
+                    values = [values]
+
+                for value in values:
+                    state.append(self.__getItemState(value))
+
+        return state
+
+
+    def markDirty(self, node=None):
+        """Forces a node to be evaluated on the next pass.
+
+        Args:
+            node (SceneItem): The operator or constraint to mark, all nodes are
+                marked if None.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        if node is None:
+            self._inputStates = {}
+        else:
+            self._inputStates.pop(node.getId(), None)
+
+        return True
+
+
+    def evaluate(self, force=False):
+        """Evaluates the nodes whose inputs changed since their last evaluation.
+
+        Args:
+            force (bool): Evaluate all nodes, even unchanged ones.
+
+        Returns:
+            int: The number of nodes evaluated.
+
+        """
+
+        nodes = self.getNodes()
+
+        Profiler.getInstance().push("evaluate")
+
+        # Flagged nodes are trusted by Object3D.globalXfo to have written their
+        # outputs already, instead of being evaluated again for each read.
+        for node in nodes:
+            node.setFlag('SCHEDULED_EVALUATION')
+
+        self._evaluationTimes = []
+        try:
+            for node in nodes:
+                if not force and self._inputStates.get(node.getId(), None) == self.__getInputState(node):
+                    continue
+
+                Profiler.getInstance().push("evaluate:" + node.getName())
+                start = default_timer()
+                try:
+                    node.evaluate()
+                finally:
+                    self._evaluationTimes.append((node, default_timer() - start))
+                    Profiler.getInstance().pop()
+
+                self._inputStates[node.getId()] = self.__getInputState(node)
+
+        finally:
+            for node in nodes:
+                node.clearFlag('SCHEDULED_EVALUATION')
+
+            Profiler.getInstance().pop()
+
+        return len(self._evaluationTimes)
+
+
+    def getEvaluationTimes(self):
+        """Returns the time spent evaluating each node during the last pass.
+
+        Returns:
+            list: (node, seconds) tuples in evaluation order. Skipped nodes
+                are not listed.
+
+        """
+
+        return list(self._evaluationTimes)
+
+
+    def generateReport(self):
+        """Returns a report of the evaluation times of the last pass.
+
+        Returns:
+            str: One line per evaluated node, slowest first.
+
+        """
+
+        times = sorted(self._evaluationTimes, key=lambda x: x[1], reverse=True)
+
+        report = ["--evaluation-- " + str(len(times)) + " of " +
+                  str(len(self._nodes)) + " nodes evaluated"]
+        for node, seconds in times:
+            report.append(str(seconds) + ': ' + node.getPath())
+
+        return '\n'.join(report)
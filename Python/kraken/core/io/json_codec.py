@@ -0,0 +1,147 @@
+"""Kraken - io.json_codec module.
+
+Encodes and decodes the math objects of Kraken data to and from JSON.
+
+Math objects are stored as JSON objects holding their class name in the
+'__mathObjectClass__' key and one key per field. Classes are looked up in the
+math class registry and their fields are listed once per class, so each value
+is converted with a dictionary lookup.
+
+Functions:
+encodeJSON - Encodes a math object, for the default argument of json.dump.
+decodeJSON - Decodes a math object, for the object_hook argument of json.load.
+toJSON - Converts data holding math objects to pure JSON data.
+fromJSON - Converts pure JSON data to data holding math objects.
+
+"""
+
+from kraken.core.maths import MathObject
+from kraken.core.maths import getMathClass
+
+
+MATH_CLASS_KEY = '__mathObjectClass__'
+
+
+def _decodeMathObject(jsonData, decodeFn=None):
+    """Constructs the math object described by the JSON data."""
+
+    className = jsonData[MATH_CLASS_KEY]
+    mathClass = getMathClass(className)
+    if mathClass is None:
+        raise Exception("Unsupported Math type:" + className)
+
+    value = mathClass()
+    for name, item in jsonData.iteritems():
+        if name == MATH_CLASS_KEY:
+            continue
+
+        if decodeFn is not None:
+            item = decodeFn(item)
+
+        setattr(value, name, item)
+
+    return value
+
+
+def encodeJSON(value):
+    """Encodes a math object to a JSON object.
+
+    Pass it as the default argument of json.dump or json.dumps to write data
+    holding math objects in a single pass, the math members of the returned
+    object are encoded by json in turn.
+
+    Args:
+        value (object): The object json can't serialize.
+
+    Returns:
+        dict: The JSON object of the math object.
+
+    """
+
+    if not isinstance(value, MathObject):
+        raise TypeError(repr(value) + " is not JSON serializable")
+
+    jsonData = {MATH_CLASS_KEY: value.__class__.__name__}
+    for name in value.getJsonFields():
+        jsonData[name] = getattr(value, name)
+
+    return jsonData
+
+
+def decodeJSON(jsonData):
+    """Decodes a JSON object, constructing the math object it describes.
+
+    Pass it as the object_hook argument of json.load or json.loads to read
+    data holding math objects in a single pass. Objects are decoded bottom
+    up, so the members of math objects are already decoded.
+
+    Args:
+        jsonData (dict): The decoded JSON object.
+
+    Returns:
+        object: The math object, or the JSON object if it isn't a math object.
+
+    """
+
+    if MATH_CLASS_KEY in jsonData:
+        return _decodeMathObject(jsonData)
+
+    return jsonData
+
+
+def toJSON(value):
+    """Converts data holding math objects to pure JSON data.
+
+    Dictionaries and lists are copied, the input data is left untouched.
+
+    Args:
+        value (object): The data to convert.
+
+    Returns:
+        object: The pure JSON data.
+
+    """
+
+    valueType = type(value)
+    if valueType is dict:
+        return dict([(key, toJSON(item)) for key, item in value.iteritems()])
+
+    if valueType is list:
+        return [toJSON(item) for item in value]
+
+    if isinstance(value, MathObject):
+        jsonData = {MATH_CLASS_KEY: value.__class__.__name__}
+        for name in value.getJsonFields():
+            jsonData[name] = toJSON(getattr(value, name))
+
+        return jsonData
+
+    return value
+
+
+def fromJSON(value):
+    """Converts pure JSON data to data holding math objects.
+
+    Dictionaries are converted in place and lists are copied. Math objects
+    already in the data are kept, so data can be converted more than once.
+
+    Args:
+        value (object): The data to convert.
+
+    Returns:
+        object: The data holding math objects.
+
+    """
+
+    valueType = type(value)
+    if valueType is list:
+        return [fromJSON(item) for item in value]
+
+    if valueType is dict:
+        if MATH_CLASS_KEY in value:
+            return _decodeMathObject(value, fromJSON)
+
+        for key, item in value.iteritems():
+            value[key] = fromJSON(item)
+
+    return value
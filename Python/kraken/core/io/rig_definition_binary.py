@@ -0,0 +1,518 @@
+"""Kraken - io.rig_definition_binary module.
+
+Compact binary container for rig definitions.
+
+A packed rig definition starts with the MAGIC header and a version byte,
+followed by a string table holding every string of the definition once
+(component class paths, names, keys) and by the root value. Values are
+tagged; float lists and math objects whose leaves are all floats are stored
+as packed float32 arrays, or float64 arrays when float32 would lose
+precision, so unpacking gives back exactly the data that was packed.
+
+Functions:
+isPackedRigDefinition - Tests if data is a packed rig definition.
+packRigDefinition - Packs JSON data into the binary container.
+unpackRigDefinition - Unpacks JSON data from the binary container.
+
+"""
+
+import struct
+
+
+MAGIC = 'KRGB'
+VERSION = 1
+
+_NONE = 0
+_TRUE = 1
+_FALSE = 2
+_INT = 3
+_FLOAT = 4
+_STRING = 5
+_LIST = 6
+_DICT = 7
+_FLOAT_ARRAY = 8
+_STRUCT = 9
+_STRUCT_ARRAY = 10
+
+# Flag or'ed with the float tags when values are packed as float64.
+_DOUBLE = 0x80
+
+_MATH_CLASS_KEY = '__mathObjectClass__'
+
+
+def isPackedRigDefinition(data):
+    """Tests if the data starts with the packed rig definition header.
+
+    Args:
+        data (str): The file contents, or at least its first bytes.
+
+    Returns:
+        bool: True if the data is a packed rig definition.
+
+    """
+
+    return data[:len(MAGIC)] == MAGIC
+
+
+def packRigDefinition(jsonData):
+    """Packs the JSON data of a rig definition into the binary container.
+
+    Args:
+        jsonData (dict): Pure JSON data, as returned by prepareToSave.
+
+    Returns:
+        str: The packed data.
+
+    """
+
+    return _Packer().pack(jsonData)
+
+
+def unpackRigDefinition(data, objectHook=None):
+    """Unpacks the JSON data of a rig definition from the binary container.
+
+    Args:
+        data (str): The packed data.
+        objectHook (func): Optional function called with each unpacked dict,
+            its return value is used instead of the dict.
+
+    Returns:
+        dict: The JSON data.
+
+    """
+
+    return _Unpacker(data, objectHook).unpack()
+
+
+def _getFloatShape(value):
+    """Returns the shape of a value made only of floats, False otherwise.
+
+    The shape replaces each float by None and is used as the layout of the
+    packed floats. Dict shapes are stored as sorted (key, shape) tuples.
+
+    """
+
+    if type(value) is float:
+        return None
+
+    if type(value) is list:
+        if len(value) == 0:
+            return False
+
+        shape = []
+        for item in value:
+            itemShape = _getFloatShape(item)
+            if itemShape is False:
+                return False
+            shape.append(itemShape)
+
+        return ('list', tuple(shape))
+
+    if type(value) is dict and _MATH_CLASS_KEY in value:
+        shape = []
+        for key in sorted(value.keys()):
+            if key == _MATH_CLASS_KEY:
+                if not isinstance(value[key], basestring):
+                    return False
+                shape.append((key, value[key]))
+                continue
+
+            itemShape = _getFloatShape(value[key])
+            if itemShape is False:
+                return False
+            shape.append((key, itemShape))
+
+        return ('dict', tuple(shape))
+
+    return False
+
+
+def _flattenFloats(value, floats):
+    if type(value) is float:
+        floats.append(value)
+    elif type(value) is list:
+        for item in value:
+            _flattenFloats(item, floats)
+    else:
+        for key in sorted(value.keys()):
+            if key != _MATH_CLASS_KEY:
+                _flattenFloats(value[key], floats)
+
+
+def _fitsFloat32(floats):
+    try:
+        packed = struct.pack('<%df' % len(floats), *floats)
+    except OverflowError:
+        return False
+
+    unpacked = struct.unpack('<%df' % len(floats), packed)
+    for i in xrange(len(floats)):
+        if unpacked[i] != floats[i] and not (floats[i] != floats[i] and unpacked[i] != unpacked[i]):
+            return False
+
+    return True
+
+
+class _Packer(object):
+
+    def __init__(self):
+        super(_Packer, self).__init__()
+        self._strings = {}
+        self._stringList = []
+        self._shapes = {}
+        self._shapeList = []
+
+
+    def pack(self, jsonData):
+        body = []
+        self._packValue(jsonData, body)
+
+        # Shapes reference strings, so they are packed before the string
+        # table is written.
+        shapes = []
+        self._packVarint(len(self._shapeList), shapes)
+        for shape in self._shapeList:
+            self._packShape(shape, shapes)
+
+        header = [MAGIC, chr(VERSION)]
+        self._packVarint(len(self._stringList), header)
+        for string in self._stringList:
+            if isinstance(string, unicode):
+                string = string.encode('utf-8')
+            self._packVarint(len(string), header)
+            header.append(string)
+
+        return ''.join(header) + ''.join(shapes) + ''.join(body)
+
+
+    def _packVarint(self, value, out):
+        while value > 0x7f:
+            out.append(chr((value & 0x7f) | 0x80))
+            value >>= 7
+        out.append(chr(value))
+
+
+    def _packString(self, string, out):
+        index = self._strings.get(string, None)
+        if index is None:
+            index = len(self._stringList)
+            self._strings[string] = index
+            self._stringList.append(string)
+
+        self._packVarint(index, out)
+
+
+    def _getShapeIndex(self, shape):
+        index = self._shapes.get(shape, None)
+        if index is None:
+            index = len(self._shapeList)
+            self._shapes[shape] = index
+            self._shapeList.append(shape)
+
+        return index
+
+
+    def _packShape(self, shape, out):
+        if shape is None:
+            out.append(chr(_FLOAT))
+        elif shape[0] == 'list':
+            out.append(chr(_LIST))
+            self._packVarint(len(shape[1]), out)
+            for itemShape in shape[1]:
+                self._packShape(itemShape, out)
+        else:
+            out.append(chr(_DICT))
+            self._packVarint(len(shape[1]), out)
+            for key, itemShape in shape[1]:
+                self._packString(key, out)
+                if key == _MATH_CLASS_KEY:
+                    self._packString(itemShape, out)
+                else:
+                    self._packShape(itemShape, out)
+
+
+    def _packFloats(self, tag, floats, out):
+        if _fitsFloat32(floats):
+            out.append(chr(tag))
+            out.append(struct.pack('<%df' % len(floats), *floats))
+        else:
+            out.append(chr(tag | _DOUBLE))
+            out.append(struct.pack('<%dd' % len(floats), *floats))
+
+
+    def _packValue(self, value, out):
+        valueType = type(value)
+
+        if value is None:
+            out.append(chr(_NONE))
+
+        elif value is True:
+            out.append(chr(_TRUE))
+
+        elif value is False:
+            out.append(chr(_FALSE))
+
+        elif valueType in (int, long):
+            out.append(chr(_INT))
+            # zigzag encoding so small negative values stay small.
+            if value < 0:
+                self._packVarint((-value << 1) - 1, out)
+            else:
+                self._packVarint(value << 1, out)
+
+        elif valueType is float:
+            out.append(chr(_FLOAT))
+            out.append(struct.pack('<d', value))
+
+        elif isinstance(value, basestring):
+            out.append(chr(_STRING))
+            self._packString(value, out)
+
+        elif valueType is list:
+            if len(value) > 0 and all([type(x) is float for x in value]):
+                chunk = []
+                self._packFloats(_FLOAT_ARRAY, value, chunk)
+                out.append(chunk[0])
+                self._packVarint(len(value), out)
+                out.append(chunk[1])
+                return
+
+            shape = False
+            if len(value) > 1:
+                shape = _getFloatShape(value[0])
+                if shape is not False and shape is not None:
+                    for item in value[1:]:
+                        if _getFloatShape(item) != shape:
+                            shape = False
+                            break
+
+            if shape is not False and shape is not None:
+                floats = []
+                for item in value:
+                    _flattenFloats(item, floats)
+
+                chunk = []
+                self._packFloats(_STRUCT_ARRAY, floats, chunk)
+                out.append(chunk[0])
+                self._packVarint(self._getShapeIndex(shape), out)
+                self._packVarint(len(value), out)
+                out.append(chunk[1])
+                return
+
+            out.append(chr(_LIST))
+            self._packVarint(len(value), out)
+            for item in value:
+                self._packValue(item, out)
+
+        elif valueType is dict:
+            shape = _getFloatShape(value)
+            if shape is not False:
+                floats = []
+                _flattenFloats(value, floats)
+
+                chunk = []
+                self._packFloats(_STRUCT, floats, chunk)
+                out.append(chunk[0])
+                self._packVarint(self._getShapeIndex(shape), out)
+                out.append(chunk[1])
+                return
+
+            out.append(chr(_DICT))
+            self._packVarint(len(value), out)
+            for key, item in value.iteritems():
+                self._packString(key, out)
+                self._packValue(item, out)
+
+        else:
+            raise TypeError("Unable to pack value of type '" +
+                            valueType.__name__ + "' in a rig definition.")
+
+
+class _Unpacker(object):
+
+    def __init__(self, data, objectHook=None):
+        super(_Unpacker, self).__init__()
+        self._data = data
+        self._bytes = bytearray(data)
+        self._objectHook = objectHook
+        self._idx = 0
+        self._strings = []
+        self._shapes = []
+
+
+    def unpack(self):
+        if not isPackedRigDefinition(self._data):
+            raise ValueError("Data is not a packed rig definition.")
+
+        self._idx = len(MAGIC)
+        version = self._bytes[self._idx]
+        self._idx += 1
+        if version > VERSION:
+            raise ValueError("Unsupported packed rig definition version: " +
+                             str(version))
+
+        for i in xrange(self._unpackVarint()):
+            length = self._unpackVarint()
+            string = self._data[self._idx:self._idx + length].decode('utf-8')
+            self._idx += length
+            self._strings.append(string)
+
+        for i in xrange(self._unpackVarint()):
+            self._shapes.append(self._unpackShape())
+
+        value = self._unpackValue()
+        if self._idx != len(self._bytes):
+            raise ValueError("Extra data after the packed rig definition.")
+
+        return value
+
+
+    def _unpackVarint(self):
+        result = 0
+        shift = 0
+        while True:
+            byte = self._bytes[self._idx]
+            self._idx += 1
+            result |= (byte & 0x7f) << shift
+            if not byte & 0x80:
+                return result
+            shift += 7
+
+
+    def _unpackShape(self):
+        tag = self._bytes[self._idx]
+        self._idx += 1
+
+        if tag == _FLOAT:
+            return None
+
+        shape = []
+        if tag == _LIST:
+            for i in xrange(self._unpackVarint()):
+                shape.append(self._unpackShape())
+            return ('list', tuple(shape))
+
+        for i in xrange(self._unpackVarint()):
+            key = self._strings[self._unpackVarint()]
+            if key == _MATH_CLASS_KEY:
+                shape.append((key, self._strings[self._unpackVarint()]))
+            else:
+                shape.append((key, self._unpackShape()))
+
+        return ('dict', tuple(shape))
+
+
+    def _unpackFloats(self, tag, count):
+        if tag & _DOUBLE:
+            fmt = '<%dd' % count
+        else:
+            fmt = '<%df' % count
+
+        floats = struct.unpack_from(fmt, self._data, self._idx)
+        self._idx += struct.calcsize(fmt)
+
+        return floats
+
+
+    def _buildStruct(self, shape, floats, idx):
+        if shape is None:
+            return floats[idx], idx + 1
+
+        if shape[0] == 'list':
+            result = []
+            for itemShape in shape[1]:
+                item, idx = self._buildStruct(itemShape, floats, idx)
+                result.append(item)
+            return result, idx
+
+        result = {}
+        for key, itemShape in shape[1]:
+            if key == _MATH_CLASS_KEY:
+                result[key] = itemShape
+            else:
+                result[key], idx = self._buildStruct(itemShape, floats, idx)
+
+        if self._objectHook is not None:
+            result = self._objectHook(result)
+
+        return result, idx
+
+
+    def _getShapeSize(self, shape):
+        if shape is None:
+            return 1
+
+        size = 0
+        for item in shape[1]:
+            if shape[0] == 'list':
+                size += self._getShapeSize(item)
+            elif item[0] != _MATH_CLASS_KEY:
+                size += self._getShapeSize(item[1])
+
+        return size
+
+
+    def _unpackValue(self):
+        tag = self._bytes[self._idx]
+        self._idx += 1
+        baseTag = tag & ~_DOUBLE
+
+        if tag == _NONE:
+            return None
+
+        elif tag == _TRUE:
+            return True
+
+        elif tag == _FALSE:
+            return False
+
+        elif tag == _INT:
+            value = self._unpackVarint()
+            if value & 1:
+                return -((value + 1) >> 1)
+            return value >> 1
+
+        elif tag == _FLOAT:
+            value = struct.unpack_from('<d', self._data, self._idx)[0]
+            self._idx += 8
+            return value
+
+        elif tag == _STRING:
+            return self._strings[self._unpackVarint()]
+
+        elif tag == _LIST:
+            return [self._unpackValue() for i in xrange(self._unpackVarint())]
+
+        elif tag == _DICT:
+            result = {}
+            for i in xrange(self._unpackVarint()):
+                key = self._strings[self._unpackVarint()]
+                result[key] = self._unpackValue()
+
+            if self._objectHook is not None:
+                result = self._objectHook(result)
+
+            return result
+
+        elif baseTag == _FLOAT_ARRAY:
+            return list(self._unpackFloats(tag, self._unpackVarint()))
+
+        elif baseTag == _STRUCT:
+            shape = self._shapes[self._unpackVarint()]
+            floats = self._unpackFloats(tag, self._getShapeSize(shape))
+            return self._buildStruct(shape, floats, 0)[0]
+
+        elif baseTag == _STRUCT_ARRAY:
+            shape = self._shapes[self._unpackVarint()]
+            count = self._unpackVarint()
+            floats = self._unpackFloats(tag, count * self._getShapeSize(shape))
+
+            result = []
+            idx = 0
+            for i in xrange(count):
+                item, idx = self._buildStruct(shape, floats, idx)
+                result.append(item)
+
+            return result
+
+        raise ValueError("Invalid tag in packed rig definition: " + str(tag))
@@ -0,0 +1,262 @@
+"""Kraken - io.rig_definition_loader module.
+
+Classes:
+RigDefinitionLoader - Single pass loader for rig definition files.
+
+"""
+
+import json
+import os
+import struct
+
+from json.decoder import WHITESPACE
+
+from kraken.core.io.json_codec import decodeJSON
+from kraken.core.profiler import Profiler
+from kraken.core.io.rig_definition_binary import isPackedRigDefinition
+from kraken.core.io.rig_definition_binary import unpackRigDefinition
+
+
+class RigDefinitionLoader(object):
+    """Loads rig definition files (.krg) in a single pass.
+
+    Files written in the packed binary format are detected from their header.
+
+    The top level object of the file is walked by hand and each element of
+    the 'components' and 'connections' arrays is decoded on its own, so
+    elements are validated against the rig definition schema and their math
+    objects decoded as they are parsed, instead of walking the whole data
+    again after json.load.
+
+    """
+
+    # Types of the top level keys of a rig definition.
+    SCHEMA = {
+        'name': basestring,
+        'components': list,
+        'connections': list,
+        'metaData': dict,
+        'guideData': dict
+    }
+
+    def __init__(self):
+        super(RigDefinitionLoader, self).__init__()
+        self._decoder = json.JSONDecoder(object_hook=decodeJSON)
+        self._filepath = None
+
+
+    # ==============
+    # Load Methods
+    # ==============
+    def loadFile(self, filepath):
+        """Loads and validates a rig definition file.
+
+        Args:
+            filepath (str): The file path of the rig definition file.
+
+        Returns:
+            dict: The rig definition with its math objects decoded.
+
+        """
+
+        if not os.path.exists(filepath):
+            raise Exception("File not found:" + filepath)
+
+        Profiler.getInstance().push("readRigDefinitionFile")
+        try:
+            with open(filepath, 'rb') as rigFile:
+                text = rigFile.read()
+        finally:
+            Profiler.getInstance().pop()
+
+        self._filepath = filepath
+        try:
+            if isPackedRigDefinition(text):
+                return self.unpack(text)
+
+            return self.loads(text)
+        finally:
+            self._filepath = None
+
+
+    def loads(self, text):
+        """Loads and validates a rig definition from a JSON string.
+
+        Args:
+            text (str): The JSON text of the rig definition.
+
+        Returns:
+            dict: The rig definition with its math objects decoded.
+
+        """
+
+        Profiler.getInstance().push("parseRigDefinition")
+
+        try:
+            rigData = {}
+
+            idx = self._expect(text, self._skip(text, 0), '{')
+            idx = self._skip(text, idx)
+            if text[idx:idx + 1] == '}':
+                idx += 1
+            else:
+                while True:
+                    key, idx = self._decode(text, idx, 'key')
+                    if not isinstance(key, basestring):
+                        self._error('keys', "Expected a string key")
+
+                    idx = self._expect(text, self._skip(text, idx), ':')
+                    idx = self._skip(text, idx)
+
+                    if key == 'components':
+                        value, idx = self._decodeArray(text, idx, key, self._validateComponent)
+                    elif key == 'connections':
+                        value, idx = self._decodeArray(text, idx, key, self._validateConnection)
+                    else:
+                        value, idx = self._decode(text, idx, key)
+
+                    expectedType = self.SCHEMA.get(key, None)
+                    if expectedType is not None and not isinstance(value, expectedType):
+                        self._error(key, "Expected a value of type '" +
+                                    expectedType.__name__ + "'")
+
+                    rigData[key] = value
+
+                    idx = self._skip(text, idx)
+                    if text[idx:idx + 1] == ',':
+                        idx = self._skip(text, idx + 1)
+                        continue
+
+                    idx = self._expect(text, idx, '}')
+                    break
+
+            if self._skip(text, idx) != len(text):
+                self._error('', "Extra data after the rig definition")
+        finally:
+            Profiler.getInstance().pop()
+
+        return rigData
+
+
+    def unpack(self, data):
+        """Loads and validates a rig definition packed in the binary format.
+
+        Args:
+            data (str): The packed rig definition.
+
+        Returns:
+            dict: The rig definition with its math objects decoded.
+
+        """
+
+        Profiler.getInstance().push("unpackRigDefinition")
+
+        try:
+            try:
+                rigData = unpackRigDefinition(data, objectHook=decodeJSON)
+            except (ValueError, IndexError, struct.error) as e:
+                self._error('', "Corrupted packed data (" + str(e) + ")")
+
+            if not isinstance(rigData, dict):
+                self._error('', "Expected an object")
+
+            for key, value in rigData.iteritems():
+                expectedType = self.SCHEMA.get(key, None)
+                if expectedType is not None and not isinstance(value, expectedType):
+                    self._error(key, "Expected a value of type '" +
+                                expectedType.__name__ + "'")
+
+            for i, componentData in enumerate(rigData.get('components', [])):
+                self._validateComponent(componentData, 'components[' + str(i) + ']')
+
+            for i, connectionData in enumerate(rigData.get('connections', [])):
+                self._validateConnection(connectionData, 'connections[' + str(i) + ']')
+        finally:
+            Profiler.getInstance().pop()
+
+        return rigData
+
+
+    # ===================
+    # Validation Methods
+    # ===================
+    def _validateComponent(self, componentData, path):
+        if not isinstance(componentData, dict):
+            self._error(path, "A component must be an object")
+
+        componentClass = componentData.get('class', None)
+        if not isinstance(componentClass, basestring) or componentClass == '':
+            self._error(path, "A component requires a 'class' string")
+
+        if 'name' in componentData and not isinstance(componentData['name'], basestring):
+            self._error(path, "The component 'name' must be a string")
+
+
+    def _validateConnection(self, connectionData, path):
+        if not isinstance(connectionData, dict):
+            self._error(path, "A connection must be an object")
+
+        for key in ('source', 'target'):
+            port = connectionData.get(key, None)
+            if not isinstance(port, basestring) or port.count('.') != 1:
+                self._error(path, "The connection '" + key +
+                            "' must be a string of the form 'component.port'")
+
+        targetIndex = connectionData.get('targetIndex', 0)
+        if not isinstance(targetIndex, (int, long)) or isinstance(targetIndex, bool):
+            self._error(path, "The connection 'targetIndex' must be an integer")
+
+
+    # ================
+    # Parsing Methods
+    # ================
+    def _decodeArray(self, text, idx, key, validateFn):
+        """Decodes an array one element at a time, validating each."""
+
+        result = []
+
+        idx = self._expect(text, idx, '[')
+        idx = self._skip(text, idx)
+        if text[idx:idx + 1] == ']':
+            return result, idx + 1
+
+        while True:
+            path = key + '[' + str(len(result)) + ']'
+            value, idx = self._decode(text, idx, path)
+            validateFn(value, path)
+            result.append(value)
+
+            idx = self._skip(text, idx)
+            if text[idx:idx + 1] == ',':
+                idx = self._skip(text, idx + 1)
+                continue
+
+            return result, self._expect(text, idx, ']')
+
+
+    def _decode(self, text, idx, path):
+        try:
+            return self._decoder.raw_decode(text, idx)
+        except ValueError as e:
+            self._error(path, str(e))
+
+
+    def _skip(self, text, idx):
+        return WHITESPACE.match(text, idx).end()
+
+
+    def _expect(self, text, idx, char):
+        if text[idx:idx + 1] != char:
+            self._error('', "Expected '" + char + "' at char " + str(idx))
+
+        return idx + 1
+
+
+    def _error(self, path, msg):
+        location = "Invalid rig definition"
+        if self._filepath is not None:
+            location += " '" + self._filepath + "'"
+        if path:
+            location += " at '" + path + "'"
+
+        raise ValueError(location + ": " + msg)
@@ -9,11 +9,10 @@ import logging
 import os
 import sys
 import json
+import hashlib
 import importlib
 from collections import OrderedDict
 
-import FabricEngine.Core
-
 # import kraken
 from kraken.core.profiler import Profiler
 from kraken.plugins import getFabricClient
@@ -23,6 +22,27 @@ from kraken.log.utils import fabricCallback
 
 logger = getLogger('kraken')
 
+MATH_BACKENDS = ('fabric', 'python')
+
+# KL types constructed by reference, each RTVal is a new instance.
+REFERENCE_INTERNAL_TYPES = ('object', 'interface')
+COMPONENT_MANIFEST_VERSION = 1
+
+
+class RTValPlan(object):
+    """Construction plan of the RTVals of a KL type."""
+
+    __slots__ = ('dataType', 'klType', 'useCreate', 'members', 'template')
+
+    def __init__(self, dataType, klType, useCreate, members, template):
+        super(RTValPlan, self).__init__()
+
+        self.dataType = dataType
+        self.klType = klType
+        self.useCreate = useCreate
+        self.members = members
+        self.template = template
+
 
 class KrakenSystem(object):
     """The KrakenSystem is a singleton object used to provide an interface with
@@ -39,9 +59,17 @@ class KrakenSystem(object):
         self.typeDescs = None
         self.registeredTypes = None
         self.loadedExtensions = []
+        self.__rtValPlans = {}
+
+        self.mathBackend = os.environ.get('KRAKEN_MATH_BACKEND', 'fabric').lower()
+        if self.mathBackend not in MATH_BACKENDS:
+            raise Exception("Invalid KRAKEN_MATH_BACKEND: '" + self.mathBackend + "', valid backends: " + ", ".join(MATH_BACKENDS))
 
         self.registeredConfigs = OrderedDict()
         self.registeredComponents = OrderedDict()
+        self.componentManifest = {}
+        self.__componentModules = {}
+        self.__componentRegistrations = None
         # self.moduleImportManager = ModuleImportManager()
 
 
@@ -53,6 +81,8 @@ class KrakenSystem(object):
 
             client = getFabricClient()
             if client is None:
+                import FabricEngine.Core
+
                 options = {
                     'reportCallback': fabricCallback,
                     'guarded': True
@@ -62,12 +92,49 @@ class KrakenSystem(object):
 
             self.client = client
 
+            # The solver arguments were introspected with another client.
+            from kraken.core.objects.operators.kl_operator import KLOperator
+            KLOperator.clearSolverArgsCache()
+
             self.loadExtension('Math')
             self.loadExtension('Kraken')
             self.loadExtension('KrakenForCanvas')
 
             Profiler.getInstance().pop()
 
+    def getMathBackend(self):
+        """Returns the name of the backend used by the kraken.core.maths types.
+
+        Returns:
+            str: 'fabric' when the math types wrap Fabric RTVals, 'python' when
+                they use the native values from kraken.core.maths.native.
+
+        """
+
+        return self.mathBackend
+
+    def setMathBackend(self, backend):
+        """Sets the backend used by the kraken.core.maths types.
+
+        Only math objects created after the call use the new backend. The
+        backend can also be set with the KRAKEN_MATH_BACKEND environment
+        variable.
+
+        Args:
+            backend (str): 'fabric' or 'python'.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        if backend not in MATH_BACKENDS:
+            raise ValueError("Invalid math backend: '" + str(backend) + "', valid backends: " + ", ".join(MATH_BACKENDS))
+
+        self.mathBackend = backend
+
+        return True
+
     def getCoreClient(self):
         """Returns the Fabric Engine Core Client owned by the KrakenSystem
 
@@ -96,6 +163,8 @@ class KrakenSystem(object):
             self.typeDescs = self.client.RT.getRegisteredTypes()
             # Cache the loaded extension so that we aviod refreshing the typeDescs cache(costly)
             self.loadedExtensions.append(extension)
+            # Types may have been redefined by the extension.
+            self.__rtValPlans = {}
             Profiler.getInstance().pop()
 
 
@@ -126,6 +195,63 @@ class KrakenSystem(object):
 
         return pythonRTVal
 
+    def getRTValPlan(self, dataType):
+        """Returns the plan used to construct the RTVals of the given type.
+
+        Plans are compiled the first time a type is constructed and discarded
+        when an extension is loaded.
+
+        Args:
+            dataType (str): The name of the data type to construct.
+
+        Returns:
+            RTValPlan: The construction plan of the type.
+
+        """
+
+        plan = self.__rtValPlans.get(dataType, None)
+        if plan is None:
+            self.loadCoreClient()
+            plan = self.__compileRTValPlan(dataType)
+            self.__rtValPlans[dataType] = plan
+
+        return plan
+
+    def __compileRTValPlan(self, dataType):
+        """Finds how the RTVals of the given type are constructed."""
+
+        klType = getattr(self.registeredTypes, dataType)
+
+        try:
+            template = klType.create()
+            useCreate = True
+        except:
+            try:
+                template = klType()
+            except Exception as e:
+                raise Exception("Error constructing RTVal:" + dataType)
+
+            useCreate = False
+
+        typeDesc = self.typeDescs.get(dataType, None)
+
+        members = None
+        if typeDesc is not None and 'members' in typeDesc:
+            members = tuple([(x['name'], x['type']) for x in typeDesc['members']])
+
+        # New values of structs and other value types are cloned from a zero
+        # valued template when the type supports it. Objects are constructed
+        # each time, a clone would share the state of the template.
+        if typeDesc is None or typeDesc.get('internalType', None) in REFERENCE_INTERNAL_TYPES:
+            template = None
+        else:
+            try:
+                template.clone(dataType)
+            except:
+                template = None
+
+        return RTValPlan(dataType, klType, useCreate, members, template)
+
     def constructRTVal(self, dataType, defaultValue=None):
         """Constructs a new RTVal using the given name and optional devault value.
 
@@ -138,41 +264,37 @@ class KrakenSystem(object):
 
         """
 
-        self.loadCoreClient()
-        klType = getattr(self.registeredTypes, dataType)
+        plan = self.__rtValPlans.get(dataType, None)
+        if plan is None:
+            plan = self.getRTValPlan(dataType)
 
-        if defaultValue is not None:
-            if hasattr(defaultValue, '_rtval'):
-                return defaultValue._rtval
+        if defaultValue is None:
+            if plan.template is not None:
+                return plan.template.clone(dataType)
+            elif plan.useCreate:
+                return plan.klType.create()
 
-            typeDesc = self.typeDescs[dataType]
-            if 'members' in typeDesc:
-                try:
-                    value = klType.create()
-                except:
-                    try:
-                        return klType()
-                    except Exception as e:
-                        raise Exception("Error constructing RTVal:" + dataType)
+            return plan.klType()
 
-                for i in xrange(0, len(typeDesc['members'])):
-                    memberName = typeDesc['members'][i]['name']
-                    memberType = typeDesc['members'][i]['type']
-                    if memberName in defaultValue:
-                        setattr(value, memberName, self.constructRTVal(memberType, getattr(defaultValue, memberName)))
+        if hasattr(defaultValue, '_rtval'):
+            return defaultValue.getRTVal()
 
-                return value
+        if plan.members is None:
+            return plan.klType(defaultValue)
 
-            else:
-                return klType(defaultValue)
+        if not plan.useCreate:
+            return plan.klType()
+
+        if plan.template is not None:
+            value = plan.template.clone(dataType)
         else:
-            try:
-                return klType.create()
-            except:
-                try:
-                    return klType()
-                except Exception as e:
-                    raise Exception("Error constructing RTVal:" + dataType)
+            value = plan.klType.create()
+
+        for memberName, memberType in plan.members:
+            if memberName in defaultValue:
+                setattr(value, memberName, self.constructRTVal(memberType, getattr(defaultValue, memberName)))
+
+        return value
 
     def rtVal(self, dataType, defaultValue=None):
         """Constructs a new RTVal using the given name and optional devault value.
@@ -214,8 +336,13 @@ class KrakenSystem(object):
 
         if ks.isRTVal(rtval):
             return json.loads(rtval.type("Type").jsonDesc("String").getSimpleType())['name']
-        else:
-            return "None"
+
+        # Values of the python math backend (kraken.core.maths.native)
+        klTypeName = getattr(rtval, 'klTypeName', None)
+        if klTypeName is not None:
+            return klTypeName
+
+        return "None"
 
     # ==================
     # Config Methods
@@ -276,9 +403,15 @@ class KrakenSystem(object):
 
         self.registeredComponents[componentClassPath] = componentClass
 
+        if self.__componentRegistrations is not None:
+            self.__componentRegistrations.append(componentClassPath)
+
     def getComponentClass(self, className):
         """Returns the registered Python component class with the given name
 
+        Components listed in the component manifest are imported the first
+        time their class is requested.
+
         Args:
             className (str): The name of the Python component class
 
@@ -287,6 +420,11 @@ class KrakenSystem(object):
 
         """
 
+        if className not in self.registeredComponents:
+            modulePath = self.__componentModules.get(className, None)
+            if modulePath is not None:
+                self.__importComponentModule(modulePath)
+
         if className not in self.registeredComponents:
             raise Exception("Component with that class not registered:" + className)
 
@@ -295,96 +433,73 @@ class KrakenSystem(object):
     def getComponentClassNames(self):
         """Returns the names of the registered Python component classes
 
+        This includes the components listed in the component manifest that
+        have not been imported yet.
+
         Returns:
             list: The array of component class names.
 
         """
 
-        return self.registeredComponents.keys()
+        classNames = self.registeredComponents.keys()
+        for className in sorted(self.__componentModules.keys()):
+            if className not in self.registeredComponents:
+                classNames.append(className)
 
-    def loadComponentModules(self):
-        """Loads all the component modules and configs specified in the 'KRAKEN_PATHS' environment variable.
+        return classNames
 
-        The kraken_components are loaded at all times.
+    def getComponentType(self, className):
+        """Returns the type of a registered component without importing it.
+
+        Args:
+            className (str): The name of the Python component class
 
         Returns:
-            bool: True if all components loaded, else False.
+            str: The component type, 'Guide' or 'Rig'.
 
         """
 
-        for componentClassPath in self.registeredComponents:
-            componentModulePath = self.registeredComponents[componentClassPath].__module__
-            if componentModulePath in sys.modules:
-                del(sys.modules[componentModulePath])
-
-        self.registeredComponents = {}
-
-        logger.info("Loading component modules...")
-
-        def __importDirRecursive(path, parentModulePath=''):
-            isSuccessful = True
-
-            contents = os.listdir(path)
-            moduleFilefound = False
-            for item in contents:
-                if os.path.isfile(os.path.join(path, item)):
-                    if item == "__init__.py":
-                        if parentModulePath == '':
-                            modulePath = os.path.basename(path)
-
-                            moduleParentFolder = os.path.split( path )[0]
-                            if moduleParentFolder not in sys.path:
-                                sys.path.append(moduleParentFolder)
-                        else:
-                            modulePath = parentModulePath + '.' + os.path.basename(path)
-                        moduleFilefound = True
+        if className in self.registeredComponents:
+            return self.registeredComponents[className].getComponentType()
 
+        modulePath = self.__componentModules.get(className, None)
+        if modulePath is None:
+            raise Exception("Component with that class not registered:" + className)
 
-            if moduleFilefound:
-                logger.info(" " + path + ":")
-                for i, item in enumerate(contents):
-                    if os.path.isfile(os.path.join(path, item)):
+        return self.componentManifest[modulePath]['components'][className]
 
-                        # Parse all the files of given path and import python
-                        # modules. The files in these folders really should be
-                        # limited to components, otherwise we are loading more
-                        # than modules and that is not clear.
+    def getComponentFilePath(self, className):
+        """Returns the file of the module of a component without importing it.
 
-                        # TODO: Figure out a way to limit imports to just rig
-                        # component modules.
+        Args:
+            className (str): The name of the Python component class
 
-                        if item.endswith(".py") and item != "__init__.py":
-                            module = modulePath + "." + item[:-3]
-                            try:
-                                logger.info("  " + module)
-                                importlib.import_module(module)
+        Returns:
+            str: The file path of the component module.
 
-                            except ImportError, e:
-                                isSuccessful = False
-                                logging.exception("Error importing '" + module)
+        """
 
-                            except Exception, e:
-                                isSuccessful = False
-                                logging.exception("Error Loading Modules'" + module)
+        if className in self.registeredComponents:
+            return sys.modules[self.registeredComponents[className].__module__].__file__
 
-                logging.info("")
+        modulePath = self.__componentModules.get(className, None)
+        if modulePath is None:
+            raise Exception("Component with that class not registered:" + className)
 
+        return self.componentManifest[modulePath]['file']
 
-            for item in contents:
-                if os.path.isdir(os.path.join(path, item)):
-                    if moduleFilefound:
-                        if not __importDirRecursive(os.path.join(path, item), modulePath):
-                            isSuccessful = False
-                    else:
-                        if not __importDirRecursive(os.path.join(path, item)):
-                            isSuccessful = False
+    def getComponentPaths(self):
+        """Returns the folders the component modules are loaded from.
 
-            return isSuccessful
+        Returns:
+            list: The kraken_components folder and the valid folders of the
+                'KRAKEN_PATHS' environment variable.
 
+        """
 
         # Find the kraken examples module in the same folder as the kraken module.
         default_component_path = os.path.normpath(os.path.join(os.environ.get('KRAKEN_PATH'), 'Python', 'kraken_components'))
-        isSuccessful = __importDirRecursive(default_component_path)
+        componentPaths = [default_component_path]
 
         pathsVar = os.getenv('KRAKEN_PATHS')
         if pathsVar is not None:
@@ -398,8 +513,250 @@ class KrakenSystem(object):
                     logging.info("Invalid Kraken Path: " + path)
                     continue
 
-                if not __importDirRecursive(path):
-                    isSuccessful = False
+                componentPaths.append(path)
+
+        return componentPaths
+
+    def getComponentManifestPath(self):
+        """Returns the path of the component manifest file.
+
+        The path is set by the KRAKEN_COMPONENT_MANIFEST environment variable
+        and defaults to a file of the '.kraken' folder in the home folder named
+        after the component paths, so installs loading different components
+        don't share a manifest. An empty path keeps the manifest in memory
+        only.
+
+        Returns:
+            str: The path of the manifest file, None if it isn't saved.
+
+        """
+
+        manifestPath = os.environ.get('KRAKEN_COMPONENT_MANIFEST', None)
+        if manifestPath is None:
+            pathsKey = hashlib.md5(os.pathsep.join(self.getComponentPaths())).hexdigest()
+            manifestPath = os.path.join(os.path.expanduser('~'), '.kraken', 'component_manifest_' + pathsKey + '.json')
+
+        if manifestPath == '':
+            return None
+
+        return manifestPath
+
+    def __readComponentManifest(self, componentPaths):
+        """Reads the component modules listed in the manifest file.
+
+        Manifests written for other component paths are ignored.
+
+        """
+
+        manifestPath = self.getComponentManifestPath()
+        if manifestPath is None or not os.path.exists(manifestPath):
+            return self.componentManifest
+
+        try:
+            with open(manifestPath, 'r') as manifestFile:
+                manifest = json.load(manifestFile)
+        except (IOError, ValueError):
+            logger.warning("Invalid component manifest, it will be rebuilt: " + manifestPath)
+            return {}
+
+        if manifest.get('version', None) != COMPONENT_MANIFEST_VERSION:
+            return {}
+
+        if manifest.get('componentPaths', None) != componentPaths:
+            return {}
+
+        return manifest.get('modules', {})
+
+    def __writeComponentManifest(self, componentPaths, modules):
+        """Writes the component modules to the manifest file."""
+
+        manifestPath = self.getComponentManifestPath()
+        if manifestPath is None:
+            return False
+
+        manifest = {
+            'version': COMPONENT_MANIFEST_VERSION,
+            'componentPaths': componentPaths,
+            'modules': modules
+        }
+
+        try:
+            manifestDir = os.path.dirname(manifestPath)
+            if manifestDir != '' and not os.path.exists(manifestDir):
+                os.makedirs(manifestDir)
+
+            with open(manifestPath, 'w') as manifestFile:
+                json.dump(manifest, manifestFile, indent=2, sort_keys=True)
+        except (IOError, OSError):
+            logger.warning("Unable to write the component manifest: " + manifestPath)
+            return False
+
+        return True
+
+    def __importComponentModule(self, modulePath, reloadModule=False):
+        """Imports a component module.
+
+        Args:
+            modulePath (str): The module to import.
+            reloadModule (bool): Reload the module if it was already imported.
+
+        Returns:
+            list: The class names of the components the module registered.
+
+        """
+
+        previousRegistrations = self.__componentRegistrations
+        self.__componentRegistrations = []
+        try:
+            if reloadModule and modulePath in sys.modules:
+                reload(sys.modules[modulePath])
+            else:
+                importlib.import_module(modulePath)
+
+            registrations = self.__componentRegistrations
+        finally:
+            self.__componentRegistrations = previousRegistrations
+
+        # Modules imported earlier as dependencies of other modules don't
+        # register their components again.
+        for className, componentClass in self.registeredComponents.iteritems():
+            if componentClass.__module__ == modulePath and className not in registrations:
+                registrations.append(className)
+
+        return registrations
+
+    def __findComponentModules(self, path, parentModulePath=''):
+        """Lists the Python modules of a component folder.
+
+        Args:
+            path (str): The folder to search.
+            parentModulePath (str): The module path of the folder's parent.
+
+        Returns:
+            list: (module path, file path) tuples.
+
+        """
+
+        modules = []
+
+        contents = os.listdir(path)
+        modulePath = None
+        if os.path.isfile(os.path.join(path, "__init__.py")):
+            if parentModulePath == '':
+                modulePath = os.path.basename(path)
+
+                moduleParentFolder = os.path.split(path)[0]
+                if moduleParentFolder not in sys.path:
+                    sys.path.append(moduleParentFolder)
+            else:
+                modulePath = parentModulePath + '.' + os.path.basename(path)
+
+            # The files in these folders really should be limited to
+            # components, otherwise we are loading more than modules and that
+            # is not clear.
+            for item in contents:
+                itemPath = os.path.join(path, item)
+                if item.endswith(".py") and item != "__init__.py" and os.path.isfile(itemPath):
+                    modules.append((modulePath + "." + item[:-3], itemPath))
+
+        for item in contents:
+            if os.path.isdir(os.path.join(path, item)):
+                if modulePath is not None:
+                    modules += self.__findComponentModules(os.path.join(path, item), modulePath)
+                else:
+                    modules += self.__findComponentModules(os.path.join(path, item))
+
+        return modules
+
+    def loadComponentModules(self):
+        """Loads all the component modules and configs specified in the 'KRAKEN_PATHS' environment variable.
+
+        The kraken_components are loaded at all times.
+
+        The component classes of each module are recorded in a manifest along
+        with the module file modification time. Modules that haven't changed
+        since they were recorded are not imported, their components are
+        registered by name and imported by getComponentClass. Calling this
+        again only re-imports the modules whose files changed.
+
+        Returns:
+            bool: True if all components loaded, else False.
+
+        """
+
+        Profiler.getInstance().push("loadComponentModules")
+
+        logger.info("Loading component modules...")
+
+        componentPaths = self.getComponentPaths()
+
+        modules = []
+        for path in componentPaths:
+            modules += self.__findComponentModules(path)
+
+        manifest = self.__readComponentManifest(componentPaths)
+
+        changedModules = set()
+        for modulePath, filePath in modules:
+            entry = manifest.get(modulePath, None)
+            if entry is None or entry['file'] != filePath or entry['mtime'] != os.path.getmtime(filePath):
+                changedModules.add(modulePath)
+
+        # Forget the components of the changed modules and of the ones that
+        # disappeared. Modules whose file changed since they were recorded are
+        # reloaded, new modules are only imported if they weren't already.
+        foundModules = set([x[0] for x in modules])
+        for modulePath, entry in manifest.iteritems():
+            if modulePath in foundModules and modulePath not in changedModules:
+                continue
+
+            for className in entry['components']:
+                if className in self.registeredComponents:
+                    del self.registeredComponents[className]
+
+        isSuccessful = True
+        newManifest = {}
+        for modulePath, filePath in modules:
+            if modulePath not in changedModules:
+                newManifest[modulePath] = manifest[modulePath]
+                continue
+
+            try:
+                logger.info("  " + modulePath)
+                classNames = self.__importComponentModule(modulePath, reloadModule=modulePath in manifest)
+
+            except ImportError, e:
+                isSuccessful = False
+                logging.exception("Error importing '" + modulePath)
+                continue
+
+            except Exception, e:
+                isSuccessful = False
+                logging.exception("Error Loading Modules'" + modulePath)
+                continue
+
+            components = {}
+            for className in classNames:
+                components[className] = self.registeredComponents[className].getComponentType()
+
+            newManifest[modulePath] = {
+                'file': filePath,
+                'mtime': os.path.getmtime(filePath),
+                'components': components
+            }
+
+        self.__componentModules = {}
+        for modulePath, filePath in modules:
+            if modulePath in newManifest:
+                for className in newManifest[modulePath]['components']:
+                    self.__componentModules[className] = modulePath
+
+        if newManifest != manifest:
+            self.__writeComponentManifest(componentPaths, newManifest)
+
+        self.componentManifest = newManifest
+
+        Profiler.getInstance().pop()
 
         return isSuccessful
 
@@ -1,6 +1,8 @@
 """Kraken - math module."""
 
 from math_object import MathObject
+from math_object import registerMathClass
+from math_object import getMathClass
 from vec2 import Vec2
 from vec3 import Vec3
 from vec4 import Vec4
@@ -14,6 +16,10 @@ from color import Color
 from constants import DEG_TO_RAD, RAD_TO_DEG, PI
 
 
+for mathClass in (Vec2, Vec3, Vec4, Quat, Euler, Xfo, Mat33, Mat44, RotationOrder, Color):
+    registerMathClass(mathClass)
+
+
 def Math_radToDeg(val):
     """Converts radians to degrees.
 
@@ -58,31 +64,11 @@ def decodeValue(jsonData):
     if '__mathObjectClass__' not in jsonData:
         raise Exception("Invalid JSON data for constructing value:" + str(jsonData))
 
-    if jsonData['__mathObjectClass__'] == 'Vec2':
-        val = Vec2()
-        val.jsonDecode(jsonData, decodeValue)
-    elif jsonData['__mathObjectClass__'] == 'Vec3':
-        val = Vec3()
-        val.jsonDecode(jsonData, decodeValue)
-    elif jsonData['__mathObjectClass__'] == 'Vec4':
-        val = Vec4()
-        val.jsonDecode(jsonData, decodeValue)
-    elif jsonData['__mathObjectClass__'] == 'Euler':
-        val = Euler()
-        val.jsonDecode(jsonData, decodeValue)
-    elif jsonData['__mathObjectClass__'] == 'Quat':
-        val = Quat()
-        val.jsonDecode(jsonData, decodeValue)
-    elif jsonData['__mathObjectClass__'] == 'Xfo':
-        val = Xfo()
-        val.jsonDecode(jsonData, decodeValue)
-    elif jsonData['__mathObjectClass__'] == 'Mat33':
-        val = Mat33()
-        val.jsonDecode(jsonData, decodeValue)
-    elif jsonData['__mathObjectClass__'] == 'Mat44':
-        val = Mat44()
-        val.jsonDecode(jsonData, decodeValue)
-    else:
+    mathClass = getMathClass(jsonData['__mathObjectClass__'])
+    if mathClass is None:
         raise Exception("Unsupported Math type:" + jsonData['__mathObjectClass__'])
 
+    val = mathClass()
+    val.jsonDecode(jsonData, decodeValue)
+
     return val
@@ -9,6 +9,7 @@ import random
 import math
 from kraken.core.kraken_system import ks
 from math_object import MathObject
+from math_object import mathRTVal
 
 
 class Color(MathObject):
@@ -19,9 +20,9 @@ class Color(MathObject):
 
         super(Color, self).__init__()
         if ks.getRTValTypeName(r) == 'Color':
-            self._rtval = r
+            self.setRTVal(r)
         else:
-            self._rtval = ks.rtVal('Color')
+            self._rtval = mathRTVal('Color')
             if isinstance(r, Color):
                 self.set(r=r.r, g=r.g, b=r.b, a=r.b)
             else:
@@ -68,7 +69,7 @@ class Color(MathObject):
 
         """
 
-        self._rtval.r = ks.rtVal('Scalar', value)
+        self._rtval.r = mathRTVal('Scalar', value)
 
         return True
 
@@ -97,7 +98,7 @@ class Color(MathObject):
 
         """
 
-        self._rtval.g = ks.rtVal('Scalar', value)
+        self._rtval.g = mathRTVal('Scalar', value)
 
         return True
 
@@ -126,7 +127,7 @@ class Color(MathObject):
 
         """
 
-        self._rtval.b = ks.rtVal('Scalar', value)
+        self._rtval.b = mathRTVal('Scalar', value)
 
         return True
 
@@ -155,7 +156,7 @@ class Color(MathObject):
 
         """
 
-        self._rtval.a = ks.rtVal('Scalar', value)
+        self._rtval.a = mathRTVal('Scalar', value)
 
 
     def __eq__(self, other):
@@ -206,8 +207,8 @@ class Color(MathObject):
 
         """
 
-        self._rtval.set('', ks.rtVal('Scalar', r), ks.rtVal('Scalar', g),
-                        ks.rtVal('Scalar', b), ks.rtVal('Scalar', a))
+        self._rtval.set('', mathRTVal('Scalar', r), mathRTVal('Scalar', g),
+                        mathRTVal('Scalar', b), mathRTVal('Scalar', a))
 
         return True
 
@@ -239,7 +240,7 @@ class Color(MathObject):
         """
 
         return self._rtval.almostEqual('Boolean', other._rtval,
-                                       ks.rtVal('Scalar', precision)).getSimpleType()
+                                       mathRTVal('Scalar', precision)).getSimpleType()
 
 
     def component(self, i):
@@ -253,7 +254,7 @@ class Color(MathObject):
 
         """
 
-        return self._rtval.component('Scalar', ks.rtVal('Size', i)).getSimpleType()
+        return self._rtval.component('Scalar', mathRTVal('Size', i)).getSimpleType()
 
 
     def setComponent(self, i, v):
@@ -268,8 +269,8 @@ class Color(MathObject):
 
         """
 
-        return self._rtval.setComponent('', ks.rtVal('Size', i),
-                                        ks.rtVal('Scalar', v))
+        return self._rtval.setComponent('', mathRTVal('Size', i),
+                                        mathRTVal('Scalar', v))
 
 
 
@@ -340,7 +341,7 @@ class Color(MathObject):
 
         """
 
-        return Color(self._rtval.multiplyScalar('Color', ks.rtVal('Scalar', other)))
+        return Color(self._rtval.multiplyScalar('Color', mathRTVal('Scalar', other)))
 
 
     def divideScalar(self, other):
@@ -354,7 +355,7 @@ class Color(MathObject):
 
         """
 
-        return Color(self._rtval.divideScalar('Color', ks.rtVal('Scalar', other)))
+        return Color(self._rtval.divideScalar('Color', mathRTVal('Scalar', other)))
 
 
     def linearInterpolate(self, other, t):
@@ -370,7 +371,7 @@ class Color(MathObject):
 
         """
 
-        return Color(self._rtval.linearInterpolate('Color', ks.rtVal('Color', other), ks.rtVal('Scalar', t)))
+        return Color(self._rtval.linearInterpolate('Color', mathRTVal('Color', other), mathRTVal('Scalar', t)))
 
 
     @classmethod
@@ -8,6 +8,7 @@ import math
 
 from kraken.core.kraken_system import ks
 from kraken.core.maths.math_object import MathObject
+from kraken.core.maths.math_object import mathRTVal
 from kraken.core.maths.mat33 import Mat33
 from kraken.core.maths.rotation_order import RotationOrder
 
@@ -21,7 +22,7 @@ class Euler(MathObject):
         super(Euler, self).__init__()
 
         if ks.getRTValTypeName(x) == 'Euler':
-            self._rtval = x
+            self.setRTVal(x)
         else:
 
             if x is not None and not isinstance(x, (int, float)) and not isinstance(x, Euler):
@@ -40,7 +41,7 @@ class Euler(MathObject):
                 if isinstance(ro, basestring) or isinstance(ro, (int)):
                     ro = RotationOrder(order=ro)
 
-            self._rtval = ks.rtVal('Euler')
+            self._rtval = mathRTVal('Euler')
             if isinstance(x, Euler):
                 self.set(x=x.x, y=x.y, z=x.z, ro=x.ro)
             elif x is not None and y is not None and z is not None:
@@ -77,7 +78,7 @@ class Euler(MathObject):
 
         """
 
-        self._rtval.x = ks.rtVal('Scalar', value)
+        self._rtval.x = mathRTVal('Scalar', value)
 
 
     @property
@@ -101,7 +102,7 @@ class Euler(MathObject):
 
         """
 
-        self._rtval.y = ks.rtVal('Scalar', value)
+        self._rtval.y = mathRTVal('Scalar', value)
 
 
     @property
@@ -125,7 +126,7 @@ class Euler(MathObject):
 
         """
 
-        self._rtval.z = ks.rtVal('Scalar', value)
+        self._rtval.z = mathRTVal('Scalar', value)
 
 
     @property
@@ -148,7 +149,7 @@ class Euler(MathObject):
 
         """
 
-        self._rtval.ro = ks.rtVal('RotationOrder', value)
+        self._rtval.ro = mathRTVal('RotationOrder', value)
 
 
     def __eq__(self, other):
@@ -191,9 +192,9 @@ class Euler(MathObject):
         """
 
         if ro is None:
-            self._rtval.set('', ks.rtVal('Scalar', x), ks.rtVal('Scalar', y), ks.rtVal('Scalar', z))
+            self._rtval.set('', mathRTVal('Scalar', x), mathRTVal('Scalar', y), mathRTVal('Scalar', z))
         else:
-            self._rtval.set('', ks.rtVal('Scalar', x), ks.rtVal('Scalar', y), ks.rtVal('Scalar', z), ks.rtVal('RotationOrder', ro))
+            self._rtval.set('', mathRTVal('Scalar', x), mathRTVal('Scalar', y), mathRTVal('Scalar', z), mathRTVal('RotationOrder', ro))
 
         return True
 
@@ -209,7 +210,7 @@ class Euler(MathObject):
 
         """
 
-        return self._rtval.equal('Boolean', ks.rtVal('Euler', other)).getSimpleType()
+        return self._rtval.equal('Boolean', mathRTVal('Euler', other)).getSimpleType()
 
 
     def almostEqual(self, other, precision):
@@ -224,7 +225,7 @@ class Euler(MathObject):
 
         """
 
-        return self._rtval.almostEqual('Boolean', ks.rtVal('Euler', other), ks.rtVal('Scalar', precision)).getSimpleType()
+        return self._rtval.almostEqual('Boolean', mathRTVal('Euler', other), mathRTVal('Scalar', precision)).getSimpleType()
 
 
     def toMat33(self):
@@ -6,6 +6,7 @@ Mat33 -- Matrix 3 transform object.
 
 from kraken.core.kraken_system import ks
 from kraken.core.maths.math_object import MathObject
+from kraken.core.maths.math_object import mathRTVal
 from kraken.core.maths.vec3 import Vec3
 
 
@@ -18,9 +19,9 @@ class Mat33(MathObject):
         super(Mat33, self).__init__()
 
         if ks.getRTValTypeName(row0) == 'Mat33':
-            self._rtval = row0
+            self.setRTVal(row0)
         else:
-            self._rtval = ks.rtVal('Mat33')
+            self._rtval = mathRTVal('Mat33')
             if isinstance(row0, Mat33):
                 self.setRows(row0=row0.row0, row1=row0.row1, row2=row0.row2)
             elif row0 is not None and row1 is not None and row2 is not None:
@@ -57,7 +58,7 @@ class Mat33(MathObject):
 
         """
 
-        self._rtval.row0 = ks.rtVal('Vec3', value)
+        self._rtval.row0 = mathRTVal('Vec3', value)
 
         return True
 
@@ -86,7 +87,7 @@ class Mat33(MathObject):
 
         """
 
-        self._rtval.row1 = ks.rtVal('Vec3', value)
+        self._rtval.row1 = mathRTVal('Vec3', value)
 
         return True
 
@@ -115,7 +116,7 @@ class Mat33(MathObject):
 
         """
 
-        self._rtval.row2 = ks.rtVal('Vec3', value)
+        self._rtval.row2 = mathRTVal('Vec3', value)
 
         return True
 
@@ -165,7 +166,7 @@ class Mat33(MathObject):
 
         """
 
-        self._rtval.setRows('', ks.rtVal('Vec3', row0), ks.rtVal('Vec3', row1), ks.rtVal('Vec3', row2))
+        self._rtval.setRows('', mathRTVal('Vec3', row0), mathRTVal('Vec3', row1), mathRTVal('Vec3', row2))
 
         return True
 
@@ -183,7 +184,7 @@ class Mat33(MathObject):
 
         """
 
-        self._rtval.setColumns('', ks.rtVal('Vec3', col0), ks.rtVal('Vec3', col1), ks.rtVal('Vec3', col2))
+        self._rtval.setColumns('', mathRTVal('Vec3', col0), mathRTVal('Vec3', col1), mathRTVal('Vec3', col2))
 
         return True
 
@@ -225,7 +226,7 @@ class Mat33(MathObject):
 
         """
 
-        self._rtval.setDiagonal('', ks.rtVal('Scalar', v))
+        self._rtval.setDiagonal('', mathRTVal('Scalar', v))
 
         return True
 
@@ -242,7 +243,7 @@ class Mat33(MathObject):
 
         """
 
-        self._rtval.setDiagonal('', ks.rtVal('Vec3', v))
+        self._rtval.setDiagonal('', mathRTVal('Vec3', v))
 
         return True
 
@@ -258,7 +259,7 @@ class Mat33(MathObject):
 
         """
 
-        return self._rtval.equal('Boolean', ks.rtVal('Mat33', other)).getSimpleType()
+        return self._rtval.equal('Boolean', mathRTVal('Mat33', other)).getSimpleType()
 
 
     def almostEqual(self, other, precision=None):
@@ -273,9 +274,9 @@ class Mat33(MathObject):
 
         """
         if precision is not None:
-            return self._rtval.almostEqual('Boolean', ks.rtVal('Mat33', other), ks.rtVal('Scalar', precision)).getSimpleType()
+            return self._rtval.almostEqual('Boolean', mathRTVal('Mat33', other), mathRTVal('Scalar', precision)).getSimpleType()
         else:
-            return self._rtval.almostEqual('Boolean', ks.rtVal('Mat33', other)).getSimpleType()
+            return self._rtval.almostEqual('Boolean', mathRTVal('Mat33', other)).getSimpleType()
 
 
     def add(self, other):
@@ -289,7 +290,7 @@ class Mat33(MathObject):
 
         """
 
-        return Mat33(self._rtval.add('Mat33', ks.rtVal('Mat33', other)))
+        return Mat33(self._rtval.add('Mat33', mathRTVal('Mat33', other)))
 
 
     def subtract(self, other):
@@ -303,7 +304,7 @@ class Mat33(MathObject):
 
         """
 
-        return Mat33(self._rtval.subtract('Mat33', ks.rtVal('Mat33', other)))
+        return Mat33(self._rtval.subtract('Mat33', mathRTVal('Mat33', other)))
 
 
     def multiply(self, other):
@@ -317,7 +318,7 @@ class Mat33(MathObject):
 
         """
 
-        return Mat33(self._rtval.multiply('Mat33', ks.rtVal('Mat33', other)))
+        return Mat33(self._rtval.multiply('Mat33', mathRTVal('Mat33', other)))
 
 
     def multiplyScalar(self, other):
@@ -331,7 +332,7 @@ class Mat33(MathObject):
 
         """
 
-        return Mat33(self._rtval.multiplyScalar('Mat33', ks.rtVal('Scalar', other)))
+        return Mat33(self._rtval.multiplyScalar('Mat33', mathRTVal('Scalar', other)))
 
 
     def multiplyVector(self, other):
@@ -345,7 +346,7 @@ class Mat33(MathObject):
 
         """
 
-        return Vec3(self._rtval.multiplyVector('Vec3', ks.rtVal('Vec3', other)))
+        return Vec3(self._rtval.multiplyVector('Vec3', mathRTVal('Vec3', other)))
 
 
     def divideScalar(self, other):
@@ -5,6 +5,7 @@ Mat44 -- Matrix 3 transform object.
 """
 
 from math_object import MathObject
+from math_object import mathRTVal
 from kraken.core.kraken_system import ks
 from vec import Vec3, Vec4
 from mat33 import Mat33
@@ -19,9 +20,9 @@ class Mat44(MathObject):
         super(Mat44, self).__init__()
 
         if ks.getRTValTypeName(row0) == 'Mat44':
-            self._rtval = row0
+            self.setRTVal(row0)
         else:
-            self._rtval = ks.rtVal('Mat44')
+            self._rtval = mathRTVal('Mat44')
             if isinstance(row0, Mat33):
                 self.setRows(row0=row0.row0, row1=row0.row1, row2=row0.row2, row3=row0.row3)
             elif row0 is not None and row1 is not None and row2 is not None and row3 is not None:
@@ -68,7 +69,7 @@ class Mat44(MathObject):
 
         """
 
-        self._rtval.row0 = ks.rtVal('Vec4', value)
+        self._rtval.row0 = mathRTVal('Vec4', value)
 
         return True
 
@@ -96,7 +97,7 @@ class Mat44(MathObject):
 
         """
 
-        self._rtval.row1 = ks.rtVal('Vec4', value)
+        self._rtval.row1 = mathRTVal('Vec4', value)
 
         return True
 
@@ -124,7 +125,7 @@ class Mat44(MathObject):
 
         """
 
-        self._rtval.row2 = ks.rtVal('Vec4', value)
+        self._rtval.row2 = mathRTVal('Vec4', value)
 
         return True
 
@@ -152,7 +153,7 @@ class Mat44(MathObject):
 
         """
 
-        self._rtval.row3 = ks.rtVal('Vec4', value)
+        self._rtval.row3 = mathRTVal('Vec4', value)
 
         return True
 
@@ -203,8 +204,8 @@ class Mat44(MathObject):
 
         """
 
-        self._rtval.setRows('', ks.rtVal('Vec4', row0), ks.rtVal('Vec4', row1),
-                            ks.rtVal('Vec4', row2), ks.rtVal('Vec4', row3))
+        self._rtval.setRows('', mathRTVal('Vec4', row0), mathRTVal('Vec4', row1),
+                            mathRTVal('Vec4', row2), mathRTVal('Vec4', row3))
 
         return True
 
@@ -222,8 +223,8 @@ class Mat44(MathObject):
 
         """
 
-        self._rtval.setColumns('', ks.rtVal('Vec4', col0), ks.rtVal('Vec4', col1),
-                               ks.rtVal('Vec4', col2), ks.rtVal('Vec4', col3))
+        self._rtval.setColumns('', mathRTVal('Vec4', col0), mathRTVal('Vec4', col1),
+                               mathRTVal('Vec4', col2), mathRTVal('Vec4', col3))
 
         return True
 
@@ -262,7 +263,7 @@ class Mat44(MathObject):
 
         """
 
-        self._rtval.setDiagonal('', ks.rtVal('Scalar', v))
+        self._rtval.setDiagonal('', mathRTVal('Scalar', v))
 
         return True
 
@@ -278,7 +279,7 @@ class Mat44(MathObject):
 
         """
 
-        self._rtval.setDiagonal('', ks.rtVal('Vec3', v))
+        self._rtval.setDiagonal('', mathRTVal('Vec3', v))
 
         return True
 
@@ -294,7 +295,7 @@ class Mat44(MathObject):
 
         """
 
-        self._rtval.setDiagonal('', ks.rtVal('Vec4', v))
+        self._rtval.setDiagonal('', mathRTVal('Vec4', v))
 
         return True
 
@@ -309,7 +310,7 @@ class Mat44(MathObject):
 
         """
 
-        return self._rtval.equal('Boolean', ks.rtVal('Mat44', other)).getSimpleType()
+        return self._rtval.equal('Boolean', mathRTVal('Mat44', other)).getSimpleType()
 
     def almostEqualWithPrecision(self, other, precision):
         """Checks almost equality of this Matrix44 with another.
@@ -323,8 +324,8 @@ class Mat44(MathObject):
 
         """
 
-        return self._rtval.almostEqual('Boolean', ks.rtVal('Mat44', other),
-                                       ks.rtVal('Scalar', precision)).getSimpleType()
+        return self._rtval.almostEqual('Boolean', mathRTVal('Mat44', other),
+                                       mathRTVal('Scalar', precision)).getSimpleType()
 
     def almostEqual(self, other):
         """Checks almost equality of this Matrix44 with another
@@ -338,7 +339,7 @@ class Mat44(MathObject):
 
         """
 
-        return self._rtval.almostEqual('Boolean', ks.rtVal('Mat44', other)).getSimpleType()
+        return self._rtval.almostEqual('Boolean', mathRTVal('Mat44', other)).getSimpleType()
 
     def add(self, other):
         """Overload method for the add operator.
@@ -351,7 +352,7 @@ class Mat44(MathObject):
 
         """
 
-        return Mat44(self._rtval.add('Mat44', ks.rtVal('Mat44', other)))
+        return Mat44(self._rtval.add('Mat44', mathRTVal('Mat44', other)))
 
     def subtract(self, other):
         """Overload method for the subtract operator.
@@ -364,7 +365,7 @@ class Mat44(MathObject):
 
         """
 
-        return Mat44(self._rtval.subtract('Mat44', ks.rtVal('Mat44', other)))
+        return Mat44(self._rtval.subtract('Mat44', mathRTVal('Mat44', other)))
 
     def multiply(self, other):
         """Overload method for the multiply operator.
@@ -377,7 +378,7 @@ class Mat44(MathObject):
 
         """
 
-        return Mat44(self._rtval.multiply('Mat44', ks.rtVal('Mat44', other)))
+        return Mat44(self._rtval.multiply('Mat44', mathRTVal('Mat44', other)))
 
     def multiplyScalar(self, other):
         """Product of this matrix and a scalar.
@@ -390,7 +391,7 @@ class Mat44(MathObject):
 
         """
 
-        return Mat44(self._rtval.multiplyScalar('Mat44', ks.rtVal('Scalar', other)))
+        return Mat44(self._rtval.multiplyScalar('Mat44', mathRTVal('Scalar', other)))
 
     def multiplyVector3(self, other):
         """Returns the product of this matrix and a vector.
@@ -403,7 +404,7 @@ class Mat44(MathObject):
 
         """
 
-        return Vec3(self._rtval.multiplyVector3('Vec3', ks.rtVal('Vec3', other)))
+        return Vec3(self._rtval.multiplyVector3('Vec3', mathRTVal('Vec3', other)))
 
     def multiplyVector4(self, other):
         """Returns the product of this matrix and a vector.
@@ -416,7 +417,7 @@ class Mat44(MathObject):
 
         """
 
-        return Vec4(self._rtval.multiplyVector4('Vec4', ks.rtVal('Vec4', other)))
+        return Vec4(self._rtval.multiplyVector4('Vec4', mathRTVal('Vec4', other)))
 
     def divideScalar(self, other):
         """Divides this matrix and a scalar.
@@ -483,7 +484,7 @@ class Mat44(MathObject):
 
         """
 
-        self._rtval.setTranslation('', ks.rtVal('Vec3', vec))
+        self._rtval.setTranslation('', mathRTVal('Vec3', vec))
 
         return True
 
@@ -498,7 +499,7 @@ class Mat44(MathObject):
 
         """
 
-        self._rtval.setRotation('', ks.rtVal('Quat', quat))
+        self._rtval.setRotation('', mathRTVal('Quat', quat))
 
     def setScaling(self, vec):
         """Sets the scaling of the matrix by a Vec3.
@@ -511,7 +512,7 @@ class Mat44(MathObject):
 
         """
 
-        self._rtval.setScaling('', ks.rtVal('Vec3', vec))
+        self._rtval.setScaling('', mathRTVal('Vec3', vec))
 
         return True
 
@@ -526,7 +527,7 @@ class Mat44(MathObject):
 
         """
 
-        self._rtval.setFromMat33('', ks.rtVal('Mat33', mat))
+        self._rtval.setFromMat33('', mathRTVal('Mat33', mat))
 
         return True
 
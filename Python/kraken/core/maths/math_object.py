@@ -2,10 +2,148 @@
 
 Classes:
 MathObject -- A base class for all math types.
+
+Functions:
+mathRTVal -- Constructs a value of the active math backend.
+toRTVal -- Converts a native math value to a Fabric RTVal.
+fromRTVal -- Converts a Fabric RTVal to a native math value.
+registerMathClass -- Registers a math class for JSON decoding.
+getMathClass -- Returns a registered math class by name.
 """
 
 import json
-import FabricEngine.Core
+
+from kraken.core.kraken_system import ks
+from kraken.core.maths.native import NATIVE_TYPES
+from kraken.core.maths.native import NativeValue
+from kraken.core.maths.native import simpleValue
+
+
+def mathRTVal(dataType, defaultValue=None):
+    """Constructs a value of the given KL type using the active math backend.
+
+    With the 'fabric' backend this is the same as ks.rtVal. With the 'python'
+    backend a native value is returned instead and Fabric is never loaded.
+
+    Args:
+        dataType (str): The name of the data type to construct.
+        defaultValue (value): The default value to use to initialize the value.
+
+    Returns:
+        object: The constructed RTVal or native value.
+
+    """
+
+    if ks.mathBackend != 'python':
+        return ks.rtVal(dataType, defaultValue)
+
+    if defaultValue is None:
+        nativeType = NATIVE_TYPES.get(dataType)
+        if nativeType is None:
+            return simpleValue(dataType)
+
+        return nativeType()
+
+    if isinstance(defaultValue, MathObject):
+        defaultValue = defaultValue._rtval
+
+    if isinstance(defaultValue, NativeValue):
+        return defaultValue
+
+    if ks.isRTVal(defaultValue):
+        return fromRTVal(defaultValue, dataType)
+
+    return simpleValue(dataType, defaultValue)
+
+
+def toRTVal(value):
+    """Converts a native math value to a new Fabric RTVal.
+
+    Args:
+        value (object): The native value to convert.
+
+    Returns:
+        object: The Fabric RTVal.
+
+    """
+
+    if not isinstance(value, NativeValue):
+        return ks.rtVal(value.typeName, value.getSimpleType())
+
+    rtval = ks.rtVal(value.klTypeName)
+    for memberName, memberType in value.members:
+        setattr(rtval, memberName, toRTVal(getattr(value, memberName)))
+
+    return rtval
+
+
+def fromRTVal(rtval, dataType=None):
+    """Converts a Fabric RTVal to a new native math value.
+
+    Args:
+        rtval (object): The Fabric RTVal to convert.
+        dataType (str): The KL type of the RTVal, queried when not given.
+
+    Returns:
+        object: The native value.
+
+    """
+
+    if dataType is None:
+        dataType = ks.getRTValTypeName(rtval)
+
+    nativeType = NATIVE_TYPES.get(dataType)
+    if nativeType is None:
+        return simpleValue(dataType, rtval.getSimpleType())
+
+    value = nativeType()
+    for memberName, memberType in nativeType.members:
+        member = getattr(rtval, memberName)
+        if memberType in NATIVE_TYPES:
+            setattr(value, memberName, fromRTVal(member, memberType))
+        else:
+            setattr(value, memberName, member.getSimpleType())
+
+    return value
+
+
+# Registered math classes by name, used to decode JSON data.
+_mathClasses = {}
+
+# Names of the fields encoded to JSON, by math class.
+_jsonFields = {}
+
+
+def registerMathClass(mathClass):
+    """Registers a math class so JSON data of that class can be decoded.
+
+    Args:
+        mathClass (class): The MathObject subclass, it must be constructible
+            without arguments.
+
+    Returns:
+        class: The registered class.
+
+    """
+
+    _mathClasses[mathClass.__name__] = mathClass
+
+    return mathClass
+
+
+def getMathClass(className):
+    """Returns a registered math class.
+
+    Args:
+        className (str): The name of the class, as stored in the
+            '__mathObjectClass__' key of the JSON data.
+
+    Returns:
+        class: The math class, None if no class is registered with that name.
+
+    """
+
+    return _mathClasses.get(className, None)
 
 
 class MathObject(object):
@@ -21,25 +159,57 @@ class MathObject(object):
     def getRTVal(self):
         """Returns the internal RTVal object owned by the math object.
 
+        When the object uses the python math backend, a new Fabric RTVal holding
+        a copy of its value is returned.
+
         Returns:
             object: RTVal
 
         """
 
+        if isinstance(self._rtval, NativeValue):
+            return toRTVal(self._rtval)
+
         return self._rtval
 
 
     def setRTVal(self, rtval):
         """Sets the internal RTVal object owned by the math object.
 
+        Fabric RTVals are converted to native values when the python math
+        backend is active.
+
         Args:
             rtval (object): The internal RTVal object owned by the math object.
 
         """
 
+        if ks.mathBackend == 'python' and ks.isRTVal(rtval):
+            rtval = fromRTVal(rtval)
+
         self._rtval = rtval
 
 
+    @classmethod
+    def getJsonFields(cls):
+        """Returns the names of the fields encoded to JSON.
+
+        These are the public attributes of the class that are not callable,
+        the properties of the math types. They are looked up once per class.
+
+        Returns:
+            tuple: The sorted field names.
+
+        """
+
+        fields = _jsonFields.get(cls, None)
+        if fields is None:
+            fields = tuple([name for name in dir(cls) if not name.startswith('_') and not callable(getattr(cls, name))])
+            _jsonFields[cls] = fields
+
+        return fields
+
+
     def jsonEncode(self):
         """Encodes object to JSON.
 
@@ -52,8 +222,7 @@ class MathObject(object):
              "__mathObjectClass__": self.__class__.__name__,
             }
 
-        public_attrs = (name for name in dir(self) if not name.startswith('_') and not callable(getattr(self,name)) and name)
-        for name in public_attrs:
+        for name in self.getJsonFields():
             item = getattr(self, name)
             if isinstance(item, MathObject):
                 d[name] = item.jsonEncode()
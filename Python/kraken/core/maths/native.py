@@ -0,0 +1,1527 @@
+"""Kraken - maths.native module.
+
+Pure Python implementations of the KL Math types wrapped by the Kraken math
+classes. They are used in place of Fabric RTVals when the 'python' math backend
+is active (see KrakenSystem.setMathBackend), so that building and editing rigs
+does not cross the Python / Fabric boundary for every component access.
+
+The native values follow the RTVal calling convention used by the math classes,
+``value.method(returnTypeName, *args)``, and expose their members the way the
+Fabric bindings do (``value.x.getSimpleType()``). Components are stored as 32
+bit floats and every intermediate result is rounded to 32 bits so that results
+match the KL Scalar arithmetic.
+
+Classes:
+SimpleValue -- Stand in for the RTVals of the KL simple types.
+NativeValue -- Base class for the native math values.
+NativeVec2 -- Native Vec2.
+NativeVec3 -- Native Vec3.
+NativeVec4 -- Native Vec4.
+NativeColor -- Native Color.
+NativeRotationOrder -- Native RotationOrder.
+NativeEuler -- Native Euler.
+NativeQuat -- Native Quat.
+NativeMat33 -- Native Mat33.
+NativeMat44 -- Native Mat44.
+NativeXfo -- Native Xfo.
+
+"""
+
+import math
+from array import array
+from struct import Struct
+
+from kraken.core.maths.constants import ROT_ORDER_INT_TO_STR_MAP
+
+
+PRECISION = 1.0e-5
+DIVIDEPRECISION = 1.0e-9
+
+_float32 = Struct('f')
+_pack = _float32.pack
+_unpack = _float32.unpack
+
+_AXIS_INDEX_MAP = {'X': 0, 'Y': 1, 'Z': 2}
+
+SCALAR_TYPES = ('Scalar', 'Float32', 'Float64')
+INTEGER_TYPES = ('Integer', 'SInt32', 'UInt32', 'SInt64', 'UInt64', 'Size', 'Index', 'UInt8', 'SInt8', 'UInt16', 'SInt16', 'Byte')
+
+
+def f32(value):
+    """Rounds a float to the nearest 32 bit float, as KL Scalars do.
+
+    Args:
+        value (float): Value to round.
+
+    Returns:
+        float: Rounded value.
+
+    """
+
+    try:
+        return _unpack(_pack(value))[0]
+    except OverflowError:
+        return math.copysign(float('inf'), value)
+
+
+def unwrap(value):
+    """Returns the Python value of a simple value or simple type RTVal.
+
+    Args:
+        value (object): SimpleValue, RTVal or Python value.
+
+    Returns:
+        object: Python value.
+
+    """
+
+    if type(value) is SimpleValue:
+        return value._value
+
+    if hasattr(value, 'getSimpleType'):
+        return value.getSimpleType()
+
+    return value
+
+
+def _scalar(value):
+    if type(value) is SimpleValue:
+        return value._value
+
+    return f32(unwrap(value))
+
+
+def _dot(a, b):
+    result = f32(a[0] * b[0])
+    for i in xrange(1, len(a)):
+        result = f32(result + f32(a[i] * b[i]))
+
+    return result
+
+
+def _cross(a, b):
+    return (f32(f32(a[1] * b[2]) - f32(a[2] * b[1])),
+            f32(f32(a[2] * b[0]) - f32(a[0] * b[2])),
+            f32(f32(a[0] * b[1]) - f32(a[1] * b[0])))
+
+
+def _add(a, b):
+    return [f32(x + y) for x, y in zip(a, b)]
+
+
+def _sub(a, b):
+    return [f32(x - y) for x, y in zip(a, b)]
+
+
+def _scale(a, s):
+    return [f32(x * s) for x in a]
+
+
+class SimpleValue(object):
+    """Stand in for the RTVals of the KL simple types (Scalar, Integer, ...)."""
+
+    __slots__ = ('typeName', '_value')
+
+    def __init__(self, typeName, value):
+        super(SimpleValue, self).__init__()
+        self.typeName = typeName
+        self._value = value
+
+
+    def __repr__(self):
+        return self.typeName + "(" + repr(self._value) + ")"
+
+
+    def getSimpleType(self):
+        """Returns the Python value of this simple value.
+
+        Returns:
+            object: Python value.
+
+        """
+
+        return self._value
+
+
+def simpleValue(typeName, value=None):
+    """Constructs a SimpleValue, converting the value to the KL precision.
+
+    Args:
+        typeName (str): Name of the KL simple type.
+        value (object): Python value or simple value.
+
+    Returns:
+        SimpleValue: The constructed value.
+
+    """
+
+    value = unwrap(value)
+    if typeName in SCALAR_TYPES:
+        value = 0.0 if value is None else float(value)
+        if typeName != 'Float64':
+            value = f32(value)
+    elif typeName in INTEGER_TYPES:
+        value = 0 if value is None else int(value)
+    elif typeName == 'Boolean':
+        value = bool(value)
+    elif typeName == 'String':
+        value = '' if value is None else str(value)
+    else:
+        raise TypeError("Unsupported simple type for the python math backend: " + str(typeName))
+
+    return SimpleValue(typeName, value)
+
+
+def _boolean(value):
+    return SimpleValue('Boolean', value)
+
+
+def _scalarValue(value):
+    return SimpleValue('Scalar', value)
+
+
+class NativeValue(object):
+    """Base class for the native math values.
+
+    Subclasses list their members as (name, KL type name) pairs so the values
+    can be converted to and from Fabric RTVals.
+
+    """
+
+    __slots__ = ()
+
+    klTypeName = None
+    members = ()
+
+
+    def __repr__(self):
+        memberStrs = [name + "=" + repr(unwrap(getattr(self, name))) for name, memberType in self.members]
+
+        return "Native" + self.klTypeName + "(" + ", ".join(memberStrs) + ")"
+
+
+    def copy(self):
+        """Returns a deep copy of this value.
+
+        Returns:
+            NativeValue: The copy.
+
+        """
+
+        raise NotImplementedError("copy() not implemented for " + self.klTypeName)
+
+
+    def clone(self, returnType=None):
+        return self.copy()
+
+
+# ===============
+# Vector Types
+# ===============
+def _component(index):
+
+    def getter(self):
+        return SimpleValue('Scalar', self._data[index])
+
+    def setter(self, value):
+        self._data[index] = unwrap(value)
+
+    return property(getter, setter)
+
+
+class _NativeVector(NativeValue):
+    """Base class for the native values storing a flat array of Scalars."""
+
+    __slots__ = ('_data',)
+
+    defaults = ()
+
+
+    def __init__(self, *values):
+        super(_NativeVector, self).__init__()
+        self._data = array('f', values or self.defaults)
+
+
+    def _new(self, values):
+        value = self.__class__.__new__(self.__class__)
+        value._data = array('f', values)
+
+        return value
+
+
+    def copy(self):
+        return self._new(self._data)
+
+
+    def getValues(self):
+        """Returns the components of this value as a list of floats.
+
+        Returns:
+            list: Components.
+
+        """
+
+        return self._data.tolist()
+
+
+    def set(self, returnType, *values):
+        for i, value in enumerate(values):
+            self._data[i] = unwrap(value)
+
+
+    def setNull(self, returnType):
+        for i in xrange(len(self._data)):
+            self._data[i] = 0.0
+
+
+    def equal(self, returnType, other):
+        return _boolean(self._data == other._data)
+
+
+    def almostEqual(self, returnType, other, precision=None):
+        if precision is None:
+            precision = PRECISION
+        else:
+            precision = _scalar(precision)
+
+        for a, b in zip(self._data, other._data):
+            if abs(f32(a - b)) >= precision:
+                return _boolean(False)
+
+        return _boolean(True)
+
+
+    def component(self, returnType, index):
+        return _scalarValue(self._data[unwrap(index)])
+
+
+    def setComponent(self, returnType, index, value):
+        self._data[unwrap(index)] = unwrap(value)
+
+
+    def add(self, returnType, other):
+        return self._new([a + b for a, b in zip(self._data, other._data)])
+
+
+    def subtract(self, returnType, other):
+        return self._new([a - b for a, b in zip(self._data, other._data)])
+
+
+    def multiply(self, returnType, other):
+        return self._new([a * b for a, b in zip(self._data, other._data)])
+
+
+    def divide(self, returnType, other):
+        return self._new([a / b for a, b in zip(self._data, other._data)])
+
+
+    def multiplyScalar(self, returnType, other):
+        other = _scalar(other)
+
+        return self._new([a * other for a in self._data])
+
+
+    def divideScalar(self, returnType, other):
+        other = _scalar(other)
+
+        return self._new([a / other for a in self._data])
+
+
+    def linearInterpolate(self, returnType, other, t):
+        t = _scalar(t)
+
+        return self._new([a + f32(f32(b - a) * t) for a, b in zip(self._data, other._data)])
+
+
+class _NativeVec(_NativeVector):
+    """Base class for the native Vec2, Vec3 and Vec4."""
+
+    __slots__ = ()
+
+
+    def negate(self, returnType):
+        return self._new([-a for a in self._data])
+
+
+    def inverse(self, returnType):
+        return self._new([1.0 / a for a in self._data])
+
+
+    def dot(self, returnType, other):
+        return _scalarValue(_dot(self._data, other._data))
+
+
+    def lengthSquared(self, returnType):
+        return _scalarValue(_dot(self._data, self._data))
+
+
+    def length(self, returnType):
+        return _scalarValue(f32(math.sqrt(_dot(self._data, self._data))))
+
+
+    def unit(self, returnType):
+        length = f32(math.sqrt(_dot(self._data, self._data)))
+
+        return self.divideScalar(returnType, length)
+
+
+    def unit_safe(self, returnType):
+        length = f32(math.sqrt(_dot(self._data, self._data)))
+        if length < DIVIDEPRECISION:
+            return self._new([0.0] * len(self._data))
+
+        return self.divideScalar(returnType, length)
+
+
+    def setUnit(self, returnType):
+        length = f32(math.sqrt(_dot(self._data, self._data)))
+        if length > 0.0:
+            self._data = self.divideScalar(returnType, length)._data
+
+        return _scalarValue(length)
+
+
+    def normalize(self, returnType):
+        return self.setUnit(returnType)
+
+
+    def clamp(self, returnType, minValue, maxValue):
+        return self._new([min(max(a, lo), hi) for a, lo, hi in zip(self._data, minValue._data, maxValue._data)])
+
+
+    def unitsAngleTo(self, returnType, other):
+        acosAngle = min(max(_dot(self._data, other._data), -1.0), 1.0)
+
+        return _scalarValue(f32(math.acos(acosAngle)))
+
+
+    def angleTo(self, returnType, other):
+        return self.unit(returnType).unitsAngleTo(returnType, other.unit(returnType))
+
+
+    def distanceTo(self, returnType, other):
+        return self.subtract(returnType, other).length(returnType)
+
+
+class NativeVec2(_NativeVec):
+    """Native Vec2."""
+
+    __slots__ = ()
+
+    klTypeName = 'Vec2'
+    members = (('x', 'Scalar'), ('y', 'Scalar'))
+    defaults = (0.0, 0.0)
+
+    x = _component(0)
+    y = _component(1)
+
+
+    def cross(self, returnType, other):
+        # KL returns a Scalar here, the bindings fill every component with it
+        # when the result is requested as a Vec2.
+        a = self._data
+        b = other._data
+        result = f32(f32(a[0] * b[1]) - f32(a[1] * b[0]))
+        if returnType == 'Vec2':
+            return self._new([result, result])
+
+        return _scalarValue(result)
+
+
+    def distanceToLine(self, returnType, lineP0, lineP1):
+        v = lineP1.subtract(returnType, lineP0)
+        w = self.subtract(returnType, lineP0)
+        c1 = _dot(w._data, v._data)
+        c2 = _dot(v._data, v._data)
+        if c2 < DIVIDEPRECISION:
+            return w.length(returnType)
+
+        b = f32(c1 / c2)
+        pb = lineP0.add(returnType, v.multiplyScalar(returnType, b))
+
+        return self.distanceTo(returnType, pb)
+
+
+    def distanceToSegment(self, returnType, segmentP0, segmentP1):
+        v = segmentP1.subtract(returnType, segmentP0)
+        w = self.subtract(returnType, segmentP0)
+        c1 = _dot(w._data, v._data)
+        if c1 <= 0.0:
+            return self.distanceTo(returnType, segmentP0)
+
+        c2 = _dot(v._data, v._data)
+        if c2 <= c1:
+            return self.distanceTo(returnType, segmentP1)
+
+        b = f32(c1 / c2)
+        pb = segmentP0.add(returnType, v.multiplyScalar(returnType, b))
+
+        return self.distanceTo(returnType, pb)
+
+
+class NativeVec3(_NativeVec):
+    """Native Vec3."""
+
+    __slots__ = ()
+
+    klTypeName = 'Vec3'
+    members = (('x', 'Scalar'), ('y', 'Scalar'), ('z', 'Scalar'))
+    defaults = (0.0, 0.0, 0.0)
+
+    x = _component(0)
+    y = _component(1)
+    z = _component(2)
+
+
+    def cross(self, returnType, other):
+        return self._new(_cross(self._data, other._data))
+
+
+class NativeVec4(_NativeVec):
+    """Native Vec4."""
+
+    __slots__ = ()
+
+    klTypeName = 'Vec4'
+    members = (('x', 'Scalar'), ('y', 'Scalar'), ('z', 'Scalar'), ('t', 'Scalar'))
+    defaults = (0.0, 0.0, 0.0, 0.0)
+
+    x = _component(0)
+    y = _component(1)
+    z = _component(2)
+    t = _component(3)
+
+
+class NativeColor(_NativeVector):
+    """Native Color."""
+
+    __slots__ = ()
+
+    klTypeName = 'Color'
+    members = (('r', 'Scalar'), ('g', 'Scalar'), ('b', 'Scalar'), ('a', 'Scalar'))
+    defaults = (0.0, 0.0, 0.0, 1.0)
+
+    r = _component(0)
+    g = _component(1)
+    b = _component(2)
+    a = _component(3)
+
+
+# ===============
+# Rotation Types
+# ===============
+class NativeRotationOrder(NativeValue):
+    """Native RotationOrder."""
+
+    __slots__ = ('_order',)
+
+    klTypeName = 'RotationOrder'
+    members = (('order', 'Integer'),)
+
+
+    def __init__(self, order=4):
+        super(NativeRotationOrder, self).__init__()
+        self._order = order
+
+
+    @property
+    def order(self):
+        return SimpleValue('Integer', self._order)
+
+
+    @order.setter
+    def order(self, value):
+        self._order = int(unwrap(value))
+
+
+    def copy(self):
+        return NativeRotationOrder(self._order)
+
+
+    def getAxes(self):
+        """Returns the axis indices of this rotation order, in order.
+
+        Returns:
+            tuple: Axis indices.
+
+        """
+
+        return tuple(_AXIS_INDEX_MAP[axis] for axis in ROT_ORDER_INT_TO_STR_MAP[self._order])
+
+
+    def isReversed(self, returnType=None):
+        return _boolean(self._order in (0, 1, 2))
+
+
+    def setZYX(self, returnType):
+        self._order = 0
+
+
+    def setXZY(self, returnType):
+        self._order = 1
+
+
+    def setYXZ(self, returnType):
+        self._order = 2
+
+
+    def setYZX(self, returnType):
+        self._order = 3
+
+
+    def setXYZ(self, returnType):
+        self._order = 4
+
+
+    def setZXY(self, returnType):
+        self._order = 5
+
+
+class NativeEuler(NativeValue):
+    """Native Euler."""
+
+    __slots__ = ('_data', '_ro')
+
+    klTypeName = 'Euler'
+    members = (('x', 'Scalar'), ('y', 'Scalar'), ('z', 'Scalar'), ('ro', 'RotationOrder'))
+
+    x = _component(0)
+    y = _component(1)
+    z = _component(2)
+
+
+    def __init__(self, x=0.0, y=0.0, z=0.0, order=4):
+        super(NativeEuler, self).__init__()
+        self._data = array('f', (x, y, z))
+        self._ro = NativeRotationOrder(order)
+
+
+    @property
+    def ro(self):
+        return self._ro
+
+
+    @ro.setter
+    def ro(self, value):
+        if isinstance(value, NativeRotationOrder):
+            self._ro._order = value._order
+        else:
+            self._ro.order = value
+
+
+    def copy(self):
+        return NativeEuler(self._data[0], self._data[1], self._data[2], self._ro._order)
+
+
+    def set(self, returnType, x, y, z, ro=None):
+        self._data[0] = unwrap(x)
+        self._data[1] = unwrap(y)
+        self._data[2] = unwrap(z)
+        if ro is not None:
+            self.ro = ro
+
+
+    def equal(self, returnType, other):
+        return _boolean(self._data == other._data and self._ro._order == other._ro._order)
+
+
+    def almostEqual(self, returnType, other, precision=None):
+        if precision is None:
+            precision = PRECISION
+        else:
+            precision = _scalar(precision)
+
+        if self._ro._order != other._ro._order:
+            return _boolean(False)
+
+        for a, b in zip(self._data, other._data):
+            if abs(f32(a - b)) >= precision:
+                return _boolean(False)
+
+        return _boolean(True)
+
+
+    def toMat33(self, returnType):
+        quat = NativeQuat()
+        quat.setFromEulerAngles('', self.getAngles(), self._ro)
+
+        return quat.toMat33(returnType)
+
+
+    def getAngles(self):
+        """Returns the angles of this euler as a NativeVec3.
+
+        Returns:
+            NativeVec3: Angles.
+
+        """
+
+        return NativeVec3(*self._data)
+
+
+def _axisQuat(axisIndex, angle):
+    halfAngle = f32(angle * 0.5)
+    v = [0.0, 0.0, 0.0]
+    v[axisIndex] = f32(math.sin(halfAngle))
+
+    return v, f32(math.cos(halfAngle))
+
+
+def _quatMultiply(v1, w1, v2, w2):
+    v = _add(_add(_scale(v2, w1), _scale(v1, w2)), _cross(v1, v2))
+    w = f32(f32(w1 * w2) - _dot(v1, v2))
+
+    return v, w
+
+
+class NativeQuat(NativeValue):
+    """Native Quat."""
+
+    __slots__ = ('_v', '_w')
+
+    klTypeName = 'Quat'
+    members = (('v', 'Vec3'), ('w', 'Scalar'))
+
+
+    def __init__(self, x=0.0, y=0.0, z=0.0, w=1.0):
+        super(NativeQuat, self).__init__()
+        self._v = NativeVec3(x, y, z)
+        self._w = f32(w)
+
+
+    @classmethod
+    def _fromComponents(cls, v, w):
+        quat = cls.__new__(cls)
+        quat._v = NativeVec3(*v)
+        quat._w = f32(w)
+
+        return quat
+
+
+    @property
+    def v(self):
+        return self._v
+
+
+    @v.setter
+    def v(self, value):
+        self._v._data[:] = value._data
+
+
+    @property
+    def w(self):
+        return SimpleValue('Scalar', self._w)
+
+
+    @w.setter
+    def w(self, value):
+        self._w = _scalar(value)
+
+
+    def copy(self):
+        return NativeQuat._fromComponents(self._v._data, self._w)
+
+
+    def _setComponents(self, v, w):
+        self._v._data[:] = array('f', v)
+        self._w = f32(w)
+
+
+    def set(self, returnType, v, w):
+        self.v = v
+        self.w = w
+
+
+    def setIdentity(self, returnType):
+        self._setComponents((0.0, 0.0, 0.0), 1.0)
+
+
+    def setFromEuler(self, returnType, euler):
+        if isinstance(euler, NativeEuler):
+            return self.setFromEulerAngles(returnType, euler.getAngles(), euler.ro)
+
+        return self.setFromEulerAngles(returnType, euler)
+
+
+    def setFromEulerAngles(self, returnType, angles, ro=None):
+        # The rotations are composed in the order of the axis letters, the
+        # angle of the middle axis being negated for the reversed orders.
+        if ro is None:
+            ro = NativeRotationOrder()
+
+        axes = ro.getAxes()
+        reversed = ro._order in (0, 1, 2)
+        v, w = [0.0, 0.0, 0.0], 1.0
+        for i, axis in enumerate(axes):
+            angle = angles._data[axis]
+            if i == 1 and reversed:
+                angle = -angle
+
+            axisV, axisW = _axisQuat(axis, angle)
+            v, w = _quatMultiply(v, w, axisV, axisW)
+
+        self._setComponents(v, w)
+
+        return self.copy()
+
+
+    def setFromAxisAndAngle(self, returnType, axis, angle):
+        halfAngle = f32(_scalar(angle) * 0.5)
+        unitAxis = axis.unit('Vec3')
+        self._setComponents(_scale(unitAxis._data, f32(math.sin(halfAngle))), math.cos(halfAngle))
+
+        return self.copy()
+
+
+    def setFromMat33(self, returnType, mat):
+        r0 = mat._rows[0]._data
+        r1 = mat._rows[1]._data
+        r2 = mat._rows[2]._data
+        trace = f32(f32(r0[0] + r1[1]) + r2[2])
+        if trace > 0.0:
+            s = f32(2.0 * f32(math.sqrt(f32(trace + 1.0))))
+            invS = f32(1.0 / s)
+            w = f32(0.25 * s)
+            v = (f32(r2[1] - r1[2]) * invS,
+                 f32(r0[2] - r2[0]) * invS,
+                 f32(r1[0] - r0[1]) * invS)
+        elif r0[0] > r1[1] and r0[0] > r2[2]:
+            s = f32(2.0 * f32(math.sqrt(f32(f32(f32(1.0 + r0[0]) - r1[1]) - r2[2]))))
+            invS = f32(1.0 / s)
+            w = f32(r2[1] - r1[2]) * invS
+            v = (f32(0.25 * s),
+                 f32(r0[1] + r1[0]) * invS,
+                 f32(r0[2] + r2[0]) * invS)
+        elif r1[1] > r2[2]:
+            s = f32(2.0 * f32(math.sqrt(f32(f32(f32(1.0 + r1[1]) - r0[0]) - r2[2]))))
+            invS = f32(1.0 / s)
+            w = f32(r0[2] - r2[0]) * invS
+            v = (f32(r0[1] + r1[0]) * invS,
+                 f32(0.25 * s),
+                 f32(r1[2] + r2[1]) * invS)
+        else:
+            s = f32(2.0 * f32(math.sqrt(f32(f32(f32(1.0 + r2[2]) - r0[0]) - r1[1]))))
+            invS = f32(1.0 / s)
+            w = f32(r1[0] - r0[1]) * invS
+            v = (f32(r0[2] + r2[0]) * invS,
+                 f32(r1[2] + r2[1]) * invS,
+                 f32(0.25 * s))
+
+        self._setComponents(v, w)
+        self.setUnit(returnType)
+
+        return self.copy()
+
+
+    def setFrom2Vectors(self, returnType, sourceDirVec, destDirVec, arbitraryIfAmbiguous=True):
+        val = f32(_dot(sourceDirVec._data, destDirVec._data) + 1.0)
+        if val <= DIVIDEPRECISION:
+            # The vectors are pointing in opposite directions, the rotation
+            # axis is ambiguous.
+            if unwrap(arbitraryIfAmbiguous) is False:
+                self.setIdentity(returnType)
+            else:
+                axis = _cross(sourceDirVec._data, (1.0, 0.0, 0.0))
+                if _dot(axis, axis) < DIVIDEPRECISION:
+                    axis = _cross(sourceDirVec._data, (0.0, 1.0, 0.0))
+
+                self._setComponents(NativeVec3(*axis).unit('Vec3')._data, 0.0)
+        else:
+            val = f32(math.sqrt(f32(2.0 * val)))
+            self._setComponents(_scale(_cross(sourceDirVec._data, destDirVec._data), f32(1.0 / val)), f32(val * 0.5))
+
+        return self.copy()
+
+
+    def setFromDirectionAndUpvector(self, returnType, direction, upvector):
+        zAxis = direction.unit_safe('Vec3')
+        yAxis = upvector.unit_safe('Vec3')
+        xAxis = yAxis.cross('Vec3', zAxis).unit_safe('Vec3')
+        yAxis = zAxis.cross('Vec3', xAxis).unit_safe('Vec3')
+
+        mat = NativeMat33()
+        mat.setColumns('', xAxis, yAxis, zAxis)
+
+        return self.setFromMat33(returnType, mat)
+
+
+    def equal(self, returnType, other):
+        return _boolean(self._v._data == other._v._data and self._w == other._w)
+
+
+    def almostEqual(self, returnType, other, precision=None):
+        if precision is None:
+            precision = PRECISION
+        else:
+            precision = _scalar(precision)
+
+        if abs(f32(self._w - other._w)) >= precision:
+            return _boolean(False)
+
+        return self._v.almostEqual(returnType, other._v, precision)
+
+
+    def add(self, returnType, other):
+        return NativeQuat._fromComponents(_add(self._v._data, other._v._data), self._w + other._w)
+
+
+    def subtract(self, returnType, other):
+        return NativeQuat._fromComponents(_sub(self._v._data, other._v._data), self._w - other._w)
+
+
+    def multiply(self, returnType, other):
+        v, w = _quatMultiply(self._v._data, self._w, other._v._data, other._w)
+
+        return NativeQuat._fromComponents(v, w)
+
+
+    def divide(self, returnType, other):
+        return self.multiply(returnType, other.inverse(returnType))
+
+
+    def multiplyScalar(self, returnType, other):
+        other = _scalar(other)
+
+        return NativeQuat._fromComponents(_scale(self._v._data, other), self._w * other)
+
+
+    def divideScalar(self, returnType, other):
+        return self.multiplyScalar(returnType, f32(1.0 / _scalar(other)))
+
+
+    def rotateVector(self, returnType, v):
+        # Same as (this * Quat(v, 0.0) * this.conjugate()).v
+        conjugate = [-a for a in self._v._data]
+        tempV, tempW = _quatMultiply(self._v._data, self._w, v._data, 0.0)
+        resultV, resultW = _quatMultiply(tempV, tempW, conjugate, self._w)
+
+        return NativeVec3(*resultV)
+
+
+    def dot(self, returnType, other):
+        return _scalarValue(f32(_dot(self._v._data, other._v._data) + f32(self._w * other._w)))
+
+
+    def conjugate(self, returnType):
+        return NativeQuat._fromComponents([-a for a in self._v._data], self._w)
+
+
+    def _lengthSquared(self):
+        return f32(_dot(self._v._data, self._v._data) + f32(self._w * self._w))
+
+
+    def lengthSquared(self, returnType):
+        return _scalarValue(self._lengthSquared())
+
+
+    def length(self, returnType):
+        return _scalarValue(f32(math.sqrt(self._lengthSquared())))
+
+
+    def unit(self, returnType):
+        return self.divideScalar(returnType, f32(math.sqrt(self._lengthSquared())))
+
+
+    def unit_safe(self, returnType):
+        length = f32(math.sqrt(self._lengthSquared()))
+        if length < DIVIDEPRECISION:
+            return NativeQuat()
+
+        return self.divideScalar(returnType, length)
+
+
+    def setUnit(self, returnType):
+        length = f32(math.sqrt(self._lengthSquared()))
+        if length > 0.0:
+            unit = self.divideScalar(returnType, length)
+            self._setComponents(unit._v._data, unit._w)
+
+        return _scalarValue(length)
+
+
+    def inverse(self, returnType):
+        # Unit quaternions are assumed, as in KL.
+        return self.conjugate(returnType)
+
+
+    def alignWith(self, returnType, other):
+        if self.dot(returnType, other)._value < 0.0:
+            self._setComponents([-a for a in self._v._data], -self._w)
+
+        return self.copy()
+
+
+    def getAngle(self, returnType):
+        return _scalarValue(f32(2.0 * f32(math.acos(min(max(self._w, -1.0), 1.0)))))
+
+
+    def getXaxis(self, returnType):
+        return self.rotateVector(returnType, NativeVec3(1.0, 0.0, 0.0))
+
+
+    def getYaxis(self, returnType):
+        return self.rotateVector(returnType, NativeVec3(0.0, 1.0, 0.0))
+
+
+    def getZaxis(self, returnType):
+        return self.rotateVector(returnType, NativeVec3(0.0, 0.0, 1.0))
+
+
+    def mirror(self, returnType, axisIndex):
+        x, y, z = self._v._data
+        w = self._w
+        axisIndex = unwrap(axisIndex)
+        if axisIndex == 0:
+            self._setComponents((-z, w, -x), y)
+        elif axisIndex == 1:
+            self._setComponents((-w, -z, y), x)
+        elif axisIndex == 2:
+            self._setComponents((-x, y, z), -w)
+
+        return self.copy()
+
+
+    def toMat33(self, returnType):
+        x, y, z = self._v._data
+        w = self._w
+        xx = f32(x * x)
+        xy = f32(x * y)
+        xz = f32(x * z)
+        xw = f32(x * w)
+        yy = f32(y * y)
+        yz = f32(y * z)
+        yw = f32(y * w)
+        zz = f32(z * z)
+        zw = f32(z * w)
+
+        mat = NativeMat33()
+        mat._rows[0]._data[:] = array('f', (1.0 - f32(2.0 * f32(yy + zz)), 2.0 * f32(xy - zw), 2.0 * f32(xz + yw)))
+        mat._rows[1]._data[:] = array('f', (2.0 * f32(xy + zw), 1.0 - f32(2.0 * f32(xx + zz)), 2.0 * f32(yz - xw)))
+        mat._rows[2]._data[:] = array('f', (2.0 * f32(xz - yw), 2.0 * f32(yz + xw), 1.0 - f32(2.0 * f32(xx + yy))))
+
+        return mat
+
+
+    def _eulerMatrix(self):
+        # Rotation matrix used by the euler conversion. The diagonal is
+        # computed as 1 - 2aa - 2bb (instead of 1 - 2(aa + bb) in toMat33) to
+        # round like KL does.
+        x, y, z = self._v._data
+        w = self._w
+        xx2 = f32(2.0 * f32(x * x))
+        yy2 = f32(2.0 * f32(y * y))
+        zz2 = f32(2.0 * f32(z * z))
+        xy = f32(x * y)
+        xz = f32(x * z)
+        xw = f32(x * w)
+        yz = f32(y * z)
+        yw = f32(y * w)
+        zw = f32(z * w)
+
+        return ((f32(f32(1.0 - yy2) - zz2), f32(2.0 * f32(xy - zw)), f32(2.0 * f32(xz + yw))),
+                (f32(2.0 * f32(xy + zw)), f32(f32(1.0 - xx2) - zz2), f32(2.0 * f32(yz - xw))),
+                (f32(2.0 * f32(xz - yw)), f32(2.0 * f32(yz + xw)), f32(f32(1.0 - xx2) - yy2)))
+
+
+    def toEuler(self, returnType, ro):
+        angles = self.toEulerAngles(returnType, ro)
+        euler = NativeEuler(order=ro._order)
+        euler._data[:] = angles._data
+
+        return euler
+
+
+    def toEulerAngles(self, returnType, ro=None):
+        # Inverse of setFromEulerAngles: the matrix is the product of the axis
+        # rotations in the order of the axis letters.
+        if ro is None:
+            ro = NativeRotationOrder()
+
+        i, j, k = ro.getAxes()
+        m = self._eulerMatrix()
+        sign = 1.0 if (j - i) % 3 == 1 else -1.0
+
+        sinB = min(max(m[i][k], -1.0), 1.0)
+        angles = [0.0, 0.0, 0.0]
+        if abs(sinB) < 0.99999:
+            angles[i] = math.atan2(-sign * m[j][k], m[k][k])
+            angles[j] = math.asin(sinB)
+            angles[k] = math.atan2(-sign * m[i][j], m[i][i])
+        else:
+            # Gimbal lock, the first and last axes are aligned.
+            angles[i] = math.atan2(sign * m[k][j], m[j][j])
+            angles[j] = math.copysign(math.pi * 0.5, sinB)
+            angles[k] = 0.0
+
+        return NativeVec3(*angles)
+
+
+    def sphericalLinearInterpolate(self, returnType, other, t):
+        t = _scalar(t)
+        otherV = other._v._data
+        otherW = other._w
+        cosom = _dot(self._v._data, otherV)
+        cosom = f32(cosom + f32(self._w * otherW))
+        if cosom < 0.0:
+            cosom = -cosom
+            otherV = [-a for a in otherV]
+            otherW = -otherW
+
+        if f32(1.0 - cosom) > PRECISION:
+            omega = f32(math.acos(cosom))
+            scale0 = f32(math.sin(f32(f32(1.0 - t) * omega)))
+            scale1 = f32(math.sin(f32(t * omega)))
+            invSinom = f32(1.0 / f32(math.sin(omega)))
+        else:
+            scale0 = f32(1.0 - t)
+            scale1 = t
+            invSinom = 1.0
+
+        v = _scale(_add(_scale(self._v._data, scale0), _scale(otherV, scale1)), invSinom)
+        w = f32(f32(f32(self._w * scale0) + f32(otherW * scale1)) * invSinom)
+
+        return NativeQuat._fromComponents(v, w)
+
+
+    def linearInterpolate(self, returnType, other, t):
+        t = _scalar(t)
+        v = [a + f32(f32(b - a) * t) for a, b in zip(self._v._data, other._v._data)]
+        w = self._w + f32(f32(other._w - self._w) * t)
+
+        return NativeQuat._fromComponents(v, w).unit(returnType)
+
+
+# ===============
+# Matrix Types
+# ===============
+def _row(index):
+
+    def getter(self):
+        return self._rows[index]
+
+    def setter(self, value):
+        self._rows[index]._data[:] = value._data
+
+    return property(getter, setter)
+
+
+class _NativeMat(NativeValue):
+    """Base class for the native Mat33 and Mat44."""
+
+    __slots__ = ('_rows',)
+
+    rowClass = None
+    size = 0
+
+
+    def __init__(self):
+        super(_NativeMat, self).__init__()
+        self._rows = [self.rowClass() for i in xrange(self.size)]
+        for i in xrange(self.size):
+            self._rows[i]._data[i] = 1.0
+
+
+    def _new(self, rows):
+        mat = self.__class__.__new__(self.__class__)
+        mat._rows = [self.rowClass(*row) for row in rows]
+
+        return mat
+
+
+    def _values(self):
+        return [row._data for row in self._rows]
+
+
+    def copy(self):
+        return self._new(self._values())
+
+
+    def setRows(self, returnType, *rows):
+        for i, row in enumerate(rows):
+            self._rows[i]._data[:] = row._data
+
+
+    def setColumns(self, returnType, *columns):
+        for i, column in enumerate(columns):
+            for j in xrange(self.size):
+                self._rows[j]._data[i] = column._data[j]
+
+
+    def setNull(self, returnType):
+        for row in self._rows:
+            row.setNull('')
+
+
+    def setIdentity(self, returnType):
+        for i, row in enumerate(self._rows):
+            row.setNull('')
+            row._data[i] = 1.0
+
+
+    def setDiagonal(self, returnType, value):
+        if isinstance(value, _NativeVector):
+            values = value._data
+        else:
+            values = [_scalar(value)] * self.size
+
+        for i, diagonalValue in enumerate(values):
+            self._rows[i]._data[i] = diagonalValue
+
+
+    def equal(self, returnType, other):
+        return _boolean(self._values() == other._values())
+
+
+    def almostEqual(self, returnType, other, precision=None):
+        for row, otherRow in zip(self._rows, other._rows):
+            if not row.almostEqual(returnType, otherRow, precision)._value:
+                return _boolean(False)
+
+        return _boolean(True)
+
+
+    def add(self, returnType, other):
+        return self._new([_add(a, b) for a, b in zip(self._values(), other._values())])
+
+
+    def subtract(self, returnType, other):
+        return self._new([_sub(a, b) for a, b in zip(self._values(), other._values())])
+
+
+    def multiply(self, returnType, other):
+        a = self._values()
+        b = other._values()
+        size = self.size
+        rows = []
+        for i in xrange(size):
+            rows.append([_dot(a[i], [b[k][j] for k in xrange(size)]) for j in xrange(size)])
+
+        return self._new(rows)
+
+
+    def multiplyScalar(self, returnType, other):
+        other = _scalar(other)
+
+        return self._new([_scale(row, other) for row in self._values()])
+
+
+    def divideScalar(self, returnType, other):
+        return self.multiplyScalar(returnType, f32(1.0 / _scalar(other)))
+
+
+    def transpose(self, returnType):
+        values = self._values()
+
+        return self._new([[values[j][i] for j in xrange(self.size)] for i in xrange(self.size)])
+
+
+    def inverse(self, returnType):
+        det = self._determinant()
+        if det == 0.0:
+            raise ZeroDivisionError(self.klTypeName + ".inverse: singular matrix")
+
+        return self.adjoint(returnType).divideScalar(returnType, det)
+
+
+    def inverse_safe(self, returnType):
+        det = self._determinant()
+        if abs(det) < DIVIDEPRECISION:
+            return self.__class__()
+
+        return self.adjoint(returnType).divideScalar(returnType, det)
+
+
+    def determinant(self, returnType):
+        return _scalarValue(self._determinant())
+
+
+def _det3(m):
+    return f32(f32(f32(f32(f32(
+        f32(f32(m[0][0] * m[1][1]) * m[2][2]) +
+        f32(f32(m[0][1] * m[1][2]) * m[2][0])) +
+        f32(f32(m[0][2] * m[1][0]) * m[2][1])) -
+        f32(f32(m[0][0] * m[1][2]) * m[2][1])) -
+        f32(f32(m[0][1] * m[1][0]) * m[2][2])) -
+        f32(f32(m[0][2] * m[1][1]) * m[2][0]))
+
+
+def _minor(m, row, column):
+    return [[m[i][j] for j in xrange(len(m)) if j != column] for i in xrange(len(m)) if i != row]
+
+
+class NativeMat33(_NativeMat):
+    """Native Mat33."""
+
+    __slots__ = ()
+
+    klTypeName = 'Mat33'
+    members = (('row0', 'Vec3'), ('row1', 'Vec3'), ('row2', 'Vec3'))
+    rowClass = NativeVec3
+    size = 3
+
+    row0 = _row(0)
+    row1 = _row(1)
+    row2 = _row(2)
+
+
+    def multiplyVector(self, returnType, other):
+        return NativeVec3(*[_dot(row, other._data) for row in self._values()])
+
+
+    def _determinant(self):
+        return _det3(self._values())
+
+
+    def adjoint(self, returnType):
+        m = self._values()
+        rows = [[0.0] * 3 for i in xrange(3)]
+        for i in xrange(3):
+            for j in xrange(3):
+                minor = _minor(m, j, i)
+                cofactor = f32(f32(minor[0][0] * minor[1][1]) - f32(minor[0][1] * minor[1][0]))
+                rows[i][j] = cofactor if (i + j) % 2 == 0 else -cofactor
+
+        return self._new(rows)
+
+
+class NativeMat44(_NativeMat):
+    """Native Mat44."""
+
+    __slots__ = ()
+
+    klTypeName = 'Mat44'
+    members = (('row0', 'Vec4'), ('row1', 'Vec4'), ('row2', 'Vec4'), ('row3', 'Vec4'))
+    rowClass = NativeVec4
+    size = 4
+
+    row0 = _row(0)
+    row1 = _row(1)
+    row2 = _row(2)
+    row3 = _row(3)
+
+
+    def multiplyVector4(self, returnType, other):
+        return NativeVec4(*[_dot(row, other._data) for row in self._values()])
+
+
+    def multiplyVector3(self, returnType, other):
+        result = self.multiplyVector4(returnType, NativeVec4(other._data[0], other._data[1], other._data[2], 1.0))._data
+        if result[3] != 1.0 and result[3] != 0.0:
+            invT = f32(1.0 / result[3])
+            return NativeVec3(*_scale(result[:3], invT))
+
+        return NativeVec3(*result[:3])
+
+
+    def _determinant(self):
+        m = self._values()
+        det = 0.0
+        for j in xrange(4):
+            cofactor = f32(m[0][j] * _det3(_minor(m, 0, j)))
+            if j % 2 == 0:
+                det = f32(det + cofactor)
+            else:
+                det = f32(det - cofactor)
+
+        return det
+
+
+    def adjoint(self, returnType):
+        m = self._values()
+        rows = [[0.0] * 4 for i in xrange(4)]
+        for i in xrange(4):
+            for j in xrange(4):
+                cofactor = _det3(_minor(m, j, i))
+                rows[i][j] = cofactor if (i + j) % 2 == 0 else -cofactor
+
+        return self._new(rows)
+
+
+    def setTranslation(self, returnType, tr):
+        for i in xrange(3):
+            self._rows[i]._data[3] = tr._data[i]
+
+
+    def setRotation(self, returnType, quat):
+        self._setUpperLeft(quat.toMat33('Mat33')._values())
+
+
+    def setScaling(self, returnType, sc):
+        for i in xrange(3):
+            self._rows[i]._data[i] = sc._data[i]
+
+
+    def setFromMat33(self, returnType, mat):
+        self.setIdentity(returnType)
+        self._setUpperLeft(mat._values())
+
+
+    def _setUpperLeft(self, values):
+        for i in xrange(3):
+            for j in xrange(3):
+                self._rows[i]._data[j] = values[i][j]
+
+
+    def translation(self, returnType):
+        return NativeVec3(*[self._rows[i]._data[3] for i in xrange(3)])
+
+
+    def upperLeft(self, returnType):
+        mat = NativeMat33()
+        for i in xrange(3):
+            mat._rows[i]._data[:] = self._rows[i]._data[:3]
+
+        return mat
+
+
+# ===============
+# Transform Type
+# ===============
+class NativeXfo(NativeValue):
+    """Native Xfo."""
+
+    __slots__ = ('_tr', '_ori', '_sc')
+
+    klTypeName = 'Xfo'
+    members = (('tr', 'Vec3'), ('ori', 'Quat'), ('sc', 'Vec3'))
+
+
+    def __init__(self):
+        super(NativeXfo, self).__init__()
+        self._tr = NativeVec3()
+        self._ori = NativeQuat()
+        self._sc = NativeVec3(1.0, 1.0, 1.0)
+
+
+    @property
+    def tr(self):
+        return self._tr
+
+
+    @tr.setter
+    def tr(self, value):
+        self._tr._data[:] = value._data
+
+
+    @property
+    def ori(self):
+        return self._ori
+
+
+    @ori.setter
+    def ori(self, value):
+        self._ori._setComponents(value._v._data, value._w)
+
+
+    @property
+    def sc(self):
+        return self._sc
+
+
+    @sc.setter
+    def sc(self, value):
+        self._sc._data[:] = value._data
+
+
+    @classmethod
+    def _fromComponents(cls, tr, ori, sc):
+        xfo = cls.__new__(cls)
+        xfo._tr = tr
+        xfo._ori = ori
+        xfo._sc = sc
+
+        return xfo
+
+
+    def copy(self):
+        return NativeXfo._fromComponents(self._tr.copy(), self._ori.copy(), self._sc.copy())
+
+
+    def set(self, returnType, tr, ori, sc):
+        self.tr = tr
+        self.ori = ori
+        self.sc = sc
+
+
+    def setIdentity(self, returnType):
+        self._tr.setNull('')
+        self._ori.setIdentity('')
+        self._sc._data[:] = array('f', (1.0, 1.0, 1.0))
+
+
+    def setFromMat44(self, returnType, mat):
+        m = mat._values()
+        self._tr._data[:] = array('f', [m[i][3] for i in xrange(3)])
+
+        columns = [NativeVec3(m[0][j], m[1][j], m[2][j]) for j in xrange(3)]
+        scaling = [column.length('Scalar')._value for column in columns]
+        if mat.upperLeft('Mat33')._determinant() < 0.0:
+            scaling[0] = -scaling[0]
+
+        self._sc._data[:] = array('f', scaling)
+
+        rotation = NativeMat33()
+        rotation.setColumns('', *[column.divideScalar('Vec3', sc) for column, sc in zip(columns, scaling)])
+        self._ori.setFromMat33('Quat', rotation)
+
+        return self.copy()
+
+
+    def toMat44(self, returnType):
+        rotation = self._ori.toMat33('Mat33')._values()
+        sc = self._sc._data
+
+        mat = NativeMat44()
+        for i in xrange(3):
+            mat._rows[i]._data[:] = array('f', [rotation[i][j] * sc[j] for j in xrange(3)] + [self._tr._data[i]])
+
+        return mat
+
+
+    def multiply(self, returnType, other):
+        tr = self._tr.add('Vec3', self._ori.rotateVector('Vec3', self._sc.multiply('Vec3', other._tr)))
+        ori = self._ori.multiply('Quat', other._ori)
+        ori.setUnit('Scalar')
+        sc = self._sc.multiply('Vec3', other._sc)
+
+        return NativeXfo._fromComponents(tr, ori, sc)
+
+
+    def transformVector(self, returnType, v):
+        return self._tr.add('Vec3', self._ori.rotateVector('Vec3', self._sc.multiply('Vec3', v)))
+
+
+    def inverse(self, returnType):
+        sc = self._sc.inverse('Vec3')
+        ori = self._ori.inverse('Quat')
+        tr = sc.multiply('Vec3', ori.rotateVector('Vec3', self._tr.negate('Vec3')))
+
+        return NativeXfo._fromComponents(tr, ori, sc)
+
+
+    def inverseTransformVector(self, returnType, v):
+        rotated = self._ori.inverse('Quat').rotateVector('Vec3', v.subtract('Vec3', self._tr))
+
+        return rotated.multiply('Vec3', self._sc.inverse('Vec3'))
+
+
+    def linearInterpolate(self, returnType, other, t):
+        tr = self._tr.linearInterpolate('Vec3', other._tr, t)
+        ori = self._ori.sphericalLinearInterpolate('Quat', other._ori, t)
+        sc = self._sc.linearInterpolate('Vec3', other._sc, t)
+
+        return NativeXfo._fromComponents(tr, ori, sc)
+
+
+NATIVE_TYPES = {
+    'Vec2': NativeVec2,
+    'Vec3': NativeVec3,
+    'Vec4': NativeVec4,
+    'Color': NativeColor,
+    'RotationOrder': NativeRotationOrder,
+    'Euler': NativeEuler,
+    'Quat': NativeQuat,
+    'Mat33': NativeMat33,
+    'Mat44': NativeMat44,
+    'Xfo': NativeXfo
+}
@@ -8,6 +8,7 @@ import math
 
 from kraken.core.kraken_system import ks
 from kraken.core.maths.math_object import MathObject
+from kraken.core.maths.math_object import mathRTVal
 
 from kraken.core.maths.vec3 import Vec3
 from kraken.core.maths.euler import Euler
@@ -23,7 +24,7 @@ class Quat(MathObject):
         super(Quat, self).__init__()
 
         if ks.getRTValTypeName(v) == 'Quat':
-            self._rtval = v
+            self.setRTVal(v)
         else:
             if v is not None and not isinstance(v, Vec3) and  not isinstance(v, Euler):
                 raise TypeError("Quat: Invalid type for 'v' argument. Must be a Vec3.")
@@ -31,7 +32,7 @@ class Quat(MathObject):
             if w is not None and not isinstance(w, (int, float)):
                 raise TypeError("Quat: Invalid type for 'w' argument. Must be a int or float.")
 
-            self._rtval = ks.rtVal('Quat')
+            self._rtval = mathRTVal('Quat')
             if isinstance(v, Quat):
                 self.set(v=v.v, w=v.w)
             elif isinstance(v, Euler):
@@ -75,7 +76,7 @@ class Quat(MathObject):
 
         """
 
-        self._rtval.v = ks.rtVal('Vec3', value)
+        self._rtval.v = mathRTVal('Vec3', value)
 
         return True
 
@@ -104,7 +105,7 @@ class Quat(MathObject):
 
         """
 
-        self._rtval.w = ks.rtVal('Scalar', value)
+        self._rtval.w = mathRTVal('Scalar', value)
 
         return True
 
@@ -155,7 +156,7 @@ class Quat(MathObject):
 
         """
 
-        self._rtval.set('', ks.rtVal('Vec3', v), ks.rtVal('Scalar', w))
+        self._rtval.set('', mathRTVal('Vec3', v), mathRTVal('Scalar', w))
 
         return True
 
@@ -185,7 +186,7 @@ class Quat(MathObject):
 
         """
 
-        return Quat(self._rtval.setFromEuler('Quat', ks.rtVal('Euler', e)))
+        return Quat(self._rtval.setFromEuler('Quat', mathRTVal('Euler', e)))
 
 
     def setFromEulerAnglesWithRotOrder(self, angles, ro):
@@ -201,8 +202,8 @@ class Quat(MathObject):
 
         """
 
-        return Quat(self._rtval.setFromEulerAngles('Quat', ks.rtVal('Vec3', angles),
-                    ks.rtVal('RotationOrder', ro)))
+        return Quat(self._rtval.setFromEulerAngles('Quat', mathRTVal('Vec3', angles),
+                    mathRTVal('RotationOrder', ro)))
 
 
     def setFromEulerAngles(self, angles):
@@ -217,7 +218,7 @@ class Quat(MathObject):
 
         """
 
-        return Quat(self._rtval.setFromEuler('Quat', ks.rtVal('Vec3', angles)))
+        return Quat(self._rtval.setFromEuler('Quat', mathRTVal('Vec3', angles)))
 
 
     def setFromAxisAndAngle(self, axis, angle):
@@ -233,8 +234,8 @@ class Quat(MathObject):
 
         """
 
-        return Quat(self._rtval.setFromAxisAndAngle('Quat', ks.rtVal('Vec3', axis),
-                    ks.rtVal('Scalar', angle)))
+        return Quat(self._rtval.setFromAxisAndAngle('Quat', mathRTVal('Vec3', axis),
+                    mathRTVal('Scalar', angle)))
 
 
     def setFromMat33(self, mat):
@@ -248,7 +249,7 @@ class Quat(MathObject):
 
         """
 
-        return Quat(self._rtval.setFromMat33('Quat', ks.rtVal('Mat33', mat)))
+        return Quat(self._rtval.setFromMat33('Quat', mathRTVal('Mat33', mat)))
 
 
     def setFrom2Vectors(self, sourceDirVec, destDirVec, arbitraryIfAmbiguous=True):
@@ -268,8 +269,8 @@ class Quat(MathObject):
 
         """
 
-        return Quat(self._rtval.setFrom2Vectors('Quat', ks.rtVal('Vec3', sourceDirVec),
-                    ks.rtVal('Vec3', destDirVec), ks.rtVal('Boolean', arbitraryIfAmbiguous)))
+        return Quat(self._rtval.setFrom2Vectors('Quat', mathRTVal('Vec3', sourceDirVec),
+                    mathRTVal('Vec3', destDirVec), mathRTVal('Boolean', arbitraryIfAmbiguous)))
 
 
     def setFromDirectionAndUpvector(self, direction, upvector):
@@ -286,7 +287,7 @@ class Quat(MathObject):
         """
 
         return Quat(self._rtval.setFromDirectionAndUpvector('Quat',
-                    ks.rtVal('Vec3', direction), ks.rtVal('Vec3', upvector)))
+                    mathRTVal('Vec3', direction), mathRTVal('Vec3', upvector)))
 
 
     def equal(self, other):
@@ -300,7 +301,7 @@ class Quat(MathObject):
 
         """
 
-        return self._rtval.equal('Boolean', ks.rtVal('Quat', other)).getSimpleType()
+        return self._rtval.equal('Boolean', mathRTVal('Quat', other)).getSimpleType()
 
 
     def almostEqualWithPrecision(self, other, precision):
@@ -316,8 +317,8 @@ class Quat(MathObject):
 
         """
 
-        return self._rtval.almostEqual('Boolean', ks.rtVal('Quat', other),
-                                       ks.rtVal('Scalar', precision)).getSimpleType()
+        return self._rtval.almostEqual('Boolean', mathRTVal('Quat', other),
+                                       mathRTVal('Scalar', precision)).getSimpleType()
 
 
     def almostEqual(self, other):
@@ -332,7 +333,7 @@ class Quat(MathObject):
 
         """
 
-        return self._rtval.almostEqual('Boolean', ks.rtVal('Quat', other)).getSimpleType()
+        return self._rtval.almostEqual('Boolean', mathRTVal('Quat', other)).getSimpleType()
 
 
     def add(self, other):
@@ -346,7 +347,7 @@ class Quat(MathObject):
 
         """
 
-        return Quat(self._rtval.add('Quat', ks.rtVal('Quat', other)))
+        return Quat(self._rtval.add('Quat', mathRTVal('Quat', other)))
 
 
     def subtract(self, other):
@@ -360,7 +361,7 @@ class Quat(MathObject):
 
         """
 
-        return Quat(self._rtval.subtract('Quat', ks.rtVal('Quat', other)))
+        return Quat(self._rtval.subtract('Quat', mathRTVal('Quat', other)))
 
 
     def multiply(self, other):
@@ -374,7 +375,7 @@ class Quat(MathObject):
 
         """
 
-        return Quat(self._rtval.multiply('Quat', ks.rtVal('Quat', other)))
+        return Quat(self._rtval.multiply('Quat', mathRTVal('Quat', other)))
 
 
     def divide(self, other):
@@ -388,7 +389,7 @@ class Quat(MathObject):
 
         """
 
-        return Quat(self._rtval.divide('Quat', ks.rtVal('Quat', other)))
+        return Quat(self._rtval.divide('Quat', mathRTVal('Quat', other)))
 
 
     def multiplyScalar(self, other):
@@ -402,7 +403,7 @@ class Quat(MathObject):
 
         """
 
-        return Quat(self._rtval.multiplyScalar('Quat', ks.rtVal('Scalar', other)))
+        return Quat(self._rtval.multiplyScalar('Quat', mathRTVal('Scalar', other)))
 
 
     def divideScalar(self, other):
@@ -416,7 +417,7 @@ class Quat(MathObject):
 
         """
 
-        return Quat(self._rtval.divideScalar('Quat', ks.rtVal('Scalar', other)))
+        return Quat(self._rtval.divideScalar('Quat', mathRTVal('Scalar', other)))
 
 
     def rotateVector(self, v):
@@ -432,7 +433,7 @@ class Quat(MathObject):
 
         """
 
-        return Vec3(self._rtval.rotateVector('Vec3', ks.rtVal('Vec3', v)))
+        return Vec3(self._rtval.rotateVector('Vec3', mathRTVal('Vec3', v)))
 
 
     def dot(self, other):
@@ -446,7 +447,7 @@ class Quat(MathObject):
 
         """
 
-        return self._rtval.dot('Scalar', ks.rtVal('Quat', other)).getSimpleType()
+        return self._rtval.dot('Scalar', mathRTVal('Quat', other)).getSimpleType()
 
 
     def conjugate(self):
@@ -540,7 +541,7 @@ class Quat(MathObject):
 
         """
 
-        return self._rtval.alignWith('Quat', ks.rtVal('Quat', other))
+        return self._rtval.alignWith('Quat', mathRTVal('Quat', other))
 
 
     def getAngle(self):
@@ -598,7 +599,7 @@ class Quat(MathObject):
 
         """
 
-        self._rtval.mirror('Quat', ks.rtVal('Integer', axisIndex))
+        self._rtval.mirror('Quat', mathRTVal('Integer', axisIndex))
 
         return True
 
@@ -625,7 +626,7 @@ class Quat(MathObject):
 
         """
 
-        return Euler(self._rtval.toEuler('Euler', ks.rtVal('RotationOrder', ro)))
+        return Euler(self._rtval.toEuler('Euler', mathRTVal('RotationOrder', ro)))
 
 
     def toEulerAnglesWithRotOrder(self, ro):
@@ -643,7 +644,7 @@ class Quat(MathObject):
 
         return Vec3(self._rtval.toEulerAngles(
             'Vec3',
-            ks.rtVal('RotationOrder', ro)))
+            mathRTVal('RotationOrder', ro)))
 
 
     def toEulerAngles(self):
@@ -673,7 +674,7 @@ class Quat(MathObject):
         """
 
         return Quat(self._rtval.sphericalLinearInterpolate('Quat',
-                    ks.rtVal('Quat', q2), ks.rtVal('Scalar', t)))
+                    mathRTVal('Quat', q2), mathRTVal('Scalar', t)))
 
 
     def linearInterpolate(self, other, t):
@@ -693,4 +694,4 @@ class Quat(MathObject):
 
         """
 
-        return Quat(self._rtval.sphericalLinearInterpolate('Quat', ks.rtVal('Quat', other), ks.rtVal('Scalar', t)))
+        return Quat(self._rtval.sphericalLinearInterpolate('Quat', mathRTVal('Quat', other), mathRTVal('Scalar', t)))
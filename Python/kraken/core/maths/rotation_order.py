@@ -10,6 +10,7 @@ from kraken.core.maths.constants import ROT_ORDER_INT_TO_STR_MAP
 from kraken.core.maths.constants import ROT_ORDER_STR_TO_INT_MAP
 from kraken.core.kraken_system import ks
 from kraken.core.maths.math_object import MathObject
+from kraken.core.maths.math_object import mathRTVal
 
 
 class RotationOrder(MathObject):
@@ -21,9 +22,9 @@ class RotationOrder(MathObject):
         super(RotationOrder, self).__init__()
 
         if ks.getRTValTypeName(order) == 'RotationOrder':
-            self._rtval = order
+            self.setRTVal(order)
         else:
-            self._rtval = ks.rtVal('RotationOrder')
+            self._rtval = mathRTVal('RotationOrder')
             if isinstance(order, RotationOrder):
                 self.set(order=order.order)
             else:
@@ -65,7 +66,7 @@ class RotationOrder(MathObject):
 
         """
 
-        self._rtval.order = ks.rtVal('Integer', value)
+        self._rtval.order = mathRTVal('Integer', value)
 
         return True
 
@@ -7,6 +7,7 @@ Vec2 -- Vector 2 object.
 import math
 from kraken.core.kraken_system import ks
 from math_object import MathObject
+from math_object import mathRTVal
 
 
 class Vec2(MathObject):
@@ -17,9 +18,9 @@ class Vec2(MathObject):
 
         super(Vec2, self).__init__()
         if ks.getRTValTypeName(x) == 'Vec2':
-            self._rtval = x
+            self.setRTVal(x)
         else:
-            self._rtval = ks.rtVal('Vec2')
+            self._rtval = mathRTVal('Vec2')
             if isinstance(x, Vec2):
                 self.set(x=x.x, y=x.y)
             else:
@@ -59,7 +60,7 @@ class Vec2(MathObject):
 
         """
 
-        self._rtval.x = ks.rtVal('Scalar', value)
+        self._rtval.x = mathRTVal('Scalar', value)
 
         return True
 
@@ -88,7 +89,7 @@ class Vec2(MathObject):
 
         """
 
-        self._rtval.y = ks.rtVal('Scalar', value)
+        self._rtval.y = mathRTVal('Scalar', value)
 
         return True
 
@@ -139,7 +140,7 @@ class Vec2(MathObject):
 
         """
 
-        self._rtval.set('', ks.rtVal('Scalar', x), ks.rtVal('Scalar', y))
+        self._rtval.set('', mathRTVal('Scalar', x), mathRTVal('Scalar', y))
 
         return True
 
@@ -183,7 +184,7 @@ class Vec2(MathObject):
 
         """
 
-        return self._rtval.almostEqual('Boolean', other._rtval, ks.rtVal('Scalar', precision)).getSimpleType()
+        return self._rtval.almostEqual('Boolean', other._rtval, mathRTVal('Scalar', precision)).getSimpleType()
 
 
     def almostEqual(self, other):
@@ -212,7 +213,7 @@ class Vec2(MathObject):
 
         """
 
-        return self._rtval.component('Scalar', ks.rtVal('Size', i)).getSimpleType()
+        return self._rtval.component('Scalar', mathRTVal('Size', i)).getSimpleType()
 
 
     # Sets the component of this vector by index
@@ -228,8 +229,8 @@ class Vec2(MathObject):
 
         """
 
-        self._rtval.setComponent('', ks.rtVal('Size', i),
-                                        ks.rtVal('Scalar', v))
+        self._rtval.setComponent('', mathRTVal('Size', i),
+                                        mathRTVal('Scalar', v))
 
 
 
@@ -300,7 +301,7 @@ class Vec2(MathObject):
 
         """
 
-        return Vec2(self._rtval.multiplyScalar('Vec2', ks.rtVal('Scalar', other)))
+        return Vec2(self._rtval.multiplyScalar('Vec2', mathRTVal('Scalar', other)))
 
 
     def divideScalar(self, other):
@@ -314,7 +315,7 @@ class Vec2(MathObject):
 
         """
 
-        return Vec2(self._rtval.divideScalar('Vec2', ks.rtVal('Scalar', other)))
+        return Vec2(self._rtval.divideScalar('Vec2', mathRTVal('Scalar', other)))
 
 
     def negate(self):
@@ -507,7 +508,7 @@ class Vec2(MathObject):
 
         """
 
-        return Vec2(self._rtval.linearInterpolate('Vec2', other._rtval, ks.rtVal('Scalar', t)))
+        return Vec2(self._rtval.linearInterpolate('Vec2', other._rtval, mathRTVal('Scalar', t)))
 
 
     def distanceToLine(self, lineP0, lineP1):
@@ -7,6 +7,7 @@ Vec3 -- Vector 3 object.
 import math
 from kraken.core.kraken_system import ks
 from math_object import MathObject
+from math_object import mathRTVal
 
 
 class Vec3(MathObject):
@@ -17,9 +18,9 @@ class Vec3(MathObject):
 
         super(Vec3, self).__init__()
         if ks.getRTValTypeName(x) == 'Vec3':
-            self._rtval = x
+            self.setRTVal(x)
         else:
-            self._rtval = ks.rtVal('Vec3')
+            self._rtval = mathRTVal('Vec3')
             if isinstance(x, Vec3):
                 self.set(x=x.x, y=x.y, z=x.z)
             else:
@@ -61,7 +62,7 @@ class Vec3(MathObject):
 
         """
 
-        self._rtval.x = ks.rtVal('Scalar', value)
+        self._rtval.x = mathRTVal('Scalar', value)
 
         return True
 
@@ -90,7 +91,7 @@ class Vec3(MathObject):
 
         """
 
-        self._rtval.y = ks.rtVal('Scalar', value)
+        self._rtval.y = mathRTVal('Scalar', value)
 
 
     @property
@@ -117,7 +118,7 @@ class Vec3(MathObject):
 
         """
 
-        self._rtval.z = ks.rtVal('Scalar', value)
+        self._rtval.z = mathRTVal('Scalar', value)
 
         return True
 
@@ -170,7 +171,7 @@ class Vec3(MathObject):
 
         """
 
-        self._rtval.set('', ks.rtVal('Scalar', x), ks.rtVal('Scalar', y), ks.rtVal('Scalar', z))
+        self._rtval.set('', mathRTVal('Scalar', x), mathRTVal('Scalar', y), mathRTVal('Scalar', z))
 
         return True
 
@@ -214,7 +215,7 @@ class Vec3(MathObject):
 
         """
 
-        return self._rtval.almostEqual('Boolean', other._rtval, ks.rtVal('Scalar', precision)).getSimpleType()
+        return self._rtval.almostEqual('Boolean', other._rtval, mathRTVal('Scalar', precision)).getSimpleType()
 
 
     def almostEqual(self, other):
@@ -243,7 +244,7 @@ class Vec3(MathObject):
 
         """
 
-        return self._rtval.component('Scalar', ks.rtVal('Size', i)).getSimpleType()
+        return self._rtval.component('Scalar', mathRTVal('Size', i)).getSimpleType()
 
 
     # Sets the component of this vector by index
@@ -259,8 +260,8 @@ class Vec3(MathObject):
 
         """
 
-        self._rtval.setComponent('', ks.rtVal('Size', i),
-                                        ks.rtVal('Scalar', v))
+        self._rtval.setComponent('', mathRTVal('Size', i),
+                                        mathRTVal('Scalar', v))
 
 
     def add(self, other):
@@ -330,7 +331,7 @@ class Vec3(MathObject):
 
         """
 
-        return Vec3(self._rtval.multiplyScalar('Vec3', ks.rtVal('Scalar', other)))
+        return Vec3(self._rtval.multiplyScalar('Vec3', mathRTVal('Scalar', other)))
 
 
     def divideScalar(self, other):
@@ -344,7 +345,7 @@ class Vec3(MathObject):
 
         """
 
-        return Vec3(self._rtval.divideScalar('Vec3', ks.rtVal('Scalar', other)))
+        return Vec3(self._rtval.divideScalar('Vec3', mathRTVal('Scalar', other)))
 
 
     def negate(self):
@@ -537,4 +538,4 @@ class Vec3(MathObject):
 
         """
 
-        return Vec3(self._rtval.linearInterpolate('Vec3', other._rtval, ks.rtVal('Scalar', t)))
+        return Vec3(self._rtval.linearInterpolate('Vec3', other._rtval, mathRTVal('Scalar', t)))
@@ -7,6 +7,7 @@ Vec4 -- Vector 4 object.
 import math
 from kraken.core.kraken_system import ks
 from math_object import MathObject
+from math_object import mathRTVal
 
 
 class Vec4(MathObject):
@@ -17,9 +18,9 @@ class Vec4(MathObject):
 
         super(Vec4, self).__init__()
         if ks.getRTValTypeName(x) == 'Vec4':
-            self._rtval = x
+            self.setRTVal(x)
         else:
-            self._rtval = ks.rtVal('Vec4')
+            self._rtval = mathRTVal('Vec4')
             if isinstance(x, Vec4):
                 self.set(x=x.x, y=x.y, z=x.z, t=x.z)
             else:
@@ -65,7 +66,7 @@ class Vec4(MathObject):
 
         """
 
-        self._rtval.x = ks.rtVal('Scalar', value)
+        self._rtval.x = mathRTVal('Scalar', value)
 
         return True
 
@@ -94,7 +95,7 @@ class Vec4(MathObject):
 
         """
 
-        self._rtval.y = ks.rtVal('Scalar', value)
+        self._rtval.y = mathRTVal('Scalar', value)
 
         return True
 
@@ -123,7 +124,7 @@ class Vec4(MathObject):
 
         """
 
-        self._rtval.z = ks.rtVal('Scalar', value)
+        self._rtval.z = mathRTVal('Scalar', value)
 
         return True
 
@@ -152,7 +153,7 @@ class Vec4(MathObject):
 
         """
 
-        self._rtval.t = ks.rtVal('Scalar', value)
+        self._rtval.t = mathRTVal('Scalar', value)
 
 
     def __eq__(self, other):
@@ -203,8 +204,8 @@ class Vec4(MathObject):
 
         """
 
-        self._rtval.set('', ks.rtVal('Scalar', x), ks.rtVal('Scalar', y),
-                        ks.rtVal('Scalar', z), ks.rtVal('Scalar', t))
+        self._rtval.set('', mathRTVal('Scalar', x), mathRTVal('Scalar', y),
+                        mathRTVal('Scalar', z), mathRTVal('Scalar', t))
 
         return True
 
@@ -249,7 +250,7 @@ class Vec4(MathObject):
         """
 
         return self._rtval.almostEqual('Boolean', other._rtval,
-                                       ks.rtVal('Scalar', precision)).getSimpleType()
+                                       mathRTVal('Scalar', precision)).getSimpleType()
 
 
     def almostEqual(self, other):
@@ -278,7 +279,7 @@ class Vec4(MathObject):
 
         """
 
-        return self._rtval.component('Scalar', ks.rtVal('Size', i)).getSimpleType()
+        return self._rtval.component('Scalar', mathRTVal('Size', i)).getSimpleType()
 
 
     def setComponent(self, i, v):
@@ -293,8 +294,8 @@ class Vec4(MathObject):
 
         """
 
-        self._rtval.setComponent('', ks.rtVal('Size', i),
-                                 ks.rtVal('Scalar', v))
+        self._rtval.setComponent('', mathRTVal('Size', i),
+                                 mathRTVal('Scalar', v))
 
 
     def add(self, other):
@@ -364,7 +365,7 @@ class Vec4(MathObject):
 
         """
 
-        return Vec4(self._rtval.multiplyScalar('Vec4', ks.rtVal('Scalar', other)))
+        return Vec4(self._rtval.multiplyScalar('Vec4', mathRTVal('Scalar', other)))
 
 
     def divideScalar(self, other):
@@ -378,7 +379,7 @@ class Vec4(MathObject):
 
         """
 
-        return Vec4(self._rtval.divideScalar('Vec4', ks.rtVal('Scalar', other)))
+        return Vec4(self._rtval.divideScalar('Vec4', mathRTVal('Scalar', other)))
 
 
     def negate(self):
@@ -547,4 +548,4 @@ class Vec4(MathObject):
 
         """
 
-        return Vec4(self._rtval.linearInterpolate('Vec4', ks.rtVal('Vec4', other), ks.rtVal('Scalar', t)))
+        return Vec4(self._rtval.linearInterpolate('Vec4', mathRTVal('Vec4', other), mathRTVal('Scalar', t)))
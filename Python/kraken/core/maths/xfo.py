@@ -5,6 +5,7 @@ Xfo -- Transform.
 """
 
 from math_object import MathObject
+from math_object import mathRTVal
 from kraken.core.kraken_system import ks
 from vec3 import Vec3
 from quat import Quat
@@ -20,9 +21,9 @@ class Xfo(MathObject):
 
         super(Xfo, self).__init__()
         if ks.getRTValTypeName(tr) == 'Xfo':
-            self._rtval = tr
+            self.setRTVal(tr)
         else:
-            self._rtval = ks.rtVal('Xfo')
+            self._rtval = mathRTVal('Xfo')
             if isinstance(tr, Xfo):
                 self.set(tr=tr.tr, ori=tr.ori, sc=tr.sc)
             else:
@@ -73,7 +74,7 @@ class Xfo(MathObject):
 
         """
 
-        self._rtval.tr = ks.rtVal('Vec3', value)
+        self._rtval.tr = mathRTVal('Vec3', value)
 
         return True
 
@@ -102,7 +103,7 @@ class Xfo(MathObject):
 
         """
 
-        self._rtval.ori = ks.rtVal('Quat', value)
+        self._rtval.ori = mathRTVal('Quat', value)
 
         return True
 
@@ -131,7 +132,7 @@ class Xfo(MathObject):
 
         """
 
-        self._rtval.sc = ks.rtVal('Vec3', value)
+        self._rtval.sc = mathRTVal('Vec3', value)
 
         return True
 
@@ -175,8 +176,8 @@ class Xfo(MathObject):
 
         """
 
-        self._rtval.set('', ks.rtVal('Vec3', tr), ks.rtVal('Quat', ori),
-                        ks.rtVal('Vec3', sc))
+        self._rtval.set('', mathRTVal('Vec3', tr), mathRTVal('Quat', ori),
+                        mathRTVal('Vec3', sc))
 
         return True
 
@@ -205,7 +206,7 @@ class Xfo(MathObject):
 
         """
 
-        return Xfo(self._rtval.setFromMat44('Xfo', ks.rtVal('Mat44', m)))
+        return Xfo(self._rtval.setFromMat44('Xfo', mathRTVal('Mat44', m)))
 
 
     def toMat44(self):
@@ -230,7 +231,7 @@ class Xfo(MathObject):
 
         """
 
-        return Xfo(self._rtval.multiply('Xfo', ks.rtVal('Xfo', xfo)))
+        return Xfo(self._rtval.multiply('Xfo', mathRTVal('Xfo', xfo)))
 
 
     def transformVector(self, v):
@@ -244,7 +245,7 @@ class Xfo(MathObject):
 
         """
 
-        return Vec3(self._rtval.transformVector('Vec3', ks.rtVal('Vec3', v)))
+        return Vec3(self._rtval.transformVector('Vec3', mathRTVal('Vec3', v)))
 
 
     def inverse(self):
@@ -272,7 +273,7 @@ class Xfo(MathObject):
 
         """
 
-        return Vec3(self._rtval.inverseTransformVector('Vec3', ks.rtVal('Vec3', vec)))
+        return Vec3(self._rtval.inverseTransformVector('Vec3', mathRTVal('Vec3', vec)))
 
 
     def linearInterpolate(self, other, t):
@@ -288,8 +289,8 @@ class Xfo(MathObject):
 
         """
 
-        return Xfo(self._rtval.linearInterpolate('Xfo', ks.rtVal('Xfo', other),
-                                                 ks.rtVal('Scalar', t)))
+        return Xfo(self._rtval.linearInterpolate('Xfo', mathRTVal('Xfo', other),
+                                                 mathRTVal('Scalar', t)))
 
 
     def setFromVectors(self, inVec1, inVec2, inVec3, translation):
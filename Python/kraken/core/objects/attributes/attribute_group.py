@@ -83,6 +83,7 @@ class AttributeGroup(SceneItem):
             return False
 
         del self._attributes[index]
+        SceneItem.bumpGraphRevision()
 
         return True
 
@@ -8,6 +8,8 @@ Component -- Component representation.
 from kraken.core.configs.config import Config
 from kraken.helpers.utility_methods import mirrorData
 from kraken.core.maths import *
+from kraken.core.evaluator import Evaluator
+from kraken.core.objects.scene_item import SceneItem
 from kraken.core.objects.object_3d import Object3D
 from kraken.core.objects.layer import Layer
 from kraken.core.objects.locator import Locator
@@ -38,6 +40,7 @@ class Component(Object3D):
         self._inputs = []
         self._outputs = []
         self._operators = []
+        self._evaluator = None
         self._items = {}
 
         self.setShapeVisibility(False)
@@ -239,12 +242,11 @@ class Component(Object3D):
 
         """
 
-
-
         # Assign the child self as the component.
         item.setComponent(self)
 
         self._items[name] = item
+        SceneItem.bumpGraphRevision()
 
         return True
 
@@ -675,16 +677,25 @@ class Component(Object3D):
     # =================
     # Operator Methods
     # =================
-    def evalOperators(self):
-        """Evaluates all component operators in order they were created.
+    def evalOperators(self, force=False):
+        """Evaluates the operators and constraints of the component.
+
+        Each one is evaluated once, after the ones driving its inputs. Those
+        whose inputs haven't changed since the previous call are skipped.
+
+        Args:
+            force (bool): Evaluate all of them, even unchanged ones.
 
         Returns:
             bool: True if no errors during evaluation.
 
         """
 
-        for op in self._operators:
-            op.evaluate()
+        if self._evaluator is None:
+            self._evaluator = Evaluator()
+            self._evaluator.addRootItem(self)
+
+        self._evaluator.evaluate(force=force)
 
         return True
 
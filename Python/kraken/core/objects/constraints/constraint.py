@@ -284,6 +284,7 @@ class Constraint(SceneItem):
                             kObject3D.getName() + "'.")
 
         self._constrainers[index] = kObject3D
+        SceneItem.bumpGraphRevision()
 
         return True
 
@@ -302,6 +303,7 @@ class Constraint(SceneItem):
             raise IndexError("Index '{}' is out of range: {}".format(index, len(self._constrainers)))
 
         del self._constrainers[index]
+        SceneItem.bumpGraphRevision()
 
         return True
 
@@ -33,15 +33,22 @@ logger.setLevel(logging.INFO)
 class Object3D(SceneItem):
     """Kraken base object type for any 3D object."""
 
+    __staticNameClasses = {}
+
     def __init__(self, name, parent=None, flags=None, metaData=None):
         super(Object3D, self).__init__(name, parent=parent, metaData=metaData)
         self._children = []
+        self._childIds = set()
+        self._childrenByDecoratedName = {}
+        self._dynamicNameChildren = []
+        self._nameSuffixes = {}
         self._flags = {}
         self._attributeGroups = []
         self._constraints = []
         self._xfo = Xfo()
         self._ro = RotationOrder()
         self._color = None
+        self._buildNameCache = None
 
         self._implicitAttrGrp = AttributeGroup("implicitAttrGrp", self)
         self._visibility = BoolAttribute('visibility',
@@ -181,6 +188,11 @@ class Object3D(SceneItem):
         for source in self.getSources():
             if isinstance(source, Object3D):
                 continue
+            if isinstance(source, (Constraint, Operator)) and \
+                    source.testFlag('SCHEDULED_EVALUATION'):
+                # The Evaluator evaluates sources before the items reading
+                # them, so the xfo is already up to date.
+                break
             if isinstance(source, Constraint):
                 return source.compute()
             if isinstance(source, Operator):
@@ -200,8 +212,6 @@ class Object3D(SceneItem):
 
         """
 
-        typeNameHierarchy = self.getTypeHierarchyNames()
-
         config = Config.getInstance()
 
         # If flag is set on object to use explicit name, return it.
@@ -211,24 +221,30 @@ class Object3D(SceneItem):
 
         nameTemplate = config.getNameTemplate()
 
-        # Get the token list for this type of object
-        nameFormat = None
-        for typeName in nameTemplate['formats'].keys():
-            if typeName in typeNameHierarchy:
-                nameFormat = nameTemplate['formats'][typeName]
-                break
-
-        if nameFormat is None:
-            nameFormat = nameTemplate['formats']['default']
-
-        objectType = None
-        for eachType in typeNameHierarchy:
-            if eachType in nameTemplate['types'].keys():
-                objectType = eachType
-                break
-
-        if objectType is None:
-            objectType = 'default'
+        nameFormat, objectType = config.getNameFormatPlan(
+            self._getTypeHierarchy()[0])
+
+        location = None
+        if 'location' in nameFormat:
+            if self.isTypeOf('Component'):
+                location = self.getLocation()
+            elif self.getComponent() is not None:
+                location = self.getComponent().getLocation()
+
+        # Build names only depend on the names and hierarchy of the items,
+        # the component location and the config, so reuse the last resolved
+        # name while none of them changed.
+        cacheKey = (config,
+                    nameTemplate,
+                    SceneItem.getGraphRevision(),
+                    SceneItem.getNameRevision(),
+                    location,
+                    self.testFlag('inputObject'),
+                    self.testFlag('outputObject'))
+
+        if self._buildNameCache is not None and \
+                self._buildNameCache[0] == cacheKey:
+            return self._buildNameCache[1]
 
         # Generate a name by concatenating the resolved tokens together.
         builtName = ""
@@ -240,16 +256,6 @@ class Object3D(SceneItem):
                     builtName += nameTemplate['separator']
 
             elif token is 'location':
-                if self.isTypeOf('Component'):
-                    location = self.getLocation()
-                elif self.getComponent() is None:
-                    location = None
-                else:
-                    component = self.getComponent()
-                    if component is None:
-                        raise ValueError("object [%s] does not have a component." % self.getName())
-                    location = component.getLocation()
-
                 altLocation = self.getMetaDataItem("altLocation")
                 if altLocation is not None and altLocation in nameTemplate['locations']:
                     location = altLocation
@@ -293,6 +299,8 @@ class Object3D(SceneItem):
                 raise ValueError("Unresolvabled token '" + token +
                                  "' used on: " + self.getPath())
 
+        self._buildNameCache = (cacheKey, builtName)
+
         return builtName
 
     def setName(self, name):
@@ -306,30 +314,74 @@ class Object3D(SceneItem):
 
         """
 
+        parent = self.getParent()
+        oldDecoratedName = None
+
         # check for name collision and adjust the name if they exist
-        if self.getParent() is not None:
-            # Increment name if it already exists
-            initName = name
-            suffix = 1
-            collision = True
-            while collision:
-                child = self.getParent().getChildByDecoratedName(name + self.getNameDecoration())
-                collision = child is not None and child is not self
-                if not collision:
-                    break
+        if parent is not None:
+            oldDecoratedName = self.getDecoratedName()
+            nameDecoration = self.getNameDecoration()
+
+            child = parent.getChildByDecoratedName(name + nameDecoration)
+            if child is not None and child is not self:
 
+                # Increment name if it already exists
+                initName = name
+                suffix = 1
                 result = re.split(r"(\d+)$", initName, 1)
                 if len(result) > 1:
                     initName = result[0]
                     suffix = int(result[1])
 
-                name = initName + str(suffix).zfill(2)
-                suffix += 1
+                # Start from the first suffix not known to be taken. A child
+                # being renamed may keep its own suffix, so probe all of them.
+                suffixKey = (initName, suffix, nameDecoration)
+                if not parent.hasChild(self):
+                    suffix = parent._nameSuffixes.get(suffixKey, suffix)
+
+                while True:
+                    name = initName + str(suffix).zfill(2)
+                    child = parent.getChildByDecoratedName(name + nameDecoration)
+                    if child is None or child is self:
+                        break
+
+                    suffix += 1
+
+                parent._nameSuffixes[suffixKey] = suffix + 1
 
         super(Object3D, self).setName(name)
 
+        if parent is not None and parent.hasChild(self):
+            parent._reindexChild(self, oldDecoratedName)
+
         return True
 
+    def _hasStaticDecoratedName(self):
+        """Returns whether the decorated name only changes through setName.
+
+        Classes deriving their name or decoration from other items (e.g.
+        components decorated with their location) can't be indexed by name
+        on their parent.
+
+        Returns:
+            bool: True if the decorated name only changes through setName.
+
+        """
+
+        cls = type(self)
+        isStatic = Object3D.__staticNameClasses.get(cls, None)
+        if isStatic is None:
+            isStatic = True
+            for methodName in ('getName', 'getNameDecoration', 'getDecoratedName'):
+                method = getattr(cls, methodName).__func__
+                if method is not getattr(SceneItem, methodName).__func__:
+                    isStatic = False
+                    break
+
+            Object3D.__staticNameClasses[cls] = isStatic
+
+        return isStatic
+
     # ==================
     # Hierarchy Methods
     # ==================
@@ -373,11 +425,7 @@ class Object3D(SceneItem):
 
         """
 
-        for i, eachChild in enumerate(self.getChildren()):
-            if eachChild == child:
-                return True
-
-        return False
+        return child.getId() in self._childIds
 
     def _checkChildIndex(self, index):
         """Checks the supplied index is valid.
@@ -410,12 +458,15 @@ class Object3D(SceneItem):
 
         if child.getParent() is not None:
             parent = child.getParent()
-            if child in parent.getChildren():
+            if parent.hasChild(child):
                 parent.getChildren().remove(child)
+                parent._unindexChild(child)
 
         child.setName(child.getName())
 
         self.getChildren().append(child)
+        self._indexChild(child)
+        SceneItem.bumpGraphRevision()
 
         # Assign the child the same component.
         if self._component is not None:
@@ -504,7 +555,9 @@ class Object3D(SceneItem):
                             "' does not have child:" + child.getPath() +
                             ". it does have:" + str(names))
 
+        self._unindexChild(child)
         SceneItem.setParent(child, None)
+        SceneItem.bumpGraphRevision()
 
         # Un-assign the child the component.
         if self._component is not None:
@@ -591,11 +644,15 @@ class Object3D(SceneItem):
 
         """
 
-        for eachChild in self.getChildren():
-            if eachChild.getName() == name:
-                return eachChild
+        # Indexed children have no name decoration, so their name is the
+        # decorated name.
+        candidates = [x for x in self._dynamicNameChildren if x.getName() == name]
 
-        return None
+        child = self._childrenByDecoratedName.get(name, None)
+        if child is not None and child.getName() == name:
+            candidates.append(child)
+
+        return self._getFirstChild(candidates)
 
     def getChildByDecoratedName(self, decoratedName):
         """Returns the child object with the specified name.
@@ -608,11 +665,89 @@ class Object3D(SceneItem):
 
         """
 
-        for eachChild in self.getChildren():
-            if eachChild.getDecoratedName() == decoratedName:
-                return eachChild
+        candidates = [x for x in self._dynamicNameChildren
+                      if x.getDecoratedName() == decoratedName]
 
-        return None
+        child = self._childrenByDecoratedName.get(decoratedName, None)
+        if child is not None and child.getDecoratedName() == decoratedName:
+            candidates.append(child)
+
+        return self._getFirstChild(candidates)
+
+    def _getFirstChild(self, candidates):
+        """Returns the candidate child coming first in the children list.
+
+        Args:
+            candidates (list): Children of this object.
+
+        Returns:
+            Object: The first candidate, None if there are no candidates.
+
+        """
+
+        if not candidates:
+            return None
+
+        if len(candidates) == 1:
+            return candidates[0]
+
+        children = self.getChildren()
+        return min(candidates, key=children.index)
+
+    def _indexChild(self, child):
+        """Adds a child to the name indexes of this object.
+
+        Args:
+            child (Object): Child to index.
+
+        """
+
+        self._childIds.add(child.getId())
+
+        if child._hasStaticDecoratedName():
+            self._childrenByDecoratedName[child.getDecoratedName()] = child
+        elif child not in self._dynamicNameChildren:
+            self._dynamicNameChildren.append(child)
+
+    def _unindexChild(self, child, decoratedName=None):
+        """Removes a child from the name indexes of this object.
+
+        Args:
+            child (Object): Child to remove.
+            decoratedName (str): Decorated name the child was indexed with,
+                defaults to its current decorated name.
+
+        """
+
+        if decoratedName is None:
+            decoratedName = child.getDecoratedName()
+
+        self._childIds.discard(child.getId())
+
+        if self._childrenByDecoratedName.get(decoratedName, None) is child:
+            del self._childrenByDecoratedName[decoratedName]
+
+        if child in self._dynamicNameChildren:
+            self._dynamicNameChildren.remove(child)
+
+        # A name was freed, suffixes known to be taken may not be anymore.
+        self._nameSuffixes.clear()
+
+    def _reindexChild(self, child, oldDecoratedName):
+        """Updates the name index of this object after a child is renamed.
+
+        Args:
+            child (Object): The renamed child.
+            oldDecoratedName (str): Decorated name of the child before it was
+                renamed.
+
+        """
+
+        if oldDecoratedName == child.getDecoratedName():
+            return
+
+        self._unindexChild(child, oldDecoratedName)
+        self._indexChild(child)
 
     def getChildrenByType(self, childType):
         """Returns all children that are of the specified type.
@@ -688,6 +823,7 @@ class Object3D(SceneItem):
             return False
 
         del self._attributeGroups[index]
+        SceneItem.bumpGraphRevision()
 
         return True
 
@@ -876,6 +1012,7 @@ class Object3D(SceneItem):
         sourceIndex = self._sources.index(self._constraints[index])
         del self._sources[sourceIndex]
         del self._constraints[index]
+        SceneItem.bumpGraphRevision()
 
         return True
 
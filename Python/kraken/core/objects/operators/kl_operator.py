@@ -18,8 +18,40 @@ from kraken.log import getLogger
 logger = getLogger('kraken')
 
 
+def _isFixedArrayType(dataType):
+    return bool(re.search(r'\[\d', dataType))
+
+
+class KLSolverArg(object):
+    """Plain Python description of a KL solver argument."""
+
+    __slots__ = ('name', 'dataType', 'connectionType', 'isArray',
+                 'isFixedArray', 'hasDefaultValue')
+
+    def __init__(self, name, dataType, connectionType, hasDefaultValue):
+        super(KLSolverArg, self).__init__()
+
+        self.name = name
+        self.dataType = dataType
+        self.connectionType = connectionType
+        self.isArray = dataType.endswith('[]')
+        self.isFixedArray = _isFixedArrayType(dataType)
+        self.hasDefaultValue = hasDefaultValue
+
+
 class KLOperator(Operator):
-    """KL Operator representation."""
+    """KL Operator representation.
+
+    The arguments of a solver type never change, so they are introspected
+    once per solver type and their descriptions are shared by all the
+    operators using it.
+
+    """
+
+    # Maps 'extension::solverTypeName' to the tuple of KLSolverArg and a dict
+    # of the KLSolverArg by name. Only plain Python objects are cached, the
+    # RTVals belong to the client they were constructed with.
+    __solverArgsCache = {}
 
     def __init__(self, name, solverTypeName, extension, metaData=None):
         super(KLOperator, self).__init__(name, metaData=metaData)
@@ -32,25 +64,79 @@ class KLOperator(Operator):
         ks.loadExtension('Kraken')
         if self.extension != 'Kraken':
             ks.loadExtension(self.extension)
-        self.solverRTVal = ks.constructRTVal('%s::%s' % (self.extension, self.solverTypeName))
+        solverType = '%s::%s' % (self.extension, self.solverTypeName)
+        self.solverRTVal = ks.constructRTVal(solverType)
 
         # logger.debug("Creating kl operator object [%s] of type [%s] from extension [%s]:" % (self.getName(), self.solverTypeName, self.extension))
 
-        self.args = self.solverRTVal.getArguments('Kraken::KrakenSolverArg[]')
+        # The arguments RTVal of the solver is only queried when requested.
+        self.args = None
+
+        solverArgs = KLOperator.__solverArgsCache.get(solverType, None)
+        if solverArgs is None:
+            self.args, argDescs, argDescsByName = self.__introspectSolverArgs(self.solverRTVal)
+            solverArgs = (argDescs, argDescsByName)
+            KLOperator.__solverArgsCache[solverType] = solverArgs
+
+        self.argDescs, self._argDescsByName = solverArgs
 
         # Initialize the inputs and outputs based on the given args.
-        for i in xrange(len(self.args)):
-            arg = self.args[i]
-            argName = arg.name.getSimpleType()
-            argDataType = arg.dataType.getSimpleType()
-            argConnectionType = arg.connectionType.getSimpleType()
+        for argDesc in self.argDescs:
 
             # Note, do not create empty arrays here as we need to know later whether or not
             # to create default values if input/output is None
-            if argConnectionType == 'In':
-                self.inputs[argName] = None
+            if argDesc.connectionType == 'In':
+                self.inputs[argDesc.name] = None
             else:
-                self.outputs[argName] = None
+                self.outputs[argDesc.name] = None
+
+
+    @staticmethod
+    def __introspectSolverArgs(solverRTVal):
+        """Queries the arguments of a solver from its RTVal.
+
+        Args:
+            solverRTVal (RTVal): Solver to query the arguments of.
+
+        Returns:
+            tuple: The arguments RTVal, the KLSolverArg list and a dict of the
+                KLSolverArg by name.
+
+        """
+
+        args = solverRTVal.getArguments('Kraken::KrakenSolverArg[]')
+
+        argDescs = []
+        argDescsByName = {}
+        for i in xrange(len(args)):
+            arg = args[i]
+            argName = arg.name.getSimpleType()
+            hasDefaultValue = solverRTVal.defaultValues.has("Boolean", argName).getSimpleType()
+
+            argDesc = KLSolverArg(argName,
+                                  arg.dataType.getSimpleType(),
+                                  arg.connectionType.getSimpleType(),
+                                  hasDefaultValue)
+
+            argDescs.append(argDesc)
+            argDescsByName.setdefault(argName, argDesc)
+
+        return args, tuple(argDescs), argDescsByName
+
+
+    @staticmethod
+    def clearSolverArgsCache():
+        """Clears the cached solver arguments, needed after a new client is
+        created or a KL extension defining solvers is reloaded.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        KLOperator.__solverArgsCache.clear()
+
+        return True
 
 
     def getSolverTypeName(self):
@@ -81,21 +167,34 @@ class KLOperator(Operator):
 
         """
 
+        if self.args is None:
+            self.args = self.solverRTVal.getArguments('Kraken::KrakenSolverArg[]')
+
         return self.args
 
+    def getSolverArgDescs(self):
+        """Returns the descriptions of the args defined by the KL Operator.
+
+        Returns:
+            tuple: KLSolverArg objects in the order of the solve arguments.
+
+        """
+
+        return self.argDescs
+
     def getInputType(self, name):
         """Returns the type of input with the specified name."""
-        for arg in self.args:
-            if arg.connectionType.getSimpleType() == "In" and arg.name.getSimpleType() == name:
-                return arg.dataType.getSimpleType()
+        argDesc = self._argDescsByName.get(name, None)
+        if argDesc is not None and argDesc.connectionType == "In":
+            return argDesc.dataType
 
         raise Exception("Could not find input argument %s in kl operator %s" % (name, self.getName()))
 
     def getOutputType(self, name):
         """Returns the type of output with the specified name."""
-        for arg in self.args:
-            if arg.connectionType.getSimpleType() == "Out" and arg.name.getSimpleType() == name:
-                return arg.dataType.getSimpleType()
+        argDesc = self._argDescsByName.get(name, None)
+        if argDesc is not None and argDesc.connectionType == "Out":
+            return argDesc.dataType
 
         raise Exception("Could not find output argument %s in kl operator %s" % (name, self.getName()))
 
@@ -112,17 +211,20 @@ class KLOperator(Operator):
 
         """
 
-        def isFixedArrayType(string):
-            return bool(re.search(r'\[\d', string))
+        argDesc = self._argDescsByName.get(name, None)
+        if argDesc is not None:
+            hasDefaultValue = argDesc.hasDefaultValue
+        else:
+            hasDefaultValue = self.solverRTVal.defaultValues.has("Boolean", name).getSimpleType()
 
         # If attribute has a default value
-        if self.solverRTVal.defaultValues.has("Boolean", name).getSimpleType():
+        if hasDefaultValue:
 
             RTVal = ks.convertFromRTVal(self.solverRTVal.defaultValues[name])
 
             if RTVal.isArray():
                 # If RTValDataType is variable array, but default value is fixed array, convert it
-                if isFixedArrayType(RTVal.getTypeName().getSimpleType()) and not isFixedArrayType(RTValDataType):
+                if _isFixedArrayType(RTVal.getTypeName().getSimpleType()) and not _isFixedArrayType(RTValDataType):
                     RTValArray = ks.rtVal(RTValDataType)
                     if len(RTVal):
                         RTValArray.resize(len(RTVal))
@@ -181,13 +283,11 @@ class KLOperator(Operator):
 
             #raise ValueError("Cannot convert rtval %s from %s" (rtVal, rtType))
 
-        argDataType = None
-        for arg in self.args:
-            if arg.name.getSimpleType() == name:
-                argDataType = arg.dataType.getSimpleType()
-                break
-        if argDataType is None:
-            raise Exception("Cannot find arg %s for object %s" (arg, self.getName()))
+        argDesc = self._argDescsByName.get(name, None)
+        if argDesc is None:
+            raise Exception("Cannot find arg %s for object %s" % (name, self.getName()))
+
+        argDataType = argDesc.dataType
 
         defaultVal = self.getDefaultValue(name, argDataType, mode="arg")
         pyVal = rt2Py(defaultVal, argDataType)
@@ -208,13 +308,10 @@ class KLOperator(Operator):
         # In SpliceMaya, output arrays are not resized by the system prior to
         # calling into Splice, so we explicily resize the arrays in the
         # generated operator stub code.
-        for i in xrange(len(self.args)):
-            arg = self.args[i]
-            argName = arg.name.getSimpleType()
-            argDataType = arg.dataType.getSimpleType()
-            argConnectionType = arg.connectionType.getSimpleType()
+        for argDesc in self.argDescs:
+            argName = argDesc.name
 
-            if argDataType.endswith('[]') and argConnectionType == 'Out':
+            if argDesc.isArray and argDesc.connectionType == 'Out':
                 arraySize = len(self.getOutput(argName))
                 opSourceCode += "  " + argName + ".resize(" + str(arraySize) + \
                     ");\n"
@@ -222,9 +319,9 @@ class KLOperator(Operator):
         opSourceCode += "  if(solver == null)\n"
         opSourceCode += "    solver = " + self.solverTypeName + "();\n"
         opSourceCode += "  solver.solve(\n"
-        for i in xrange(len(self.args)):
-            argName = self.args[i].name.getSimpleType()
-            if i == len(self.args) - 1:
+        for i in xrange(len(self.argDescs)):
+            argName = self.argDescs[i].name
+            if i == len(self.argDescs) - 1:
                 opSourceCode += "    " + argName + "\n"
             else:
                 opSourceCode += "    " + argName + ",\n"
@@ -295,11 +392,10 @@ class KLOperator(Operator):
 
         argVals = []
         debug = []
-        for i in xrange(len(self.args)):
-            arg = self.args[i]
-            argName = arg.name.getSimpleType()
-            argDataType = arg.dataType.getSimpleType()
-            argConnectionType = arg.connectionType.getSimpleType()
+        for argDesc in self.argDescs:
+            argName = argDesc.name
+            argDataType = argDesc.dataType
+            argConnectionType = argDesc.connectionType
 
             if argDataType == 'EvalContext':
                 argVals.append(ks.constructRTVal(argDataType))
@@ -312,7 +408,7 @@ class KLOperator(Operator):
                 continue
 
             if argConnectionType == 'In':
-                if str(argDataType).endswith('[]'):
+                if argDesc.isArray:
                     if argName in self.inputs and self.inputs[argName] is not None:
                         rtValArray = ks.rtVal(argDataType)
                         rtValArray.resize(len(self.inputs[argName]))
@@ -338,7 +434,7 @@ class KLOperator(Operator):
                     argVals.append(rtVal)
 
             elif argConnectionType in ('IO', 'Out'):
-                if str(argDataType).endswith('[]'):
+                if argDesc.isArray:
                     if argName in self.outputs and self.outputs[argName] is not None:
                         rtValArray = ks.rtVal(argDataType)
                         rtValArray.resize(len(self.outputs[argName]))
@@ -410,14 +506,12 @@ class KLOperator(Operator):
                     (rtval, obj.getName(), self.getName()))
 
         for i in xrange(len(argVals)):
-            arg = self.args[i]
-            argName = arg.name.getSimpleType()
-            argDataType = arg.dataType.getSimpleType()
-            argConnectionType = arg.connectionType.getSimpleType()
+            argDesc = self.argDescs[i]
+            argName = argDesc.name
 
-            if argConnectionType != 'In':
+            if argDesc.connectionType != 'In':
                 if argName in self.outputs and self.outputs[argName] is not None:
-                    if str(argDataType).endswith('[]'):
+                    if argDesc.isArray:
                         for j in xrange(len(argVals[i])):
                             if len(self.outputs[argName]) > j and self.outputs[argName][j] is not None:
                                 setRTVal(self.outputs[argName][j], argVals[i][j])
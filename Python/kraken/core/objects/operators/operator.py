@@ -271,6 +271,8 @@ class Operator(SceneItem):
         else:
             self.inputs[name] = operatorInput
 
+        SceneItem.bumpGraphRevision()
+
         return True
 
     def getInput(self, name):
@@ -373,6 +375,8 @@ class Operator(SceneItem):
             self.outputs[name] = operatorOutput
             operatorOutput.addSource(self)
 
+        SceneItem.bumpGraphRevision()
+
         return True
 
     def getOutput(self, name):
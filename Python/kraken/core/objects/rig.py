@@ -7,12 +7,15 @@ Rig -- Rig representation.
 
 import importlib
 import json
-import os
 
 from container import Container
 from kraken.core.kraken_system import KrakenSystem
+from kraken.core.evaluator import Evaluator
 from kraken.core.profiler import Profiler
-from kraken.helpers.utility_methods import prepareToSave, prepareToLoad
+from kraken.core.io.rig_definition_loader import RigDefinitionLoader
+from kraken.core.io.rig_definition_binary import packRigDefinition
+from kraken.core.io.json_codec import encodeJSON
+from kraken.helpers.utility_methods import prepareToSave
 
 
 class Rig(Container):
@@ -20,15 +23,17 @@ class Rig(Container):
 
     def __init__(self, name='rig', metaData=None):
         super(Rig, self).__init__(name, metaData=metaData)
+        self._evaluator = None
 
     # ====================
     # Load / Save Methods
     # ====================
-    def writeRigDefinitionFile(self, filepath):
+    def writeRigDefinitionFile(self, filepath, binary=False):
         """Load a rig definition from a file on disk.
 
         Args:
             filepath (str): The file path of the rig definition file.
+            binary (bool): Write the compact binary format instead of JSON.
 
         Returns:
             bool: True if successful.
@@ -39,17 +44,22 @@ class Rig(Container):
 
         jsonData = self.getData()
 
-        # now preprocess the data ready for saving to disk.
-        pureJSON = prepareToSave(jsonData)
-
-        with open(filepath,'w') as rigFile:
-            rigFile.write(json.dumps(pureJSON, indent=2))
+        if binary:
+            with open(filepath, 'wb') as rigFile:
+                rigFile.write(packRigDefinition(prepareToSave(jsonData)))
+        else:
+            # Math objects are encoded while the JSON is written.
+            with open(filepath,'w') as rigFile:
+                rigFile.write(json.dumps(jsonData, indent=2, default=encodeJSON))
 
         Profiler.getInstance().pop()
 
     def loadRigDefinitionFile(self, filepath):
         """Load a rig definition from a file on disk.
 
+        Both the JSON and the binary formats are supported, the format is
+        detected from the file header.
+
         Args:
             filepath (str): The file path of the rig definition file.
 
@@ -60,14 +70,8 @@ class Rig(Container):
 
         Profiler.getInstance().push("LoadRigDefinitionFile:" + filepath)
 
-        if not os.path.exists(filepath):
-            raise Exception("File not found:" + filepath)
-
-        with open(filepath) as rigFile:
-            jsonData = json.load(rigFile)
-
-        # now preprocess the data ready for loading.
-        jsonData = prepareToLoad(jsonData)
+        # Parses, validates and decodes the math values in a single pass.
+        jsonData = RigDefinitionLoader().loadFile(filepath)
 
         self.loadRigDefinition(jsonData)
         Profiler.getInstance().pop()
@@ -85,18 +89,34 @@ class Rig(Container):
 
         krakenSystem = KrakenSystem.getInstance()
 
+        # Resolve each component class once, rigs often hold many instances
+        # of the same components.
+        Profiler.getInstance().push("__resolveComponentClasses")
+        componentClasses = {}
         for componentData in componentsJson:
+            className = componentData['class']
+            if className in componentClasses:
+                continue
+
             # trim off the class name to get the module path.
-            modulePath = '.'.join(componentData['class'].split('.')[:-1])
+            modulePath = '.'.join(className.split('.')[:-1])
 
             if modulePath is not "":
                 try:
                     importlib.import_module(modulePath)
                 except:
                     print "Warning: Error finding module path: " + modulePath
+                    componentClasses[className] = None
                     continue
 
-            componentClass = krakenSystem.getComponentClass(componentData['class'])
+            componentClasses[className] = krakenSystem.getComponentClass(className)
+        Profiler.getInstance().pop()
+
+        for componentData in componentsJson:
+            componentClass = componentClasses[componentData['class']]
+            if componentClass is None:
+                continue
+
             if 'name' in componentData:
                 component = componentClass(name=componentData['name'], parent=self)
             else:
@@ -175,6 +195,13 @@ class Rig(Container):
             if 'connections' in jsonData:
                 self._makeConnections(jsonData['connections'])
 
+            # Evaluate the operators and constraints of the whole rig so that
+            # the poses flow through the connections between components.
+            # Guides only hold the guide poses and are not evaluated.
+            components = self.getChildrenByType('Component')
+            if len([x for x in components if x.getComponentType() == 'Guide']) == 0:
+                self.evalOperators()
+
         if 'metaData' in jsonData:
 
             for k, v in jsonData['metaData'].iteritems():
@@ -185,11 +212,12 @@ class Rig(Container):
 
         Profiler.getInstance().pop()
 
-    def writeGuideDefinitionFile(self, filepath):
+    def writeGuideDefinitionFile(self, filepath, binary=False):
         """Writes a rig definition to a file on disk.
 
         Args:
             filepath (str): The file path of the rig definition file.
+            binary (bool): Write the compact binary format instead of JSON.
 
         Returns:
             bool: True if successful.
@@ -200,11 +228,13 @@ class Rig(Container):
 
         guideData = self.getRigBuildData()
 
-        # now preprocess the data ready for saving to disk.
-        pureJSON = prepareToSave(guideData)
-
-        with open(filepath, 'w') as rigDef:
-            rigDef.write(json.dumps(pureJSON, indent=2))
+        if binary:
+            with open(filepath, 'wb') as rigDef:
+                rigDef.write(packRigDefinition(prepareToSave(guideData)))
+        else:
+            # Math objects are encoded while the JSON is written.
+            with open(filepath, 'w') as rigDef:
+                rigDef.write(json.dumps(guideData, indent=2, default=encodeJSON))
 
         Profiler.getInstance().pop()
 
@@ -283,3 +313,39 @@ class Rig(Container):
         rigBuildData['connections'] = connectionsJson
 
         return rigBuildData
+
+    # ==================
+    # Evaluation Methods
+    # ==================
+    def getEvaluator(self):
+        """Returns the evaluator of the operators and constraints of the rig.
+
+        Returns:
+            Evaluator: The rig's evaluator.
+
+        """
+
+        if self._evaluator is None:
+            self._evaluator = Evaluator()
+            self._evaluator.addRootItem(self)
+
+        return self._evaluator
+
+    def evalOperators(self, force=False):
+        """Evaluates the operators and constraints of all the components.
+
+        Each one is evaluated once, after the ones driving its inputs, so
+        connections between components are honored. Those whose inputs haven't
+        changed since the previous call are skipped.
+
+        Args:
+            force (bool): Evaluate all of them, even unchanged ones.
+
+        Returns:
+            bool: True if no errors during evaluation.
+
+        """
+
+        self.getEvaluator().evaluate(force=force)
+
+        return True
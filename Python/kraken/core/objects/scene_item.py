@@ -10,6 +10,9 @@ class SceneItem(object):
     """Kraken base object type for any 3D object."""
 
     __maxId = 0
+    __graphRevision = 0
+    __nameRevision = 0
+    __typeHierarchies = {}
 
     def __init__(self, name, parent=None, metaData=None):
         super(SceneItem, self).__init__()
@@ -25,6 +28,64 @@ class SceneItem(object):
 
         SceneItem.__maxId = SceneItem.__maxId + 1
 
+    # =================
+    # Revision Methods
+    # =================
+    @staticmethod
+    def getGraphRevision():
+        """Returns the revision of the scene graph.
+
+        The revision is bumped each time a parent, child, source or operator
+        connection changes on any scene item, so that traversals of an
+        unchanged graph can be cached.
+
+        Returns:
+            int: Graph revision.
+
+        """
+
+        return SceneItem.__graphRevision
+
+    @staticmethod
+    def bumpGraphRevision():
+        """Increments the revision of the scene graph.
+
+        Returns:
+            int: The new graph revision.
+
+        """
+
+        SceneItem.__graphRevision = SceneItem.__graphRevision + 1
+
+        return SceneItem.__graphRevision
+
+    @staticmethod
+    def getNameRevision():
+        """Returns the revision of scene item names.
+
+        The revision is bumped each time an item is renamed or its naming
+        meta data changes, so that resolved build names can be cached.
+
+        Returns:
+            int: Name revision.
+
+        """
+
+        return SceneItem.__nameRevision
+
+    @staticmethod
+    def bumpNameRevision():
+        """Increments the revision of scene item names.
+
+        Returns:
+            int: The new name revision.
+
+        """
+
+        SceneItem.__nameRevision = SceneItem.__nameRevision + 1
+
+        return SceneItem.__nameRevision
+
     # ==============
     # Type Methods
     # ==============
@@ -49,20 +110,48 @@ class SceneItem(object):
         return self.__class__.__name__
 
     def getTypeHierarchyNames(self):
-        """Returns the class name of this object.
+        """Returns the class names of the type hierarchy of this object.
 
         Returns:
-            bool: True if successful.
+            list: Class names from this object's class up to the base class.
+
+        """
+
+        return list(self._getTypeHierarchy()[0])
+
+    def getTypeNameSet(self):
+        """Returns the set of all class names in this object's type hierarchy.
+
+        Returns:
+            frozenset: Class names of the type hierarchy.
+
+        """
+
+        return self._getTypeHierarchy()[1]
+
+    def _getTypeHierarchy(self):
+        """Returns the memoized type hierarchy of this object's class.
+
+        Returns:
+            tuple: The ordered class names, excluding object, and a frozenset
+                of all class names.
 
         """
 
-        khierarchy = []
-        for cls in type.mro(type(self)):
-            if cls == object:
-                break
-            khierarchy.append(cls.__name__)
+        cls = type(self)
+        typeHierarchy = SceneItem.__typeHierarchies.get(cls, None)
+        if typeHierarchy is None:
+            khierarchy = []
+            for mroCls in type.mro(cls):
+                if mroCls == object:
+                    break
+                khierarchy.append(mroCls.__name__)
+
+            typeHierarchy = (tuple(khierarchy),
+                             frozenset([x.__name__ for x in type.mro(cls)]))
+            SceneItem.__typeHierarchies[cls] = typeHierarchy
 
-        return khierarchy
+        return typeHierarchy
 
     def isTypeOf(self, typeName):
         """Returns the class name of this object.
@@ -75,11 +164,7 @@ class SceneItem(object):
 
         """
 
-        for cls in type.mro(type(self)):
-            if cls.__name__ == typeName:
-                return True
-
-        return False
+        return typeName in self._getTypeHierarchy()[1]
 
     def isOfAnyType(self, typeNames):
         """Returns true if this item has any of the given type names
@@ -92,11 +177,7 @@ class SceneItem(object):
 
         """
 
-        for typeName in typeNames:
-            if self.isTypeOf(typeName):
-                return True
-
-        return False
+        return not self._getTypeHierarchy()[1].isdisjoint(typeNames)
 
     # =============
     # Name methods
@@ -123,6 +204,7 @@ class SceneItem(object):
         """
 
         self._name = name
+        SceneItem.bumpNameRevision()
 
         return True
 
@@ -253,6 +335,8 @@ class SceneItem(object):
         else:
             self._sources.append(source)
 
+        SceneItem.bumpGraphRevision()
+
         if self not in source._depends:
             source._depends.append(self)
 
@@ -270,6 +354,7 @@ class SceneItem(object):
             return False
 
         self._sources[:] = [s for s in self._sources if s != source]
+        SceneItem.bumpGraphRevision()
 
         if self not in source._depends:
             source._depends[:] = [s for s in self._depends if s != self]
@@ -284,6 +369,7 @@ class SceneItem(object):
         """
 
         self._sources[index] = source
+        SceneItem.bumpGraphRevision()
 
         return True
 
@@ -421,4 +507,7 @@ class SceneItem(object):
 
         self._metaData[name] = data
 
+        if name in ('altType', 'altLocation'):
+            SceneItem.bumpNameRevision()
+
         return True
\ No newline at end of file
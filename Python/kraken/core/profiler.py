@@ -5,16 +5,22 @@ Profiler - Profiler Object.
 
 """
 
-import time
-import operator
+import os
+import csv
+import json
+import functools
+
+from timeit import default_timer
 
 
 class _ProfilerItem(object):
 
+    __slots__ = ('label', 'start', 'end', 'children')
+
     def __init__(self, label):
         super(_ProfilerItem, self).__init__()
 
-        t = time.time()
+        t = default_timer()
         self.label = label
         self.start = t
         self.end = t
@@ -26,17 +32,75 @@ class _ProfilerItem(object):
 
 
     def endProfiling(self):
-        self.end = time.time()
+        self.end = default_timer()
+
+
+    def getDuration(self):
+        return self.end - self.start
+
+
+    def getSelfTime(self):
+        return self.getDuration() - sum([x.getDuration() for x in self.children])
+
+
+class _ProfilerSpan(object):
+    """Pushes a label on the profiler for the duration of a with block or of
+    each call to a decorated function."""
+
+    def __init__(self, profiler, label):
+        super(_ProfilerSpan, self).__init__()
+        self.profiler = profiler
+        self.label = label
+
+
+    def __enter__(self):
+        self.profiler.push(self.label)
+        return self
+
+
+    def __exit__(self, excType, excValue, traceback):
+        self.profiler.pop()
+        return False
+
+
+    def __call__(self, func):
+        label = self.label
+        if label is None:
+            label = func.__module__ + '.' + func.__name__
+
+        profiler = self.profiler
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler.push(label)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profiler.pop()
+
+        return wrapper
 
 
 class Profiler(object):
-    """Kraken profiler object for debugging performance issues."""
+    """Kraken profiler object for debugging performance issues.
+
+    Spans are timed with the highest resolution timer of the platform and
+    recorded as a tree. Per label call counts, total and self times are
+    derived from the tree when reporting, so recording a span costs a single
+    object allocation. When the profiler is disabled, push and pop only
+    balance the stack, making it cheap enough to leave in production code.
+
+    Profiling is enabled unless the KRAKEN_PROFILER environment variable is
+    set to '0'.
+
+    """
 
     __instance = None
 
 
     def __init__(self):
         super(Profiler, self).__init__()
+        self.__enabled = os.environ.get('KRAKEN_PROFILER', '1') != '0'
         self.reset()
 
 
@@ -47,6 +111,33 @@ class Profiler(object):
         self.__stack = []
 
 
+    def isEnabled(self):
+        """Returns whether the profiler is recording spans.
+
+        Returns:
+            bool: True if the profiler is enabled.
+
+        """
+
+        return self.__enabled
+
+
+    def setEnabled(self, enabled):
+        """Enables or disables the recording of spans.
+
+        Args:
+            enabled (bool): Whether spans should be recorded.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self.__enabled = bool(enabled)
+
+        return True
+
+
     def push(self, label):
 
         """Adds a new child to the profiling tree and activates it.
@@ -56,11 +147,24 @@ class Profiler(object):
 
         """
 
+        if not self.__enabled:
+            self.__stack.append(None)
+            return
+
         item = _ProfilerItem(label)
-        if len(self.__stack) == 0:
+
+        # Attach to the closest recorded item, pushes made while disabled
+        # are skipped.
+        parent = None
+        for stackItem in reversed(self.__stack):
+            if stackItem is not None:
+                parent = stackItem
+                break
+
+        if parent is None:
             self.__roots.append(item)
         else:
-            self.__stack[-1].addChild(item)
+            parent.addChild(item)
 
         self.__stack.append(item)
 
@@ -73,62 +177,171 @@ class Profiler(object):
             raise Exception("""Unable to close bracket. Pop has been called more """ +
                             """times than push.""")
 
-        self.__stack[-1].endProfiling()
-        self.__stack.pop()
+        item = self.__stack.pop()
+        if item is not None:
+            item.endProfiling()
 
 
-    def generateReport(self, listFunctionTotals=False):
-        """Returns a report string containing all the data gathered turing
-        profiling.
+    def span(self, label=None):
+        """Returns a span usable as a context manager or function decorator.
 
         Args:
-            listFunctionTotals (bool): list information relating to the total time spent in each function.
+            label (str): The label of the span. When decorating a function it
+                defaults to the function's module and name.
 
         Returns:
-            str: The profiler report.
+            object: The span.
 
         """
 
+        return _ProfilerSpan(self, label)
+
+
+    def __checkClosed(self):
         if len(self.__stack) != 0:
             raise Exception("""Profiler brackets not closed properly. """ +
                             """Pop must be called for every call to push. Pop """ +
                             """needs to be called another """ +
                             str(len(self.__stack)) + """ times""")
 
-        report = []
-        report.append("--callstack--")
 
-        functions = {}
+    def __iterItems(self):
+        """Iterates over all recorded items with their depth, depth first."""
 
-        def reportItem(item, indent):
-            duration = item.end - item.start
-            report.append(indent + item.label + ' duration: ' + str(duration))
-            if item.label not in functions:
-                functions[item.label] = duration
-            else:
-                functions[item.label] += duration
+        stack = [(x, 0) for x in reversed(self.__roots)]
+        while stack:
+            item, depth = stack.pop()
+            yield item, depth
+            stack.extend([(x, depth + 1) for x in reversed(item.children)])
 
-            for childItem in item.children:
-                reportItem(childItem, indent + '  ')
 
-        for rootItem in self.__roots:
-            reportItem(rootItem, '  ')
+    def getStats(self):
+        """Returns the call count, total and self time of each label.
+
+        Returns:
+            dict: Label to a dict with 'count', 'total' and 'self' keys.
+
+        """
+
+        stats = {}
+        for item, depth in self.__iterItems():
+            labelStats = stats.get(item.label, None)
+            if labelStats is None:
+                labelStats = {'count': 0, 'total': 0.0, 'self': 0.0}
+                stats[item.label] = labelStats
+
+            labelStats['count'] += 1
+            labelStats['total'] += item.getDuration()
+            labelStats['self'] += item.getSelfTime()
+
+        return stats
+
+
+    def generateReport(self, listFunctionTotals=False):
+        """Returns a report string containing all the data gathered turing
+        profiling.
+
+        Args:
+            listFunctionTotals (bool): list information relating to the total time spent in each function.
+
+        Returns:
+            str: The profiler report.
+
+        """
+
+        self.__checkClosed()
+
+        report = []
+        report.append("--callstack--")
+
+        for item, depth in self.__iterItems():
+            report.append('  ' * (depth + 1) + item.label + ' duration: ' + str(item.getDuration()))
 
         if listFunctionTotals:
             report.append("--functions--")
 
-            def reverse_numeric(x, y):
-                return y < x
-
-            sorted_fns = sorted(functions.items(), key=operator.itemgetter(1),
-                                cmp=reverse_numeric)
+            stats = self.getStats()
+            sortedLabels = sorted(stats.keys(), key=lambda x: stats[x]['total'],
+                                  reverse=True)
 
-            for fn_tuple in sorted_fns:
-                report.append(str(fn_tuple[1]) + ': ' + fn_tuple[0])
+            for label in sortedLabels:
+                labelStats = stats[label]
+                report.append(str(labelStats['total']) + ': ' + label +
+                              ' (calls: ' + str(labelStats['count']) +
+                              ', self: ' + str(labelStats['self']) + ')')
 
         return '\n'.join(report)
 
 
+    def exportChromeTrace(self, filepath):
+        """Writes the recorded spans as Chrome trace events.
+
+        The file can be loaded in chrome://tracing or Perfetto.
+
+        Args:
+            filepath (str): Path of the JSON file to write.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self.__checkClosed()
+
+        origin = None
+        if len(self.__roots) > 0:
+            origin = self.__roots[0].start
+
+        pid = os.getpid()
+        events = []
+        for item, depth in self.__iterItems():
+            events.append({
+                'name': item.label,
+                'cat': 'kraken',
+                'ph': 'X',
+                'ts': (item.start - origin) * 1000000.0,
+                'dur': item.getDuration() * 1000000.0,
+                'pid': pid,
+                'tid': 0
+            })
+
+        with open(filepath, 'w') as traceFile:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'},
+                      traceFile, indent=2)
+
+        return True
+
+
+    def exportCSV(self, filepath):
+        """Writes the call count, total and self time of each label as CSV.
+
+        Args:
+            filepath (str): Path of the CSV file to write.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self.__checkClosed()
+
+        stats = self.getStats()
+        sortedLabels = sorted(stats.keys(), key=lambda x: stats[x]['total'],
+                              reverse=True)
+
+        with open(filepath, 'wb') as csvFile:
+            writer = csv.writer(csvFile)
+            writer.writerow(['label', 'count', 'total', 'self'])
+            for label in sortedLabels:
+                labelStats = stats[label]
+                writer.writerow([label,
+                                 labelStats['count'],
+                                 labelStats['total'],
+                                 labelStats['self']])
+
+        return True
+
+
     @classmethod
     def getInstance(cls):
         """This class method returns the singleton instance for the Profiler
@@ -1,8 +1,30 @@
+"""Kraken - core.synchronizer module.
+
+Classes:
+Synchronizer - Base Synchronizer Object.
+
+"""
+
+from kraken.core.objects.scene_item import SceneItem
+from kraken.core.profiler import Profiler
 
 
 class Synchronizer(object):
     """The Synchronizer is a singleton object used to synchronize data between
-    Kraken objects and the DCC objects."""
+    Kraken objects and the DCC objects.
+
+    The hierarchy map and the list of items to synchronize are kept between
+    syncs for as long as the target's scene graph and names are unchanged.
+    Sub-classed synchronizers can implement getDCCItemState to return a cheap
+    snapshot of a DCC item, and getDCCItemStates to query the snapshots of all
+    the items at once; items whose snapshot is unchanged since their last sync
+    are skipped.
+
+    """
+
+    SYNC_XFO = 1
+    SYNC_CURVE = 2
+    SYNC_ATTRIBUTE = 4
 
     def __init__(self, target=None):
         """Initializes Synchronizer.
@@ -16,6 +38,8 @@ class Synchronizer(object):
 
         super(Synchronizer, self).__init__()
         self._hrcMap = {}
+        self._hrcMapRevision = None
+        self._syncList = None
         self._target = None
 
         if target is not None:
@@ -39,6 +63,10 @@ class Synchronizer(object):
     def setTarget(self, target):
         """Sets the target for synchronization.
 
+        Setting the current target again keeps the hierarchy map unless the
+        scene graph or the names of the scene items changed since it was
+        created.
+
         Args:
             target (object): top Kraken object to synchronize.
 
@@ -47,15 +75,23 @@ class Synchronizer(object):
 
         """
 
+        if target is self._target and self._hrcMapRevision == self._getRevision():
+            return True
+
         self.clearHierarchyMap()
 
         self._target = target
 
         self.createHierarchyMap(self.getTarget())
+        self._hrcMapRevision = self._getRevision()
 
         return True
 
 
+    def _getRevision(self):
+        return (SceneItem.getGraphRevision(), SceneItem.getNameRevision())
+
+
     # ======================
     # Hierarchy Map Methods
     # ======================
@@ -81,7 +117,8 @@ class Synchronizer(object):
             dccItem = self.getDCCItem(kObject)
 
             self._hrcMap[kObject] = {
-                           "dccItem": dccItem
+                           "dccItem": dccItem,
+                           "state": None
                           }
 
         # =======================
@@ -118,86 +155,286 @@ class Synchronizer(object):
         """
 
         self._hrcMap = {}
+        self._hrcMapRevision = None
+        self._syncList = None
+
+        return True
+
+
+    # ==================
+    # Dirty Item Methods
+    # ==================
+    def markDirty(self, kObject=None):
+        """Marks an item to be synchronized on the next sync even if its DCC
+        item state is unchanged.
+
+        DCC change callbacks can use this to journal the items that changed.
+
+        Args:
+            kObject (object): The item to mark, all mapped items are marked if
+                None.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        if kObject is None:
+            for mapItem in self._hrcMap.itervalues():
+                mapItem['state'] = None
+
+            return True
+
+        mapItem = self._hrcMap.get(kObject, None)
+        if mapItem is not None:
+            mapItem['state'] = None
 
         return True
 
 
+    def isDirty(self, kObject):
+        """Checks if an item changed in the DCC since it was last synchronized.
+
+        Args:
+            kObject (object): The item to check.
+
+        Returns:
+            bool: True if the item must be synchronized.
+
+        """
+
+        mapItem = self._hrcMap.get(kObject, None)
+        if mapItem is None or mapItem['state'] is None:
+            return True
+
+        dccItem = self._getMappedDCCItem(kObject)
+        if dccItem is None:
+            return True
+
+        return self.getDCCItemState(kObject, dccItem) != mapItem['state']
+
+
+    def _getMappedDCCItem(self, kObject):
+        """Gets the mapped DCC item of an object, resolving it again if it was
+        not found when mapped or has since been deleted."""
+
+        mapItem = self._hrcMap.get(kObject, None)
+        if mapItem is None:
+            return self.getDCCItem(kObject)
+
+        dccItem = mapItem['dccItem']
+        if dccItem is None or self.isDCCItemValid(dccItem) is False:
+            dccItem = self.getDCCItem(kObject)
+            mapItem['dccItem'] = dccItem
+            mapItem['state'] = None
+
+        return dccItem
+
+
     # ========================
     # Synchronization Methods
     # ========================
-    def sync(self):
+    def sync(self, force=False):
         """Synchronizes the target hierarchy with the matching objects in the DCC.
 
+        Args:
+            force (bool): Synchronize all items, even those that have not
+                changed since the last sync.
+
         Returns:
             bool: True if successful.
 
         """
 
-        self.synchronize(self.getTarget())
+        self.synchronize(self.getTarget(), force=force)
 
         return True
 
 
-    def synchronize(self, kObject):
-        """Iteration method that traverses the hierarchy and syncs the different
-        object types.
+    def synchronize(self, kObject, force=False):
+        """Synchronizes the different object types of a hierarchy.
 
         Args:
             kObject (object): object to synchronize.
+            force (bool): Synchronize all items, even those that have not
+                changed since the last sync.
 
         Returns:
             bool: True if successful.
 
         """
 
-        # =================
-        # Synchronize Data
-        # =================
-        if kObject.isTypeOf('Object3D'):
+        Profiler.getInstance().push("synchronize:" + kObject.getName())
+
+        if kObject is self._target:
+            if self._syncList is None:
+                self._syncList = self._collectSyncItems(kObject)
+
+            syncList = self._syncList
+        else:
+            syncList = self._collectSyncItems(kObject)
+
+        states = self._getSyncItemStates(syncList)
 
-            # Sync Xfo if it's not a Component
-            if kObject.isTypeOf('Component') is False:
+        result = True
+        i = 0
+        while i < len(syncList):
+            item, syncFlags, subtreeEnd = syncList[i]
+            i += 1
 
+            if item.isTypeOf('Rig'):
                 # If the top-level rig DCC node does not exist, don't proceed
                 # through the hierarchy.
-                if kObject.isTypeOf('Rig') and self.getDCCItem(kObject) is None:
-                    return False
+                if self._getMappedDCCItem(item) is None:
+                    if item is kObject:
+                        result = False
 
-                self.syncXfo(kObject)
+                    i = subtreeEnd
+                    continue
 
-            # Sync Curves / Controls
-            if kObject.isTypeOf('Curve') is True:
-                self.syncCurveData(kObject)
+            if syncFlags == 0:
+                continue
 
-        elif kObject.isTypeOf('Attribute'):
-            self.syncAttribute(kObject)
+            self._syncItem(item, syncFlags, force, states=states)
 
-        else:
-            pass
+        Profiler.getInstance().pop()
 
-        # =======================
-        # Iterate over hierarchy
-        # =======================
-        if kObject.isTypeOf('Object3D'):
-            # Iterate over attribute groups
-            for i in xrange(kObject.getNumAttributeGroups()):
-                attrGrp = kObject.getAttributeGroupByIndex(i)
-                self.synchronize(attrGrp)
+        return result
 
-        # Iterate over attributes
-        if kObject.isTypeOf('AttributeGroup'):
 
-            if kObject.getName() != 'implicitAttrGrp' and kObject.getParent().isTypeOf("Component") is False:
-                for i in xrange(kObject.getNumAttributes()):
-                    attr = kObject.getAttributeByIndex(i)
-                    self.synchronize(attr)
+    def _collectSyncItems(self, kObject):
+        """Walks a hierarchy and lists the items to synchronize, in the order
+        they are synchronized.
 
-        if kObject.isTypeOf('Object3D'):
+        Each entry holds the item, its sync flags and the index of the entry
+        following its sub-hierarchy.
 
-            # Iterate over children
-            for i in xrange(kObject.getNumChildren()):
-                child = kObject.getChildByIndex(i)
-                self.synchronize(child)
+        """
+
+        syncList = []
+
+        # Once an item's sub-hierarchy has been listed, its index in syncList
+        # is popped to record where the sub-hierarchy ends.
+        stack = [kObject]
+        while len(stack) > 0:
+            item = stack.pop()
+            if isinstance(item, int):
+                syncList[item][2] = len(syncList)
+                continue
+
+            syncFlags = 0
+            if item.isTypeOf('Object3D'):
+                # Sync Xfo if it's not a Component
+                if item.isTypeOf('Component') is False:
+                    syncFlags |= self.SYNC_XFO
+
+                # Sync Curves / Controls
+                if item.isTypeOf('Curve') is True:
+                    syncFlags |= self.SYNC_CURVE
+
+            elif item.isTypeOf('Attribute'):
+                syncFlags |= self.SYNC_ATTRIBUTE
+
+            stack.append(len(syncList))
+            syncList.append([item, syncFlags, None])
+
+            # Children are pushed in reverse so they are popped in order.
+            children = []
+            if item.isTypeOf('Object3D'):
+                # Iterate over attribute groups
+                for i in xrange(item.getNumAttributeGroups()):
+                    children.append(item.getAttributeGroupByIndex(i))
+
+            # Iterate over attributes
+            if item.isTypeOf('AttributeGroup'):
+                if item.getName() != 'implicitAttrGrp' and item.getParent().isTypeOf("Component") is False:
+                    for i in xrange(item.getNumAttributes()):
+                        children.append(item.getAttributeByIndex(i))
+
+            if item.isTypeOf('Object3D'):
+                # Iterate over children
+                for i in xrange(item.getNumChildren()):
+                    children.append(item.getChildByIndex(i))
+
+            stack.extend(reversed(children))
+
+        return syncList
+
+
+    def _getSyncItemStates(self, syncList):
+        """Gets the DCC item snapshots of the mapped items of a sync list in a
+        single getDCCItemStates call.
+
+        Returns:
+            dict: The snapshot of each mapped item that has a DCC item.
+
+        """
+
+        kObjects = []
+        dccItems = []
+
+        i = 0
+        while i < len(syncList):
+            item, syncFlags, subtreeEnd = syncList[i]
+            i += 1
+
+            if item.isTypeOf('Rig') and self._getMappedDCCItem(item) is None:
+                i = subtreeEnd
+                continue
+
+            if syncFlags == 0 or item not in self._hrcMap:
+                continue
+
+            dccItem = self._getMappedDCCItem(item)
+            if dccItem is None:
+                continue
+
+            kObjects.append(item)
+            dccItems.append(dccItem)
+
+        if len(kObjects) == 0:
+            return {}
+
+        return dict(zip(kObjects, self.getDCCItemStates(kObjects, dccItems)))
+
+
+    def _syncItem(self, kObject, syncFlags, force, states=None):
+        """Synchronizes a single item if it changed since its last sync.
+
+        Args:
+            kObject (object): The item to synchronize.
+            syncFlags (int): The data of the item to synchronize.
+            force (bool): Synchronize the item even if it has not changed.
+            states (dict): The DCC item snapshots queried for the sync, the
+                snapshot of the item is queried if None.
+
+        """
+
+        mapItem = self._hrcMap.get(kObject, None)
+
+        state = None
+        if mapItem is not None:
+            if states is not None:
+                state = states.get(kObject, None)
+            else:
+                dccItem = self._getMappedDCCItem(kObject)
+                if dccItem is not None:
+                    state = self.getDCCItemState(kObject, dccItem)
+
+            if force is False and state is not None and state == mapItem['state']:
+                return False
+
+        if syncFlags & self.SYNC_XFO:
+            self.syncXfo(kObject)
+
+        if syncFlags & self.SYNC_CURVE:
+            self.syncCurveData(kObject)
+
+        if syncFlags & self.SYNC_ATTRIBUTE:
+            self.syncAttribute(kObject)
+
+        if mapItem is not None:
+            mapItem['state'] = state
 
         return True
 
@@ -224,6 +461,62 @@ class Synchronizer(object):
         return dccItem
 
 
+    def isDCCItemValid(self, dccItem):
+        """Checks that a DCC item found earlier still exists in the DCC.
+
+        **This should be re-implemented in the sub-classed synchronizer for each
+        plugin.**
+
+        Args:
+            dccItem (object): The DCC item to check.
+
+        Returns:
+            bool: True if the DCC item can still be used.
+
+        """
+
+        return True
+
+
+    def getDCCItemState(self, kObject, dccItem):
+        """Gets a snapshot of the DCC item data that the object is synced from.
+
+        The snapshot should be much cheaper to query than the sync itself, the
+        object is only synchronized again once its snapshot changes.
+
+        **This should be re-implemented in the sub-classed synchronizer for each
+        plugin.**
+
+        Args:
+            kObject (object): The Kraken object being synchronized.
+            dccItem (object): The DCC item of the object.
+
+        Returns:
+            object: A comparable snapshot, or None to always sync the object.
+
+        """
+
+        return None
+
+
+    def getDCCItemStates(self, kObjects, dccItems):
+        """Gets the snapshots of several DCC items at once.
+
+        Synchronizers able to query many DCC items in a single call should
+        re-implement this, it calls getDCCItemState for each item by default.
+
+        Args:
+            kObjects (list): The Kraken objects being synchronized.
+            dccItems (list): The DCC item of each object.
+
+        Returns:
+            list: The snapshot of each item, None to always sync the item.
+
+        """
+
+        return [self.getDCCItemState(x, y) for x, y in zip(kObjects, dccItems)]
+
+
     def syncXfo(self, kObject):
         """Syncs the xfo from the DCC object to the Kraken object.
 
@@ -23,8 +23,12 @@ class Traverser(object):
 
     """
 
+    __cache = {}
+    __cacheRevision = None
+
     def __init__(self, name='Traverser'):
         self._rootItems = []
+        self._rootItemIds = set()
         self.reset()
 
     # ==================
@@ -52,11 +56,11 @@ class Traverser(object):
 
         """
 
-        for rootItem in self._rootItems:
-            if rootItem.getId() == item.getId():
-                return False
+        if item.getId() in self._rootItemIds:
+            return False
 
         self._rootItems.append(item)
+        self._rootItemIds.add(item.getId())
 
         return True
 
@@ -90,8 +94,12 @@ class Traverser(object):
     def getItemsOfType(self, typeNames):
         """Gets only the traversed items of a given type.
 
+        Items are bucketed by every class name of their type hierarchy as they
+        are collected, so this is a dictionary lookup preserving the traversal
+        order.
+
         Args:
-            typeName (str): The name of the type to look for.
+            typeNames (str or list): The name(s) of the type(s) to look for.
 
         Returns:
             list: The items in the total items list matching the given type.
@@ -101,12 +109,15 @@ class Traverser(object):
         if not isinstance(typeNames, list):
             typeNames = [typeNames]
 
-        result = []
-        for item in self._items:
-            if item.isOfAnyType(typeNames):
-                result.append(item)
+        if len(typeNames) == 1:
+            return list(self._itemsByType.get(typeNames[0], []))
 
-        return result
+        itemIds = set()
+        for typeName in typeNames:
+            for item in self._itemsByType.get(typeName, []):
+                itemIds.add(item.getId())
+
+        return [x for x in self._items if x.getId() in itemIds]
 
     # =============
     # Traverse Methods
@@ -116,9 +127,49 @@ class Traverser(object):
 
         self._visited = {}
         self._items = []
+        self._itemsByType = {}
+
+    @staticmethod
+    def clearCache():
+        """Clears the cached traversal orders shared by all Traversers."""
+
+        Traverser.__cache.clear()
+        Traverser.__cacheRevision = SceneItem.getGraphRevision()
+
+    def __getCacheKey(self, itemCallback, discoverCallback, discoveredItemsFirst):
+        """Returns the key of the cached order for a traversal.
+
+        Only traversals without an item callback and using one of the
+        built-in discover callbacks can be cached, as their result depends
+        solely on the scene graph.
+
+        Args:
+            itemCallback (func): The item callback of the traversal.
+            discoverCallback (func): The discover callback of the traversal.
+            discoveredItemsFirst (bool): Whether discovered items are
+                collected first.
+
+        Returns:
+            tuple: The cache key, None if the traversal can't be cached.
+
+        """
+
+        if itemCallback is not None:
+            return None
+
+        if discoverCallback == self.discoverBySource:
+            discoverName = 'discoverBySource'
+        elif discoverCallback == self.discoverChildren:
+            discoverName = 'discoverChildren'
+        else:
+            return None
+
+        rootIds = tuple([x.getId() for x in self._rootItems])
+
+        return (rootIds, discoverName, bool(discoveredItemsFirst))
 
     def traverse(self, itemCallback=None, discoverCallback=None,
-                 discoveredItemsFirst=True):
+                 discoveredItemsFirst=True, useCache=False):
         """Visits all objects within this Traverser based on the root items.
 
         Args:
@@ -126,6 +177,13 @@ class Traverser(object):
                 item visited.
             discoverCallback (func): A callback to return an array of children
                 for each item.
+            discoveredItemsFirst (bool): Whether discovered items are
+                collected before the item discovering them.
+            useCache (bool): Reuse the order of a previous identical traversal
+                if the scene graph revision hasn't changed since.
+
+        Returns:
+            list: The traversed items.
 
         """
 
@@ -134,88 +192,158 @@ class Traverser(object):
         if discoverCallback is None:
             discoverCallback = self.discoverBySource
 
+        cacheKey = None
+        if useCache:
+            cacheKey = self.__getCacheKey(itemCallback,
+                                          discoverCallback,
+                                          discoveredItemsFirst)
+
+        if cacheKey is not None:
+            if Traverser.__cacheRevision != SceneItem.getGraphRevision():
+                Traverser.clearCache()
+
+            cachedItems = Traverser.__cache.get(cacheKey, None)
+            if cachedItems is not None:
+                for item in cachedItems:
+                    self._visited[item.getId()] = True
+                    self.__addItem(item)
+
+                return self.items
+
         for item in self._rootItems:
             self.__visitItem(item,
                              itemCallback,
                              discoverCallback,
                              discoveredItemsFirst)
 
+        if cacheKey is not None:
+            Traverser.__cache[cacheKey] = list(self._items)
+
         return self.items
 
     def __collectVisitedItem(self, item, itemCallback):
-        """Doc String.
+        """Collects an item into the ordered list of traversed items.
 
         Args:
-            item (Type): information.
-            itemCallback (Type): information.
+            item (SceneItem): The item to collect.
+            itemCallback (func): Callback to invoke for the item.
 
         """
 
         if itemCallback is not None:
             itemCallback(item=item, traverser=self)
 
+        self.__addItem(item)
+
+    def __addItem(self, item):
+        """Appends an item to the traversed items and to its type buckets.
+
+        Args:
+            item (SceneItem): The item to add.
+
+        """
+
         self._items.append(item)
+        for typeName in item.getTypeNameSet():
+            bucket = self._itemsByType.get(typeName, None)
+            if bucket is None:
+                bucket = []
+                self._itemsByType[typeName] = bucket
+
+            bucket.append(item)
 
     def __visitItem(self, item, itemCallback, discoverCallback, discoveredItemsFirst):
-        """Doc String.
+        """Visits an item, its parents and the items it discovers.
+
+        The visit uses an explicit stack rather than recursion so that deep
+        hierarchies don't hit the interpreter's recursion limit. Each frame
+        holds the item, its stage, its discovered items, the index of the next
+        discovered item to visit and whether it is sourced by a constraint or
+        operator.
 
         Args:
-            item (Type): information.
-            itemCallback (Type): information.
-            discoverCallback (Type): information.
-            discoveredItemsFirst (Type): information.
+            item (SceneItem): The item to visit.
+            itemCallback (func): Callback to invoke for each collected item.
+            discoverCallback (func): Callback returning the items to visit
+                from each item.
+            discoveredItemsFirst (bool): Whether discovered items are
+                collected before the item discovering them.
 
         Returns:
-            Type: information.
+            bool: True if the item was visited.
 
         """
 
         if self._visited.get(item.getId(), False):
             return False
 
-        self._visited[item.getId()] = True
+        visited = self._visited
+        stack = [[item, 0, None, 0, False]]
+        while stack:
+            frame = stack[-1]
+            current = frame[0]
 
-        if hasattr(item, 'getParent') and item.getParent():
-            # If this is an attribute and we have not traversed its parent AttributeGroup then skip this
-            # and visit the parent so we get this attribute and all others from there (for the sake of attr order)
-            if item.isTypeOf("Attribute") and not self._visited.get(item.getParent().getId(), False):
-                self._visited[item.getId()] = False
-                self.__visitItem(item.getParent(),
-                             itemCallback,
-                             discoverCallback,
-                             discoveredItemsFirst)
-                return False
+            if frame[1] == 0:
+                if visited.get(current.getId(), False):
+                    stack.pop()
+                    continue
 
-            self.__visitItem(item.getParent(),
-                             itemCallback,
-                             discoverCallback,
-                             discoveredItemsFirst)
+                visited[current.getId()] = True
+                frame[1] = 1
+
+                parent = None
+                if hasattr(current, 'getParent'):
+                    parent = current.getParent()
+
+                if parent:
+                    # If this is an attribute and we have not traversed its
+                    # parent AttributeGroup then skip this and visit the
+                    # parent so we get this attribute and all others from
+                    # there (for the sake of attr order)
+                    if current.isTypeOf("Attribute") and not visited.get(parent.getId(), False):
+                        visited[current.getId()] = False
+                        stack[-1] = [parent, 0, None, 0, False]
+                        continue
+
+                    stack.append([parent, 0, None, 0, False])
+                    continue
+
+            if frame[1] == 1:
+                sourcedByConstraintOrOperator = False
+                if discoveredItemsFirst:
+                    for source in current.getSources():
+                        if isinstance(source, (Constraint, Operator)):
+                            sourcedByConstraintOrOperator = True
+                            break
+
+                frame[4] = sourcedByConstraintOrOperator
+
+                if not discoveredItemsFirst or sourcedByConstraintOrOperator:
+                    self.__collectVisitedItem(current, itemCallback)
+
+                discoveredItems = None
+                if discoverCallback:
+                    if isinstance(current, AttributeGroup):
+                        discoveredItems = self.discoverChildren(current)
+                    else:
+                        discoveredItems = discoverCallback(current)
+
+                frame[2] = discoveredItems or []
+                frame[1] = 2
+
+            if frame[1] == 2:
+                if frame[3] < len(frame[2]):
+                    discoveredItem = frame[2][frame[3]]
+                    frame[3] += 1
+                    if not visited.get(discoveredItem.getId(), False):
+                        stack.append([discoveredItem, 0, None, 0, False])
+
+                    continue
+
+                if discoveredItemsFirst and not frame[4]:
+                    self.__collectVisitedItem(current, itemCallback)
 
-        sourcedByConstraintOrOperator = False
-        if discoveredItemsFirst:
-            for source in item.getSources():
-                if isinstance(source, (Constraint, Operator)):
-                    sourcedByConstraintOrOperator = True
-                    break
-
-        if not discoveredItemsFirst or sourcedByConstraintOrOperator:
-            self.__collectVisitedItem(item, itemCallback)
-
-        if discoverCallback:
-            if isinstance(item, AttributeGroup):
-                discoveredItems = self.discoverChildren(item)
-            else:
-                discoveredItems = discoverCallback(item)
-
-            if discoveredItems:
-                for discoveredItem in discoveredItems:
-                    self.__visitItem(discoveredItem,
-                                     itemCallback,
-                                     discoverCallback,
-                                     discoveredItemsFirst)
-
-        if discoveredItemsFirst and not sourcedByConstraintOrOperator:
-            self.__collectVisitedItem(item, itemCallback)
+                stack.pop()
 
         return True
 
@@ -1,9 +1,9 @@
-from kraken.core.maths.math_object import MathObject
 from kraken.core.maths.vec3 import Vec3
 from kraken.core.maths.xfo import Xfo
 from kraken.core.maths.quat import Quat
 
-from kraken.core.maths import decodeValue
+from kraken.core.io.json_codec import toJSON
+from kraken.core.io.json_codec import fromJSON
 
 
 def logHierarchy(kObject):
@@ -20,21 +20,6 @@ def logHierarchy(kObject):
         logHierarchy(child)
 
 
-def __convertFromJSON(jsonData):
-
-    if type(jsonData) is list:
-        newList = []
-        for item in jsonData:
-            newList.append(__convertFromJSON(item))
-        return newList
-    elif type(jsonData) is dict:
-        if '__mathObjectClass__' in jsonData.keys():
-            return decodeValue(jsonData)
-        for key, value in jsonData.iteritems():
-            jsonData[key] = __convertFromJSON(value)
-    return jsonData
-
-
 def prepareToLoad(jsonData):
     """Prepares the json data for loading into kraken.
 
@@ -46,24 +31,7 @@ def prepareToLoad(jsonData):
 
     """
 
-    return __convertFromJSON(jsonData)
-
-
-def __convertToJSON(jsonData):
-
-    if isinstance(jsonData, MathObject):
-        return jsonData.jsonEncode()
-    elif type(jsonData) is list:
-        newList = []
-        for item in jsonData:
-            newList.append(__convertToJSON(item))
-        return newList
-    elif type(jsonData) is dict:
-        newDict = {}
-        for key, value in jsonData.iteritems():
-            newDict[key] = __convertToJSON(value)
-        return newDict
-    return jsonData
+    return fromJSON(jsonData)
 
 
 def prepareToSave(jsonData):
@@ -77,7 +45,7 @@ def prepareToSave(jsonData):
 
     """
 
-    return __convertToJSON(jsonData)
+    return toJSON(jsonData)
 
 
 def __mirrorData(jsonData, plane):
@@ -26,6 +26,7 @@ from kraken.core.maths.xfo import Xfo
 
 from kraken.plugins.canvas_plugin.hash import makeHash
 from kraken.plugins.canvas_plugin.graph_manager import GraphManager
+from kraken.plugins.canvas_plugin.graph_layout import GraphLayout
 
 import FabricEngine.Core as core
 
@@ -923,12 +924,12 @@ class Builder(Builder):
 
         argPorts = {}
 
-        args = kOperator.getSolverArgs()
+        args = kOperator.getSolverArgDescs()
         for i in xrange(len(args)):
             arg = args[i]
-            argName = arg.name.getSimpleType()
-            argDataType = arg.dataType.getSimpleType()
-            argConnectionType = arg.connectionType.getSimpleType()
+            argName = arg.name
+            argDataType = arg.dataType
+            argConnectionType = arg.connectionType
 
             argPort = None
             if argConnectionType == 'In':
@@ -1124,6 +1125,8 @@ class Builder(Builder):
 
         """
 
+        self._clearSceneItemPairs()
+
         self.__rigTitle = self.getConfig().getMetaData('RigTitle', 'Rig')
         self.__rigGraph = GraphManager()
         self.rigGraph.setTitle('Rig')
@@ -1215,86 +1218,11 @@ class Builder(Builder):
                 self.rigGraph.connectNodes(linesNode, linesPort, ifNode, "if_true")
                 self.rigGraph.connectArg('debugDraw', ifNode, 'cond')
 
-        # perform layout based on reingold tilford
-        nodes = self.rigGraph.getAllNodeNames()
-        nodeConnections = self.rigGraph.getAllNodeConnections()
-
-        depth = {}
-        height = {}
-        for n in nodes:
-            depth[n] = 0
-
-        changed = True
-        while changed:
-            changed = False
-
-            # forward
-            for n in nodes:
-                connections = nodeConnections.get(n, [])
-                for c in connections:
-                    if depth[c] <= depth[n]:
-                        depth[c] = depth[n] + 1
-                        changed = True
-
-            # backward
-            for n in nodes:
-                connections = nodeConnections.get(n, [])
-                minDiff = 0
-                for c in connections:
-                    diff = depth[c] - depth[n]
-                    if diff < minDiff or minDiff == 0:
-                        minDiff = diff
-                if minDiff > 1:
-                    depth[n] = depth[n] + minDiff - 1
-
-        rows = []
-        maxPortsPerRow = []
-        for n in depth:
-            while len(rows) <= depth[n]:
-                rows += [[]]
-                maxPortsPerRow += [0]
-            rows[depth[n]] += [n]
-            if self.rigGraph.getNumPorts(n) > maxPortsPerRow[depth[n]]:
-                maxPortsPerRow[depth[n]] = self.rigGraph.getNumPorts(n)
-
-        for j in range(len(rows)-1, -1, -1):
-
-            row = rows[j]
-            rowHeights = {}
-            for i in range(len(row)):
-                n = row[i]
-                if j == len(rows)-1:
-                    height[n] = i
-                    continue
-
-                connectedNodes = self.rigGraph.getNodeConnections(n)
-                offset = maxPortsPerRow[j+1]
-                height[n] = len(rows[j+1]) *  + i
-                for connectedNode in connectedNodes:
-                    h = height[connectedNode] * maxPortsPerRow[j+1]
-                    h = h + self.rigGraph.getMinConnectionPortIndex(n, connectedNode)
-                    if h < height[n]:
-                        height[n] = h
-
-                h = height[n]
-                while rowHeights.has_key(h):
-                  h = h + 1
-                height[n] = h
-                rowHeights[height[n]] = True
-
-            # normalize the heights
-            sortedHeights = sorted(rowHeights.keys())
-            if len(sortedHeights) > 0:
-                heightLookup = {}
-                for i in range(len(sortedHeights)):
-                    heightLookup[sortedHeights[i]] = i
-                for i in range(len(row)):
-                    n = row[i]
-                    height[n] = heightLookup[height[n]]
-
-        for n in nodes:
-            x = float(depth[n]) * 300.0
-            y = float(height[n]) * 120.0
+        # perform a layered layout of the graph
+        layout = GraphLayout(self.rigGraph.getAllNodeNames(),
+                             self.rigGraph.getAllNodeConnections())
+
+        for n, (x, y) in layout.getPositions().iteritems():
             self.rigGraph.setNodeMetaData(n, 'uiGraphPos', json.dumps({"x": x, "y": y}))
             self.rigGraph.setNodeMetaData(n, 'uiCollapsedState', "1")
 
@@ -0,0 +1,372 @@
+"""Kraken Canvas - Canvas Graph Layout module.
+
+Classes:
+GraphLayout -- Layered layout of the nodes of a graph.
+
+Functions:
+layoutCanvasFile -- Lays out the nodes of a saved .canvas file.
+
+"""
+
+import json
+import json.decoder
+import json.scanner
+from collections import deque
+from collections import OrderedDict
+
+
+class GraphLayout(object):
+    """Layered layout of the nodes of a directed graph.
+
+    Nodes are assigned to layers (depths) so that every connection goes to a
+    deeper layer, and nodes are pulled towards the nodes they feed. The nodes
+    of each layer are then ordered by the average position of their
+    neighbours in the adjacent layers (barycentric ordering) to reduce the
+    connection crossings.
+
+    Layering is linear in the number of nodes and connections, and each
+    ordering sweep sorts every layer once. The result only depends on the
+    order of the given nodes.
+
+    """
+
+    def __init__(self, nodes, connections, sweeps=2):
+        """Initializes the layout.
+
+        Args:
+            nodes (list): The node names, their order is used to break ties.
+            connections (dict): The names of the nodes connected to the
+                outputs of each node, as returned by
+                GraphManager.getAllNodeConnections.
+            sweeps (int): The number of up and down ordering sweeps.
+
+        """
+
+        super(GraphLayout, self).__init__()
+
+        self.__nodes = []
+        self.__indices = {}
+        for node in nodes:
+            if node not in self.__indices:
+                self.__indices[node] = len(self.__nodes)
+                self.__nodes.append(node)
+
+        # Adjacency by node index, without duplicated or unknown nodes.
+        self.__successors = [[] for x in self.__nodes]
+        self.__predecessors = [[] for x in self.__nodes]
+        for node in self.__nodes:
+            index = self.__indices[node]
+            seen = set()
+            for otherNode in connections.get(node, []):
+                otherIndex = self.__indices.get(otherNode, None)
+                if otherIndex is None or otherIndex == index or otherIndex in seen:
+                    continue
+
+                seen.add(otherIndex)
+                self.__successors[index].append(otherIndex)
+                self.__predecessors[otherIndex].append(index)
+
+        self.__depths = self.__computeDepths()
+        self.__rows = self.__computeRows(sweeps)
+
+
+    # ===============
+    # Layout Methods
+    # ===============
+    def __topologicalOrder(self):
+        """Returns the node indices with every node after its predecessors.
+
+        Nodes in cycles are appended in their original order once no other
+        node can be reached.
+
+        """
+
+        numNodes = len(self.__nodes)
+        inDegrees = [len(x) for x in self.__predecessors]
+        queue = deque([i for i in xrange(numNodes) if inDegrees[i] == 0])
+        ordered = [False] * numNodes
+        order = []
+
+        nextIndex = 0
+        while len(order) < numNodes:
+            if not queue:
+                # Break a cycle at the first node that isn't ordered yet.
+                while ordered[nextIndex]:
+                    nextIndex += 1
+
+                inDegrees[nextIndex] = 0
+                queue.append(nextIndex)
+
+            index = queue.popleft()
+            if ordered[index]:
+                continue
+
+            ordered[index] = True
+            order.append(index)
+
+            for successor in self.__successors[index]:
+                inDegrees[successor] -= 1
+                if inDegrees[successor] == 0:
+                    queue.append(successor)
+
+        return order
+
+    def __computeDepths(self):
+        """Assigns a layer to each node."""
+
+        order = self.__topologicalOrder()
+        position = [0] * len(order)
+        for i, index in enumerate(order):
+            position[index] = i
+
+        # Longest path from the sources. Connections closing a cycle are
+        # ignored.
+        depths = [0] * len(order)
+        for index in order:
+            for successor in self.__successors[index]:
+                if position[successor] > position[index] and depths[successor] <= depths[index]:
+                    depths[successor] = depths[index] + 1
+
+        # Pull the nodes next to the closest node they feed.
+        for index in reversed(order):
+            minDepth = None
+            for successor in self.__successors[index]:
+                if position[successor] < position[index]:
+                    continue
+
+                if minDepth is None or depths[successor] < minDepth:
+                    minDepth = depths[successor]
+
+            if minDepth is not None and minDepth - 1 > depths[index]:
+                depths[index] = minDepth - 1
+
+        return depths
+
+    def __orderRow(self, row, neighbours, rowPositions):
+        """Sorts a row by the average position of the neighbours of its nodes.
+
+        Nodes without placed neighbours keep their current position.
+
+        """
+
+        keys = {}
+        for i, index in enumerate(row):
+            total = 0.0
+            count = 0
+            for neighbour in neighbours[index]:
+                neighbourPosition = rowPositions[neighbour]
+                if neighbourPosition is not None:
+                    total += neighbourPosition
+                    count += 1
+
+            if count > 0:
+                keys[index] = (total / count, i)
+            else:
+                keys[index] = (float(i), i)
+
+        row.sort(key=keys.__getitem__)
+        for i, index in enumerate(row):
+            rowPositions[index] = i
+
+    def __computeRows(self, sweeps):
+        """Groups the nodes by layer and orders each layer."""
+
+        rows = []
+        for index in xrange(len(self.__nodes)):
+            depth = self.__depths[index]
+            while len(rows) <= depth:
+                rows.append([])
+
+            rows[depth].append(index)
+
+        for sweep in xrange(sweeps):
+            # Upwards, following the nodes each node feeds.
+            rowPositions = [None] * len(self.__nodes)
+            for i in xrange(len(rows) - 1, -1, -1):
+                self.__orderRow(rows[i], self.__successors, rowPositions)
+
+            # Downwards, following the nodes feeding each node.
+            rowPositions = [None] * len(self.__nodes)
+            for i in xrange(len(rows)):
+                self.__orderRow(rows[i], self.__predecessors, rowPositions)
+
+        return rows
+
+    def getDepth(self, node):
+        """Returns the layer of a node.
+
+        Args:
+            node (str): The name of the node.
+
+        Returns:
+            int: The layer index, 0 for the layer of the source nodes.
+
+        """
+
+        return self.__depths[self.__indices[node]]
+
+    def getRows(self):
+        """Returns the nodes of each layer in their layout order.
+
+        Returns:
+            list: A list of node name lists, one per layer.
+
+        """
+
+        return [[self.__nodes[x] for x in row] for row in self.__rows]
+
+    def getPositions(self, spacingX=300.0, spacingY=120.0):
+        """Returns the graph position of each node.
+
+        Args:
+            spacingX (float): The distance between two layers.
+            spacingY (float): The distance between two nodes of a layer.
+
+        Returns:
+            dict: The (x, y) position of each node name.
+
+        """
+
+        positions = {}
+        for depth, row in enumerate(self.__rows):
+            for i, index in enumerate(row):
+                positions[self.__nodes[index]] = (float(depth) * spacingX, float(i) * spacingY)
+
+        return positions
+
+
+# =============
+# Canvas Files
+# =============
+class _CanvasString(unicode):
+    """String value of a .canvas file, remembering its text in the file."""
+
+    __slots__ = ('text', )
+
+
+class _CanvasFloat(float):
+    """Number value of a .canvas file, remembering its text in the file."""
+
+    __slots__ = ('text', )
+
+
+def _parseCanvasString(s, end, encoding, strict):
+    value, stringEnd = json.decoder.scanstring(s, end, encoding, strict)
+    value = _CanvasString(value)
+    value.text = s[end - 1:stringEnd]
+
+    return value, stringEnd
+
+
+def _parseCanvasFloat(text):
+    value = _CanvasFloat(text)
+    value.text = text
+
+    return value
+
+
+def _loadCanvas(content):
+    """Decodes the content of a .canvas file.
+
+    The values keep their order and their text, Canvas writes numbers with
+    more digits than Python and strings with raw new lines, so the values
+    left untouched are written back as they were read.
+
+    Args:
+        content (str): The content of the .canvas file.
+
+    Returns:
+        tuple: The text before the graph, the graph data and the text after
+            the graph.
+
+    """
+
+    decoder = json.JSONDecoder(strict=False, object_pairs_hook=OrderedDict,
+                               parse_float=_parseCanvasFloat)
+    decoder.parse_string = _parseCanvasString
+    decoder.scan_once = json.scanner.py_make_scanner(decoder)
+
+    # Files written by kl2dfg start with a comment line.
+    start = content.index('{')
+    data, end = decoder.raw_decode(content, start)
+
+    return content[:start], data, content[end:]
+
+
+def _dumpCanvas(value, level=0):
+    """Encodes a value as Canvas does.
+
+    The members of objects and arrays are written one per line, the closing
+    brackets are indented as the members.
+
+    """
+
+    indent = '  ' * (level + 1)
+
+    if isinstance(value, dict):
+        if len(value) == 0:
+            return '{}'
+
+        members = [indent + json.dumps(k) + ' : ' + _dumpCanvas(v, level + 1) for k, v in value.iteritems()]
+        return '{\n' + ',\n'.join(members) + '\n' + indent + '}'
+
+    if isinstance(value, list):
+        if len(value) == 0:
+            return '[]'
+
+        members = [indent + _dumpCanvas(v, level + 1) for v in value]
+        return '[\n' + ',\n'.join(members) + '\n' + indent + ']'
+
+    if isinstance(value, (_CanvasString, _CanvasFloat)):
+        return value.text
+
+    return json.dumps(value)
+
+
+def layoutCanvasFile(filePath, outputPath, spacingX=300.0, spacingY=120.0):
+    """Lays out the nodes of the graph saved in a .canvas file.
+
+    The positions are stored in the 'uiGraphPos' metadata of the nodes, as the
+    Canvas builder does. The rest of the file is written back unchanged, so
+    the output path can be the input file.
+
+    Args:
+        filePath (str): The .canvas file to read.
+        outputPath (str): The file to write.
+        spacingX (float): The distance between two layers.
+        spacingY (float): The distance between two nodes of a layer.
+
+    Returns:
+        GraphLayout: The computed layout.
+
+    """
+
+    with open(filePath, 'r') as canvasFile:
+        content = canvasFile.read()
+
+    prefix, data, suffix = _loadCanvas(content)
+
+    nodes = [x['name'] for x in data.get('nodes', [])]
+
+    # Connections are keyed by 'node.port', or by the name of a graph argument.
+    connections = {}
+    for source, targets in data.get('connections', {}).iteritems():
+        if '.' not in source:
+            continue
+
+        sourceNode = source.split('.', 1)[0]
+        for target in targets:
+            if '.' in target:
+                connections.setdefault(sourceNode, []).append(target.split('.', 1)[0])
+
+    layout = GraphLayout(nodes, connections)
+    positions = layout.getPositions(spacingX=spacingX, spacingY=spacingY)
+
+    for nodeData in data.get('nodes', []):
+        x, y = positions[nodeData['name']]
+        nodeData.setdefault('metadata', OrderedDict())['uiGraphPos'] = json.dumps({"x": x, "y": y})
+
+    with open(outputPath, 'w') as canvasFile:
+        canvasFile.write(prefix + _dumpCanvas(data) + suffix)
+
+    return layout
@@ -6,13 +6,20 @@ GraphManager -- Node management.
 """
 
 import json
+from collections import OrderedDict
 
 from kraken.core.kraken_system import ks
 # import FabricEngine.Core as core
 
 
 class GraphManager(object):
-    """Manager object for taking care of all low level Canvas tasks"""
+    """Manager object for taking care of all low level Canvas tasks
+
+    The connections made through the manager are indexed by source port, by
+    target port and by node in both directions, so the connection queries only
+    visit the connections of the nodes involved.
+
+    """
 
     __dfgHost = None
     __dfgBinding = None
@@ -21,6 +28,10 @@ class GraphManager(object):
     __dfgNodes = None
     __dfgNodeAndPortMap = None
     __dfgConnections = None
+    __dfgInputs = None
+    __dfgNodeTargets = None
+    __dfgNodeSources = None
+    __dfgPortIndices = None
     __dfgGroups = None
     __dfgGroupNames = None
     __dfgCurrentGroup = None
@@ -37,7 +48,15 @@ class GraphManager(object):
         self.__dfgArgs = {}
         self.__dfgNodes = {}
         self.__dfgNodeAndPortMap = {}
+        # source node -> source port -> [(target node, target port)]
         self.__dfgConnections = {}
+        # target node -> target port -> (source node, source port)
+        self.__dfgInputs = {}
+        # source node -> target node -> [target port], and the reverse
+        self.__dfgNodeTargets = {}
+        self.__dfgNodeSources = {}
+        # node -> port -> index, filled on demand
+        self.__dfgPortIndices = {}
         self.__dfgGroups = {}
         self.__dfgGroupNames = []
         self.__dfgCurrentGroup = None
@@ -220,19 +239,17 @@ class GraphManager(object):
                     break
 
         # clean up connections
-        if node in self.__dfgConnections:
-            del self.__dfgConnections[node]
-        for nodeName in self.__dfgConnections:
-            ports = self.__dfgConnections[nodeName]
-            for portName in ports:
-                connections = ports[portName]
-                newConnections = []
-                for c in connections:
-                    if c[0] == node:
-                        continue
-
-                    newConnections += [c]
-                self.__dfgConnections[nodeName][portName] = newConnections
+        for portName, targets in self.__dfgConnections.get(node, {}).items():
+            for (targetNode, targetPort) in list(targets):
+                self.__unregisterConnection(node, portName, targetNode, targetPort)
+
+        for portName, (sourceNode, sourcePort) in self.__dfgInputs.get(node, {}).items():
+            self.__unregisterConnection(sourceNode, sourcePort, node, portName)
+
+        for table in (self.__dfgConnections, self.__dfgInputs, self.__dfgNodeTargets,
+                      self.__dfgNodeSources, self.__dfgPortIndices):
+            if node in table:
+                del table[node]
 
         return True
 
@@ -265,15 +282,34 @@ class GraphManager(object):
                 raise Exception('Cannot connect - incompatible type specs %s and %s.' % (typeA, typeB))
 
         self.__dfgExec.connectTo(nodeA+'.'+portA, nodeB+'.'+portB)
-
-        if not self.__dfgConnections.has_key(nodeA):
-          self.__dfgConnections[nodeA] = {}
-        if not self.__dfgConnections[nodeA].has_key(portA):
-          self.__dfgConnections[nodeA][portA] = []
-        self.__dfgConnections[nodeA][portA].append((nodeB, portB))
+        self.__registerConnection(nodeA, portA, nodeB, portB)
 
         return True
 
+    def __registerConnection(self, nodeA, portA, nodeB, portB):
+        self.__dfgConnections.setdefault(nodeA, {}).setdefault(portA, []).append((nodeB, portB))
+        self.__dfgInputs.setdefault(nodeB, {})[portB] = (nodeA, portA)
+
+        targets = self.__dfgNodeTargets.setdefault(nodeA, OrderedDict())
+        targets.setdefault(nodeB, []).append(portB)
+
+        sources = self.__dfgNodeSources.setdefault(nodeB, OrderedDict())
+        sources.setdefault(nodeA, []).append(portB)
+
+    def __unregisterConnection(self, nodeA, portA, nodeB, portB):
+        self.__dfgConnections[nodeA][portA].remove((nodeB, portB))
+        del self.__dfgInputs[nodeB][portB]
+
+        targets = self.__dfgNodeTargets[nodeA]
+        targets[nodeB].remove(portB)
+        if len(targets[nodeB]) == 0:
+            del targets[nodeB]
+
+        sources = self.__dfgNodeSources[nodeB]
+        sources[nodeA].remove(portB)
+        if len(sources[nodeA]) == 0:
+            del sources[nodeA]
+
     def connectArg(self, argA, argB, argC):
         if self.__dfgArgs.has_key(argA):
             self.__dfgExec.connectTo(argA, argB+'.'+argC)
@@ -294,42 +330,25 @@ class GraphManager(object):
             self.connectNodes(newNode, newPort, c[0], c[1])
 
     def removeConnection(self, node, port):
-        result = False
-        for nodeName in self.__dfgConnections:
-            ports = self.__dfgConnections[nodeName]
-            for portName in ports:
-                connections = ports[portName]
-                newConnections = []
-                for i in range(len(connections)):
-                    if '.'.join(connections[i]) == node+'.'+port:
-                        self.__dfgExec.disconnectFrom(nodeName+'.'+portName, node+'.'+port)
-                        result = True
-                        break
-                    else:
-                        newConnections += [connections[i]]
-                self.__dfgConnections[nodeName][portName] = newConnections
-                if result:
-                    return result
+        source = self.__dfgInputs.get(node, {}).get(port, None)
+        if source is None:
+            return False
 
-        return result
+        (sourceNode, sourcePort) = source
+        self.__dfgExec.disconnectFrom(sourceNode+'.'+sourcePort, node+'.'+port)
+        self.__unregisterConnection(sourceNode, sourcePort, node, port)
+
+        return True
 
     def getConnections(self, node, port, targets=True):
-        result = []
-        for nodeName in self.__dfgConnections:
-            ports = self.__dfgConnections[nodeName]
-            for portName in ports:
-                connections = ports[portName]
-                if targets:
-                    if node+'.'+port == nodeName+'.'+portName:
-                        result += connections
-                    else:
-                        continue
-                else:
-                    for c in connections:
-                        if '.'.join(c) == node+'.'+port:
-                            result += [(nodeName, portName)]
+        if targets:
+            return list(self.__dfgConnections.get(node, {}).get(port, []))
 
-        return result
+        source = self.__dfgInputs.get(node, {}).get(port, None)
+        if source is None:
+            return []
+
+        return [source]
 
     def getNodeMetaData(self, path, key, defaultValue=None, title=None):
         lookup = path
@@ -440,35 +459,16 @@ class GraphManager(object):
         return self.__dfgNodes.values()
 
     def getNodeConnections(self, nodeName):
-        keys = {}
-        result = []
-        node = self.__dfgConnections.get(nodeName, {})
-        for portName in node:
-            port = node[portName]
-            for (otherNode, otherPort) in port:
-                key = '%s - %s' % (nodeName, otherNode)
-                if keys.has_key(key):
-                    continue
-                keys[key] = True
-                result += [otherNode]
+        return self.__dfgNodeTargets.get(nodeName, {}).keys()
 
-        return result
+    def getNodeInputConnections(self, nodeName):
+        return self.__dfgNodeSources.get(nodeName, {}).keys()
 
     def getAllNodeConnections(self):
-        keys = {}
         result = {}
-        for nodeName in self.__dfgConnections:
-            node = self.__dfgConnections[nodeName]
-            for portName in node:
-                port = node[portName]
-                for (otherNode, otherPort) in port:
-                    key = '%s - %s' % (nodeName, otherNode)
-                    if keys.has_key(key):
-                        continue
-                    keys[key] = True
-                    if not result.has_key(nodeName):
-                        result[nodeName] = []
-                    result[nodeName] += [otherNode]
+        for nodeName, targets in self.__dfgNodeTargets.iteritems():
+            if len(targets) > 0:
+                result[nodeName] = targets.keys()
 
         return result
 
@@ -483,67 +483,48 @@ class GraphManager(object):
         return 0
 
     def hasInputConnections(self, node):
-        for nodeName in self.__dfgConnections:
-            ports = self.__dfgConnections[nodeName]
-            for portName in ports:
-                connections = ports[portName]
-                for c in connections:
-                    if c[0] == node:
-                        return True
-
-        return False
+        return len(self.__dfgNodeSources.get(node, {})) > 0
 
     def hasOutputConnections(self, node):
-        ports = self.__dfgConnections.get(node, {})
-        for port in ports:
-            if len(ports) > 0:
-                return True
+        return len(self.__dfgNodeTargets.get(node, {})) > 0
 
-        return False
+    def __getNodePortIndices(self, node, refresh=False):
+        if not refresh and node in self.__dfgPortIndices:
+            return self.__dfgPortIndices[node]
 
-    def getPortIndex(self, node, port):
+        indices = {}
         nodeType = self.__dfgExec.getNodeType(node)
         if nodeType == 3: # var
-            return 0
+            indices['value'] = 0
         elif nodeType == 0: # inst
             subExec = self.getSubExec(node)
             for i in range(subExec.getExecPortCount()):
-                portName = subExec.getExecPortName(i)
-                if portName == port:
-                    return i
+                indices[subExec.getExecPortName(i)] = i
 
-        return 0
+        self.__dfgPortIndices[node] = indices
+
+        return indices
+
+    def getPortIndex(self, node, port):
+        indices = self.__getNodePortIndices(node)
+        if port not in indices:
+            # ports may have been added since the indices were cached
+            indices = self.__getNodePortIndices(node, refresh=True)
+
+        return indices.get(port, 0)
 
     def getMinConnectionPortIndex(self, sourceNode, targetNode):
-        minIndex = 10000
-        node = self.__dfgConnections.get(sourceNode, {})
-        for portName in node:
-            port = node[portName]
-            for (otherNode, otherPort) in port:
-                if not otherNode == targetNode:
-                    continue
-                index = self.getPortIndex(otherNode, otherPort)
-                if index < minIndex:
-                    minIndex = index
-
-        if minIndex == 10000:
+        ports = self.__dfgNodeTargets.get(sourceNode, {}).get(targetNode, [])
+        if len(ports) == 0:
             return 0
 
-        return minIndex
+        return min([self.getPortIndex(targetNode, x) for x in ports])
 
     def getAllNodePortIndices(self):
         result = {}
         nodes = self.getAllNodeNames()
         for n in nodes:
-            result[n] = {}
-            nodeType = self.__dfgExec.getNodeType(n)
-            if nodeType == 3: # var
-                result[n]['value'] = 0
-            elif nodeType == 0: # inst
-                subExec = self.getSubExec(n)
-                for i in range(subExec.getExecPortCount()):
-                    port = subExec.getExecPortName(i)
-                    result[n][port] = i
+            result[n] = dict(self.__getNodePortIndices(n))
 
         return result
 
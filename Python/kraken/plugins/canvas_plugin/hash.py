@@ -1,33 +1,58 @@
 """Kraken Canvas - Hash module."""
 
-import copy
 
+# Tags mixed into the hashes of the containers so that a dict, a set and a
+# sequence holding the same items hash differently.
+_SEQUENCE_TAG = 'sequence'
+_SET_TAG = 'set'
+_DICT_TAG = 'dict'
 
-def makeHash(o):
+
+def makeHash(o, memo=None):
     """Makes a hash from a dictionary, list, tuple or set to any level, that
     contains only other hashable types (including any lists, tuples, sets, and
     dictionaries).
 
+    The input is walked once and never copied. Lists and tuples are hashed in
+    order and hash the same when they hold the same items. Sets are hashed
+    regardless of the order of their items, and so are dictionaries, whose
+    keys are hashed as is and values hashed recursively. Other objects are
+    hashed with hash().
+
     Args:
         o (object): Object to hash.
+        memo (dict): Optional cache of the container hashes, keyed by object
+            id. Only pass it when the hashed containers are not modified while
+            the memo is in use.
 
     Returns:
         hash: Hash of the object.
 
     """
 
-    if isinstance(o, (set, tuple, list)):
-        new_o = copy.deepcopy(o)
-        for i in range(len(new_o)):
-            new_o[i] = makeHash(new_o[i])
+    if isinstance(o, (list, tuple)):
+        tag = _SEQUENCE_TAG
+    elif isinstance(o, (set, frozenset)):
+        tag = _SET_TAG
+    elif isinstance(o, dict):
+        tag = _DICT_TAG
+    else:
+        return hash(o)
 
-        return hash(tuple(frozenset(sorted(new_o))))
+    if memo is not None:
+        entry = memo.get(id(o), None)
+        if entry is not None:
+            return entry[0]
 
-    elif not isinstance(o, dict):
-        return hash(o)
+    if tag is _SEQUENCE_TAG:
+        result = hash((tag, tuple([makeHash(x, memo) for x in o])))
+    elif tag is _SET_TAG:
+        result = hash((tag, frozenset([makeHash(x, memo) for x in o])))
+    else:
+        result = hash((tag, frozenset([(k, makeHash(v, memo)) for k, v in o.iteritems()])))
 
-    new_o = copy.deepcopy(o)
-    for k, v in new_o.items():
-        new_o[k] = makeHash(v)
+    if memo is not None:
+        # Keep the object alive so its id isn't reused by another object.
+        memo[id(o)] = (result, o)
 
-    return hash(tuple(frozenset(sorted(new_o.items()))))
+    return result
@@ -4,5 +4,5 @@ import logging
 class DCCHandler(logging.StreamHandler):
     """Logging Handler for Canvas."""
 
-    def __init__(self, *args, **kwargs):
-        super(DCCHandler, self).__init__(args, kwargs)
+    def __init__(self, stream=None):
+        super(DCCHandler, self).__init__(stream)
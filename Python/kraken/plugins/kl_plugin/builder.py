@@ -38,6 +38,8 @@ from kraken.core.maths.xfo import Xfo
 from kraken.core.maths.mat44 import Mat44
 
 from kraken.plugins.canvas_plugin.graph_manager import GraphManager
+from kraken.plugins.kl_plugin.code_emitter import CodeEmitter, CodeSpool
+from kraken.plugins.kl_plugin.item_graph import ItemGraph
 
 from kraken.log import getLogger
 
@@ -58,6 +60,7 @@ class Builder(Builder):
     __objectIdToUid = None
     __uidToName = None
     __itemByUniqueId = None
+    __itemGraph = None
     __klMembers = None
     __klMaxUniqueId = None
     __klObjects = None
@@ -65,6 +68,11 @@ class Builder(Builder):
     __klConstraints = None
     __klSolvers = None
     __klCanvasOps = None
+    __klObjectsByMember = None
+    __klAttributesByMember = None
+    __klConstraintsByMember = None
+    __klSolversByMember = None
+    __klCanvasOpsByMember = None
     __klPreCode = None
     __klConstants = None
     __klExtExecuted = None
@@ -234,6 +242,14 @@ class Builder(Builder):
             return
         item['visited'] = True
 
+        self.__generateSolveCode(item, indent=indent)
+
+        # The solve code of the item is complete, it is kept in the spool
+        # until the solve methods are written.
+        item['solveCode'] = self.__solveCodeSpool.addBlock(item['solveCode'])
+
+    def __generateSolveCode(self, item, indent=""):
+
         member = item['member']
         name = self.getUniqueName(item['sceneItem'])
         sources = item['sceneItem'].getSources()
@@ -311,14 +327,14 @@ class Builder(Builder):
                 sourceMember = sourceSolver['member']
                 sourceName = self.getUniqueName(kOperator)
                 eventSolverName = sourceMember.replace('[', '').replace(']', '')
-                args = kOperator.getSolverArgs()
+                args = kOperator.getSolverArgDescs()
 
                 # output to the results!
                 for i in xrange(len(args)):
                     arg = args[i]
-                    argName = arg.name.getSimpleType()
-                    argDataType = arg.dataType.getSimpleType()
-                    argConnectionType = arg.connectionType.getSimpleType()
+                    argName = arg.name
+                    argDataType = arg.dataType
+                    argConnectionType = arg.connectionType
                     if argConnectionType == 'In':
                       continue
                     argMember = self.getUniqueArgMember(kOperator, argName, argDataType)
@@ -376,7 +392,7 @@ class Builder(Builder):
             sourceMember = sourceSolver['member']
             sourceName = self.getUniqueName(kOperator)
             eventSolverName = sourceMember.replace('[', '').replace(']', '')
-            args = kOperator.getSolverArgs()
+            args = kOperator.getSolverArgDescs()
 
             if self.__debugMode:
                 logger.debug(indent+"sourceSolver: %s for item %s" % (sourceSolver['member'], item['member']))
@@ -431,9 +447,9 @@ class Builder(Builder):
             # first let's find all args which are arrays and prepare storage
             for i in xrange(len(args)):
                 arg = args[i]
-                argName = arg.name.getSimpleType()
-                argDataType = arg.dataType.getSimpleType()
-                argConnectionType = arg.connectionType.getSimpleType()
+                argName = arg.name
+                argDataType = arg.dataType
+                argConnectionType = arg.connectionType
                 connectedObjects = None
                 argMember = self.getUniqueArgMember(kOperator, argName, argDataType)
                 isArray = argDataType.endswith('[]')
@@ -522,9 +538,9 @@ class Builder(Builder):
             if self.__debugMode:
                 for i in xrange(len(args)):
                     arg = args[i]
-                    argName = arg.name.getSimpleType()
-                    argDataType = arg.dataType.getSimpleType()
-                    argConnectionType = arg.connectionType.getSimpleType()
+                    argName = arg.name
+                    argDataType = arg.dataType
+                    argConnectionType = arg.connectionType
                     if argConnectionType != 'In':
                         continue
                     item['solveCode'] += ["report(\"arg %s \" + this.%s);" % (argName, argMember)]
@@ -535,8 +551,8 @@ class Builder(Builder):
             item['solveCode'] += ["this.%s.solve(" % sourceMember]
             for i in xrange(len(args)):
                 arg = args[i]
-                argName = arg.name.getSimpleType()
-                argDataType = arg.dataType.getSimpleType()
+                argName = arg.name
+                argDataType = arg.dataType
                 argMember = self.getUniqueArgMember(kOperator, argName, argDataType)
                 comma = ""
                 if i < len(args) - 1:
@@ -567,13 +583,38 @@ class Builder(Builder):
 
 
     def generateKLCode(self):
+        kl = CodeEmitter()
+        self.writeKLCode(kl)
+        return kl.getValue()
+
+    def writeKLCode(self, kl):
+        """Writes the KL code of the rig extension.
+
+        The solve code of each item is written to a temporary spool as soon
+        as it is generated and read back when its solve method is written.
+
+        Args:
+            kl (CodeEmitter): The emitter the code is written to.
+
+        """
+
+        self.__solveCodeSpool = CodeSpool()
+        try:
+            self.__writeKLCode(kl)
+        finally:
+            self.__solveCodeSpool.close()
+            self.__solveCodeSpool = None
+
+    def __writeKLCode(self, kl):
 
         # ensure to generate a unique id for everything
         allItems = self.__klObjects + self.__klConstraints + self.__klSolvers + self.__klCanvasOps + self.__klAttributes
         self.__itemByUniqueId = {}
+        self.__itemGraph = ItemGraph()
         for item in allItems:
-            self.__itemByUniqueId[self.getUniqueId(item['sceneItem'])] = item
-            item['targetIds'] = []
+            uniqueId = self.getUniqueId(item['sceneItem'])
+            self.__itemByUniqueId[uniqueId] = item
+            self.__itemGraph.addItem(uniqueId, self.getUniqueName(item['sceneItem']))
             item['sourceIds'] = []
 
         for item in allItems:
@@ -593,13 +634,35 @@ class Builder(Builder):
                     continue
                 if self.__debugMode:
                     print '%s (%d) is driven by %s (%d)' % (self.getUniqueName(item['sceneItem']), id, self.getUniqueName(self.__itemByUniqueId[sourceId]['sceneItem']), sourceId)
-                self.__itemByUniqueId[sourceId]['targetIds'] += [id]
+                self.__itemGraph.connect(sourceId, id)
 
         controls = []
         for obj in self.__klObjects:
             if obj['sceneItem'].isTypeOf('Control'):
                 controls.append(obj)
 
+        # only controls or attributes are dirtied - we don't need to dirty anything else
+        dirtySourceIds = []
+        for item in allItems:
+            if isinstance(item['sceneItem'], (Control, Attribute)):
+                dirtySourceIds.append(self.getUniqueId(item['sceneItem']))
+
+        # drop the solve code of the items feeding no deformer, control or
+        # shape, and solve the items never dirtied once in resetPose.
+        staticIds = []
+        if self.__optimizeItems:
+            outputItems = self.__krkDeformers + controls + self.__krkShapes
+            deadIds = self.__itemGraph.eliminateDeadItems([self.getUniqueId(x['sceneItem']) for x in outputItems])
+            for deadId in deadIds:
+                self.__itemByUniqueId[deadId]['solveCode'] = []
+
+            dirtySourceIds = [x for x in dirtySourceIds if self.__itemGraph.hasItem(x)]
+            for staticId in self.__itemGraph.getStaticIds(dirtySourceIds):
+                if len(self.__itemByUniqueId[staticId]['solveCode']) > 0:
+                    staticIds.append(staticId)
+
+            self.report("Eliminated %d dead items of %d, solving %d static items in resetPose." % (len(deadIds), len(allItems), len(staticIds)))
+
         scalarAttributes = []
         for attr in self.__klAttributes:
             source = attr['sceneItem'].getCurrentSource()
@@ -607,14 +670,23 @@ class Builder(Builder):
                 scalarAttributes.append(attr)
 
         for solver in self.__klSolvers:
-            args = solver['sceneItem'].getSolverArgs()
+            args = solver['sceneItem'].getSolverArgDescs()
             for i in xrange(len(args)):
                 arg = args[i]
-                argName = arg.name.getSimpleType()
-                argDataType = arg.dataType.getSimpleType()
+                argName = arg.name
+                argDataType = arg.dataType
                 argMember = self.getUniqueArgMember(solver['sceneItem'], argName, argDataType)
 
-        kl = []
+        # solve the items the deformers depend on level by level, the items
+        # of a level are independent and solved in parallel.
+        solveLevelsCode = None
+        if self.__solveThreads > 0:
+            solvableIds = set([self.getUniqueId(x['sceneItem']) for x in allItems if len(x['solveCode']) > 0])
+            solvableIds.difference_update(staticIds)
+            deformerIds = [self.getUniqueId(x['sceneItem']) for x in self.__krkDeformers]
+            solveLevels = self.__itemGraph.getSolveLevels(deformerIds, solvableIds)
+            solveLevelsCode = self.__itemGraph.generateSolveLevelsCode(self.getKLExtensionName(), solveLevels)
+
         kl += ["require Math;"]
         kl += ["require Geometry;"]
         kl += ["require Kraken;"]
@@ -633,6 +705,12 @@ class Builder(Builder):
         kl += ["object %s : KrakenKLRig {" % self.getKLExtensionName()]
         kl += ["  UInt64 evalVersion;"]
         kl += ["  Boolean isItemDirty[%d];" % self.__klMaxUniqueId]
+        if self.__dirtyPropagation:
+            kl += ["  UInt32 dirtySolveIds[]; // the dirty outputs to solve"]
+        if solveLevelsCode:
+            kl += ["  UInt32 numSolveThreads;"]
+            kl += ["  UInt32 solveOrder[]; // the items to solve, level by level"]
+            kl += ["  Size solveLevelOffsets[];"]
         if self.__profilingFrames > 0:
             kl += ["  SInt32 profilingFrame;"]
         kl += ["  KrakenClip clip; // the default clip of the rig"]
@@ -655,6 +733,13 @@ class Builder(Builder):
         kl += ["  this.init();"]
         kl += ["}", ""]
 
+        if solveLevelsCode:
+            kl += solveLevelsCode['operator']
+
+            kl += ["inline function %s.setSolveThreads!(UInt32 numThreads) {" % self.getKLExtensionName()]
+            kl += ["  this.numSolveThreads = numThreads;"]
+            kl += ["}", ""]
+
         kl += [""]
         kl += ["inline function UInt64 %s.getEvalVersion() {" % self.getKLExtensionName()]
         kl += ["  return this.evalVersion;"]
@@ -667,6 +752,12 @@ class Builder(Builder):
         kl += ["  // reset attributes"]
         for attr in scalarAttributes:
             kl += ["  this.%s.value = %.4g;" % (attr['member'], attr['value'])]
+        if len(staticIds) > 0:
+            kl += ["  // solve static items"]
+            for staticId in staticIds:
+                kl += ["  this.isItemDirty[%d] = true;" % staticId]
+            for staticId in staticIds:
+                kl += ["  this.%s();" % self.getSolveMethodName(self.__itemByUniqueId[staticId]['sceneItem'])]
         kl += ["}", ""]
 
         kl += ["inline function %s.solve!(KrakenClipContext context) {" % self.getKLExtensionName()]
@@ -678,8 +769,19 @@ class Builder(Builder):
         if self.__profilingFrames > 0:
             kl += ["  {  AutoProfilingEvent visitKLObjectsEvent(\"rig pose solve\");"]
 
-        for krkDef in self.__krkDeformers:
-            kl += ["    this.%s();" % (self.getSolveMethodName(krkDef['sceneItem']))]
+        if solveLevelsCode:
+            kl.pushIndent("    ")
+            kl += solveLevelsCode['solve']
+            kl.popIndent()
+            if self.__dirtyPropagation:
+                kl += ["    this.dirtySolveIds.resize(0);"]
+        elif self.__dirtyPropagation:
+            kl.pushIndent("    ")
+            kl += self.__itemGraph.generateSolveDirtyItemsCode()
+            kl.popIndent()
+        else:
+            for krkDef in self.__krkDeformers:
+                kl += ["    this.%s();" % (self.getSolveMethodName(krkDef['sceneItem']))]
 
         if self.__profilingFrames > 0:
             kl += ["  }"]
@@ -729,45 +831,23 @@ class Builder(Builder):
             kl += ["  this.processProfiling();"]
         kl += ["}", ""]
 
-        kl += ["inline function %s.dirtyItem!(Index uniqueId) {" % self.getKLExtensionName()]
-        kl += ["  if(this.isItemDirty[uniqueId])"]
-        kl += ["    return;"]
-        kl += ["  this.isItemDirty[uniqueId] = true;"]
-        kl += ["  switch(uniqueId) {"]
-        for item in allItems:
-            # only do this for controls or attributes - we don't need to dirty anything else
-            if not isinstance(item['sceneItem'], (Control, Attribute)):
-                continue
-            if len(item['targetIds']) == 0:
-                continue
-            kl += ["    case %d: { // %s" % (self.getUniqueId(item['sceneItem']), self.getUniqueName(item['sceneItem']))]
-            uidsToDirty = item['targetIds']
-            for uidToDirty in uidsToDirty:
-                targetItem = self.__itemByUniqueId[uidToDirty]
-                kl += ["      this.isItemDirty[%d] = true; // %s" % (uidToDirty, self.getUniqueName(targetItem['sceneItem']))]
-                targetIds = targetItem['targetIds']
-                for targetId in targetIds:
-                    if targetId in uidsToDirty:
-                        continue
-                    uidsToDirty += [targetId]
+        solveIds = None
+        if self.__dirtyPropagation:
+            solveIds = [self.getUniqueId(x['sceneItem']) for x in self.__krkDeformers]
 
-            kl += ["      break;"]
-            kl += ["    }"]
-        kl += ["  }"]
-        kl += ["}", ""]
+        kl += self.__itemGraph.generateDirtyItemCode(self.getKLExtensionName(), dirtySourceIds, solveIds=solveIds)
 
         kl += ["inline function %s.cleanItem!(Index uniqueId) {" % self.getKLExtensionName()]
         kl += ["  this.isItemDirty[uniqueId] = false;"]
         kl += ["}", ""]
 
-        kl += ["inline function %s.dirtyAllItems!() {" % self.getKLExtensionName()]
-        kl += ["  for(Size i=0;i<%d;i++)" % self.__klMaxUniqueId]
-        kl += ["    this.isItemDirty[i] = true;"]
-        kl += ["}", ""]
+        kl += self.__itemGraph.generateDirtyAllItemsCode(self.getKLExtensionName(), self.__klMaxUniqueId, staticIds=staticIds, solveIds=solveIds)
 
         kl += ["inline function %s.cleanAllItems!() {" % self.getKLExtensionName()]
         kl += ["  for(Size i=0;i<%d;i++)" % self.__klMaxUniqueId]
         kl += ["    this.isItemDirty[i] = false;"]
+        if self.__dirtyPropagation:
+            kl += ["  this.dirtySolveIds.resize(0);"]
         kl += ["}", ""]
 
         kl += ["inline function Mat44 %s.getControlLocalMat44(Index index) {" % self.getKLExtensionName()]
@@ -799,8 +879,9 @@ class Builder(Builder):
             kl += ["  this.isItemDirty[%d] = false;" % self.getUniqueId(sceneItem)]
             if self.__debugMode:
                 kl += ["  report(\"solving %s\ (%d)\");" % (self.getUniqueName(sceneItem), self.getUniqueId(sceneItem))]
-            for solveLine in item['solveCode']:
-                kl += ["  " + solveLine]
+            kl.pushIndent()
+            kl += item['solveCode']
+            kl.popIndent()
             kl += ["}", ""]
 
         kl += ["inline function %s.solveItem!(Index uniqueId) {" % self.getKLExtensionName()]
@@ -922,7 +1003,14 @@ class Builder(Builder):
                     Boolean(attr['animatable']),
                     attr['value']
                 )]
-            kl += ["  this.%s.uniqueId = %d;" % (memberName, self.getUniqueId(attr['sceneItem']))]
+            kl += ["  this.%s.uniqueId = %d;" % (attr['member'], self.getUniqueId(attr['sceneItem']))]
+
+        if solveLevelsCode:
+            kl += ["", "  // schedule the solve"]
+            kl += ["  this.numSolveThreads = %d;" % self.__solveThreads]
+            kl.pushIndent()
+            kl += solveLevelsCode['init']
+            kl.popIndent()
 
         kl += ["  this.resetPose();"]
         kl += ["  this.dirtyAllItems();"]
@@ -1134,10 +1222,12 @@ class Builder(Builder):
             kl += ["  StopFabricProfiling();"]
             kl += ["}"]
 
-        return "\n".join(kl)
-
     def getKLTestCode(self):
-        kl = []
+        kl = CodeEmitter()
+        self.writeKLTestCode(kl)
+        return kl.getValue()
+
+    def writeKLTestCode(self, kl):
         kl += ["require %s;" % self.getKLExtensionName()]
         kl += [""]
         kl += ["operator entry() {"]
@@ -1156,7 +1246,6 @@ class Builder(Builder):
             kl += ["  context.time = 1.0;"]
             kl += ["  rig.evaluate(context);"]
         kl += ["}"]
-        return "\n".join(kl)
 
     def generateKLExtension(self):
         if not self.__outputFolder:
@@ -1182,6 +1271,8 @@ class Builder(Builder):
         )
 
     def reloadKLExtension(self):
+        # The reloaded extension may redefine the solvers of the rig.
+        KLOperator.clearSolverArgsCache()
         return self.loadKLExtension( reloadExt = True)
 
     def __ensureFolderExists(self, filePath):
@@ -1190,9 +1281,12 @@ class Builder(Builder):
             os.makedirs(folder)
 
     def saveKLExtension(self):
-        ext = self.generateKLExtension()
+        if not self.__outputFolder:
+            raise Exception("KL Builder: OutputFolder not specified!")
+
+        klFileName = "%s.kl" % self.getKLExtensionName()
         fpmFilePath = os.path.join(self.__outputFolder, "%s.fpm.json" % self.getKLExtensionName())
-        klFilePath = os.path.join(self.__outputFolder, ext[0]['filename'])
+        klFilePath = os.path.join(self.__outputFolder, klFileName)
         testFilePath = os.path.join(self.__outputFolder, "test.kl")
         fpm = """{
   \"code\": [\"%s\"],
@@ -1201,16 +1295,30 @@ class Builder(Builder):
     \"presetPath\": \"Kraken.KLRigs.%s\"
   },
   \"autoNamespace\": true
-}""" % (ext[0]['filename'], self.getKLExtensionName())
+}""" % (klFileName, self.getKLExtensionName())
         self.__ensureFolderExists(fpmFilePath)
         self.__ensureFolderExists(klFilePath)
         self.__ensureFolderExists(testFilePath)
-        open(fpmFilePath, "w").write(fpm)
-        open(klFilePath, "w").write(ext[0]['sourceCode'])
-        open(testFilePath, "w").write(self.getKLTestCode())
+        self.__saveFile(fpmFilePath, fpm)
+
+        # the extension is streamed to the file as it is generated
+        with open(klFilePath, "w") as klFile:
+            kl = CodeEmitter(klFile)
+            self.writeKLCode(kl)
+            kl.flush()
+
+        with open(testFilePath, "w") as testFile:
+            kl = CodeEmitter(testFile)
+            self.writeKLTestCode(kl)
+            kl.flush()
+
         self.saveDFGPresets()
         return True
 
+    def __saveFile(self, filePath, content):
+        with open(filePath, "w") as contentFile:
+            contentFile.write(content)
+
     def saveDFGPresets(self):
         client = ks.getCoreClient()
         dfgHost = client.getDFGHost()
@@ -1237,8 +1345,7 @@ class Builder(Builder):
         funcResult = subExec.addExecPort('result', client.DFG.PortTypes.Out, rigType)
         subExec.setCode(requireCode + "dfgEntry {\n  %s = %s();\n}\n" % (funcResult, rigType))
         dfgExec.connectTo(func+'.'+funcResult, var+'.value')
-        content = dfgBinding.exportJSON()
-        open(filePath, "w").write(content)
+        self.__saveFile(filePath, dfgBinding.exportJSON())
 
         # SetClip preset
         filePath = os.path.join(presetFolder, 'SetClip.canvas')
@@ -1250,8 +1357,7 @@ class Builder(Builder):
         funcResult = dfgExec.addExecPort('rig', client.DFG.PortTypes.IO, rigType)
         clipInput = dfgExec.addExecPort('clip', client.DFG.PortTypes.In, "KrakenClip")
         dfgExec.setCode(requireCode + "dfgEntry {\n  %s.setClip(%s);\n}\n" % (funcResult, clipInput))
-        content = dfgBinding.exportJSON()
-        open(filePath, "w").write(content)
+        self.__saveFile(filePath, dfgBinding.exportJSON())
 
         # Solve preset
         filePath = os.path.join(presetFolder, 'Solve.canvas')
@@ -1262,8 +1368,7 @@ class Builder(Builder):
         dfgExec.addExtDep('KrakenAnimation')
         funcResult = dfgExec.addExecPort('rig', client.DFG.PortTypes.IO, rigType)
         dfgExec.setCode(requireCode + "dfgEntry {\n  %s.solve(KrakenClipContext());\n}\n" % (funcResult))
-        content = dfgBinding.exportJSON()
-        open(filePath, "w").write(content)
+        self.__saveFile(filePath, dfgBinding.exportJSON())
 
         # Evaluate preset
         filePath = os.path.join(presetFolder, 'Evaluate.canvas')
@@ -1275,8 +1380,7 @@ class Builder(Builder):
         funcResult = dfgExec.addExecPort('rig', client.DFG.PortTypes.IO, rigType)
         contextInput = dfgExec.addExecPort('context', client.DFG.PortTypes.In, "KrakenClipContext")
         dfgExec.setCode(requireCode + "dfgEntry {\n  %s.evaluate(%s);\n}\n" % (funcResult, contextInput))
-        content = dfgBinding.exportJSON()
-        open(filePath, "w").write(content)
+        self.__saveFile(filePath, dfgBinding.exportJSON())
 
         # ResetPose preset
         filePath = os.path.join(presetFolder, 'ResetPose.canvas')
@@ -1286,8 +1390,7 @@ class Builder(Builder):
         dfgExec.addExtDep(rigType)
         funcResult = dfgExec.addExecPort('rig', client.DFG.PortTypes.IO, rigType)
         dfgExec.setCode(requireCode + "dfgEntry {\n  %s.resetPose();\n}\n" % (funcResult))
-        content = dfgBinding.exportJSON()
-        open(filePath, "w").write(content)
+        self.__saveFile(filePath, dfgBinding.exportJSON())
 
         # GetJointXfos preset
         filePath = os.path.join(presetFolder, 'GetJointXfos.canvas')
@@ -1298,8 +1401,7 @@ class Builder(Builder):
         funcInput = dfgExec.addExecPort('rig', client.DFG.PortTypes.In, rigType)
         funcResult = dfgExec.addExecPort('result', client.DFG.PortTypes.Out, 'Xfo[]')
         dfgExec.setCode(requireCode + "dfgEntry {\n  %s = %s.getJointXfos();\n}\n" % (funcResult, funcInput))
-        content = dfgBinding.exportJSON()
-        open(filePath, "w").write(content)
+        self.__saveFile(filePath, dfgBinding.exportJSON())
 
         # GetAllXfos preset
         filePath = os.path.join(presetFolder, 'GetAllXfos.canvas')
@@ -1310,8 +1412,7 @@ class Builder(Builder):
         funcInput = dfgExec.addExecPort('rig', client.DFG.PortTypes.In, rigType)
         funcResult = dfgExec.addExecPort('result', client.DFG.PortTypes.Out, 'Xfo[]')
         dfgExec.setCode(requireCode + "dfgEntry {\n  %s = %s.getAllXfos();\n}\n" % (funcResult, funcInput))
-        content = dfgBinding.exportJSON()
-        open(filePath, "w").write(content)
+        self.__saveFile(filePath, dfgBinding.exportJSON())
 
         # GetJointNames preset
         filePath = os.path.join(presetFolder, 'GetJointNames.canvas')
@@ -1322,8 +1423,7 @@ class Builder(Builder):
         funcInput = dfgExec.addExecPort('rig', client.DFG.PortTypes.In, rigType)
         funcResult = dfgExec.addExecPort('result', client.DFG.PortTypes.Out, 'String[]')
         dfgExec.setCode(requireCode + "dfgEntry {\n  %s = %s.getJointNames();\n}\n" % (funcResult, funcInput))
-        content = dfgBinding.exportJSON()
-        open(filePath, "w").write(content)
+        self.__saveFile(filePath, dfgBinding.exportJSON())
 
         # GetAllNames preset
         filePath = os.path.join(presetFolder, 'GetAllNames.canvas')
@@ -1334,8 +1434,12 @@ class Builder(Builder):
         funcInput = dfgExec.addExecPort('rig', client.DFG.PortTypes.In, rigType)
         funcResult = dfgExec.addExecPort('result', client.DFG.PortTypes.Out, 'String[]')
         dfgExec.setCode(requireCode + "dfgEntry {\n  %s = %s.getAllNames();\n}\n" % (funcResult, funcInput))
-        content = dfgBinding.exportJSON()
-        open(filePath, "w").write(content)
+        self.__saveFile(filePath, dfgBinding.exportJSON())
+
+    def __indexKLItem(self, index, item):
+        # Several items can share a member, the first one built is found.
+        if item['member'] not in index:
+            index[item['member']] = item
 
     def findDictForSI(self, kSceneItem):
         if isinstance(kSceneItem, Attribute):
@@ -1348,38 +1452,23 @@ class Builder(Builder):
 
     def findKLObjectForSI(self, kSceneItem):
         member = self.getUniqueObjectMember(kSceneItem, None)
-        for obj in self.__klObjects:
-            if obj['member'] == member:
-                return obj
-        return None
+        return self.__klObjectsByMember.get(member, None)
 
     def findKLAttribute(self, kAttribute):
         member = self.getUniqueObjectMember(kAttribute, None)
-        for attr in self.__klAttributes:
-            if attr['member'] == member:
-                return attr
-        return None
+        return self.__klAttributesByMember.get(member, None)
 
     def findKLConstraint(self, kConstraint):
         member = self.getUniqueObjectMember(kConstraint, None)
-        for constraint in self.__klConstraints:
-            if constraint['member'] == member:
-                return constraint
-        return None
+        return self.__klConstraintsByMember.get(member, None)
 
     def findKLSolver(self, kOperator):
         member = self.getUniqueObjectMember(kOperator, None)
-        for solver in self.__klSolvers:
-            if solver['member'] == member:
-                return solver
-        return None
+        return self.__klSolversByMember.get(member, None)
 
     def findKLCanvasOp(self, kOperator):
         member = self.getUniqueObjectMember(kOperator, None)
-        for canvasOp in self.__klCanvasOps:
-            if canvasOp['member'] == member:
-                return canvasOp
-        return None
+        return self.__klCanvasOpsByMember.get(member, None)
 
     def buildKLSceneItem(self, kSceneItem, buildName):
 
@@ -1447,6 +1536,8 @@ class Builder(Builder):
                 obj['parent'] = parent.getDecoratedPath()
 
         self.__klObjects.append(obj)
+        self.__indexKLItem(self.__klObjectsByMember, obj)
+        self._registerSceneItemPair(kSceneItem, obj)
         return True
 
     def buildKLAttribute(self, kAttribute):
@@ -1483,6 +1574,8 @@ class Builder(Builder):
               attr['max'] = kAttribute.getMax()
 
         self.__klAttributes.append(attr)
+        self.__indexKLItem(self.__klAttributesByMember, attr)
+        self._registerSceneItemPair(kAttribute, attr)
 
         if kAttribute.isTypeOf("ScalarAttribute") and kAttribute.getMetaDataItem("blendShapeName") is not None:
             self.__krkShapes.append(attr)
@@ -1509,6 +1602,8 @@ class Builder(Builder):
         }
 
         self.__klConstraints.append(constraint)
+        self.__indexKLItem(self.__klConstraintsByMember, constraint)
+        self._registerSceneItemPair(kConstraint, constraint)
         return kConstraint
 
     # ========================
@@ -1811,6 +1906,8 @@ class Builder(Builder):
         }
 
         self.__klSolvers.append(solver)
+        self.__indexKLItem(self.__klSolversByMember, solver)
+        self._registerSceneItemPair(kOperator, solver)
 
         if kOperator.extension != "Kraken" and kOperator.extension not in self.__klExtensions:
             self.__klExtensions.append(kOperator.extension)
@@ -1853,6 +1950,8 @@ class Builder(Builder):
           "buildName": buildName
         }
         self.__klCanvasOps.append(canvasOp)
+        self.__indexKLItem(self.__klCanvasOpsByMember, canvasOp)
+        self._registerSceneItemPair(kOperator, canvasOp)
 
         return False
 
@@ -1981,10 +2080,15 @@ class Builder(Builder):
 
         """
 
+        self._clearSceneItemPairs()
+
         self.__rigTitle = self.getConfig().getMetaData('RigTitle', 'Rig')
         self.getConfig().setMetaData('ExtensionName', "KRK_" + self.__rigTitle.replace(' ', ''))
         self.__useRigConstants = self.getConfig().getMetaData('UseRigConstants', False)
         self.__profilingFrames = self.getConfig().getMetaData('ProfilingFrames', 0)
+        self.__dirtyPropagation = self.getConfig().getMetaData('DirtyPropagation', False)
+        self.__solveThreads = self.getConfig().getMetaData('SolveThreads', 0)
+        self.__optimizeItems = self.getConfig().getMetaData('OptimizeItems', False)
         self.__profilingLogFile = self.getConfig().getMetaData('ProfilingLogFile', None)
         self.__canvasGraph = GraphManager()
         self.__debugMode = False
@@ -1992,6 +2096,8 @@ class Builder(Builder):
         self.__objectIdToUid = {}
         self.__uidToName = {}
         self.__itemByUniqueId = None
+        self.__itemGraph = None
+        self.__solveCodeSpool = None
         self.__klExtensions = []
         self.__klMembers = {'members': {}, 'lookup': {}}
         self.__klMaxUniqueId = 0
@@ -2000,6 +2106,11 @@ class Builder(Builder):
         self.__klConstraints = []
         self.__klSolvers = []
         self.__klCanvasOps = []
+        self.__klObjectsByMember = {}
+        self.__klAttributesByMember = {}
+        self.__klConstraintsByMember = {}
+        self.__klSolversByMember = {}
+        self.__klCanvasOpsByMember = {}
         self.__klConstants = {}
         self.__klExtExecuted = False
         self.__klArgs = {'members': {}, 'lookup': {}}
@@ -0,0 +1,202 @@
+"""Kraken KL - Code Emitter module.
+
+Classes:
+CodeEmitter -- Writes generated KL code to a stream.
+CodeSpool -- Keeps blocks of generated KL code in a temporary file.
+CodeBlock -- Block of KL code lines stored in a CodeSpool.
+
+"""
+
+import os
+import tempfile
+from cStringIO import StringIO
+
+
+class CodeEmitter(object):
+    """Writes generated KL code to a stream line by line.
+
+    Lines are added with the += operator, the same way they are added to a
+    list of lines, and are written to the stream in chunks of about
+    bufferSize characters so the generated code is never held in memory as a
+    whole. Without a stream, the code is written to an in memory buffer
+    returned by getValue.
+
+    The lines are separated by new lines, the code ends without one.
+
+    """
+
+    def __init__(self, stream=None, bufferSize=65536):
+        super(CodeEmitter, self).__init__()
+
+        self.__ownsStream = stream is None
+        if self.__ownsStream:
+            stream = StringIO()
+
+        self.__stream = stream
+        self.__bufferSize = bufferSize
+        self.__chunk = []
+        self.__chunkSize = 0
+        self.__indents = []
+        self.__indent = ''
+        self.__numLines = 0
+
+    def __iadd__(self, lines):
+        if isinstance(lines, basestring):
+            self.writeLine(lines)
+        else:
+            for line in lines:
+                self.writeLine(line)
+
+        return self
+
+
+    # =============
+    # Write Methods
+    # =============
+    def writeLine(self, line):
+        """Writes a line of code at the current indentation.
+
+        Args:
+            line (str): The line of code.
+
+        """
+
+        if self.__numLines > 0:
+            line = '\n' + self.__indent + line
+        else:
+            line = self.__indent + line
+
+        self.__chunk.append(line)
+        self.__chunkSize += len(line)
+        self.__numLines += 1
+
+        if self.__chunkSize >= self.__bufferSize:
+            self.flush()
+
+    def pushIndent(self, indent='  '):
+        """Indents the lines written until the matching popIndent call.
+
+        Args:
+            indent (str): The characters added in front of the lines.
+
+        """
+
+        self.__indents.append(self.__indent)
+        self.__indent += indent
+
+    def popIndent(self):
+        self.__indent = self.__indents.pop()
+
+    def flush(self):
+        """Writes the pending lines to the stream."""
+
+        if self.__chunkSize == 0:
+            return
+
+        self.__stream.write(''.join(self.__chunk))
+        self.__chunk = []
+        self.__chunkSize = 0
+
+
+    # ================
+    # Accessor Methods
+    # ================
+    def getNumLines(self):
+        return self.__numLines
+
+    def getValue(self):
+        """Returns the code written to the in memory buffer.
+
+        Returns:
+            str: The code.
+
+        """
+
+        if not self.__ownsStream:
+            raise Exception("CodeEmitter: The code is written to a stream, not to a buffer!")
+
+        self.flush()
+
+        return self.__stream.getvalue()
+
+
+class CodeSpool(object):
+    """Keeps blocks of generated KL code in a temporary file until emitted.
+
+    A block is added once all of its lines are generated and its lines are
+    read back from the file when the block is iterated, so only the blocks
+    being generated or emitted are held in memory.
+
+    """
+
+    def __init__(self):
+        super(CodeSpool, self).__init__()
+        self.__file = tempfile.TemporaryFile()
+
+    def addBlock(self, lines):
+        """Writes a block of lines to the spool.
+
+        Args:
+            lines (list): The lines of code of the block.
+
+        Returns:
+            CodeBlock: The block, an empty list if there are no lines.
+
+        """
+
+        if len(lines) == 0:
+            return []
+
+        code = '\n'.join(lines)
+        if isinstance(code, unicode):
+            code = code.encode('utf-8')
+
+        self.__file.seek(0, os.SEEK_END)
+        offset = self.__file.tell()
+        self.__file.write(code)
+
+        return CodeBlock(self, offset, len(code), len(lines))
+
+    def read(self, offset, size):
+        """Reads code back from the spool.
+
+        Args:
+            offset (int): The position of the code in the spool.
+            size (int): The number of characters to read.
+
+        Returns:
+            str: The code.
+
+        """
+
+        self.__file.seek(offset)
+
+        return self.__file.read(size)
+
+    def close(self):
+        """Closes and deletes the temporary file of the spool."""
+
+        self.__file.close()
+
+
+class CodeBlock(object):
+    """Block of KL code lines stored in a CodeSpool.
+
+    The length of a block is its number of lines and iterating it yields its
+    lines, so it is checked and emitted the same way as a list of lines.
+
+    """
+
+    __slots__ = ('_spool', '_offset', '_size', '_numLines')
+
+    def __init__(self, spool, offset, size, numLines):
+        self._spool = spool
+        self._offset = offset
+        self._size = size
+        self._numLines = numLines
+
+    def __len__(self):
+        return self._numLines
+
+    def __iter__(self):
+        return iter(self._spool.read(self._offset, self._size).split('\n'))
@@ -0,0 +1,442 @@
+"""Kraken KL - Item Graph module.
+
+Classes:
+ItemGraph -- Dependency graph of the items of a KL rig.
+
+"""
+
+from collections import deque
+from collections import OrderedDict
+
+
+class ItemGraph(object):
+    """Dependency graph of the items of a KL rig.
+
+    Items are identified by the unique ids the KL builder gives them and are
+    connected from the items they are solved from (sources) to the items they
+    feed (targets). The graph finds the items which can be left out of the
+    rig or solved once, and generates the KL code marking items dirty and
+    solving them, level by level or as they are dirtied.
+
+    """
+
+    def __init__(self):
+        super(ItemGraph, self).__init__()
+
+        self.__names = OrderedDict()
+        self.__sourceIds = {}
+        self.__targetIds = {}
+
+
+    # ==============
+    # Graph Methods
+    # ==============
+    def addItem(self, uniqueId, name):
+        """Adds an item to the graph.
+
+        Args:
+            uniqueId (int): The unique id of the item.
+            name (str): The unique name of the item, used in comments.
+
+        """
+
+        if uniqueId in self.__names:
+            return
+
+        self.__names[uniqueId] = name
+        self.__sourceIds[uniqueId] = []
+        self.__targetIds[uniqueId] = []
+
+    def hasItem(self, uniqueId):
+        return uniqueId in self.__names
+
+    def getItemIds(self):
+        """Returns the unique ids of the items in the order they were added.
+
+        Returns:
+            list: The unique ids.
+
+        """
+
+        return self.__names.keys()
+
+    def getName(self, uniqueId):
+        return self.__names[uniqueId]
+
+    def connect(self, sourceId, targetId):
+        """Connects an item to an item solved from it.
+
+        Args:
+            sourceId (int): The unique id of the source item.
+            targetId (int): The unique id of the target item.
+
+        Returns:
+            bool: True if the connection was added, False if it already
+                existed.
+
+        """
+
+        targetIds = self.__targetIds[sourceId]
+        if targetId in targetIds:
+            return False
+
+        targetIds.append(targetId)
+        self.__sourceIds[targetId].append(sourceId)
+
+        return True
+
+    def getSourceIds(self, uniqueId):
+        return self.__sourceIds[uniqueId]
+
+    def getTargetIds(self, uniqueId):
+        return self.__targetIds[uniqueId]
+
+    def getDownstreamIds(self, uniqueId):
+        """Returns the items solved from an item, directly or not.
+
+        Args:
+            uniqueId (int): The unique id of the item.
+
+        Returns:
+            list: The unique ids of the downstream items, breadth first.
+
+        """
+
+        visited = set([uniqueId])
+        downstreamIds = []
+
+        queue = deque(self.__targetIds[uniqueId])
+        while queue:
+            targetId = queue.popleft()
+            if targetId in visited:
+                continue
+
+            visited.add(targetId)
+            downstreamIds.append(targetId)
+            queue.extend(self.__targetIds[targetId])
+
+        return downstreamIds
+
+    def getUpstreamIds(self, uniqueIds):
+        """Returns the items some items are solved from, directly or not.
+
+        Args:
+            uniqueIds (list): The unique ids of the items.
+
+        Returns:
+            list: The unique ids of the items and of their upstream items,
+                breadth first.
+
+        """
+
+        visited = set()
+        upstreamIds = []
+
+        queue = deque(uniqueIds)
+        while queue:
+            sourceId = queue.popleft()
+            if sourceId in visited:
+                continue
+
+            visited.add(sourceId)
+            upstreamIds.append(sourceId)
+            queue.extend(self.__sourceIds[sourceId])
+
+        return upstreamIds
+
+    def getStaticIds(self, dynamicIds):
+        """Returns the items which don't change once solved.
+
+        Args:
+            dynamicIds (list): The unique ids of the items changed at runtime,
+                the controls and attributes.
+
+        Returns:
+            list: The unique ids of the items neither changed at runtime nor
+                solved from such an item, in the order they were added.
+
+        """
+
+        # Breadth first from all of the dynamic items at once.
+        dynamicIdSet = set([x for x in dynamicIds if x in self.__names])
+
+        queue = deque(dynamicIdSet)
+        while queue:
+            for targetId in self.__targetIds[queue.popleft()]:
+                if targetId not in dynamicIdSet:
+                    dynamicIdSet.add(targetId)
+                    queue.append(targetId)
+
+        return [x for x in self.__names if x not in dynamicIdSet]
+
+    def removeItem(self, uniqueId):
+        """Removes an item and its connections from the graph.
+
+        Args:
+            uniqueId (int): The unique id of the item.
+
+        """
+
+        for sourceId in self.__sourceIds[uniqueId]:
+            self.__targetIds[sourceId].remove(uniqueId)
+
+        for targetId in self.__targetIds[uniqueId]:
+            self.__sourceIds[targetId].remove(uniqueId)
+
+        del self.__names[uniqueId]
+        del self.__sourceIds[uniqueId]
+        del self.__targetIds[uniqueId]
+
+    def eliminateDeadItems(self, outputIds):
+        """Removes the items no output of the rig is solved from.
+
+        Args:
+            outputIds (list): The unique ids of the outputs of the rig, the
+                deformers and the items read back from it.
+
+        Returns:
+            list: The unique ids of the removed items, in the order they were
+                added.
+
+        """
+
+        liveIds = set(self.getUpstreamIds([x for x in outputIds if x in self.__names]))
+        deadIds = [x for x in self.__names if x not in liveIds]
+        for deadId in deadIds:
+            self.removeItem(deadId)
+
+        return deadIds
+
+    def getSolveLevels(self, solveIds, solvableIds):
+        """Groups the items the outputs are solved from in levels.
+
+        Every item is in a level after the levels of its sources, so the items
+        of a level don't depend on each other and can be solved in parallel
+        once the previous levels are solved.
+
+        Args:
+            solveIds (list): The unique ids of the outputs of the rig.
+            solvableIds (set): The unique ids of the items with a solve
+                method, other items are left out of the levels.
+
+        Returns:
+            list: The unique ids of the items of each level, in a stable
+                order.
+
+        """
+
+        # Depth first, sources before their targets.
+        order = []
+        finished = set()
+        inProgress = set()
+        for solveId in solveIds:
+            if solveId in finished:
+                continue
+
+            stack = [(solveId, 0)]
+            inProgress.add(solveId)
+            while stack:
+                uniqueId, index = stack[-1]
+                sourceIds = self.__sourceIds[uniqueId]
+                if index < len(sourceIds):
+                    stack[-1] = (uniqueId, index + 1)
+                    sourceId = sourceIds[index]
+                    # Connections closing a cycle are ignored.
+                    if sourceId not in finished and sourceId not in inProgress:
+                        inProgress.add(sourceId)
+                        stack.append((sourceId, 0))
+                    continue
+
+                stack.pop()
+                inProgress.discard(uniqueId)
+                finished.add(uniqueId)
+                order.append(uniqueId)
+
+        depths = {}
+        for uniqueId in order:
+            depth = 0
+            for sourceId in self.__sourceIds[uniqueId]:
+                if sourceId in depths and depths[sourceId] >= depth:
+                    depth = depths[sourceId] + 1
+
+            depths[uniqueId] = depth
+
+        levels = []
+        for uniqueId in order:
+            if uniqueId not in solvableIds:
+                continue
+
+            depth = depths[uniqueId]
+            while len(levels) <= depth:
+                levels.append([])
+
+            levels[depth].append(uniqueId)
+
+        return [x for x in levels if len(x) > 0]
+
+
+    # ==================
+    # Code Gen Methods
+    # ==================
+    def generateDirtyItemCode(self, extensionName, dirtySourceIds, solveIds=None):
+        """Generates the KL method marking an item and its targets dirty.
+
+        Without solve ids, dirtyItem only flags the downstream items and the
+        rig is expected to call the solve method of all of its outputs.
+
+        With solve ids, the dirty propagation mode, dirtyItem also queues the
+        downstream items to solve in the dirtySolveIds member, and the rig
+        only solves the queued items. Since the solve method of an item
+        solves its dirty sources first, queueing the dirty outputs is enough.
+        An output is only queued when it wasn't dirty yet, so it is queued
+        once however many of its sources are dirtied between two solves.
+
+        Args:
+            extensionName (str): The name of the rig object.
+            dirtySourceIds (list): The unique ids of the items the rig can
+                mark dirty, the controls and attributes.
+            solveIds (list): The unique ids of the outputs of the rig, solved
+                by its solve method.
+
+        Returns:
+            list: The KL code lines.
+
+        """
+
+        dirtyPropagation = solveIds is not None
+        if dirtyPropagation:
+            solveIdSet = set(solveIds)
+
+        kl = []
+        kl += ["inline function %s.dirtyItem!(Index uniqueId) {" % extensionName]
+        if not dirtyPropagation:
+            kl += ["  if(this.isItemDirty[uniqueId])"]
+            kl += ["    return;"]
+        kl += ["  this.isItemDirty[uniqueId] = true;"]
+        kl += ["  switch(uniqueId) {"]
+        for uniqueId in dirtySourceIds:
+            if len(self.__targetIds[uniqueId]) == 0:
+                continue
+
+            downstreamIds = self.getDownstreamIds(uniqueId)
+
+            kl += ["    case %d: { // %s" % (uniqueId, self.__names[uniqueId])]
+            for downstreamId in downstreamIds:
+                if dirtyPropagation and downstreamId in solveIdSet:
+                    kl += ["      if(!this.isItemDirty[%d]) { // %s" % (downstreamId, self.__names[downstreamId])]
+                    kl += ["        this.isItemDirty[%d] = true;" % downstreamId]
+                    kl += ["        this.dirtySolveIds.push(%d);" % downstreamId]
+                    kl += ["      }"]
+                else:
+                    kl += ["      this.isItemDirty[%d] = true; // %s" % (downstreamId, self.__names[downstreamId])]
+            kl += ["      break;"]
+            kl += ["    }"]
+        kl += ["  }"]
+        kl += ["}", ""]
+
+        return kl
+
+    def generateDirtyAllItemsCode(self, extensionName, numItems, staticIds=(), solveIds=None):
+        """Generates the KL method marking all of the items dirty.
+
+        Args:
+            extensionName (str): The name of the rig object.
+            numItems (int): The size of the isItemDirty member.
+            staticIds (list): The unique ids of the items solved once in
+                resetPose, left clean.
+            solveIds (list): The unique ids of the outputs of the rig, queued
+                in the dirty propagation mode.
+
+        Returns:
+            list: The KL code lines.
+
+        """
+
+        kl = []
+        kl += ["inline function %s.dirtyAllItems!() {" % extensionName]
+        kl += ["  for(Size i=0;i<%d;i++)" % numItems]
+        kl += ["    this.isItemDirty[i] = true;"]
+        for staticId in staticIds:
+            kl += ["  this.isItemDirty[%d] = false;" % staticId]
+        if solveIds is not None:
+            kl += ["  this.dirtySolveIds.resize(0);"]
+            for solveId in solveIds:
+                kl += ["  this.dirtySolveIds.push(%d);" % solveId]
+        kl += ["}", ""]
+
+        return kl
+
+    def generateSolveDirtyItemsCode(self):
+        """Generates the KL code solving the outputs queued by dirtyItem.
+
+        Returns:
+            list: The KL code lines of the solve method body.
+
+        """
+
+        kl = []
+        kl += ["for(Size i=0;i<this.dirtySolveIds.size();i++)"]
+        kl += ["  this.solveItem(this.dirtySolveIds[i]);"]
+        kl += ["this.dirtySolveIds.resize(0);"]
+
+        return kl
+
+    def generateSolveLevelsCode(self, extensionName, levels):
+        """Generates the KL code solving the items level by level.
+
+        The items of a level are split in up to numSolveThreads tasks run in
+        parallel by a PEX operator. With a single thread, or when a level
+        holds a single item, the level is solved serially in a deterministic
+        order.
+
+        Args:
+            extensionName (str): The name of the rig object.
+            levels (list): The unique ids of the items of each level, as
+                returned by getSolveLevels.
+
+        Returns:
+            dict: The KL code lines of the 'operator' solving a task, of the
+                'solve' method body and of the 'init' method body.
+
+        """
+
+        numItems = sum([len(x) for x in levels])
+
+        operator = []
+        operator += ["operator %s_solveLevelTask<<<taskIndex>>>(io %s rig, Size levelStart, Size levelEnd, Size numTasks) {" % (extensionName, extensionName)]
+        operator += ["  for(Size i=levelStart+taskIndex;i<levelEnd;i+=numTasks)"]
+        operator += ["    rig.solveItem(rig.solveOrder[i]);"]
+        operator += ["}", ""]
+
+        solve = []
+        solve += ["for(Size level=0;level<%d;level++) {" % len(levels)]
+        solve += ["  Size levelStart = this.solveLevelOffsets[level];"]
+        solve += ["  Size levelEnd = this.solveLevelOffsets[level+1];"]
+        solve += ["  Size numTasks = levelEnd - levelStart;"]
+        solve += ["  if(numTasks > this.numSolveThreads)"]
+        solve += ["    numTasks = this.numSolveThreads;"]
+        solve += ["  if(numTasks < 2) {"]
+        solve += ["    for(Size i=levelStart;i<levelEnd;i++)"]
+        solve += ["      this.solveItem(this.solveOrder[i]);"]
+        solve += ["  } else {"]
+        solve += ["    %s rig = this;" % extensionName]
+        solve += ["    %s_solveLevelTask<<<numTasks>>>(rig, levelStart, levelEnd, numTasks);" % extensionName]
+        solve += ["  }"]
+        solve += ["}"]
+
+        init = []
+        init += ["this.solveOrder.resize(%d);" % numItems]
+        init += ["this.solveLevelOffsets.resize(%d);" % (len(levels) + 1)]
+        offset = 0
+        for i, level in enumerate(levels):
+            init += ["this.solveLevelOffsets[%d] = %d;" % (i, offset)]
+            for uniqueId in level:
+                init += ["this.solveOrder[%d] = %d; // %s" % (offset, uniqueId, self.__names[uniqueId])]
+                offset += 1
+        init += ["this.solveLevelOffsets[%d] = %d;" % (len(levels), offset)]
+
+        return {
+            'operator': operator,
+            'solve': solve,
+            'init': init
+        }
@@ -85,7 +85,7 @@ class Builder(Builder):
                                               builtElement['src'].getTypeName()))
                     continue
 
-        self._buildElements = []
+        self._clearSceneItemPairs()
 
         return
 
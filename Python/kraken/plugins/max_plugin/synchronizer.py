@@ -14,7 +14,12 @@ logger = getLogger('kraken')
 
 class Synchronizer(Synchronizer):
     """The Synchronizer is a singleton object used to synchronize data between
-    Kraken objects and the DCC objects."""
+    Kraken objects and the DCC objects.
+
+    getDCCItemState isn't implemented, so every item is synchronized on each
+    sync.
+
+    """
 
     def __init__(self):
         super(Synchronizer, self).__init__()
@@ -125,7 +130,7 @@ class Synchronizer(Synchronizer):
 
         hrcMap = self.getHierarchyMap()
 
-        if kObject not in hrcMap.keys():
+        if kObject not in hrcMap:
             logger.warning("SyncXfo: 3D Object '" + kObject.getName() + "' was not found in the mapping!")
             return False
 
@@ -176,7 +181,7 @@ class Synchronizer(Synchronizer):
 
         hrcMap = self.getHierarchyMap()
 
-        if kObject not in hrcMap.keys():
+        if kObject not in hrcMap:
             logger.warning("SyncAttribute: Attribute '" + kObject.getName() + "' was not found in the mapping!")
             return False
 
@@ -204,7 +209,7 @@ class Synchronizer(Synchronizer):
 
         hrcMap = self.getHierarchyMap()
 
-        if kObject not in hrcMap.keys():
+        if kObject not in hrcMap:
             logger.warning("SyncCurveData: 3D Object '" + kObject.getName() + "' was not found in the mapping!")
             return False
 
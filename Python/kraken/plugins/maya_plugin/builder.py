@@ -100,7 +100,7 @@ class Builder(Builder):
             if node.exists():
                 pm.delete(node)
 
-        self._buildElements = []
+        self._clearSceneItemPairs()
 
         return
 
@@ -69,6 +69,88 @@ class Synchronizer(Synchronizer):
         return foundItem
 
 
+    def isDCCItemValid(self, dccItem):
+        """Checks that a DCC item found earlier still exists in the DCC.
+
+        Args:
+            dccItem (object): The DCC item to check.
+
+        Returns:
+            bool: True if the DCC item can still be used.
+
+        """
+
+        return dccItem.exists()
+
+
+    def getDCCItemState(self, kObject, dccItem):
+        """Gets a snapshot of the DCC item data that the object is synced from.
+
+        Transforms are snapshot by their world matrix and curves also by the
+        positions of their control vertices.
+
+        Args:
+            kObject (object): The Kraken object being synchronized.
+            dccItem (object): The DCC item of the object.
+
+        Returns:
+            object: A comparable snapshot, or None to always sync the object.
+
+        """
+
+        if kObject.isTypeOf('Object3D') is False:
+            return None
+
+        state = tuple(cmds.xform(dccItem.longName(), query=True, worldSpace=True, matrix=True))
+
+        if kObject.isTypeOf('Curve') is True:
+            state += self.__getCurveState(dccItem)
+
+        return state
+
+
+    def getDCCItemStates(self, kObjects, dccItems):
+        """Gets the snapshots of several DCC items at once.
+
+        The world matrices of all the transforms are queried with a single
+        xform call, the control vertices are queried for each curve.
+
+        Args:
+            kObjects (list): The Kraken objects being synchronized.
+            dccItems (list): The DCC item of each object.
+
+        Returns:
+            list: The snapshot of each item, None to always sync the item.
+
+        """
+
+        states = [None] * len(kObjects)
+
+        indices = [i for i in xrange(len(kObjects)) if kObjects[i].isTypeOf('Object3D')]
+        if len(indices) == 0:
+            return states
+
+        matrices = cmds.xform([dccItems[i].longName() for i in indices], query=True, worldSpace=True, matrix=True)
+        if matrices is None or len(matrices) != 16 * len(indices):
+            return super(Synchronizer, self).getDCCItemStates(kObjects, dccItems)
+
+        for j, i in enumerate(indices):
+            state = tuple(matrices[j * 16:(j + 1) * 16])
+
+            if kObjects[i].isTypeOf('Curve') is True:
+                state += self.__getCurveState(dccItems[i])
+
+            states[i] = state
+
+        return states
+
+
+    def __getCurveState(self, dccItem):
+        """Gets the positions of the control vertices of a curve's shapes."""
+
+        return tuple([tuple(cmds.getAttr(shape.longName() + '.cv[*]')) for shape in dccItem.getShapes()])
+
+
     def syncXfo(self, kObject):
         """Syncs the xfo from the DCC object to the Kraken object.
 
@@ -82,8 +164,8 @@ class Synchronizer(Synchronizer):
 
         hrcMap = self.getHierarchyMap()
 
-        if kObject not in hrcMap.keys():
-            ogger.warning("SyncXfo: 3D Object '" + kObject.getName() + "' was not found in the mapping!")
+        if kObject not in hrcMap:
+            logger.warning("SyncXfo: 3D Object '" + kObject.getName() + "' was not found in the mapping!")
             return False
 
         dccItem = hrcMap[kObject]['dccItem']
@@ -130,7 +212,7 @@ class Synchronizer(Synchronizer):
 
         hrcMap = self.getHierarchyMap()
 
-        if kObject not in hrcMap.keys():
+        if kObject not in hrcMap:
             logger.warning("SyncAttribute: Attribute '" + kObject.getName() + "' was not found in the mapping!")
             return False
 
@@ -158,7 +240,7 @@ class Synchronizer(Synchronizer):
 
         hrcMap = self.getHierarchyMap()
 
-        if kObject not in hrcMap.keys():
+        if kObject not in hrcMap:
             logger.warning("SyncCurveData: 3D Object '" + kObject.getName() + "' was not found in the mapping!")
             return False
 
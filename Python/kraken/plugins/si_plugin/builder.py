@@ -72,7 +72,7 @@ class Builder(Builder):
             except:
                 continue
 
-        self._buildElements = []
+        self._clearSceneItemPairs()
 
         si.SetValue("preferences.scripting.cmdlog", True, "")
 
@@ -41,6 +41,7 @@ class KGraphViewWidget(GraphViewWidget):
 
         self._builder = None
         self._guideBuilder = None
+        self._synchronizer = None
         self.guideRig = None
 
         graphView = KGraphView(parent=self)
@@ -292,7 +293,12 @@ class KGraphViewWidget(GraphViewWidget):
             self.window().setCursor(QtCore.Qt.ArrowCursor)
 
     def synchGuideRig(self):
-        synchronizer = plugins.getSynchronizer()
+        # Keep the synchronizer between syncs so only the items changed in the
+        # DCC since the last sync are synchronized again.
+        if self._synchronizer is None:
+            self._synchronizer = plugins.getSynchronizer()
+
+        synchronizer = self._synchronizer
 
         # Guide is always  built with "_guide" need this so synchronizer not confused with real Rig nodes
         if self.guideRig.getName().endswith('_guide') is False:
@@ -1,5 +1,4 @@
 
-import sys
 import os
 
 import difflib
@@ -48,22 +47,25 @@ class ComponentTreeWidget(QtWidgets.QTreeWidget):
 
         """
 
+        componentClassNames = self.ks.getComponentClassNames()
         for item in sorted(data['components']):
-            if data['components'][item] not in self.ks.registeredComponents.keys():
+            if data['components'][item] not in componentClassNames:
                 print ("Warning: Component module " + data['components'][item] + " not found in registered components:")
-                for component in self.ks.registeredComponents:
+                for component in componentClassNames:
                     print "  " + component
                 continue
 
+            # The module file comes from the component manifest so that the
+            # component module isn't imported until it is used.
+            moduleFile = self.ks.getComponentFilePath(data['components'][item])
+
             treeItem = QtWidgets.QTreeWidgetItem(parentWidget)
             treeItem.setData(0, QtCore.Qt.UserRole, data['components'][item])
             treeItem.setText(0, item)
-            component = self.ks.registeredComponents[data['components'][item]]
-            module = sys.modules[component.__module__]
-            treeItem.setToolTip(0, module.__file__)
+            treeItem.setToolTip(0, moduleFile)
 
             if parentWidget is not None:
-                parentWidget.setToolTip(0, os.path.dirname(module.__file__))
+                parentWidget.setToolTip(0, os.path.dirname(moduleFile))
 
         for item in data['subDirs'].keys():
 
@@ -87,8 +89,7 @@ class ComponentTreeWidget(QtWidgets.QTreeWidget):
 
         componentClassNames = []
         for componentClassName in sorted(self.ks.getComponentClassNames()):
-            cmpCls = self.ks.getComponentClass(componentClassName)
-            if cmpCls.getComponentType() != 'Guide':
+            if self.ks.getComponentType(componentClassName) != 'Guide':
                 continue
 
             componentClassNames.append(componentClassName)
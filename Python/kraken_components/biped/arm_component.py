@@ -453,16 +453,8 @@ class ArmComponentRig(ArmComponent):
         self.forearmOutputTgt.xfo = forearmXfo
         self.wristOutputTgt.xfo = wristXfo
 
-        # Eval Constraints
-        self.ikPosInputConstraint.evaluate()
-        self.armIKCtrlSpaceInputConstraint.evaluate()
-        self.armUpVCtrlSpaceInputConstraint.evaluate()
-        self.armRootInputConstraint.evaluate()
-        self.armRootInputConstraint.evaluate()
-
-        # Eval Operators
-        self.armSolverKLOperator.evaluate()
-        self.outputsToDeformersKLOp.evaluate()
+        # Eval Constraints and Operators
+        self.evalOperators()
 
 
 from kraken.core.kraken_system import KrakenSystem
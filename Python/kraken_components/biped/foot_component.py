@@ -509,17 +509,8 @@ class FootComponentRig(FootComponent):
         self.ikTargetOutputTgt.xfo.tr = footXfo.tr
         self.ikTargetOutputTgt.xfo.ori = ankleXfo.ori
 
-        # Eval Canvas Ops
-        self.footPivotCanvasOp.evaluate()
-        self.footSolverCanvasOp.evaluate()
-
-        # Eval Constraints
-        self.pivotAllInputConstraint.evaluate()
-        self.ikTargetOutputConstraint.evaluate()
-        self.ankleFKInputConstraint.evaluate()
-
-        # Eval Operators
-        self.footDefKLOp.evaluate()
+        # Eval Constraints and Operators
+        self.evalOperators()
 
 
 from kraken.core.kraken_system import KrakenSystem
@@ -550,10 +550,8 @@ class HandComponentRig(HandComponent):
         self.handCtrlSpace.xfo = handXfo
         self.handCtrl.xfo = handXfo
 
-        fingerOps = []
         for finger in fingerData.keys():
-            fingerOp = self.addFinger(finger, fingerData[finger])
-            fingerOps.append(fingerOp)
+            self.addFinger(finger, fingerData[finger])
 
         # ============
         # Set IO Xfos
@@ -561,14 +559,8 @@ class HandComponentRig(HandComponent):
         self.armEndInputTgt.xfo = handXfo
         self.handOutputTgt.xfo = handXfo
 
-        # Eval Constraints
-        self.armEndInputConstraint.evaluate()
-        self.handOutputConstraint.evaluate()
-        self.handDefConstraint.evaluate()
-
-        # Eval Operators
-        for op in fingerOps:
-            op.evaluate()
+        # Eval Constraints and Operators
+        self.evalOperators()
 
 
 from kraken.core.kraken_system import KrakenSystem
@@ -464,19 +464,8 @@ class LegComponentRig(LegComponent):
         # if not ikTargetInput.isConnected():
             # self.legIKKLOp.setInput('ikHandle', self.legIKCtrl)
 
-        # Eval Input Constraints
-        self.ikRootPosInputConstraint.evaluate()
-        self.legIKCtrlSpaceInputConstraint.evaluate()
-        self.legUpVCtrlSpaceInputConstraint.evaluate()
-        self.legRootInputConstraint.evaluate()
-
-        # Eval Operators
-        self.legIKKLOp.evaluate()
-        self.outputsToDeformersKLOp.evaluate()
-
-        # Eval Output Constraints
-        self.legEndFKOutputConstraint.evaluate()
-        self.ikHandleOutputConstraint.evaluate()
+        # Eval Constraints and Operators
+        self.evalOperators()
 
 
 from kraken.core.kraken_system import KrakenSystem
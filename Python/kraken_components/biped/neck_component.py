@@ -372,14 +372,8 @@ class NeckComponentRig(NeckComponent):
         self.neck02OutputTgt.xfo = neckMidXfo
         self.neckEndOutputTgt.xfo = neckEndXfo
 
-        # Evaluate Constraints
-        self.neckInputCnstr.evaluate()
-        self.neck01OutCnstr.evaluate()
-        self.neck02OutCnstr.evaluate()
-        self.neckEndCnstr.evaluate()
-
-        # Evaluate Operators
-        self.neckDeformerKLOp.evaluate()
+        # Evaluate Constraints and Operators
+        self.evalOperators()
 
 
 from kraken.core.kraken_system import KrakenSystem
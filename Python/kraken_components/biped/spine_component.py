@@ -411,17 +411,8 @@ class SpineComponentRig(SpineComponent):
         # Set IO Xfos
         # ============
 
-        # Evaluate Constraints
-        self.spineSrtInputConstraint.evaluate()
-        self.spineCogOutputConstraint.evaluate()
-        self.spineBaseOutputConstraint.evaluate()
-        self.pelvisOutputConstraint.evaluate()
-        self.spineEndOutputConstraint.evaluate()
-
-        # Evaluate Operators
-        self.bezierSpineKLOp.evaluate()
-        self.deformersToOutputsKLOp.evaluate()
-        self.pelvisDefKLOp.evaluate()
+        # Evaluate Constraints and Operators
+        self.evalOperators()
 
 
 
@@ -398,14 +398,8 @@ class StretchyLimbComponentRig(StretchyLimbComponent):
         # Set Attrs
         self.rightSideInputAttr.setValue(self.getLocation() is 'R')
 
-        # Eval Constraints
-        self.limbIKCtrlSpaceInputConstraint.evaluate()
-        self.limbUpVCtrlSpaceInputConstraint.evaluate()
-        self.limbRootInputConstraint.evaluate()
-
-        # Eval Operators
-        self.limbIKKLOp.evaluate()
-        self.outputsToDeformersKLOp.evaluate()
+        # Eval Constraints and Operators
+        self.evalOperators()
 
 
 from kraken.core.kraken_system import KrakenSystem
@@ -245,7 +245,7 @@ class FabriceClavicleRig(FabriceClavicle):
         self.clavicleOutputTgt.xfo = data['clavicleXfo']
 
         # Eval Operators
-        self.defConstraintOp.evaluate()
+        self.evalOperators()
 
 
 from kraken.core.kraken_system import KrakenSystem
@@ -327,15 +327,9 @@ class FabriceHeadRig(FabriceHead):
         # ====================
         # Evaluate Splice Ops
         # ====================
-        # evaluate the constraint op so that all the joint transforms are updated.
-        self.headAimCanvasOp.evaluate()
-        self.deformersToOutputsKLOp.evaluate()
-
-        # evaluate the constraints to ensure the outputs are now in the correct location.
-        self.headToAimConstraint.evaluate()
-        self.headAimInputConstraint.evaluate()
-        self.headOutputConstraint.evaluate()
-        self.jawOutputConstraint.evaluate()
+        # evaluate the ops and constraints so that the joint transforms and
+        # the outputs are updated.
+        self.evalOperators()
 
 
 from kraken.core.kraken_system import KrakenSystem
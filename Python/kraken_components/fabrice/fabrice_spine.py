@@ -535,19 +535,9 @@ class FabriceSpineRig(FabriceSpine):
         # ====================
         # Evaluate Splice Ops
         # ====================
-        # evaluate the spine op so that all the output transforms are updated.
-        self.bezierSpineKLOp.evaluate()
-
-        # evaluate the constraint op so that all the joint transforms are updated.
-        self.deformersToOutputsKLOp.evaluate()
-
-        # evaluate the constraints to ensure the outputs are now in the correct location.
-        self.spineSrtInputConstraint.evaluate()
-        self.spineCogOutputConstraint.evaluate()
-        self.spineBaseOutputPosConstraint.evaluate()
-        self.spineBaseOutputOriConstraint.evaluate()
-        self.spineEndOutputConstraint.evaluate()
-        self.spineEndCtrlOutputConstraint.evaluate()
+        # evaluate the ops and constraints so that the joint transforms and
+        # the outputs are updated.
+        self.evalOperators()
 
 
 
@@ -479,16 +479,9 @@ class FabriceTailRig(FabriceTail):
         # ====================
         # Evaluate Splice Ops
         # ====================
-        # evaluate the spine op so that all the output transforms are updated.
-        self.bezierTailKLOp.evaluate()
-
-        # evaluate the constraint op so that all the joint transforms are updated.
-        self.deformersToOutputsKLOp.evaluate()
-
-        # evaluate the constraints to ensure the outputs are now in the correct location.
-        self.tailBaseHandleInputConstraint.evaluate()
-        self.tailBaseOutputConstraint.evaluate()
-        self.tailEndOutputConstraint.evaluate()
+        # evaluate the ops and constraints so that the joint transforms and
+        # the outputs are updated.
+        self.evalOperators()
 
 
 
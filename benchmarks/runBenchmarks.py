@@ -0,0 +1,485 @@
+"""Kraken headless benchmark suite.
+
+Constructs and builds rigs end to end with the pure Python Builder, records
+the timings of each phase, the peak memory and the object counts, and
+compares them against a stored baseline.
+
+Each benchmark runs in its own process so that the peak memory and the
+caches of one benchmark don't leak into another. When the Fabric Engine core
+can't be imported, the benchmarks run with the python math backend and the
+stand-in client of the standInClient module.
+
+The scene items of the built rig must match the baseline and the Python
+objects it leaves alive must not grow by more than the tolerance. Timings and
+memory depend on the machine and its load, so the fastest time of each phase
+over the repeated runs and the peak memory are compared with a generous ratio
+on top of a noise floor: they only fail on large regressions.
+
+Usage:
+    python runBenchmarks.py [--benchmark NAME] [--repeat N] [--output FILE] [--time-ratio R] [--memory-ratio R] [--update-baseline]
+
+"""
+
+import os
+import sys
+import gc
+import json
+import time
+import logging
+import argparse
+import platform
+import subprocess
+from collections import OrderedDict
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows, the peak memory isn't recorded there.
+    resource = None
+
+
+BENCHMARKS_DIR = os.path.dirname(os.path.realpath(__file__))
+KRAKEN_PATH = os.path.dirname(BENCHMARKS_DIR)
+
+DEFAULT_BASELINE = os.path.join(BENCHMARKS_DIR, 'baseline.json')
+
+PHASES = ('construct', 'build')
+
+# The relative growth of the Python objects left alive by a rig allowed
+# before it is reported as a regression.
+OBJECT_TOLERANCE = 0.05
+
+# The ratio to the baseline allowed for the time of a phase and the peak
+# memory, on top of an absolute noise floor in seconds and KB.
+TIME_RATIO = 1.5
+TIME_NOISE_FLOOR = 0.05
+MEMORY_RATIO = 1.5
+MEMORY_NOISE_FLOOR = 8192
+
+
+# ===========
+# Rig Makers
+# ===========
+def makeBobRig():
+    from kraken_examples.bob_rig import BobRig
+
+    return BobRig("char_bob")
+
+
+def makeBobGuideRig():
+    from kraken_examples.bob_guide_rig import BobGuideRig
+
+    return BobGuideRig("char_bob_guide")
+
+
+def makeRigFromFile(filepath):
+    """Makes a rig from a rig definition file.
+
+    The example files predate the move of the components to the
+    kraken_components package, so their classes are resolved by class name.
+
+    """
+
+    from kraken.core.kraken_system import KrakenSystem
+    from kraken.core.io.rig_definition_loader import RigDefinitionLoader
+    from kraken.core.objects.rig import Rig
+
+    ks = KrakenSystem.getInstance()
+    ks.loadComponentModules()
+
+    classPaths = {}
+    for classPath in ks.getComponentClassNames():
+        classPaths.setdefault(classPath.split('.')[-1], classPath)
+
+    rigData = RigDefinitionLoader().loadFile(filepath)
+    for componentData in rigData.get('components', []):
+        className = componentData['class'].split('.')[-1]
+        componentData['class'] = classPaths.get(className, componentData['class'])
+
+    rig = Rig()
+    rig.loadRigDefinition(rigData)
+
+    return rig
+
+
+def makeLimbsRig(numLimbs, numSegments=6):
+    """Makes a rig of FK limbs built only from Python scene items.
+
+    Every limb is a component with a chain of controls and spaces, and a
+    chain of joints constrained to the controls.
+
+    """
+
+    from kraken.core.maths import Vec3, Xfo
+    from kraken.core.objects.rig import Rig
+    from kraken.core.objects.control import Control
+    from kraken.core.objects.ctrlSpace import CtrlSpace
+    from kraken.core.objects.joint import Joint
+    from kraken.core.objects.component_group import ComponentGroup
+    from kraken.core.objects.components.base_example_component import BaseExampleComponent
+    from kraken.core.objects.attributes.attribute_group import AttributeGroup
+    from kraken.core.objects.attributes.scalar_attribute import ScalarAttribute
+
+    rig = Rig("limbs%d" % numLimbs)
+    for i in xrange(numLimbs):
+        limb = BaseExampleComponent("limb%d" % i, parent=rig)
+        limb.setLocation(('L', 'R', 'M')[i % 3])
+
+        deformersLayer = limb.getOrCreateLayer('deformers')
+        defCmpGrp = ComponentGroup(limb.getName(), limb, parent=deformersLayer)
+        limb.addItem('defCmpGrp', defCmpGrp)
+
+        ctrlParent = limb.ctrlCmpGrp
+        jointParent = defCmpGrp
+        for j in xrange(numSegments):
+            space = CtrlSpace("segment%d" % j, parent=ctrlParent)
+            space.xfo = Xfo(Vec3(float(i), float(j), 0.0))
+
+            ctrl = Control("segment%d" % j, parent=space, shape="circle")
+            ctrl.xfo = space.xfo.clone()
+            ctrl.scalePoints(Vec3(0.5, 0.5, 0.5))
+
+            settings = AttributeGroup("settings", parent=ctrl)
+            ScalarAttribute("blend", value=1.0, minValue=0.0, maxValue=1.0, parent=settings)
+
+            joint = Joint("segment%d" % j, parent=jointParent)
+            joint.xfo = ctrl.xfo.clone()
+            joint.constrainTo(ctrl)
+
+            ctrlParent = ctrl
+            jointParent = joint
+
+    return rig
+
+
+# name: rig maker
+BENCHMARKS = OrderedDict([
+    ('bob_rig', makeBobRig),
+    ('bob_guide_rig', makeBobGuideRig),
+    ('fabrice_rig', lambda: makeRigFromFile(os.path.join(KRAKEN_PATH, 'Python', 'kraken_components', 'fabrice', 'fabrice_rig.krg'))),
+    ('arms', lambda: makeRigFromFile(os.path.join(KRAKEN_PATH, 'tests', 'performanceTest', 'arms.krg'))),
+    ('limbs_4', lambda: makeLimbsRig(4)),
+    ('limbs_32', lambda: makeLimbsRig(32)),
+    ('limbs_256', lambda: makeLimbsRig(256)),
+])
+
+
+# ================
+# Single Benchmark
+# ================
+def isFabricAvailable():
+    try:
+        import FabricEngine.Core
+    except ImportError:
+        return False
+
+    return True
+
+
+def getPeakMemory():
+    """Returns the peak resident memory of the process in KB."""
+
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        # Reported in bytes on OSX.
+        peak = peak / 1024
+
+    return peak
+
+
+def countSceneItems(rig):
+    from kraken.core.traverser import Traverser
+
+    traverser = Traverser()
+    traverser.addRootItem(rig)
+
+    return len(traverser.traverse(discoverCallback=traverser.discoverChildren))
+
+
+def runBenchmark(name):
+    """Constructs and builds a rig, returning its measurements.
+
+    Args:
+        name (str): The name of the benchmark to run.
+
+    Returns:
+        dict: The measurements of the benchmark.
+
+    """
+
+    from kraken.log import getLogger
+    from kraken.core.builder import Builder
+    from kraken.core.profiler import Profiler
+
+    getLogger('kraken').setLevel(logging.WARNING)
+
+    if not isFabricAvailable():
+        import standInClient
+        standInClient.install()
+
+    makeRig = BENCHMARKS[name]
+
+    gc.collect()
+    numObjects = len(gc.get_objects())
+    memoryBefore = getPeakMemory()
+
+    profiler = Profiler.getInstance()
+    profiler.reset()
+    profiler.setEnabled(True)
+
+    start = time.time()
+
+    profiler.push("construct")
+    rig = makeRig()
+    profiler.pop()
+
+    profiler.push("build")
+    Builder().build(rig)
+    profiler.pop()
+
+    total = time.time() - start
+
+    gc.collect()
+
+    stats = profiler.getStats()
+
+    result = {
+        'status': 'ok',
+        'total': total,
+        'phases': dict([(x, stats[x]['total']) for x in PHASES]),
+        'peakMemory': getPeakMemory(),
+        'startMemory': memoryBefore,
+        'sceneItems': countSceneItems(rig),
+        'pythonObjects': len(gc.get_objects()) - numObjects,
+        'profiler': stats
+    }
+
+    return result
+
+
+def runBenchmarkProcess(name, mathBackend):
+    """Runs a benchmark in a new Python process.
+
+    Args:
+        name (str): The name of the benchmark to run.
+        mathBackend (str): The math backend of the process.
+
+    Returns:
+        dict: The measurements of the benchmark.
+
+    """
+
+    env = dict(os.environ)
+    env['KRAKEN_PATH'] = KRAKEN_PATH
+    env['KRAKEN_MATH_BACKEND'] = mathBackend
+    env['KRAKEN_PROFILER'] = '1'
+
+    pythonPath = os.path.join(KRAKEN_PATH, 'Python')
+    if env.get('PYTHONPATH'):
+        pythonPath = pythonPath + os.pathsep + env['PYTHONPATH']
+    env['PYTHONPATH'] = pythonPath
+
+    cmd = [sys.executable, os.path.realpath(__file__), '--run', name]
+    proc = subprocess.Popen(cmd, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    stdout, stderr = proc.communicate()
+
+    if proc.returncode != 0:
+        return {'status': 'error', 'error': stderr.strip().split('\n')[-1]}
+
+    # The result is the last line, components may print while loading.
+    return json.loads(stdout.strip().split('\n')[-1])
+
+
+# ===========
+# Comparison
+# ===========
+def compareResults(name, result, baseline, tolerance=OBJECT_TOLERANCE,
+                   timeRatio=TIME_RATIO, memoryRatio=MEMORY_RATIO):
+    """Compares the measurements of a benchmark with its baseline.
+
+    Args:
+        name (str): The name of the benchmark.
+        result (dict): The measurements of the benchmark.
+        baseline (dict): The baseline measurements of the benchmark.
+        tolerance (float): The relative growth of the Python objects allowed.
+        timeRatio (float): The ratio to the baseline allowed for each phase.
+        memoryRatio (float): The ratio to the baseline allowed for the peak
+            memory.
+
+    Returns:
+        list: The description of each regression.
+
+    """
+
+    regressions = []
+
+    reference = baseline.get('sceneItems', None)
+    if reference is not None and result['sceneItems'] != reference:
+        regressions.append("%s: %d scene items, baseline %d" % (name, result['sceneItems'], reference))
+
+    reference = baseline.get('pythonObjects', None)
+    if reference is not None and result['pythonObjects'] > reference * (1.0 + tolerance):
+        regressions.append("%s: %d Python objects, baseline %d (+%d%%)" % (
+            name, result['pythonObjects'], reference, int((float(result['pythonObjects']) / reference - 1.0) * 100.0)))
+
+    for phase in PHASES:
+        value = result['phases'][phase]
+        reference = baseline.get('phases', {}).get(phase, None)
+        if reference is not None and value > reference * timeRatio + TIME_NOISE_FLOOR:
+            regressions.append("%s: %s %.3fs, baseline %.3fs (x%.2f)" % (
+                name, phase, value, reference, value / max(reference, 1e-6)))
+
+    peakMemory = result.get('peakMemory', None)
+    reference = baseline.get('peakMemory', None)
+    if peakMemory is not None and reference is not None and \
+            peakMemory > reference * memoryRatio + MEMORY_NOISE_FLOOR:
+        regressions.append("%s: peak memory %dKB, baseline %dKB (x%.2f)" % (
+            name, peakMemory, reference, float(peakMemory) / reference))
+
+    return regressions
+
+
+def reportTimings(name, result, baseline):
+    """Prints the timings and peak memory of a benchmark next to its baseline."""
+
+    for phase in PHASES:
+        value = result['phases'][phase]
+        reference = baseline['phases'].get(phase, None)
+        if reference:
+            print "%s: %s %.3fs, baseline %.3fs (x%.2f)" % (name, phase, value, reference, value / reference)
+
+    peakMemory = result.get('peakMemory', None)
+    reference = baseline.get('peakMemory', None)
+    if peakMemory is not None and reference is not None:
+        print "%s: peak memory %dKB, baseline %dKB" % (name, peakMemory, reference)
+
+
+def mergeRepeats(results):
+    """Keeps the fastest time of each phase and the largest memory use."""
+
+    merged = dict(results[0])
+    merged['total'] = min([x['total'] for x in results])
+    merged['phases'] = dict([(x, min([y['phases'][x] for y in results])) for x in PHASES])
+    if merged.get('peakMemory') is not None:
+        merged['peakMemory'] = max([x['peakMemory'] for x in results])
+
+    return merged
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--benchmark', action='append', help="The benchmark to run, all of them if not given. (optional, repeatable)")
+    parser.add_argument('--repeat', type=int, default=3, help="The number of runs of each benchmark, the fastest is kept. (optional)")
+    parser.add_argument('--output', help="The results file to write, not written if not given. (optional)")
+    parser.add_argument('--tolerance', type=float, default=OBJECT_TOLERANCE, help="The relative growth of the Python objects allowed. (optional)")
+    parser.add_argument('--time-ratio', type=float, default=TIME_RATIO, help="The ratio to the baseline allowed for the time of each phase. (optional)")
+    parser.add_argument('--memory-ratio', type=float, default=MEMORY_RATIO, help="The ratio to the baseline allowed for the peak memory. (optional)")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="The baseline file to compare to. (optional)")
+    parser.add_argument('--update-baseline', action='store_const', const=True, default=False, help="Write the results as the new baseline. (optional)")
+    parser.add_argument('--list', action='store_const', const=True, default=False, help="List the benchmarks. (optional)")
+    parser.add_argument('--run', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run is not None:
+        # Child process, print the measurements of a single run.
+        print json.dumps(runBenchmark(args.run))
+        sys.exit(0)
+
+    if args.list:
+        for name in BENCHMARKS:
+            print name
+        sys.exit(0)
+
+    names = args.benchmark or BENCHMARKS.keys()
+    for name in names:
+        if name not in BENCHMARKS:
+            parser.error("Unknown benchmark: " + name)
+
+    fabricAvailable = isFabricAvailable()
+    mathBackend = 'fabric' if fabricAvailable else 'python'
+
+    results = OrderedDict()
+    for name in names:
+        runs = []
+        for i in xrange(max(1, args.repeat)):
+            result = runBenchmarkProcess(name, mathBackend)
+            if result['status'] != 'ok':
+                break
+
+            runs.append(result)
+
+        if result['status'] != 'ok':
+            print "Benchmark Failed:%s %s" % (name, result['error'])
+            results[name] = result
+            continue
+
+        results[name] = mergeRepeats(runs)
+        print "Benchmark Ran:%s construct %.3fs, build %.3fs, %d scene items" % (
+            name, results[name]['phases']['construct'], results[name]['phases']['build'], results[name]['sceneItems'])
+
+    report = OrderedDict([
+        ('platform', platform.platform()),
+        ('python', platform.python_version()),
+        ('mathBackend', mathBackend),
+        ('benchmarks', results)
+    ])
+
+    if args.output is not None:
+        with open(args.output, 'w') as resultsFile:
+            json.dump(report, resultsFile, indent=2, separators=(',', ': '))
+
+    failed = [x for x in results if results[x]['status'] == 'error']
+
+    if args.update_baseline:
+        baseline = OrderedDict()
+        if os.path.exists(args.baseline):
+            with open(args.baseline, 'r') as baselineFile:
+                baseline = json.load(baselineFile, object_pairs_hook=OrderedDict)
+
+        # Profiler details are left out of the baseline to keep it readable.
+        for name, result in results.iteritems():
+            if result['status'] == 'ok':
+                baseline[name] = dict([(x, result[x]) for x in ('phases', 'peakMemory', 'sceneItems', 'pythonObjects')])
+                baseline[name]['mathBackend'] = mathBackend
+
+        with open(args.baseline, 'w') as baselineFile:
+            json.dump(baseline, baselineFile, indent=2, sort_keys=True, separators=(',', ': '))
+
+        print "Baseline Updated:" + args.baseline
+
+    else:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, 'r') as baselineFile:
+                baseline = json.load(baselineFile)
+
+        regressions = []
+        for name, result in results.iteritems():
+            if result['status'] != 'ok' or name not in baseline:
+                continue
+
+            # Object counts of different math backends can't be compared.
+            if baseline[name].get('mathBackend', mathBackend) != mathBackend:
+                print "Benchmark Not Compared:%s (baseline uses the %s math backend)" % (name, baseline[name]['mathBackend'])
+                continue
+
+            reportTimings(name, result, baseline[name])
+            regressions += compareResults(name, result, baseline[name], tolerance=args.tolerance,
+                                          timeRatio=args.time_ratio, memoryRatio=args.memory_ratio)
+
+        if len(regressions) > 0 or len(failed) > 0:
+            print "======================================"
+            print "BENCHMARK REGRESSIONS"
+
+            for regression in regressions:
+                print regression
+            for name in failed:
+                print name + ": failed to run"
+
+            sys.exit(1)
+
+        print "======================================"
+        print "NO REGRESSIONS"
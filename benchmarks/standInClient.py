@@ -0,0 +1,330 @@
+"""Kraken benchmark stand-in for the Fabric Engine core client.
+
+Without Fabric Engine, the KL solvers and Canvas presets used by the operators
+and constraints of the example rigs can't be constructed or evaluated. The
+stand-in reads the solver arguments from the KL sources of the Kraken
+extension and the ports from the Canvas presets, and evaluates the
+constraints in Python, so the example rigs can be constructed and built
+headless.
+
+Operators are not evaluated: their outputs keep the transforms the components
+gave them. The benchmarks measure the Python side of constructing and building
+the rigs, not the solvers.
+
+"""
+
+import os
+import re
+import json
+
+
+KRAKEN_PATH = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+SOLVER_PATHS = [os.path.join(KRAKEN_PATH, 'Exts')]
+PRESET_PATHS = [os.path.join(KRAKEN_PATH, 'Presets', 'DFG')]
+
+_objectRe = re.compile(r'^\s*object\s+(\w+)\s*(?::\s*(\w+))?')
+_constructorRe = re.compile(r'^\s*(?:inline|function)\s+(\w+)\s*\(')
+_methodRe = re.compile(r'^\s*(?:inline|function)\s+.*?\b(\w+)\.\w+!?\s*\(')
+_getArgumentsRe = re.compile(r'^\s*function\s+KrakenSolverArg\[\]\s+(\w+)\.getArguments\s*\(')
+_argRe = re.compile(r'KrakenSolverArg\(\s*[\'"](\w+)[\'"]\s*,\s*[\'"](\w+)[\'"]\s*,\s*[\'"]([\w\[\]:]+)[\'"]\s*\)')
+_defaultValueRe = re.compile(r'this\.defaultValues\[\s*"(\w+)"\s*\]\s*=')
+
+_solvers = None
+
+
+# ========
+# Solvers
+# ========
+def parseSolverSource(source, solvers):
+    """Reads the objects, arguments and default values of a KL source.
+
+    Args:
+        source (str): The KL source code.
+        solvers (dict): The solvers by type name, updated in place.
+
+    """
+
+    owner = None
+    argsOwner = None
+    for line in source.split('\n'):
+        match = _objectRe.match(line)
+        if match:
+            solver = solvers.setdefault(match.group(1), {'parent': None, 'args': None, 'defaults': set()})
+            solver['parent'] = match.group(2)
+            continue
+
+        match = _getArgumentsRe.match(line)
+        if match:
+            owner = None
+            argsOwner = match.group(1)
+            solver = solvers.setdefault(argsOwner, {'parent': None, 'args': None, 'defaults': set()})
+            solver['args'] = []
+            continue
+
+        match = _constructorRe.match(line) or _methodRe.match(line)
+        if match:
+            owner = match.group(1)
+            argsOwner = None
+            continue
+
+        if argsOwner is not None:
+            if 'this.parent.getArguments()' in line:
+                solvers[argsOwner]['args'].append(None)
+
+            for arg in _argRe.findall(line):
+                solvers[argsOwner]['args'].append(arg)
+
+        elif owner is not None:
+            for name in _defaultValueRe.findall(line):
+                solvers.setdefault(owner, {'parent': None, 'args': None, 'defaults': set()})['defaults'].add(name)
+
+
+def getSolvers():
+    """Returns the solvers defined by the KL sources, parsed once."""
+
+    global _solvers
+
+    if _solvers is None:
+        _solvers = {}
+        for path in SOLVER_PATHS:
+            for root, dirs, files in os.walk(path):
+                for fileName in sorted(files):
+                    if fileName.endswith('.kl'):
+                        with open(os.path.join(root, fileName), 'r') as klFile:
+                            parseSolverSource(klFile.read(), _solvers)
+
+    return _solvers
+
+
+def getSolverArgs(solverTypeName):
+    """Returns the arguments of a solver type.
+
+    Args:
+        solverTypeName (str): The name of the KL solver type.
+
+    Returns:
+        list: The name, connection type, data type and whether a default
+            value is set of each argument.
+
+    """
+
+    solvers = getSolvers()
+    if solverTypeName not in solvers:
+        raise Exception("Stand-in client: Unknown solver type: " + solverTypeName)
+
+    solver = solvers[solverTypeName]
+
+    # Arguments and default values are inherited from the parent solver.
+    defaults = set()
+    parentName = solver['parent']
+    while parentName is not None and parentName in solvers:
+        defaults.update(solvers[parentName]['defaults'])
+        parentName = solvers[parentName]['parent']
+    defaults.update(solver['defaults'])
+
+    args = []
+    for arg in solver['args'] or []:
+        if arg is None:
+            args += [(x[0], x[1], x[2], x[0] in defaults) for x in getSolverArgs(solver['parent'])]
+        else:
+            args.append((arg[0], arg[1], arg[2], arg[0] in defaults))
+
+    return args
+
+
+def getPresetPorts(presetPath):
+    """Returns the ports of a Canvas preset.
+
+    Args:
+        presetPath (str): The dotted path of the preset.
+
+    Returns:
+        list: The name, connection type and data type of each port.
+
+    """
+
+    relPath = os.path.join(*presetPath.split('.')) + '.canvas'
+    for path in PRESET_PATHS:
+        filePath = os.path.join(path, relPath)
+        if os.path.exists(filePath):
+            break
+    else:
+        raise Exception("Stand-in client: Unknown Canvas preset: " + presetPath)
+
+    with open(filePath, 'r') as presetFile:
+        preset = json.loads(presetFile.read(), strict=False)
+
+    ports = []
+    for port in preset.get('ports', []):
+        dataType = port.get('typeSpec', None)
+        if dataType is None:
+            defaultValues = port.get('defaultValues', {})
+            dataType = defaultValues.keys()[0] if len(defaultValues) > 0 else 'Mat44'
+
+        ports.append((str(port['name']), str(port['execPortType']), str(dataType)))
+
+    return ports
+
+
+# ==============
+# Python Values
+# ==============
+def getDefaultValue(dataType):
+    """Returns the Python value an unconnected argument defaults to."""
+
+    from kraken.core.maths import Xfo, Mat44, Vec2, Vec3
+
+    if dataType.endswith(']'):
+        return []
+
+    defaults = {
+        'Xfo': Xfo,
+        'Mat44': Mat44,
+        'Vec2': Vec2,
+        'Vec3': Vec3,
+        'Boolean': bool,
+        'Scalar': float,
+        'Float32': float,
+        'Float64': float,
+        'Integer': int,
+        'SInt32': int,
+        'UInt32': int,
+        'Size': int,
+        'Index': int,
+        'String': str
+    }
+
+    return defaults.get(dataType, lambda: None)()
+
+
+# ========
+# Install
+# ========
+def install():
+    """Replaces the Fabric Engine parts of the operators and constraints."""
+
+    from kraken.core.kraken_system import ks
+    from kraken.core.objects.operators.operator import Operator
+    from kraken.core.objects.operators.kl_operator import KLOperator, KLSolverArg
+    from kraken.core.objects.operators.canvas_operator import CanvasOperator
+    from kraken.core.objects.constraints.constraint import Constraint
+
+    def klOperatorInit(self, name, solverTypeName, extension, metaData=None):
+        Operator.__init__(self, name, metaData=metaData)
+
+        self.solverTypeName = solverTypeName
+        self.extension = extension
+        self.solverRTVal = None
+        self.args = None
+
+        self.argDescs = tuple([KLSolverArg(x[0], x[2], x[1], x[3]) for x in getSolverArgs(solverTypeName)])
+        self._argDescsByName = {}
+        for argDesc in self.argDescs:
+            self._argDescsByName.setdefault(argDesc.name, argDesc)
+
+            if argDesc.connectionType == 'In':
+                self.inputs[argDesc.name] = None
+            else:
+                self.outputs[argDesc.name] = None
+
+    def klOperatorGetInput(self, name):
+        if name in self.inputs and self.inputs[name] is not None:
+            return self.inputs[name]
+
+        argDesc = self._argDescsByName.get(name, None)
+        if argDesc is None:
+            raise Exception("Cannot find arg %s for object %s" % (name, self.getName()))
+
+        return getDefaultValue(argDesc.dataType)
+
+    def canvasOperatorInit(self, name, canvasPresetPath, metaData=None):
+        Operator.__init__(self, name, metaData=metaData)
+
+        self.canvasPresetPath = canvasPresetPath
+        self.binding = None
+        self.node = None
+        self.portTypes = {}
+
+        for portName, portConnectionType, portDataType in getPresetPorts(canvasPresetPath):
+            if portDataType == 'Execute':
+                continue
+
+            self.portTypes[portName] = (portConnectionType, portDataType)
+
+            value = [] if portDataType.endswith('[]') else None
+            if portConnectionType == 'In':
+                self.inputs[portName] = value
+            else:
+                self.outputs[portName] = value
+
+    def canvasOperatorGetInput(self, name):
+        if name in self.inputs and self.inputs[name] is not None:
+            return self.inputs[name]
+
+        if name not in self.inputs:
+            raise Exception("Input with name '" + name +
+                            "' was not found in operator: " +
+                            self.getName() + ".")
+
+        return getDefaultValue(self.portTypes[name][1])
+
+    def canvasOperatorGetPortType(connectionType):
+        def getPortType(self, name):
+            if name in self.portTypes and self.portTypes[name][0] == connectionType:
+                return self.portTypes[name][1]
+
+            raise Exception("Could not find port %s in canvas operator %s" % (name, self.getName()))
+
+        return getPortType
+
+    def constraintCompute(self):
+        if self._constrainee is None:
+            return None
+        if len(self._constrainers) == 0:
+            return None
+        if self.getMaintainOffset():
+            return self._constrainee.xfo
+
+        result = self._constrainee.xfo.clone()
+        source = self._constrainers[0].globalXfo
+        cls = self.__class__.__name__
+        if cls in ('PoseConstraint', 'PositionConstraint'):
+            result.tr = source.tr.clone()
+        if cls in ('PoseConstraint', 'OrientationConstraint'):
+            result.ori = source.ori.clone()
+        if cls in ('PoseConstraint', 'ScaleConstraint'):
+            result.sc = source.sc.clone()
+
+        return result
+
+    def constraintComputeOffset(self):
+        from kraken.core.maths import Xfo
+
+        if self._constrainee is None:
+            return Xfo()
+        if len(self._constrainers) == 0:
+            return Xfo()
+        if not self.getMaintainOffset():
+            return Xfo()
+
+        return self._constrainers[0].globalXfo.inverse() * self._constrainee.xfo
+
+    KLOperator.__init__ = klOperatorInit
+    KLOperator.getInput = klOperatorGetInput
+    KLOperator.evaluate = Operator.evaluate
+
+    CanvasOperator.__init__ = canvasOperatorInit
+    CanvasOperator.getInput = canvasOperatorGetInput
+    CanvasOperator.getInputType = canvasOperatorGetPortType('In')
+    CanvasOperator.getOutputType = canvasOperatorGetPortType('Out')
+    CanvasOperator.evaluate = Operator.evaluate
+
+    Constraint.compute = constraintCompute
+    Constraint.computeOffset = constraintComputeOffset
+
+    # Anything else asking for the client fails explicitly.
+    def loadCoreClient():
+        raise Exception("Stand-in client: Fabric Engine is not available.")
+
+    ks.loadCoreClient = loadCoreClient
@@ -0,0 +1,50 @@
+import os
+import shutil
+import tempfile
+
+from kraken.plugins.canvas_plugin.graph_layout import GraphLayout, layoutCanvasFile
+
+
+nodes = ['xfo', 'control', 'attribute', 'solver', 'constraint', 'joint', 'debug']
+connections = {
+    'xfo': ['control', 'constraint'],
+    'control': ['solver'],
+    'attribute': ['solver'],
+    'solver': ['constraint', 'joint'],
+    'constraint': ['joint'],
+    'debug': ['debug']
+}
+
+layout = GraphLayout(nodes, connections)
+for depth, row in enumerate(layout.getRows()):
+    print "%d: %s" % (depth, ", ".join(row))
+
+positions = layout.getPositions()
+print "joint: %s" % str(positions['joint'])
+
+# Lay out again the Canvas graph saved by the builder.
+canvasFile = os.path.join(os.environ['KRAKEN_PATH'], 'Exts', 'KrakenForCanvas',
+                          'DFG', 'CanvasBuilder', 'arm', 'Rig.canvas')
+
+tempDir = tempfile.mkdtemp()
+try:
+    outputFile = os.path.join(tempDir, 'Rig.canvas')
+    layout = layoutCanvasFile(canvasFile, outputFile)
+    rows = layout.getRows()
+    print "Rig.canvas: %d nodes in %d layers" % (sum([len(x) for x in rows]), len(rows))
+
+    # Only the node positions change.
+    lines = open(canvasFile).read().split('\n')
+    outputLines = open(outputFile).read().split('\n')
+    changedLines = [y for x, y in zip(lines, outputLines) if x != y]
+    print "Rig.canvas: %d of %d lines changed, %d positions" % (
+        len(changedLines), len(outputLines), len([x for x in changedLines if '"uiGraphPos"' in x]))
+
+    # The comment line of the files written by kl2dfg is kept.
+    presetFile = os.path.join(os.environ['KRAKEN_PATH'], 'Exts', 'KrakenForCanvas',
+                              'DFG', 'Constraints', 'AddConstrainer.canvas')
+    outputFile = os.path.join(tempDir, 'AddConstrainer.canvas')
+    layoutCanvasFile(presetFile, outputFile)
+    print "AddConstrainer.canvas unchanged: %s" % (open(presetFile).read() == open(outputFile).read())
+finally:
+    shutil.rmtree(tempDir)
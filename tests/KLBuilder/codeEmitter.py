@@ -0,0 +1,90 @@
+import os
+import shutil
+import tempfile
+
+from kraken.plugins.kl_plugin.code_emitter import CodeEmitter, CodeSpool
+
+
+class ChunkCounter(object):
+    """Stream recording the size of the chunks written to a file."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.chunkSizes = []
+
+    def write(self, chunk):
+        self.chunkSizes.append(len(chunk))
+        self.stream.write(chunk)
+
+
+lines = []
+lines += ["require Math;", ""]
+lines += ["object KRK_emitter {"]
+lines += ["  Mat44 local;"]
+lines += ["};", ""]
+
+kl = CodeEmitter()
+kl += lines
+kl += "inline function KRK_emitter.solve!() {"
+kl.pushIndent()
+kl += ["// solving", ""]
+kl.pushIndent()
+kl += ["this.local = Mat44();"]
+kl.popIndent()
+kl += ["report(this.local);"]
+kl.popIndent()
+kl += ["}"]
+
+print kl.getValue()
+print "Lines: %d" % kl.getNumLines()
+
+# Streaming a large extension to disk writes it in bounded chunks and gives
+# the same code as joining the lines.
+bigLines = ["  this.item%d.global = this.item%d.local;" % (i, i) for i in xrange(20000)]
+
+outputFolder = tempfile.mkdtemp()
+try:
+    filePath = os.path.join(outputFolder, "emitter.kl")
+    with open(filePath, "w") as klFile:
+        stream = ChunkCounter(klFile)
+        kl = CodeEmitter(stream, bufferSize=4096)
+        for line in bigLines:
+            kl += [line]
+        kl.flush()
+
+    with open(filePath, "r") as klFile:
+        code = klFile.read()
+finally:
+    shutil.rmtree(outputFolder)
+
+print "Same code: %s" % (code == "\n".join(bigLines))
+print "Chunks: %d" % len(stream.chunkSizes)
+print "Bounded chunks: %s" % (max(stream.chunkSizes) < 4096 + 64)
+
+try:
+    kl.getValue()
+except Exception as e:
+    print e
+
+# Spooled blocks of solve code are emitted the same as their lines.
+spool = CodeSpool()
+blocks = []
+for i in xrange(1000):
+    blocks.append(spool.addBlock(["", "// solving item%d" % i, "this.item%d.global = this.item%d.local;" % (i, i)]))
+emptyBlock = spool.addBlock([])
+
+kl = CodeEmitter()
+expected = CodeEmitter()
+for i, block in enumerate(blocks):
+    kl.pushIndent()
+    kl += block
+    kl.popIndent()
+
+    expected.pushIndent()
+    expected += ["", "// solving item%d" % i, "this.item%d.global = this.item%d.local;" % (i, i)]
+    expected.popIndent()
+spool.close()
+
+print "Block lines: %d" % len(blocks[-1])
+print "Empty block lines: %d" % len(emptyBlock)
+print "Same spooled code: %s" % (kl.getValue() == expected.getValue())
@@ -0,0 +1,45 @@
+from kraken.plugins.kl_plugin.item_graph import ItemGraph
+
+
+# Two arms driven by the main control: the left arm control drives the left
+# arm joint through a constraint, the right arm joint is solved by a solver
+# reading the right arm control and a blend attribute.
+items = [
+    (0, 'mainCtrl'),
+    (1, 'armLCtrl'),
+    (2, 'armLConstraint'),
+    (3, 'armLJoint'),
+    (4, 'armRCtrl'),
+    (5, 'blendAttr'),
+    (6, 'armRSolver'),
+    (7, 'armRJoint')
+]
+
+connections = [
+    (0, 1), (0, 4),
+    (1, 2), (2, 3),
+    (4, 6), (5, 6), (6, 7)
+]
+
+graph = ItemGraph()
+for uniqueId, name in items:
+    graph.addItem(uniqueId, name)
+
+for sourceId, targetId in connections:
+    graph.connect(sourceId, targetId)
+
+print "duplicate connection: %s" % graph.connect(0, 1)
+print "downstream of mainCtrl: %s" % graph.getDownstreamIds(0)
+print "downstream of blendAttr: %s" % graph.getDownstreamIds(5)
+
+dirtySourceIds = [0, 1, 4, 5]
+solveIds = [3, 7]
+
+print ""
+print "\n".join(graph.generateDirtyItemCode('KRK_arms', dirtySourceIds))
+print "\n".join(graph.generateDirtyItemCode('KRK_arms', dirtySourceIds, solveIds=solveIds))
+
+# The solve and dirtyAllItems methods of the dirty propagation mode.
+print "\n".join(graph.generateSolveDirtyItemsCode())
+print ""
+print "\n".join(graph.generateDirtyAllItemsCode('KRK_arms', len(items), solveIds=solveIds))
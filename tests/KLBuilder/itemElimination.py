@@ -0,0 +1,49 @@
+from kraken.plugins.kl_plugin.item_graph import ItemGraph
+
+
+# An arm joint constrained to its control, a static offset locator constrained
+# to a static root, and a debug locator feeding nothing.
+items = [
+    (0, 'root'),
+    (1, 'armCtrlSpace'),
+    (2, 'armCtrl'),
+    (3, 'armConstraint'),
+    (4, 'armJoint'),
+    (5, 'offsetConstraint'),
+    (6, 'offsetLocator'),
+    (7, 'offsetJoint'),
+    (8, 'debugConstraint'),
+    (9, 'debugLocator'),
+    (10, 'unusedAttr')
+]
+
+connections = [
+    (0, 1), (1, 2), (2, 3), (3, 4),
+    (0, 5), (5, 6), (6, 7),
+    (2, 8), (8, 9)
+]
+
+graph = ItemGraph()
+for uniqueId, name in items:
+    graph.addItem(uniqueId, name)
+
+for sourceId, targetId in connections:
+    graph.connect(sourceId, targetId)
+
+print "upstream of armJoint: %s" % graph.getUpstreamIds([4])
+
+dynamicIds = [2, 10]
+outputIds = [4, 7, 2]
+
+print "static before: %s" % [graph.getName(x) for x in graph.getStaticIds(dynamicIds)]
+
+deadIds = graph.eliminateDeadItems(outputIds)
+print "dead: %s" % deadIds
+print "items: %s" % [graph.getName(x) for x in graph.getItemIds()]
+print "targets of armCtrl: %s" % graph.getTargetIds(2)
+
+dynamicIds = [x for x in dynamicIds if graph.hasItem(x)]
+print "static after: %s" % [graph.getName(x) for x in graph.getStaticIds(dynamicIds)]
+
+print ""
+print "\n".join(graph.generateDirtyItemCode('KRK_arm', dynamicIds))
@@ -0,0 +1,58 @@
+from kraken.plugins.kl_plugin.item_graph import ItemGraph
+
+
+# Arms and legs driven by the main control. The limbs are independent from
+# each other, so their items are solved in parallel level by level. The right
+# arm joint is also driven by the left arm joint, and the controls have no
+# solve method.
+items = [
+    (0, 'mainCtrl'),
+    (1, 'armLCtrl'),
+    (2, 'armLConstraint'),
+    (3, 'armLJoint'),
+    (4, 'armRCtrl'),
+    (5, 'armRSolver'),
+    (6, 'armRJoint'),
+    (7, 'legLCtrl'),
+    (8, 'legLSolver'),
+    (9, 'legLJoint'),
+    (10, 'legRCtrl'),
+    (11, 'legRSolver'),
+    (12, 'legRJoint'),
+    (13, 'unusedConstraint')
+]
+
+connections = [
+    (0, 1), (0, 4), (0, 7), (0, 10),
+    (1, 2), (2, 3),
+    (4, 5), (3, 5), (5, 6),
+    (7, 8), (8, 9),
+    (10, 11), (11, 12),
+    (0, 13)
+]
+
+graph = ItemGraph()
+for uniqueId, name in items:
+    graph.addItem(uniqueId, name)
+
+for sourceId, targetId in connections:
+    graph.connect(sourceId, targetId)
+
+solveIds = [3, 6, 9, 12]
+solvableIds = set([2, 3, 5, 6, 8, 9, 11, 12, 13])
+
+levels = graph.getSolveLevels(solveIds, solvableIds)
+for i, level in enumerate(levels):
+    print "level %d: %s" % (i, ", ".join([graph.getName(x) for x in level]))
+
+# A cycle doesn't prevent the levels from being computed.
+graph.connect(6, 4)
+print "levels with a cycle: %s" % graph.getSolveLevels(solveIds, solvableIds)
+
+code = graph.generateSolveLevelsCode('KRK_limbs', levels)
+
+print ""
+print "\n".join(code['operator'])
+print "\n".join(code['solve'])
+print ""
+print "\n".join(code['init'])
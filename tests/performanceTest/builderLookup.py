@@ -0,0 +1,82 @@
+import logging
+
+from kraken.log import getLogger
+from kraken.core.builder import Builder
+from kraken.core.profiler import Profiler
+from kraken.core.objects.components.base_example_component import BaseExampleComponent
+from kraken.core.objects.locator import Locator
+from kraken.core.objects.rig import Rig
+from kraken.core.objects.transform import Transform
+
+
+NUM_COMPONENTS = 500
+CHAIN_LENGTH = 20
+
+
+class LookupBuilder(Builder):
+    """Python builder registering every built object, as the DCC builders do."""
+
+    def buildLocator(self, kSceneItem, buildName):
+        self._registerSceneItemPair(kSceneItem, buildName)
+        return buildName
+
+    def buildGroup(self, kSceneItem, buildName):
+        self._registerSceneItemPair(kSceneItem, buildName)
+        return buildName
+
+    def buildLayer(self, kSceneItem, buildName):
+        self._registerSceneItemPair(kSceneItem, buildName)
+        return buildName
+
+    def buildHierarchyGroup(self, kSceneItem, buildName):
+        self._registerSceneItemPair(kSceneItem, buildName)
+        return buildName
+
+    def buildAttributeGroup(self, kAttributeGroup):
+        self._registerSceneItemPair(kAttributeGroup, kAttributeGroup.getName())
+        return kAttributeGroup.getName()
+
+
+getLogger('kraken').setLevel(logging.WARNING)
+
+Profiler.getInstance().push("builderLookup")
+
+Profiler.getInstance().push("createRig")
+rig = Rig("lookupRig")
+objects = []
+for i in xrange(NUM_COMPONENTS):
+    component = BaseExampleComponent("chain%d" % i, parent=rig)
+    component.setLocation(('L', 'R', 'M')[i % 3])
+    rig.addChild(component)
+
+    parent = Transform("chain%d" % i, parent=component.ctrlCmpGrp)
+    objects.append(parent)
+    for j in xrange(CHAIN_LENGTH - 1):
+        parent = Locator("loc%d" % j, parent=parent)
+        objects.append(parent)
+Profiler.getInstance().pop()
+
+builder = LookupBuilder()
+
+Profiler.getInstance().push("build")
+builder.build(rig)
+Profiler.getInstance().pop()
+
+Profiler.getInstance().push("getDCCSceneItem")
+missing = [x for x in objects if builder.getDCCSceneItem(x) is None]
+Profiler.getInstance().pop()
+
+Profiler.getInstance().push("logOrphanedGraphItems")
+builder.logOrphanedGraphItems(rig)
+Profiler.getInstance().pop()
+
+Profiler.getInstance().pop()
+
+
+if __name__ == "__main__":
+    print Profiler.getInstance().generateReport()
+else:
+    print "Objects: %d" % len(objects)
+    print "Registered pairs: %d" % len(builder.getDCCSceneItemPairs())
+    print "Missing lookups: %d" % len(missing)
+    print "Lookup by path: %s" % builder.getDCCSceneItemFromPath(objects[-1].getPath())
@@ -0,0 +1,34 @@
+import logging
+import timeit
+
+from kraken.log import getLogger
+from kraken.core.kraken_system import ks
+from kraken.core.profiler import Profiler
+
+
+NUM_VALUES = 10000
+DATA_TYPES = ('Scalar', 'Vec3', 'Xfo')
+
+
+getLogger('kraken').setLevel(logging.WARNING)
+
+ks.loadCoreClient()
+
+Profiler.getInstance().push("constructRTVal")
+for dataType in DATA_TYPES:
+    Profiler.getInstance().push("rtVal:" + dataType)
+    for i in xrange(NUM_VALUES):
+        ks.rtVal(dataType)
+    Profiler.getInstance().pop()
+Profiler.getInstance().pop()
+
+
+if __name__ == "__main__":
+    for dataType in DATA_TYPES:
+        seconds = min(timeit.repeat(lambda: ks.rtVal(dataType), number=NUM_VALUES, repeat=3))
+        print "rtVal('%s'): %.2f us" % (dataType, seconds / NUM_VALUES * 1000000.0)
+
+    print Profiler.getInstance().generateReport()
+else:
+    for dataType in DATA_TYPES:
+        print "%s: %s" % (dataType, ks.getRTValTypeName(ks.rtVal(dataType)))
@@ -0,0 +1,108 @@
+import os
+import json
+import timeit
+
+from kraken.core.maths import decodeValue
+from kraken.core.maths.math_object import MathObject
+from kraken.core.io.json_codec import encodeJSON
+from kraken.core.io.json_codec import decodeJSON
+from kraken.core.profiler import Profiler
+
+
+NUM_PASSES = 10
+
+filepath = os.path.join(os.environ['KRAKEN_PATH'], 'tests', 'performanceTest', 'arms.krg')
+
+
+def legacyJsonEncode(value):
+    """MathObject.jsonEncode as implemented before the field lists."""
+
+    d = {"__mathObjectClass__": value.__class__.__name__}
+    for name in dir(value):
+        if name.startswith('_') or callable(getattr(value, name)):
+            continue
+
+        item = getattr(value, name)
+        if isinstance(item, MathObject):
+            d[name] = legacyJsonEncode(item)
+        else:
+            d[name] = item
+
+    return d
+
+
+def legacyPrepareToSave(jsonData):
+    """prepareToSave as implemented before the JSON codec."""
+
+    if isinstance(jsonData, MathObject):
+        return legacyJsonEncode(jsonData)
+    elif type(jsonData) is list:
+        return [legacyPrepareToSave(x) for x in jsonData]
+    elif type(jsonData) is dict:
+        newDict = {}
+        for key, value in jsonData.iteritems():
+            newDict[key] = legacyPrepareToSave(value)
+        return newDict
+    return jsonData
+
+
+def legacyPrepareToLoad(jsonData):
+    """prepareToLoad as implemented before the JSON codec."""
+
+    if type(jsonData) is list:
+        return [legacyPrepareToLoad(x) for x in jsonData]
+    elif type(jsonData) is dict:
+        if '__mathObjectClass__' in jsonData.keys():
+            return decodeValue(jsonData)
+        for key, value in jsonData.iteritems():
+            jsonData[key] = legacyPrepareToLoad(value)
+    return jsonData
+
+
+def legacyLoad():
+    return legacyPrepareToLoad(json.loads(text))
+
+
+def legacySave():
+    return json.dumps(legacyPrepareToSave(rigData))
+
+
+def codecLoad():
+    return json.loads(text, object_hook=decodeJSON)
+
+
+def codecSave():
+    return json.dumps(rigData, default=encodeJSON)
+
+
+with open(filepath, 'r') as rigFile:
+    text = rigFile.read()
+
+Profiler.getInstance().push("jsonCodec")
+
+Profiler.getInstance().push("legacy")
+for i in xrange(NUM_PASSES):
+    rigData = legacyLoad()
+    legacyText = legacySave()
+Profiler.getInstance().pop()
+
+Profiler.getInstance().push("codec")
+for i in xrange(NUM_PASSES):
+    rigData = codecLoad()
+    codecText = codecSave()
+Profiler.getInstance().pop()
+
+Profiler.getInstance().pop()
+
+
+if __name__ == "__main__":
+    for fn in (legacyLoad, codecLoad, legacySave, codecSave):
+        seconds = min(timeit.repeat(fn, number=NUM_PASSES, repeat=3))
+        print "%s: %.2f ms per pass, %.2f MB/s" % (fn.__name__, seconds / NUM_PASSES * 1000.0,
+                                                   len(text) * NUM_PASSES / seconds / 1e6)
+
+    print Profiler.getInstance().generateReport()
+else:
+    print "Components: %d" % len(rigData['components'])
+    print "Same data: %s" % (json.loads(legacyText) == json.loads(codecText) == json.loads(text))
+    print "Round trip: %s" % (json.loads(json.dumps(codecLoad(), default=encodeJSON)) == json.loads(text))
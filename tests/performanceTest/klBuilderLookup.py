@@ -0,0 +1,89 @@
+import shutil
+import logging
+import tempfile
+
+from kraken.log import getLogger
+from kraken.core.maths import Vec3, Xfo
+from kraken.core.profiler import Profiler
+from kraken.core.objects.rig import Rig
+from kraken.core.objects.control import Control
+from kraken.core.objects.ctrlSpace import CtrlSpace
+from kraken.core.objects.joint import Joint
+from kraken.core.objects.component_group import ComponentGroup
+from kraken.core.objects.components.base_example_component import BaseExampleComponent
+from kraken.core.objects.attributes.attribute_group import AttributeGroup
+from kraken.core.objects.attributes.scalar_attribute import ScalarAttribute
+from kraken.plugins.kl_plugin.builder import Builder
+
+
+NUM_LIMBS = 200
+NUM_SEGMENTS = 20
+
+
+getLogger('kraken').setLevel(logging.WARNING)
+
+Profiler.getInstance().push("klBuilderLookup")
+
+# Every segment adds a space, a control, an attribute, a joint and a
+# constraint: 20000 items to generate KL for.
+Profiler.getInstance().push("createRig")
+rig = Rig("klLookupRig")
+items = []
+for i in xrange(NUM_LIMBS):
+    limb = BaseExampleComponent("limb%d" % i, parent=rig)
+    limb.setLocation(('L', 'R', 'M')[i % 3])
+
+    deformersLayer = limb.getOrCreateLayer('deformers')
+    defCmpGrp = ComponentGroup(limb.getName(), limb, parent=deformersLayer)
+    limb.addItem('defCmpGrp', defCmpGrp)
+
+    ctrlParent = limb.ctrlCmpGrp
+    jointParent = defCmpGrp
+    for j in xrange(NUM_SEGMENTS):
+        space = CtrlSpace("segment%d" % j, parent=ctrlParent)
+        space.xfo = Xfo(Vec3(float(i), float(j), 0.0))
+
+        ctrl = Control("segment%d" % j, parent=space, shape="circle")
+        ctrl.xfo = space.xfo.clone()
+
+        settings = AttributeGroup("settings", parent=ctrl)
+        blend = ScalarAttribute("blend", value=1.0, minValue=0.0, maxValue=1.0, parent=settings)
+
+        joint = Joint("segment%d" % j, parent=jointParent)
+        joint.xfo = ctrl.xfo.clone()
+        constraint = joint.constrainTo(ctrl)
+
+        items += [space, ctrl, blend, joint, constraint]
+
+        ctrlParent = ctrl
+        jointParent = joint
+Profiler.getInstance().pop()
+
+outputFolder = tempfile.mkdtemp()
+try:
+    builder = Builder()
+    builder.setOutputFolder(outputFolder)
+
+    Profiler.getInstance().push("build")
+    builder.build(rig)
+    Profiler.getInstance().pop()
+
+    Profiler.getInstance().push("generateKLCode")
+    klCode = builder.generateKLCode()
+    Profiler.getInstance().pop()
+
+    Profiler.getInstance().push("findDictForSI")
+    missing = [x for x in items if builder.findDictForSI(x) is None]
+    Profiler.getInstance().pop()
+finally:
+    shutil.rmtree(outputFolder)
+
+Profiler.getInstance().pop()
+
+
+if __name__ == "__main__":
+    print Profiler.getInstance().generateReport()
+else:
+    print "Items: %d" % len(items)
+    print "Missing lookups: %d" % len(missing)
+    print "Solve methods: %s" % ("inline function %s.solve!(" % builder.getKLExtensionName() in klCode)
@@ -0,0 +1,25 @@
+import os
+
+from kraken.core.io.rig_definition_loader import RigDefinitionLoader
+from kraken.core.profiler import Profiler
+
+
+NUM_LOADS = 20
+
+filepath = os.path.join(os.environ['KRAKEN_PATH'], 'tests', 'performanceTest', 'arms.krg')
+
+Profiler.getInstance().push("loadRigDefinition")
+
+for i in xrange(NUM_LOADS):
+    rigData = RigDefinitionLoader().loadFile(filepath)
+
+Profiler.getInstance().pop()
+
+
+if __name__ == "__main__":
+    print Profiler.getInstance().generateReport(listFunctionTotals=True)
+else:
+    print "Components: %d" % len(rigData['components'])
+    print "Connections: %d" % len(rigData['connections'])
+    print "Component classes: %s" % ", ".join(sorted(set([x['class'] for x in rigData['components']])))
+    print "First component: %s" % rigData['components'][0]['name']
@@ -0,0 +1,91 @@
+import copy
+import logging
+import timeit
+
+from kraken.log import getLogger
+from kraken.core.configs.config import Config
+from kraken.core.maths import Vec3
+from kraken.core.objects.control import Control
+from kraken.core.objects.rig import Rig
+from kraken.core.profiler import Profiler
+from kraken.core.traverser import Traverser
+from kraken.plugins.canvas_plugin.hash import makeHash
+
+
+NUM_CONTROLS = 200
+NUM_PASSES = 5
+
+
+def legacyMakeHash(o):
+    """makeHash as implemented before the single pass hasher."""
+
+    if isinstance(o, (set, tuple, list)):
+        new_o = copy.deepcopy(o)
+        for i in range(len(new_o)):
+            new_o[i] = legacyMakeHash(new_o[i])
+
+        return hash(tuple(frozenset(sorted(new_o))))
+
+    elif not isinstance(o, dict):
+        return hash(o)
+
+    new_o = copy.deepcopy(o)
+    for k, v in new_o.items():
+        new_o[k] = legacyMakeHash(v)
+
+    return hash(tuple(frozenset(sorted(new_o.items()))))
+
+
+def getHashSource(curveData):
+    """Builds the hash source of a curve as the Canvas builder does."""
+
+    numVertices = 0
+    for subCurve in curveData:
+        numVertices = numVertices + len(subCurve['points'])
+
+    return [curveData, len(curveData), numVertices]
+
+
+getLogger('kraken').setLevel(logging.WARNING)
+
+# Controls of a character sized rig, using every shape of the config at a few
+# sizes. Their curve data is what the Canvas builder hashes.
+rig = Rig("hashRig")
+controlShapes = sorted(Config.getInstance().getControlShapes().keys())
+for i in xrange(NUM_CONTROLS):
+    control = Control("control%d" % i, parent=rig, shape=controlShapes[i % len(controlShapes)])
+    control.scalePoints(Vec3(1.0 + (i % 4), 1.0, 1.0))
+
+hashSources = []
+traverser = Traverser()
+traverser.addRootItem(rig)
+traverser.traverse(discoverCallback=traverser.discoverChildren)
+for item in traverser.getItemsOfType('Curve'):
+    hashSources.append(getHashSource(item.getCurveData()))
+
+Profiler.getInstance().push("makeHash")
+
+Profiler.getInstance().push("legacyMakeHash")
+for i in xrange(NUM_PASSES):
+    legacyHashes = [legacyMakeHash(x) for x in hashSources]
+Profiler.getInstance().pop()
+
+Profiler.getInstance().push("makeHash")
+for i in xrange(NUM_PASSES):
+    hashes = [makeHash(x) for x in hashSources]
+Profiler.getInstance().pop()
+
+Profiler.getInstance().pop()
+
+
+if __name__ == "__main__":
+    for fn in (legacyMakeHash, makeHash):
+        seconds = min(timeit.repeat(lambda: [fn(x) for x in hashSources], number=NUM_PASSES, repeat=3))
+        print "%s: %.3f ms per pass" % (fn.__name__, seconds / NUM_PASSES * 1000.0)
+
+    print Profiler.getInstance().generateReport()
+else:
+    print "Hashed curves: %d" % len(hashSources)
+    print "Unique legacy hashes: %d" % len(set(legacyHashes))
+    print "Unique hashes: %d" % len(set(hashes))
+    print "Stable: %s" % (hashes == [makeHash(x, memo={}) for x in hashSources])
@@ -1,14 +1,30 @@
 import unittest
 
 from core import test_core
+from core import test_kraken_system
 from core import test_builder
+from core import test_traverser
+from core import test_evaluator
+from core import test_profiler
+from core import test_synchronizer
 from core.configs import test_config
+from core.io import test_rig_definition_loader
+from core.io import test_rig_definition_binary
+from core.io import test_json_codec
 from core.maths import suite as mathTestSuite
 from core.objects import suite as objectTestSuite
 
 coreSuite = test_core.suite()
+krakenSystemSuite = test_kraken_system.suite()
 builderSuite = test_builder.suite()
+traverserSuite = test_traverser.suite()
+evaluatorSuite = test_evaluator.suite()
+profilerSuite = test_profiler.suite()
+synchronizerSuite = test_synchronizer.suite()
 configSuite = test_config.suite()
+rigDefinitionLoaderSuite = test_rig_definition_loader.suite()
+rigDefinitionBinarySuite = test_rig_definition_binary.suite()
+jsonCodecSuite = test_json_codec.suite()
 mathSuite = mathTestSuite()
 objectSuite = objectTestSuite()
 
@@ -16,8 +32,16 @@ objectSuite = objectTestSuite()
 def suites():
     suites = [
         coreSuite,
+        krakenSystemSuite,
         builderSuite,
+        traverserSuite,
+        evaluatorSuite,
+        profilerSuite,
+        synchronizerSuite,
         configSuite,
+        rigDefinitionLoaderSuite,
+        rigDefinitionBinarySuite,
+        jsonCodecSuite,
         mathSuite,
         objectSuite]
 
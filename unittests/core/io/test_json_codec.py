@@ -0,0 +1,106 @@
+import os
+import json
+import unittest
+
+from kraken.core.maths import Vec2, Vec3, Vec4, Quat, Euler, Xfo, Mat33, Mat44
+from kraken.core.maths import Color, RotationOrder
+from kraken.core.maths.math_object import MathObject
+from kraken.core.io.json_codec import encodeJSON
+from kraken.core.io.json_codec import decodeJSON
+from kraken.core.io.json_codec import toJSON
+from kraken.core.io.json_codec import fromJSON
+from kraken.core.io.rig_definition_loader import RigDefinitionLoader
+
+
+ARMS_PATH = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'tests', 'performanceTest', 'arms.krg')
+
+MATH_CLASSES = (Vec2, Vec3, Vec4, Quat, Euler, Xfo, Mat33, Mat44, Color, RotationOrder)
+
+
+def legacyJsonEncode(value):
+    """MathObject.jsonEncode as implemented before the field lists."""
+
+    d = {"__mathObjectClass__": value.__class__.__name__}
+    for name in dir(value):
+        if name.startswith('_') or callable(getattr(value, name)):
+            continue
+
+        item = getattr(value, name)
+        if isinstance(item, MathObject):
+            d[name] = legacyJsonEncode(item)
+        else:
+            d[name] = item
+
+    return d
+
+
+class TestJsonCodec(unittest.TestCase):
+
+    def testJsonFields(self):
+        for mathClass in MATH_CLASSES:
+            value = mathClass()
+            self.assertEquals(value.jsonEncode(), legacyJsonEncode(value))
+            self.assertEquals(toJSON(value), legacyJsonEncode(value))
+
+    def testRoundTrip(self):
+        euler = Euler(1.0, 2.0, 3.0)
+        euler.ro = RotationOrder(2)
+
+        data = {
+            'xfo': Xfo(Vec3(1.0, 2.0, 3.0), Quat(Vec3(0.0, 1.0, 0.0), 0.0), Vec3(2.0, 2.0, 2.0)),
+            'points': [Vec3(1.0, 0.0, 0.0), Vec3(0.0, 1.0, 0.0)],
+            'matrices': [Mat33(), Mat44()],
+            'euler': euler,
+            'color': Color(0.5, 0.25, 0.0, 1.0),
+            'settings': {'size': 2.0, 'vectors': [Vec2(1.0, 2.0), Vec4(1.0, 2.0, 3.0, 4.0)]}
+        }
+
+        text = json.dumps(data, default=encodeJSON)
+        self.assertEquals(json.loads(text), toJSON(data))
+
+        decoded = json.loads(text, object_hook=decodeJSON)
+        self.assertEquals(decoded['xfo'], data['xfo'])
+        self.assertEquals(decoded['points'], data['points'])
+        self.assertEquals(decoded['matrices'], data['matrices'])
+        self.assertEquals(decoded['euler'].ro.order, 2)
+        self.assertEquals(decoded['color'].g, 0.25)
+        self.assertEquals(decoded['settings']['vectors'], data['settings']['vectors'])
+        self.assertEquals(toJSON(decoded), toJSON(data))
+
+    def testFromJSON(self):
+        data = {'xfo': toJSON(Xfo(Vec3(1.0, 2.0, 3.0))), 'list': [toJSON(Vec3(1.0, 1.0, 1.0))]}
+
+        decoded = fromJSON(data)
+        self.assertTrue(isinstance(decoded['xfo'], Xfo))
+        self.assertEquals(decoded['xfo'].tr, Vec3(1.0, 2.0, 3.0))
+        self.assertEquals(decoded['list'][0], Vec3(1.0, 1.0, 1.0))
+
+        # Converting data twice keeps the math objects.
+        self.assertIs(fromJSON(decoded)['xfo'], decoded['xfo'])
+
+    def testErrors(self):
+        self.assertRaises(TypeError, encodeJSON, object())
+        self.assertRaises(TypeError, json.dumps, {'a': object()}, default=encodeJSON)
+        self.assertRaises(Exception, decodeJSON, {'__mathObjectClass__': 'Unknown'})
+        self.assertEquals(decodeJSON({'a': 1}), {'a': 1})
+
+    def testArmsRoundTrip(self):
+        rigData = RigDefinitionLoader().loadFile(ARMS_PATH)
+
+        with open(ARMS_PATH, 'r') as rigFile:
+            pureJSON = json.load(rigFile)
+
+        self.assertEquals(toJSON(rigData), pureJSON)
+        self.assertEquals(json.loads(json.dumps(rigData, default=encodeJSON)), pureJSON)
+
+        decoded = json.loads(json.dumps(rigData, default=encodeJSON), object_hook=decodeJSON)
+        self.assertEquals(toJSON(decoded), pureJSON)
+        self.assertEquals(toJSON(fromJSON(pureJSON)), toJSON(rigData))
+
+
+def suite():
+    return unittest.TestLoader().loadTestsFromTestCase(TestJsonCodec)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
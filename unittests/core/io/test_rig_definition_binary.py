@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+import json
+import unittest
+
+from kraken.core.io.rig_definition_binary import isPackedRigDefinition
+from kraken.core.io.rig_definition_binary import packRigDefinition
+from kraken.core.io.rig_definition_binary import unpackRigDefinition
+
+
+class TestRigDefinitionBinary(unittest.TestCase):
+
+    def testRoundTrip(self):
+        jsonData = {
+            'name': u'r\xe9g',
+            'ints': [0, -1, 300, -2 ** 70],
+            'floats': [0.1, 1.5, float('inf'), -0.0, 1e300],
+            'flags': [True, False, None],
+            'xfo': {
+                '__mathObjectClass__': 'Xfo',
+                'tr': {'__mathObjectClass__': 'Vec3', 'x': 0.1, 'y': 2.0, 'z': 3.0},
+                'sc': {'__mathObjectClass__': 'Vec3', 'x': 1.0, 'y': 1.0, 'z': 1.0}
+            },
+            'points': [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]],
+            'mixed': [[1.0], [2.0, 3.0], 'a'],
+            'empty': [[], {}]
+        }
+
+        data = packRigDefinition(jsonData)
+
+        self.assertTrue(isPackedRigDefinition(data))
+        self.assertEquals(unpackRigDefinition(data), jsonData)
+
+    def testStringTable(self):
+        components = [{'class': 'kraken_components.generic.fkChain_component.FKChainComponentGuide'}] * 50
+
+        data = packRigDefinition({'components': components})
+
+        self.assertEquals(data.count('FKChainComponentGuide'), 1)
+        self.assertTrue(len(data) < len(json.dumps(components)) / 10)
+
+    def testObjectHook(self):
+        data = packRigDefinition({'a': {'b': 1}})
+        result = unpackRigDefinition(data, objectHook=lambda x: x.keys())
+
+        self.assertEquals(result, ['a'])
+
+    def testInvalidData(self):
+        self.assertFalse(isPackedRigDefinition('{"name": "rig"}'))
+        self.assertRaises(ValueError, unpackRigDefinition, '{"name": "rig"}')
+        self.assertRaises(TypeError, packRigDefinition, {'a': object()})
+
+
+def suite():
+    return unittest.TestLoader().loadTestsFromTestCase(TestRigDefinitionBinary)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
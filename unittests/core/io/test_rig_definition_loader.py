@@ -0,0 +1,131 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from kraken.core.maths import Xfo
+from kraken.core.io.rig_definition_loader import RigDefinitionLoader
+from kraken.core.profiler import Profiler
+from kraken.core.objects.rig import Rig
+from kraken.helpers.utility_methods import prepareToSave
+
+from kraken_components.generic.mainSrt_component import MainSrtComponentGuide
+from kraken_components.generic.simpleControl_component import SimpleControlComponentGuide
+
+
+class TestRigDefinitionLoader(unittest.TestCase):
+
+    def testLoads(self):
+        loader = RigDefinitionLoader()
+        rigData = loader.loads("""{
+            "name": "testRig",
+            "components": [{"class": "a.B", "name": "b",
+                            "xfo": {"__mathObjectClass__": "Xfo",
+                                    "tr": {"__mathObjectClass__": "Vec3", "x": 1.0, "y": 2.0, "z": 3.0}}}],
+            "connections": [{"source": "b:L.out", "target": "c:L.in", "targetIndex": 0}],
+            "metaData": {}
+        }""")
+
+        self.assertEquals(rigData['name'], 'testRig')
+        self.assertTrue(isinstance(rigData['components'][0]['xfo'], Xfo))
+        self.assertEquals(rigData['components'][0]['xfo'].tr.y, 2.0)
+        self.assertEquals(len(rigData['connections']), 1)
+
+        self.assertEquals(loader.loads('{}'), {})
+
+    def testValidation(self):
+        loader = RigDefinitionLoader()
+
+        self.assertRaises(ValueError, loader.loads, '{"components": [{"name": "noClass"}]}')
+        self.assertRaises(ValueError, loader.loads, '{"components": {}}')
+        self.assertRaises(ValueError, loader.loads, '{"connections": [{"source": "a", "target": "b.c"}]}')
+        self.assertRaises(ValueError, loader.loads, '{"name": 1}')
+        self.assertRaises(ValueError, loader.loads, '{"name": "a"} extra')
+        self.assertRaises(ValueError, loader.loads, '{"name": "a",')
+
+    def testProfilerBracketsOnError(self):
+        loader = RigDefinitionLoader()
+        profiler = Profiler.getInstance()
+        profiler.reset()
+
+        self.assertRaises(ValueError, loader.loads, '{"components": [{"name": 1}]}')
+
+        tmpDir = tempfile.mkdtemp()
+        try:
+            filepath = os.path.join(tmpDir, 'invalid.krg')
+            with open(filepath, 'w') as rigFile:
+                rigFile.write('{"name": 1}')
+
+            self.assertRaises(ValueError, loader.loadFile, filepath)
+        finally:
+            shutil.rmtree(tmpDir)
+
+        # The brackets are closed, so the report can still be generated.
+        profiler.generateReport()
+        profiler.reset()
+
+    def testUnpackProfilerBracketsOnError(self):
+        loader = RigDefinitionLoader()
+        profiler = Profiler.getInstance()
+        profiler.reset()
+
+        self.assertRaises(ValueError, loader.unpack, 'KRGBgarbage')
+
+        profiler.generateReport()
+        profiler.reset()
+
+    def testLoadRigDefinitionFile(self):
+        rig = Rig('testRig')
+        mainSrt = MainSrtComponentGuide('mainSrt', parent=rig)
+        ctrl = SimpleControlComponentGuide('ctrl', parent=rig)
+        ctrl.getInputByName('mainInput').setConnection(mainSrt.getOutputByName('offset'))
+
+        tempDir = tempfile.mkdtemp()
+        try:
+            filepath = os.path.join(tempDir, 'testRig.krg')
+            rig.writeRigDefinitionFile(filepath)
+
+            loadedRig = Rig('loadedRig')
+            loadedRig.loadRigDefinitionFile(filepath)
+        finally:
+            shutil.rmtree(tempDir)
+
+        self.assertEquals(loadedRig.getName(), 'testRig')
+        self.assertEquals(len(loadedRig.getChildrenByType('Component')), 2)
+
+        loadedCtrl = loadedRig.getChildByDecoratedName(ctrl.getDecoratedName())
+        connection = loadedCtrl.getInputByName('mainInput').getConnection()
+        self.assertEquals(connection.getName(), 'offset')
+
+    def testLoadBinaryRigDefinitionFile(self):
+        rig = Rig('testRig')
+        MainSrtComponentGuide('mainSrt', parent=rig)
+
+        tempDir = tempfile.mkdtemp()
+        try:
+            jsonPath = os.path.join(tempDir, 'testRig.krg')
+            binaryPath = os.path.join(tempDir, 'testRigBinary.krg')
+            rig.writeRigDefinitionFile(jsonPath)
+            rig.writeRigDefinitionFile(binaryPath, binary=True)
+
+            loader = RigDefinitionLoader()
+            jsonData = prepareToSave(loader.loadFile(jsonPath))
+            binaryData = prepareToSave(loader.loadFile(binaryPath))
+
+            self.assertEquals(binaryData, jsonData)
+            self.assertTrue(os.path.getsize(binaryPath) < os.path.getsize(jsonPath))
+
+            loadedRig = Rig('loadedRig')
+            loadedRig.loadRigDefinitionFile(binaryPath)
+        finally:
+            shutil.rmtree(tempDir)
+
+        self.assertEquals(len(loadedRig.getChildrenByType('Component')), 1)
+
+
+def suite():
+    return unittest.TestLoader().loadTestsFromTestCase(TestRigDefinitionLoader)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
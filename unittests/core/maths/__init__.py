@@ -11,6 +11,7 @@ import test_mat44
 import test_quat
 import test_rotation_order
 import test_xfo
+import test_native
 
 loadVec2Suite = test_vec2.suite()
 loadVec3Suite = test_vec3.suite()
@@ -22,6 +23,7 @@ loadMat44Suite = test_mat44.suite()
 loadQuatSuite = test_quat.suite()
 loadRotationOrderSuite = test_rotation_order.suite()
 loadXfoSuite = test_xfo.suite()
+loadNativeSuite = test_native.suite()
 
 
 def suite():
@@ -35,7 +37,8 @@ def suite():
         loadMat44Suite,
         loadQuatSuite,
         loadRotationOrderSuite,
-        loadXfoSuite]
+        loadXfoSuite,
+        loadNativeSuite]
 
     return unittest.TestSuite(suites)
 
@@ -0,0 +1,71 @@
+import unittest
+
+from kraken.core.kraken_system import ks
+from kraken.core.maths.native import f32
+from kraken.core.maths.native import NativeQuat
+from kraken.core.maths.native import NativeRotationOrder
+from kraken.core.maths.native import NativeVec3
+from kraken.core.maths.native import NativeXfo
+from kraken.core.maths.vec3 import Vec3
+
+
+class TestNative(unittest.TestCase):
+
+    def testFloat32Rounding(self):
+        self.assertEquals(f32(3.8), 3.799999952316284)
+        self.assertEquals(f32(1.0e39), float('inf'))
+
+    def testVec3Members(self):
+        vec = NativeVec3(1.0, 2.0, 3.0)
+        vec.y = 0.1
+
+        self.assertEquals(vec.x.getSimpleType(), 1.0)
+        self.assertEquals(vec.y.getSimpleType(), 0.10000000149011612)
+
+    def testMemberReference(self):
+        xfo = NativeXfo()
+        xfo.tr.x = 3.0
+
+        self.assertEquals(xfo.tr.x.getSimpleType(), 3.0)
+
+    def testEulerAnglesRoundTrip(self):
+        angles = NativeVec3(0.3, -0.7, 1.1)
+        for order in xrange(6):
+            ro = NativeRotationOrder(order)
+            quat = NativeQuat()
+            quat.setFromEulerAngles('', angles, ro)
+
+            result = quat.toEulerAngles('Vec3', ro)
+
+            self.assertTrue(result.almostEqual('Boolean', angles).getSimpleType())
+
+    def testXfoInverse(self):
+        xfo = NativeXfo()
+        xfo.tr = NativeVec3(1.0, 2.0, 3.0)
+        xfo.ori.setFromAxisAndAngle('', NativeVec3(0.0, 1.0, 0.0), 0.5)
+        xfo.sc = NativeVec3(2.0, 2.0, 2.0)
+
+        result = xfo.multiply('Xfo', xfo.inverse('Xfo'))
+
+        self.assertTrue(result.tr.almostEqual('Boolean', NativeVec3()).getSimpleType())
+        self.assertTrue(result.sc.almostEqual('Boolean', NativeVec3(1.0, 1.0, 1.0)).getSimpleType())
+
+    def testSetMathBackend(self):
+        backend = ks.getMathBackend()
+        try:
+            ks.setMathBackend('python')
+            vec = Vec3(1.0, 2.0, 3.0)
+
+            self.assertEquals(ks.getRTValTypeName(vec._rtval), 'Vec3')
+            self.assertEquals(vec.y, 2.0)
+            self.assertRaises(ValueError, ks.setMathBackend, 'numpy')
+        finally:
+            ks.setMathBackend(backend)
+
+
+def suite():
+    return unittest.TestLoader().loadTestsFromTestCase(TestNative)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -27,6 +27,27 @@ class TestKLOperator(unittest.TestCase):
 
         self.assertEqual(len(solverArgs), 15)
 
+        # The arguments RTVal belongs to the solver of each operator.
+        otherOp = KLOperator('otherIkSolver', 'TwoBoneIKSolver', 'Kraken')
+        self.assertIsNot(otherOp.getSolverArgs(), solverArgs)
+        self.assertEqual(len(otherOp.getSolverArgs()), 15)
+
+    def testGetSolverArgDescs(self):
+        testOp = KLOperator('ikSolver', 'TwoBoneIKSolver', 'Kraken')
+        otherOp = KLOperator('otherIkSolver', 'TwoBoneIKSolver', 'Kraken')
+        argDescs = testOp.getSolverArgDescs()
+
+        self.assertEqual(len(argDescs), 15)
+        self.assertIs(otherOp.getSolverArgDescs(), argDescs)
+        self.assertEqual([x.name for x in argDescs],
+                         [x.name.getSimpleType() for x in testOp.getSolverArgs()])
+
+        KLOperator.clearSolverArgsCache()
+        newOp = KLOperator('newIkSolver', 'TwoBoneIKSolver', 'Kraken')
+        self.assertIsNot(newOp.getSolverArgDescs(), argDescs)
+        self.assertEqual([x.name for x in newOp.getSolverArgDescs()],
+                         [x.name for x in argDescs])
+
     def testGetInputType(self):
         testOp = KLOperator('ikSolver', 'TwoBoneIKSolver', 'Kraken')
         drawDebugType = testOp.getInputType('drawDebug')
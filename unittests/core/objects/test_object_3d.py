@@ -53,6 +53,25 @@ class TestObject3D(unittest.TestCase):
 
         self.assertEqual(buildName, 'testObj3D')
 
+    def testGetBuildNameCache(self):
+        testCmp = Component('testComponent', location='M')
+        testCmpGrp = ComponentGroup('testCmpGrp', testCmp)
+        testCmp.addItem('testCmpGrp', testCmpGrp)
+        testObj3D = Object3D('testObj3D', parent=testCmpGrp)
+
+        self.assertEqual(testObj3D.getBuildName(), 'testComponent_M_testObj3D_null')
+        self.assertEqual(testObj3D.getBuildName(), 'testComponent_M_testObj3D_null')
+
+        testObj3D.setName('renamed')
+        self.assertEqual(testObj3D.getBuildName(), 'testComponent_M_renamed_null')
+
+        testCmp.setLocation('L')
+        self.assertEqual(testObj3D.getBuildName(), 'testComponent_L_renamed_null')
+
+        testObj3D.setMetaDataItem('altLocation', 'R')
+        testObj3D.setMetaDataItem('altType', 'Locator')
+        self.assertEqual(testObj3D.getBuildName(), 'testComponent_R_renamed_loc')
+
     def testSetName(self):
         testObj3D = Object3D('testObj3D')
         setNameCall = testObj3D.setName('myObj')
@@ -78,12 +97,27 @@ class TestObject3D(unittest.TestCase):
         # getLayer
 
     def testHasChild(self):
-        pass
-        # hasChild
+        testObj3D = Object3D('testObj3D')
+        child = Object3D('child', parent=testObj3D)
+
+        self.assertTrue(testObj3D.hasChild(child))
+        self.assertFalse(child.hasChild(testObj3D))
 
     def testAddChild(self):
-        pass
-        # addChild
+        testObj3D = Object3D('testObj3D')
+        for i in xrange(200):
+            Object3D('child', parent=testObj3D)
+
+        names = [x.getName() for x in testObj3D.getChildren()]
+
+        self.assertEqual(names[:3], ['child', 'child01', 'child02'])
+        self.assertEqual(names[-1], 'child199')
+        self.assertEqual(len(set(names)), 200)
+
+        testObj3D.removeChild(testObj3D.getChildByName('child05'))
+        Object3D('child', parent=testObj3D)
+
+        self.assertIsNotNone(testObj3D.getChildByName('child05'))
 
     def testSetParent(self):
         pass
@@ -98,8 +132,12 @@ class TestObject3D(unittest.TestCase):
         # removeChildByName
 
     def testRemoveChild(self):
-        pass
-        # removeChild
+        testObj3D = Object3D('testObj3D')
+        child = Object3D('child', parent=testObj3D)
+        testObj3D.removeChild(child)
+
+        self.assertFalse(testObj3D.hasChild(child))
+        self.assertIsNone(testObj3D.getChildByName('child'))
 
     def testGetDescendents(self):
         pass
@@ -118,12 +156,26 @@ class TestObject3D(unittest.TestCase):
         # getChildByIndex
 
     def testGetChildByName(self):
-        pass
-        # getChildByName
+        testObj3D = Object3D('testObj3D')
+        child = Object3D('child', parent=testObj3D)
+
+        self.assertIs(testObj3D.getChildByName('child'), child)
+
+        child.setName('renamed')
+
+        self.assertIsNone(testObj3D.getChildByName('child'))
+        self.assertIs(testObj3D.getChildByName('renamed'), child)
 
     def testGetChildByDecoratedName(self):
-        pass
-        # getChildByDecoratedName
+        container = Container('testContainer')
+        testCmp = Component('testComponent', parent=container, location='L')
+
+        self.assertIs(container.getChildByDecoratedName('testComponent:L'), testCmp)
+
+        testCmp.setLocation('R')
+
+        self.assertIsNone(container.getChildByDecoratedName('testComponent:L'))
+        self.assertIs(container.getChildByDecoratedName('testComponent:R'), testCmp)
 
     def testGetChildrenByType(self):
         pass
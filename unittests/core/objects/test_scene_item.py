@@ -2,6 +2,7 @@
 import unittest
 
 from kraken.core.objects.scene_item import SceneItem
+from kraken.core.objects.locator import Locator
 
 
 class TestSceneItem(unittest.TestCase):
@@ -15,16 +16,27 @@ class TestSceneItem(unittest.TestCase):
         # getTypeName
 
     def testGetTypeHierarchyNames(self):
-        pass
-        # getTypeHierarchyNames
+        locator = Locator("locator")
+        names = locator.getTypeHierarchyNames()
+
+        self.assertEquals(names, ['Locator', 'Object3D', 'SceneItem'])
+
+        names.append('Dummy')
+        self.assertEquals(locator.getTypeHierarchyNames(),
+                          ['Locator', 'Object3D', 'SceneItem'])
 
     def testIsTypeOf(self):
-        pass
-        # isTypeOf
+        locator = Locator("locator")
+
+        self.assertTrue(locator.isTypeOf('Locator'))
+        self.assertTrue(locator.isTypeOf('SceneItem'))
+        self.assertFalse(locator.isTypeOf('Transform'))
 
     def testIsOfAnyType(self):
-        pass
-        # isOfAnyType
+        locator = Locator("locator")
+
+        self.assertTrue(locator.isOfAnyType(('Transform', 'Object3D')))
+        self.assertFalse(locator.isOfAnyType(['Transform', 'Attribute']))
 
     def testGetName(self):
         pass
@@ -3,6 +3,7 @@ import unittest
 
 from kraken.core.builder import Builder
 from kraken.core.objects.rig import Rig
+from kraken.core.objects.locator import Locator
 
 
 class TestBuilder(unittest.TestCase):
@@ -18,6 +19,23 @@ class TestBuilder(unittest.TestCase):
 
         builder.build(bobRig)
 
+    def testGetDCCSceneItem(self):
+        builder = Builder()
+        locA = Locator("locatorA")
+        locB = Locator("locatorB", parent=locA)
+
+        builder._registerSceneItemPair(locB, 'dccLocatorB')
+        builder._registerSceneItemPair(locB, 'dccLocatorB2')
+
+        self.assertEquals(builder.getDCCSceneItem(locB), 'dccLocatorB')
+        self.assertEquals(builder.getDCCSceneItemFromPath(locB.getPath()), 'dccLocatorB')
+        self.assertIsNone(builder.getDCCSceneItem(locA))
+        self.assertEquals(len(builder.getDCCSceneItemPairs()), 2)
+
+        builder._clearSceneItemPairs()
+
+        self.assertIsNone(builder.getDCCSceneItem(locB))
+
 
 def suite():
     return unittest.TestLoader().loadTestsFromTestCase(TestBuilder)
@@ -0,0 +1,177 @@
+import unittest
+
+from kraken.core.evaluator import Evaluator
+from kraken.core.maths import Vec3
+from kraken.core.objects.locator import Locator
+from kraken.core.objects.transform import Transform
+from kraken.core.objects.components.component import Component
+from kraken.core.objects.operators.operator import Operator
+from kraken.core.objects.constraints.constraint import Constraint
+
+
+class OffsetOperator(Operator):
+    """Operator translating its target from its source along X."""
+
+    def __init__(self, name, offset):
+        super(OffsetOperator, self).__init__(name)
+        self.inputs['source'] = None
+        self.outputs['target'] = None
+        self.offset = offset
+        self.evalCount = 0
+
+    def getInputType(self, name):
+        return 'Mat44'
+
+    def getOutputType(self, name):
+        return 'Mat44'
+
+    def evaluate(self):
+        super(OffsetOperator, self).evaluate()
+        self.evalCount += 1
+
+        sourceTr = self.getInput('source').globalXfo.tr
+        self.getOutput('target').xfo.tr = Vec3(sourceTr.x + self.offset,
+                                               sourceTr.y,
+                                               sourceTr.z)
+
+        return True
+
+
+class SnapConstraint(Constraint):
+    """Constraint matching its constrainee to its first constrainer."""
+
+    def compute(self):
+        return self.getConstrainers()[0].globalXfo.clone()
+
+
+class TestEvaluator(unittest.TestCase):
+
+    def setUp(self):
+        self.root = Transform("root")
+        self.locA = Locator("locatorA", parent=self.root)
+        self.locB = Locator("locatorB", parent=self.root)
+        self.locC = Locator("locatorC", parent=self.root)
+
+        # Created downstream first to check the evaluation order.
+        self.opB = OffsetOperator("opB", 2.0)
+        self.opB.setInput('source', self.locB)
+        self.opB.setOutput('target', self.locC)
+
+        self.opA = OffsetOperator("opA", 1.0)
+        self.opA.setInput('source', self.locA)
+        self.opA.setOutput('target', self.locB)
+
+    def testEvaluationOrder(self):
+        evaluator = Evaluator()
+        evaluator.addRootItem(self.root)
+
+        self.assertEquals(evaluator.getNodes(), [self.opA, self.opB])
+
+    def testEvaluate(self):
+        evaluator = Evaluator()
+        evaluator.addRootItem(self.root)
+        self.locA.xfo.tr = Vec3(1.0, 0.0, 0.0)
+
+        self.assertEquals(evaluator.evaluate(), 2)
+
+        # Reading locatorB from opB must not evaluate opA again.
+        self.assertEquals(self.opA.evalCount, 1)
+        self.assertEquals(self.opB.evalCount, 1)
+        self.assertEquals(self.locC.xfo.tr.x, 4.0)
+        self.assertFalse(self.opA.testFlag('SCHEDULED_EVALUATION'))
+
+        times = evaluator.getEvaluationTimes()
+        self.assertEquals([x[0] for x in times], [self.opA, self.opB])
+
+    def testSkipUnchangedNodes(self):
+        evaluator = Evaluator()
+        evaluator.addRootItem(self.root)
+        evaluator.evaluate()
+
+        self.assertEquals(evaluator.evaluate(), 0)
+
+        self.locA.xfo.tr = Vec3(5.0, 0.0, 0.0)
+        self.assertEquals(evaluator.evaluate(), 2)
+        self.assertEquals(self.locC.xfo.tr.x, 8.0)
+
+        self.opB.offset = 3.0
+        evaluator.markDirty(self.opB)
+        self.assertEquals(evaluator.evaluate(), 1)
+        self.assertEquals(self.locC.xfo.tr.x, 9.0)
+
+        self.assertEquals(evaluator.evaluate(force=True), 2)
+
+    def testOutputChanged(self):
+        evaluator = Evaluator()
+        evaluator.addRootItem(self.root)
+        evaluator.evaluate()
+
+        # An output set by hand is written again by its operator.
+        self.locC.xfo.tr = Vec3(0.0, 0.0, 0.0)
+        self.assertEquals(evaluator.evaluate(), 1)
+        self.assertEquals(self.opB.evalCount, 2)
+        self.assertEquals(self.locC.xfo.tr.x, 3.0)
+
+    def testConstraineeChanged(self):
+        constraint = SnapConstraint("constraint")
+        constraint.setConstrainee(self.locA)
+        constraint.addConstrainer(self.root)
+
+        evaluator = Evaluator()
+        evaluator.addRootItem(self.root)
+        evaluator.evaluate()
+        self.assertEquals(evaluator.evaluate(), 0)
+
+        # A constrainee set by hand is written again by its constraint.
+        self.locA.xfo.tr = Vec3(5.0, 0.0, 0.0)
+        self.assertEquals(evaluator.evaluate(), 1)
+        self.assertEquals(self.locA.xfo.tr.x, 0.0)
+
+    def testGraphChange(self):
+        evaluator = Evaluator()
+        evaluator.addRootItem(self.root)
+        evaluator.evaluate()
+
+        locD = Locator("locatorD", parent=self.root)
+        opC = OffsetOperator("opC", 1.0)
+        opC.setInput('source', self.locC)
+        opC.setOutput('target', locD)
+
+        self.assertEquals(evaluator.getNodes(), [self.opA, self.opB, opC])
+
+    def testComponentEvalOperators(self):
+        layer = Transform("layer")
+        component = Component("component")
+        otherComponent = Component("otherComponent")
+
+        # Component items live under layers shared with other components.
+        group = Transform("group", parent=layer)
+        component.addItem('group', group)
+        otherGroup = Transform("otherGroup", parent=layer)
+        otherComponent.addItem('group', otherGroup)
+        component.addItem('layer', layer)
+
+        locA = Locator("locatorA", parent=group)
+        locB = Locator("locatorB", parent=group)
+        op = OffsetOperator("op", 1.0)
+        op.setInput('source', locA)
+        op.setOutput('target', locB)
+
+        otherOp = OffsetOperator("otherOp", 1.0)
+        otherOp.setInput('source', otherGroup)
+        otherOp.setOutput('target', Locator("locatorC", parent=otherGroup))
+
+        component.evalOperators()
+        component.evalOperators()
+
+        self.assertEquals(op.evalCount, 1)
+        self.assertEquals(otherOp.evalCount, 0)
+        self.assertEquals(locB.xfo.tr.x, 1.0)
+
+
+def suite():
+    return unittest.TestLoader().loadTestsFromTestCase(TestEvaluator)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
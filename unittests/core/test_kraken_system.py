@@ -0,0 +1,299 @@
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+
+from kraken.core.kraken_system import KrakenSystem
+
+
+COMPONENT_SOURCE = """
+from kraken.core.kraken_system import KrakenSystem
+from kraken.core.objects.components.base_example_component import BaseExampleComponent
+
+
+class ManifestTestComponentGuide(BaseExampleComponent):
+
+    @classmethod
+    def getComponentType(cls):
+        return 'Guide'
+
+
+KrakenSystem.getInstance().registerComponent(ManifestTestComponentGuide)
+"""
+
+MODULE_PATH = 'krakenManifestTest.manifestTest_component'
+CLASS_NAME = MODULE_PATH + '.ManifestTestComponentGuide'
+
+
+class TestKrakenSystem(unittest.TestCase):
+
+    def setUp(self):
+        self.ks = KrakenSystem.getInstance()
+        self.registeredComponents = self.ks.registeredComponents.copy()
+        self.componentManifest = self.ks.componentManifest
+        self.componentModules = self.ks._KrakenSystem__componentModules
+        self.sysPath = list(sys.path)
+
+        self.tempDir = tempfile.mkdtemp()
+        self.packageDir = os.path.join(self.tempDir, 'krakenManifestTest')
+        os.mkdir(self.packageDir)
+        open(os.path.join(self.packageDir, '__init__.py'), 'w').close()
+        self.componentFile = os.path.join(self.packageDir, 'manifestTest_component.py')
+        with open(self.componentFile, 'w') as componentFile:
+            componentFile.write(COMPONENT_SOURCE)
+
+        self.manifestPath = os.path.join(self.tempDir, 'manifest.json')
+        self.environ = dict(os.environ)
+        os.environ['KRAKEN_PATHS'] = self.tempDir
+        os.environ['KRAKEN_COMPONENT_MANIFEST'] = self.manifestPath
+
+    def tearDown(self):
+        os.environ.clear()
+        os.environ.update(self.environ)
+        sys.path[:] = self.sysPath
+        self.forgetTestModule()
+
+        self.ks.registeredComponents = self.registeredComponents
+        self.ks.componentManifest = self.componentManifest
+        self.ks._KrakenSystem__componentModules = self.componentModules
+
+        shutil.rmtree(self.tempDir)
+
+    def forgetTestModule(self):
+        for moduleName in ('krakenManifestTest', MODULE_PATH):
+            if moduleName in sys.modules:
+                del sys.modules[moduleName]
+
+        if CLASS_NAME in self.ks.registeredComponents:
+            del self.ks.registeredComponents[CLASS_NAME]
+
+    def testManifestIsWritten(self):
+        self.assertTrue(self.ks.loadComponentModules())
+        self.assertIn(MODULE_PATH, sys.modules)
+
+        with open(self.manifestPath, 'r') as manifestFile:
+            manifest = json.load(manifestFile)
+
+        entry = manifest['modules'][MODULE_PATH]
+        self.assertEquals(entry['file'], self.componentFile)
+        self.assertEquals(entry['components'], {CLASS_NAME: 'Guide'})
+
+    def testLazyImport(self):
+        self.ks.loadComponentModules()
+
+        # Simulate a new session
+        self.forgetTestModule()
+        self.ks.loadComponentModules()
+
+        self.assertNotIn(MODULE_PATH, sys.modules)
+        self.assertIn(CLASS_NAME, self.ks.getComponentClassNames())
+        self.assertEquals(self.ks.getComponentType(CLASS_NAME), 'Guide')
+        self.assertNotIn(MODULE_PATH, sys.modules)
+
+        componentClass = self.ks.getComponentClass(CLASS_NAME)
+        self.assertEquals(componentClass.__name__, 'ManifestTestComponentGuide')
+        self.assertIn(MODULE_PATH, sys.modules)
+
+    def testReloadChangedModules(self):
+        self.ks.loadComponentModules()
+        componentClass = self.ks.getComponentClass(CLASS_NAME)
+
+        self.ks.loadComponentModules()
+        self.assertIs(self.ks.getComponentClass(CLASS_NAME), componentClass)
+
+        mtime = os.path.getmtime(self.componentFile) + 10.0
+        os.utime(self.componentFile, (mtime, mtime))
+
+        self.ks.loadComponentModules()
+        self.assertIsNot(self.ks.getComponentClass(CLASS_NAME), componentClass)
+
+    def testRemovedModule(self):
+        self.ks.loadComponentModules()
+        os.remove(self.componentFile)
+
+        self.ks.loadComponentModules()
+        self.assertNotIn(CLASS_NAME, self.ks.getComponentClassNames())
+
+    def testComponentFilePath(self):
+        self.ks.loadComponentModules()
+        self.forgetTestModule()
+        self.ks.loadComponentModules()
+
+        self.assertEquals(self.ks.getComponentFilePath(CLASS_NAME), self.componentFile)
+        self.assertNotIn(MODULE_PATH, sys.modules)
+
+    def testManifestOfOtherComponentPaths(self):
+        self.ks.loadComponentModules()
+        self.forgetTestModule()
+
+        # A manifest written for other component paths is not reused.
+        otherDir = os.path.join(self.tempDir, 'other')
+        os.mkdir(otherDir)
+        os.environ['KRAKEN_PATHS'] = os.pathsep.join([self.tempDir, otherDir])
+        self.ks.loadComponentModules()
+
+        self.assertIn(MODULE_PATH, sys.modules)
+
+    def testDefaultManifestPath(self):
+        del os.environ['KRAKEN_COMPONENT_MANIFEST']
+        manifestPath = self.ks.getComponentManifestPath()
+
+        os.environ['KRAKEN_PATHS'] = ''
+        self.assertNotEquals(self.ks.getComponentManifestPath(), manifestPath)
+
+        os.environ['KRAKEN_PATHS'] = self.tempDir
+        self.assertEquals(self.ks.getComponentManifestPath(), manifestPath)
+
+
+class FakeRTVal(object):
+    """RTVal holding a Python value or struct members."""
+
+    def __init__(self, typeName, value=None):
+        self.typeName = typeName
+        self.value = value
+
+    def clone(self, typeName):
+        rtval = FakeRTVal(typeName, self.value)
+        rtval.__dict__.update(self.__dict__)
+        return rtval
+
+
+class FakeRTValType(object):
+    """Registered KL type counting the RTVals it constructs."""
+
+    def __init__(self, name, members=(), canCreate=True, internalType='struct'):
+        self.name = name
+        self.members = members
+        self.canCreate = canCreate
+        self.internalType = internalType
+        self.numConstructed = 0
+
+    def __call__(self, value=None):
+        self.numConstructed += 1
+        return FakeRTVal(self.name, value)
+
+    def create(self):
+        if not self.canCreate:
+            raise Exception("Type can't be created: " + self.name)
+
+        rtval = self(0.0)
+        for memberName, memberType in self.members:
+            setattr(rtval, memberName, FakeRTVal(memberType, 0.0))
+
+        return rtval
+
+
+class FakeRT(object):
+
+    def __init__(self):
+        self.types = type('FakeTypes', (object, ), {})()
+        self.typeDescs = {}
+
+    def addType(self, rtValType):
+        setattr(self.types, rtValType.name, rtValType)
+        self.typeDescs[rtValType.name] = {'name': rtValType.name,
+                                          'internalType': rtValType.internalType}
+        if len(rtValType.members) > 0:
+            self.typeDescs[rtValType.name]['members'] = [
+                {'name': x[0], 'type': x[1]} for x in rtValType.members]
+
+    def getRegisteredTypes(self):
+        return self.typeDescs
+
+
+class FakeClient(object):
+
+    def __init__(self):
+        self.RT = FakeRT()
+
+    def loadExtension(self, extension):
+        pass
+
+
+class Vec3Value(object):
+    """Default value with some of the Vec3 members."""
+
+    def __init__(self, **members):
+        self.__dict__.update(members)
+
+    def __contains__(self, name):
+        return name in self.__dict__
+
+
+class TestConstructRTVal(unittest.TestCase):
+
+    def setUp(self):
+        self.scalarType = FakeRTValType('Scalar', canCreate=False, internalType='fp32')
+        self.vec3Type = FakeRTValType('Vec3', members=(('x', 'Scalar'),
+                                                       ('y', 'Scalar'),
+                                                       ('z', 'Scalar')))
+        self.solverType = FakeRTValType('Solver', internalType='object')
+
+        client = FakeClient()
+        client.RT.addType(self.scalarType)
+        client.RT.addType(self.vec3Type)
+        client.RT.addType(self.solverType)
+
+        self.ks = KrakenSystem()
+        self.ks.client = client
+        self.ks.registeredTypes = client.RT.types
+        self.ks.typeDescs = client.RT.getRegisteredTypes()
+
+    def testPlanIsCached(self):
+        plan = self.ks.getRTValPlan('Vec3')
+        self.assertIs(self.ks.getRTValPlan('Vec3'), plan)
+        self.assertTrue(plan.useCreate)
+        self.assertEquals(plan.members, (('x', 'Scalar'), ('y', 'Scalar'), ('z', 'Scalar')))
+
+        # Zero values are cloned from the template.
+        numConstructed = self.vec3Type.numConstructed
+        vec3 = self.ks.rtVal('Vec3')
+        self.assertIsNot(vec3, plan.template)
+        self.assertEquals(vec3.typeName, 'Vec3')
+        self.assertEquals(self.vec3Type.numConstructed, numConstructed)
+
+    def testObjectsAreCreated(self):
+        plan = self.ks.getRTValPlan('Solver')
+        self.assertTrue(plan.useCreate)
+        self.assertIs(plan.template, None)
+
+        # Each object is a new instance, never a clone.
+        numConstructed = self.solverType.numConstructed
+        solver = self.ks.rtVal('Solver')
+        self.assertIsNot(self.ks.rtVal('Solver'), solver)
+        self.assertEquals(self.solverType.numConstructed, numConstructed + 2)
+
+    def testFallbackConstruction(self):
+        plan = self.ks.getRTValPlan('Scalar')
+        self.assertFalse(plan.useCreate)
+        self.assertIs(plan.members, None)
+
+        self.assertEquals(self.ks.rtVal('Scalar', 2.0).value, 2.0)
+
+    def testDefaultValue(self):
+        vec3 = self.ks.rtVal('Vec3', Vec3Value(x=1.0, z=3.0))
+
+        self.assertEquals(vec3.x.value, 1.0)
+        self.assertEquals(vec3.y.value, 0.0)
+        self.assertEquals(vec3.z.value, 3.0)
+
+        # The template is left untouched.
+        self.assertEquals(self.ks.rtVal('Vec3').x.value, 0.0)
+
+    def testLoadExtensionClearsPlans(self):
+        plan = self.ks.getRTValPlan('Vec3')
+        self.ks.loadExtension('Test')
+
+        self.assertIsNot(self.ks.getRTValPlan('Vec3'), plan)
+
+
+def suite():
+    loader = unittest.TestLoader()
+    return unittest.TestSuite([loader.loadTestsFromTestCase(TestKrakenSystem),
+                               loader.loadTestsFromTestCase(TestConstructRTVal)])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,93 @@
+import os
+import csv
+import json
+import shutil
+import tempfile
+import unittest
+
+from kraken.core.profiler import Profiler
+
+
+class TestProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.profiler = Profiler()
+
+    def testPushPop(self):
+        self.profiler.push('build')
+        self.profiler.push('child')
+        self.profiler.pop()
+        self.profiler.push('child')
+        self.profiler.pop()
+        self.profiler.pop()
+
+        stats = self.profiler.getStats()
+
+        self.assertEquals(stats['build']['count'], 1)
+        self.assertEquals(stats['child']['count'], 2)
+        self.assertTrue(stats['build']['self'] <= stats['build']['total'])
+
+        report = self.profiler.generateReport(listFunctionTotals=True)
+        self.assertEquals(report.splitlines()[1].split(' duration')[0], '  build')
+        self.assertEquals(report.splitlines()[2].split(' duration')[0], '    child')
+        self.assertTrue('--functions--' in report)
+
+        self.assertRaises(Exception, self.profiler.pop)
+
+    def testSpan(self):
+        with self.profiler.span('block'):
+            pass
+
+        @self.profiler.span()
+        def decorated(value):
+            return value * 2
+
+        self.assertEquals(decorated(2), 4)
+        self.assertEquals(decorated.__name__, 'decorated')
+
+        stats = self.profiler.getStats()
+        self.assertEquals(stats['block']['count'], 1)
+        self.assertEquals(stats[__name__ + '.decorated']['count'], 1)
+
+    def testDisabled(self):
+        self.profiler.setEnabled(False)
+        self.profiler.push('hidden')
+        self.profiler.setEnabled(True)
+        self.profiler.push('visible')
+        self.profiler.pop()
+        self.profiler.pop()
+
+        self.assertEquals(self.profiler.getStats().keys(), ['visible'])
+
+    def testExport(self):
+        with self.profiler.span('build'):
+            with self.profiler.span('child'):
+                pass
+
+        tempDir = tempfile.mkdtemp()
+        try:
+            tracePath = os.path.join(tempDir, 'trace.json')
+            self.profiler.exportChromeTrace(tracePath)
+            with open(tracePath) as traceFile:
+                events = json.load(traceFile)['traceEvents']
+
+            self.assertEquals([x['name'] for x in events], ['build', 'child'])
+            self.assertEquals(events[0]['ph'], 'X')
+
+            csvPath = os.path.join(tempDir, 'stats.csv')
+            self.profiler.exportCSV(csvPath)
+            with open(csvPath) as csvFile:
+                rows = list(csv.reader(csvFile))
+
+            self.assertEquals(rows[0], ['label', 'count', 'total', 'self'])
+            self.assertEquals(len(rows), 3)
+        finally:
+            shutil.rmtree(tempDir)
+
+
+def suite():
+    return unittest.TestLoader().loadTestsFromTestCase(TestProfiler)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,145 @@
+import unittest
+
+from kraken.core.synchronizer import Synchronizer
+from kraken.core.objects.rig import Rig
+from kraken.core.objects.locator import Locator
+from kraken.core.objects.attributes.attribute_group import AttributeGroup
+from kraken.core.objects.attributes.scalar_attribute import ScalarAttribute
+
+
+class RecordingSynchronizer(Synchronizer):
+    """Synchronizer reading its DCC item states from a dict."""
+
+    def __init__(self):
+        super(RecordingSynchronizer, self).__init__()
+        self.dccStates = {}
+        self.deleted = set()
+        self.lookups = []
+        self.synced = []
+        self.stateQueries = []
+
+    def getDCCItem(self, kObject):
+        self.lookups.append(kObject.getName())
+        return kObject.getPath()
+
+    def isDCCItemValid(self, dccItem):
+        return dccItem not in self.deleted
+
+    def getDCCItemState(self, kObject, dccItem):
+        return self.dccStates.get(dccItem, None)
+
+    def getDCCItemStates(self, kObjects, dccItems):
+        self.stateQueries.append([x.getName() for x in kObjects])
+        return super(RecordingSynchronizer, self).getDCCItemStates(kObjects, dccItems)
+
+    def syncXfo(self, kObject):
+        self.synced.append(kObject.getName())
+        return True
+
+    def syncAttribute(self, kObject):
+        self.synced.append(kObject.getName())
+        return True
+
+
+class TestSynchronizer(unittest.TestCase):
+
+    def setUp(self):
+        self.rig = Rig("testRig")
+        self.locA = Locator("locatorA", parent=self.rig)
+        self.locB = Locator("locatorB", parent=self.locA)
+        attrGrp = AttributeGroup("settings", parent=self.locB)
+        self.attr = ScalarAttribute("weight", value=1.0, parent=attrGrp)
+
+        self.synchronizer = RecordingSynchronizer()
+        for item in (self.rig, self.locA, self.locB):
+            self.synchronizer.dccStates[item.getPath()] = 0
+
+    def testSyncOrder(self):
+        synchronizer = self.synchronizer
+        synchronizer.setTarget(self.rig)
+        synchronizer.sync()
+
+        self.assertEquals(synchronizer.synced,
+                          ['testRig', 'locatorA', 'locatorB', 'weight'])
+
+    def testSyncOnlyChangedItems(self):
+        synchronizer = self.synchronizer
+        synchronizer.setTarget(self.rig)
+        synchronizer.sync()
+
+        synchronizer.synced = []
+        synchronizer.sync()
+
+        # Items without a state are always synchronized.
+        self.assertEquals(synchronizer.synced, ['weight'])
+
+        synchronizer.synced = []
+        synchronizer.dccStates[self.locA.getPath()] = 1
+        synchronizer.sync()
+
+        self.assertEquals(synchronizer.synced, ['locatorA', 'weight'])
+
+    def testMarkDirty(self):
+        synchronizer = self.synchronizer
+        synchronizer.setTarget(self.rig)
+        synchronizer.sync()
+
+        self.assertFalse(synchronizer.isDirty(self.locB))
+        synchronizer.markDirty(self.locB)
+        self.assertTrue(synchronizer.isDirty(self.locB))
+
+        synchronizer.synced = []
+        synchronizer.sync()
+        self.assertEquals(synchronizer.synced, ['locatorB', 'weight'])
+
+        synchronizer.synced = []
+        synchronizer.sync(force=True)
+        self.assertEquals(synchronizer.synced,
+                          ['testRig', 'locatorA', 'locatorB', 'weight'])
+
+    def testBatchedStateQueries(self):
+        synchronizer = self.synchronizer
+        synchronizer.setTarget(self.rig)
+        synchronizer.sync()
+
+        synchronizer.stateQueries = []
+        synchronizer.sync()
+
+        self.assertEquals(synchronizer.stateQueries,
+                          [['testRig', 'locatorA', 'locatorB', 'weight']])
+
+    def testHierarchyMapReuse(self):
+        synchronizer = self.synchronizer
+        synchronizer.setTarget(self.rig)
+        hrcMap = synchronizer.getHierarchyMap()
+
+        synchronizer.lookups = []
+        synchronizer.setTarget(self.rig)
+        self.assertIs(synchronizer.getHierarchyMap(), hrcMap)
+        self.assertEquals(synchronizer.lookups, [])
+
+        locC = Locator("locatorC", parent=self.locA)
+        synchronizer.setTarget(self.rig)
+        self.assertIsNot(synchronizer.getHierarchyMap(), hrcMap)
+        self.assertIn(locC, synchronizer.getHierarchyMap())
+
+    def testDeletedDCCItem(self):
+        synchronizer = self.synchronizer
+        synchronizer.setTarget(self.rig)
+        synchronizer.sync()
+
+        synchronizer.deleted.add(self.locA.getPath())
+        synchronizer.lookups = []
+        synchronizer.synced = []
+        synchronizer.sync()
+
+        self.assertEquals(synchronizer.lookups, ['locatorA'])
+        self.assertEquals(synchronizer.synced, ['locatorA', 'weight'])
+
+
+def suite():
+    return unittest.TestLoader().loadTestsFromTestCase(TestSynchronizer)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,107 @@
+import unittest
+
+from kraken.core.traverser import Traverser
+from kraken.core.objects.scene_item import SceneItem
+from kraken.core.objects.locator import Locator
+from kraken.core.objects.transform import Transform
+from kraken.core.objects.constraints.pose_constraint import PoseConstraint
+
+
+class TestTraverser(unittest.TestCase):
+
+    def testTraverseOrder(self):
+        root = Transform("root")
+        locA = Locator("locatorA", parent=root)
+        locB = Locator("locatorB", parent=locA)
+
+        traverser = Traverser()
+        traverser.addRootItem(locB)
+        traverser.traverse(discoverCallback=traverser.discoverChildren)
+        items = traverser.getItemsOfType('Object3D')
+
+        self.assertEquals([x.getName() for x in items],
+                          ['root', 'locatorA', 'locatorB'])
+
+    def testGetItemsOfType(self):
+        root = Transform("root")
+        locA = Locator("locatorA", parent=root)
+
+        traverser = Traverser()
+        traverser.addRootItem(root)
+        traverser.traverse(discoverCallback=traverser.discoverChildren)
+
+        self.assertEquals(traverser.getItemsOfType('Locator'), [locA])
+        self.assertEquals(traverser.getItemsOfType(['Locator', 'Transform']),
+                          [locA, root])
+        self.assertEquals(len(traverser.getItemsOfType(['AttributeGroup', 'Attribute'])), 6)
+        self.assertEquals(traverser.getItemsOfType('Joint'), [])
+
+    def testTraverseDeepHierarchy(self):
+        parent = Transform("root")
+        for i in xrange(5000):
+            parent = Locator("locator%d" % i, parent=parent)
+
+        traverser = Traverser()
+        traverser.addRootItem(parent)
+        traverser.traverse()
+        items = traverser.getItemsOfType('Object3D')
+
+        self.assertEquals(len(items), 5001)
+        self.assertEquals(items[0].getName(), 'root')
+
+    def testTraverseCache(self):
+        root = Transform("root")
+        Locator("locatorA", parent=root)
+
+        traverser = Traverser()
+        traverser.addRootItem(root)
+        items = traverser.traverse(discoverCallback=traverser.discoverChildren,
+                                   useCache=True)
+
+        revision = SceneItem.getGraphRevision()
+        cachedItems = traverser.traverse(discoverCallback=traverser.discoverChildren,
+                                         useCache=True)
+
+        self.assertEquals(items, cachedItems)
+        self.assertEquals(SceneItem.getGraphRevision(), revision)
+
+        Locator("locatorB", parent=root)
+
+        self.assertNotEquals(SceneItem.getGraphRevision(), revision)
+        traverser.traverse(discoverCallback=traverser.discoverChildren,
+                           useCache=True)
+
+        self.assertEquals(len(traverser.getItemsOfType('Object3D')), 3)
+
+    def testTraverseCacheConstrainers(self):
+        root = Transform("root")
+        locA = Locator("locatorA", parent=root)
+        locB = Locator("locatorB", parent=root)
+        locC = Locator("locatorC")
+
+        constraint = PoseConstraint("constraint")
+        constraint.setConstrainee(locB)
+        constraint.addConstrainer(locA)
+
+        traverser = Traverser()
+        traverser.addRootItem(constraint)
+        traverser.traverse(useCache=True)
+        self.assertNotIn(locC, traverser.getItemsOfType('Object3D'))
+
+        # Adding or removing a constrainer changes the sources of the
+        # constraint.
+        constraint.addConstrainer(locC)
+        traverser.traverse(useCache=True)
+        self.assertIn(locC, traverser.getItemsOfType('Object3D'))
+
+        constraint.removeConstrainerByIndex(1)
+        traverser.traverse(useCache=True)
+        self.assertNotIn(locC, traverser.getItemsOfType('Object3D'))
+
+
+def suite():
+    return unittest.TestLoader().loadTestsFromTestCase(TestTraverser)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)